@@ -0,0 +1,152 @@
+"""Run the benchmark suite, save baselines and compare against them.
+
+From the root of the repository::
+
+    python -m benchmarks                              # run everything and print the results
+    python -m benchmarks --filter point/standard      # only run matching benchmarks
+    python -m benchmarks --save main                  # store the results as the "main" baseline
+    python -m benchmarks --compare main               # compare against the "main" baseline
+
+``--compare`` exits with ``1`` when any benchmark is slower than the baseline by more than ``--threshold``.
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+from benchmarks.suite import BENCHMARKS
+from pygeomag import __version__, backend
+
+BASELINES_PATH = os.path.join(os.path.dirname(__file__), "baselines")
+
+
+def measure(benchmark, repeat):
+    """Time a benchmark ``repeat`` times and trace its peak memory once.
+
+    :return: A dict with the best and median seconds per operation and the peak memory in bytes
+    """
+    run = benchmark.setup()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append((time.perf_counter() - start) / benchmark.number)
+    timings.sort()
+
+    tracemalloc.start()
+    run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "best": timings[0],
+        "median": timings[len(timings) // 2],
+        "peak_bytes": peak,
+    }
+
+
+def format_seconds(seconds):
+    """Format seconds with a readable unit."""
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.3f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def baseline_filename(name):
+    """Return the path of a stored baseline."""
+    return os.path.join(BASELINES_PATH, f"{name}.json")
+
+
+def compare(results, baseline, threshold):
+    """Print the results next to the baseline and return True if any benchmark regressed."""
+    regressed = False
+    print(f"{'benchmark':<56} {'baseline':>12} {'current':>12} {'ratio':>7}")
+    for name, result in results.items():
+        if name not in baseline:
+            print(f"{name:<56} {'-':>12} {format_seconds(result['median']):>12}")
+            continue
+        ratio = result["median"] / baseline[name]["median"]
+        flag = ""
+        if ratio > 1.0 + threshold:
+            flag = " slower"
+            regressed = True
+        elif ratio < 1.0 - threshold:
+            flag = " faster"
+        print(
+            f"{name:<56} {format_seconds(baseline[name]['median']):>12} "
+            f"{format_seconds(result['median']):>12} {ratio:>7.2f}{flag}"
+        )
+    return regressed
+
+
+def main(argv=None):
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.split("\n")[0]
+    )
+    parser.add_argument(
+        "--filter", default="", help="only run benchmarks containing this text"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=5, help="times to run each benchmark (default: 5)"
+    )
+    parser.add_argument(
+        "--save", metavar="NAME", help="store the results as a baseline"
+    )
+    parser.add_argument(
+        "--compare", metavar="NAME", help="compare the results against a baseline"
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed slowdown ratio before --compare fails (default: 0.1)",
+    )
+    args = parser.parse_args(argv)
+
+    results = {}
+    for benchmark in BENCHMARKS:
+        if args.filter not in benchmark.name:
+            continue
+        result = measure(benchmark, args.repeat)
+        results[benchmark.name] = result
+        if not args.compare:
+            print(
+                f"{benchmark.name:<56} {format_seconds(result['median']):>12} per op "
+                f"{result['peak_bytes'] / 1024:>10.1f} KiB peak"
+            )
+
+    if args.save:
+        os.makedirs(BASELINES_PATH, exist_ok=True)
+        with open(baseline_filename(args.save), "w") as baseline_file:
+            json.dump(
+                {
+                    "machine": {
+                        "python": platform.python_version(),
+                        "platform": platform.platform(),
+                        "pygeomag": __version__,
+                        "backends": backend.available_backends(),
+                    },
+                    "results": results,
+                },
+                baseline_file,
+                indent=2,
+                sort_keys=True,
+            )
+
+    if args.compare:
+        with open(baseline_filename(args.compare)) as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+        if compare(results, baseline, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,446 @@
+"""Benchmarks for the load, single point, batch and high resolution paths of ``GeoMag``.
+
+Each benchmark is a function that does its setup and returns the callable to time.
+"""
+
+import asyncio
+import importlib
+import os
+import random
+import sys
+import threading
+
+from pygeomag import (
+    GeoMag,
+    backend,
+    calculate_decimal_years,
+    pretty_print_degrees,
+    pretty_print_degrees_batch,
+)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+BENCHMARKS = []
+
+WMM_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), "pygeomag", "wmm")
+COEFFICIENTS_FILES = sorted(
+    filename for filename in os.listdir(WMM_PATH) if filename.endswith(".COF")
+)
+COEFFICIENTS_MODULES = sorted(
+    filename[:-3]
+    for filename in os.listdir(WMM_PATH)
+    if filename.startswith("wmm")
+    and filename.endswith(".py")
+    # The fixed point tables are not coefficients data
+    and not filename.endswith("_fixed.py")
+)
+
+
+class Benchmark:
+    """A named benchmark, ``number`` is the amount of operations each call of the timed callable does."""
+
+    def __init__(self, name, setup, number=1):
+        self.name = name
+        self.setup = setup
+        self.number = number
+
+
+def register(name, setup, number=1):
+    """Add a benchmark to the suite."""
+    BENCHMARKS.append(Benchmark(name, setup, number))
+
+
+def _high_resolution(name):
+    return "HR" in name.upper()
+
+
+def _random_points(count, seed=0):
+    rng = random.Random(seed)
+    return (
+        [rng.uniform(-90, 90) for _ in range(count)],
+        [rng.uniform(-180, 180) for _ in range(count)],
+        [rng.uniform(-1, 850) for _ in range(count)],
+        [rng.uniform(2025, 2030) for _ in range(count)],
+    )
+
+
+def _grid(step):
+    glat = []
+    glon = []
+    for lat in range(-90, 91, step):
+        for lon in range(-180, 180, step):
+            glat.append(float(lat))
+            glon.append(float(lon))
+    return glat, glon
+
+
+def _with_backend(name, run):
+    """Wrap run to select the backend while it is timed."""
+
+    def wrapped():
+        previous = backend.get_backend()
+        backend.set_backend(name)
+        try:
+            run()
+        finally:
+            backend.set_backend(previous)
+
+    return wrapped
+
+
+def _load_file(filename):
+    def setup():
+        def run():
+            GeoMag(
+                coefficients_file=f"wmm/{filename}",
+                high_resolution=_high_resolution(filename),
+            ).preload()
+
+        return run
+
+    return setup
+
+
+def _load_module(module_name):
+    def setup():
+        full_name = f"pygeomag.wmm.{module_name}"
+
+        def run():
+            sys.modules.pop(full_name, None)
+            module = importlib.import_module(full_name)
+            GeoMag(
+                coefficients_data=next(
+                    value
+                    for attribute, value in vars(module).items()
+                    if attribute.lower() == module_name
+                ),
+                high_resolution=_high_resolution(module_name),
+            ).preload()
+
+        return run
+
+    return setup
+
+
+def _point(high_resolution, evaluator, backend_name, count, pole=False):
+    def setup():
+        geo_mag = GeoMag(
+            base_year=2025, high_resolution=high_resolution, evaluator=evaluator
+        )
+        points = list(zip(*_random_points(count)))
+        if pole:
+            # At the geographic poles, where the phi component has its own recursion
+            points = [
+                (90.0 if index % 2 else -90.0, *point[1:])
+                for index, point in enumerate(points)
+            ]
+        _with_backend(backend_name, geo_mag.warmup)()
+
+        def run():
+            for point in points:
+                geo_mag.calculate(*point)
+
+        return _with_backend(backend_name, run)
+
+    return setup
+
+
+def _batch(high_resolution, evaluator, backend_name, columns):
+    def setup():
+        geo_mag = GeoMag(
+            base_year=2025, high_resolution=high_resolution, evaluator=evaluator
+        )
+        _with_backend(backend_name, geo_mag.warmup)()
+        # compile the batch kernels before timing
+        _with_backend(
+            backend_name,
+            lambda: geo_mag.calculate_batch([0.0], [0.0], 0.0, 2025.0),
+        )()
+
+        def run():
+            geo_mag.calculate_batch(*columns)
+
+        return _with_backend(backend_name, run)
+
+    return setup
+
+
+def _single_precision(high_resolution, evaluator, columns):
+    """Time ``vectorized.calculate_batch`` summing the field in single precision (always with NumPy)."""
+
+    def setup():
+        # Inline imports to only require NumPy when this benchmark is run
+        from pygeomag import vectorized
+
+        geo_mag = GeoMag(
+            base_year=2025, high_resolution=high_resolution, evaluator=evaluator
+        )
+        geo_mag.preload()
+
+        def run():
+            vectorized.calculate_batch(geo_mag, *columns, dtype=numpy.float32)
+
+        return run
+
+    return setup
+
+
+def _track(high_resolution, count, max_error):
+    def setup():
+        geo_mag = GeoMag(base_year=2025, high_resolution=high_resolution)
+        geo_mag.warmup()
+        # A fix every second of a flight heading north east at about 250 m/s
+        points = [
+            (40.0 + index * 0.0016, -100.0 + index * 0.002, 10.0, 2027.5)
+            for index in range(count)
+        ]
+
+        def run():
+            geo_mag.calculate_track(points, max_error=max_error)
+
+        return _with_backend(backend.BACKEND_PYTHON, run)
+
+    return setup
+
+
+def _fixed_point(count):
+    """Time the fixed point engine of the standard model, see ``_point``."""
+
+    def setup():
+        # Inline imports as the tables are only used by this benchmark
+        from pygeomag.fixedpoint import FixedPointGeoMag
+        from pygeomag.wmm.wmm_2025_fixed import WMM_2025_FIXED
+
+        geo_mag = FixedPointGeoMag(WMM_2025_FIXED)
+        points = list(zip(*_random_points(count)))
+
+        def run():
+            for point in points:
+                geo_mag.calculate(*point)
+
+        return run
+
+    return setup
+
+
+def _server(backend_name, connections, requests):
+    """Serve the standard model in a thread and time single position requests over keep-alive connections."""
+
+    def setup():
+        # Inline imports to only start a server when this benchmark is run
+        from pygeomag.server import Server
+
+        server = Server([GeoMag(base_year=2025)], port=0)
+        started = threading.Event()
+
+        def serve():
+            async def start():
+                await server.start()
+                started.set()
+                await server.serve_forever()
+
+            asyncio.run(start())
+
+        threading.Thread(target=serve, daemon=True).start()
+        started.wait()
+
+        async def client(seed):
+            reader, writer = await asyncio.open_connection("127.0.0.1", server.port)
+            rng = random.Random(seed)
+            for _ in range(requests):
+                writer.write(
+                    f"GET /calculate?lat={rng.uniform(-90, 90)}&lon={rng.uniform(-180, 180)}&time=2027.5 HTTP/1.1"
+                    "\r\nHost: localhost\r\n\r\n".encode()
+                )
+                await writer.drain()
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+                await reader.readexactly(length)
+            writer.close()
+
+        async def clients():
+            await asyncio.gather(*(client(seed) for seed in range(connections)))
+
+        def run():
+            asyncio.run(clients())
+
+        _with_backend(backend_name, run)()
+        return _with_backend(backend_name, run)
+
+    return setup
+
+
+def _decimal_years(values):
+    """Time converting many dates to decimal years."""
+
+    def setup():
+        def run():
+            calculate_decimal_years(values, precise=True)
+
+        return run
+
+    return setup
+
+
+def _format(values, batch):
+    """Time formatting many declinations with seconds and 2 digits, one at a time or all at once."""
+
+    def setup():
+        def run():
+            if batch:
+                list(pretty_print_degrees_batch(values, False, True, False, 2))
+            else:
+                for value in values:
+                    pretty_print_degrees(value, False, True, False, 2)
+
+        return run
+
+    return setup
+
+
+for _filename in COEFFICIENTS_FILES:
+    register(f"load/file/{_filename}", _load_file(_filename))
+
+for _module_name in COEFFICIENTS_MODULES:
+    register(f"load/module/{_module_name}", _load_module(_module_name))
+
+_seconds = [1735689600 + index * 3153.6 for index in range(10000)]
+register("time/epoch/10000/list", _decimal_years(_seconds), 10000)
+if numpy is not None:
+    register("time/epoch/10000/array", _decimal_years(numpy.array(_seconds)), 10000)
+    register(
+        "time/datetime64/10000/array",
+        _decimal_years(
+            numpy.array(_seconds, dtype=numpy.int64).astype("datetime64[s]")
+        ),
+        10000,
+    )
+
+_degrees = [random.Random(0).uniform(-180, 180) for _ in range(10000)]
+register("format/10000/scalar", _format(_degrees, False), 10000)
+register("format/10000/list", _format(_degrees, True), 10000)
+if numpy is not None:
+    register("format/10000/array", _format(numpy.array(_degrees), True), 10000)
+
+if numpy is not None:
+    for _evaluator in ("legendre", "clenshaw"):
+        _glat, _glon = _grid(5)
+        register(
+            f"grid/standard/5deg/vectorized/float32/{_evaluator}",
+            _single_precision(
+                False, _evaluator, (numpy.array(_glat), numpy.array(_glon), 0.0, 2027.5)
+            ),
+            len(_glat),
+        )
+        _glat, _glon = _grid(30)
+        register(
+            f"grid/high_resolution/30deg/vectorized/float32/{_evaluator}",
+            _single_precision(
+                True, _evaluator, (numpy.array(_glat), numpy.array(_glon), 0.0, 2027.5)
+            ),
+            len(_glat),
+        )
+
+register("point/standard/fixed_point/python", _fixed_point(100), 100)
+
+for _is_high_resolution, _resolution, _count in (
+    (False, "standard", 1000),
+    (True, "high_resolution", 100),
+):
+    register(
+        f"track/{_resolution}/{_count}/python",
+        _track(_is_high_resolution, _count, None),
+        _count,
+    )
+    register(
+        f"track/{_resolution}/{_count}/interpolated/python",
+        _track(_is_high_resolution, _count, 0.01),
+        _count,
+    )
+
+for _backend_name in backend.available_backends():
+    for _evaluator in ("legendre", "clenshaw"):
+        register(
+            f"point/standard/{_evaluator}/{_backend_name}",
+            _point(False, _evaluator, _backend_name, 100),
+            100,
+        )
+        register(
+            f"point/high_resolution/{_evaluator}/{_backend_name}",
+            _point(True, _evaluator, _backend_name, 5),
+            5,
+        )
+        register(
+            f"point/standard/pole/{_evaluator}/{_backend_name}",
+            _point(False, _evaluator, _backend_name, 100, pole=True),
+            100,
+        )
+        register(
+            f"point/high_resolution/pole/{_evaluator}/{_backend_name}",
+            _point(True, _evaluator, _backend_name, 5, pole=True),
+            5,
+        )
+
+        _glat, _glon = _grid(5)
+        register(
+            f"grid/standard/5deg/{_evaluator}/{_backend_name}",
+            _batch(False, _evaluator, _backend_name, (_glat, _glon, 0.0, 2027.5)),
+            len(_glat),
+        )
+        _glat, _glon = _grid(30)
+        register(
+            f"grid/high_resolution/30deg/{_evaluator}/{_backend_name}",
+            _batch(True, _evaluator, _backend_name, (_glat, _glon, 0.0, 2027.5)),
+            len(_glat),
+        )
+
+        _columns = _random_points(1000)
+        register(
+            f"batch/standard/1000/{_evaluator}/{_backend_name}",
+            _batch(False, _evaluator, _backend_name, _columns),
+            1000,
+        )
+
+        if numpy is not None:
+            # The same columns as NumPy arrays, calculated by pygeomag.vectorized
+            _glat, _glon = _grid(5)
+            register(
+                f"grid/standard/5deg/vectorized/{_evaluator}/{_backend_name}",
+                _batch(
+                    False,
+                    _evaluator,
+                    _backend_name,
+                    (numpy.array(_glat), numpy.array(_glon), 0.0, 2027.5),
+                ),
+                len(_glat),
+            )
+            _glat, _glon = _grid(30)
+            register(
+                f"grid/high_resolution/30deg/vectorized/{_evaluator}/{_backend_name}",
+                _batch(
+                    True,
+                    _evaluator,
+                    _backend_name,
+                    (numpy.array(_glat), numpy.array(_glon), 0.0, 2027.5),
+                ),
+                len(_glat),
+            )
+            register(
+                f"batch/standard/1000/vectorized/{_evaluator}/{_backend_name}",
+                _batch(
+                    False,
+                    _evaluator,
+                    _backend_name,
+                    [numpy.array(column) for column in _columns],
+                ),
+                1000,
+            )
+
+    register(
+        f"server/calculate/200x20/{_backend_name}",
+        _server(_backend_name, 200, 20),
+        4000,
+    )
@@ -27,6 +27,9 @@ extensions = [
     "sphinx.ext.intersphinx",
 ]
 
+# Optional dependencies, so the modules using them can be documented without installing them
+autodoc_mock_imports = ["numba", "numpy", "pyarrow"]
+
 intersphinx_mapping = {
     "python": ("https://docs.python.org/3", None),
 }
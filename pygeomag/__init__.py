@@ -1,21 +1,35 @@
 from pygeomag.format import (
     decimal_degrees_to_degrees_minutes,
+    decimal_degrees_to_degrees_minutes_batch,
     decimal_degrees_to_degrees_minutes_seconds,
+    decimal_degrees_to_degrees_minutes_seconds_batch,
     degrees_minutes_seconds_to_decimal_degrees,
+    degrees_minutes_seconds_to_decimal_degrees_batch,
     degrees_minutes_to_decimal_degrees,
+    degrees_minutes_to_decimal_degrees_batch,
+    parse_degrees,
+    parse_degrees_batch,
     pretty_print_degrees,
+    pretty_print_degrees_batch,
     round_to_digits,
+    round_to_digits_batch,
 )
 from pygeomag.geomag import (
     BlackoutZoneException,
     CautionZoneException,
     GeoMag,
+    GeoMagBatchResult,
     GeoMagResult,
     GeoMagUncertaintyResult,
+    preload_models,
 )
+from pygeomag.instrumentation import instrument
 from pygeomag.time import (
     calculate_decimal_year,
+    calculate_decimal_years,
     decimal_year_from_date,
     decimal_year_from_struct_time,
+    decimal_years_from_datetime64,
+    decimal_years_from_epoch,
 )
 from pygeomag.util import __version__
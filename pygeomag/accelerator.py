@@ -0,0 +1,222 @@
+"""Numba compiled versions of the ``GeoMag`` evaluators.
+
+These are the same loops as ``GeoMag._calculate_legendre`` and ``GeoMag._calculate_clenshaw`` working on the same
+prepared coefficients, written so `Numba <https://numba.pydata.org/>`_ can compile them. Importing this module
+requires Numba, use ``pygeomag.backend`` to select it.
+"""
+
+from typing import List, Tuple
+
+import numba
+import numpy
+
+from pygeomag.geomag import EVALUATOR_CLENSHAW
+
+
+@numba.njit(cache=True)
+def legendre_field(c, k, maxord, r, ct, st, srlon, crlon, dt):  # noqa: PLR0913,PLR0915 - Too many arguments,Too many statements
+    """Compiled version of ``GeoMag._calculate_legendre``."""
+    size = (maxord + 1) * (maxord + 2) // 2
+    p = numpy.zeros(size)
+    dp = numpy.zeros(size)
+    sp = numpy.zeros(maxord + 1)
+    cp = numpy.zeros(maxord + 1)
+    pp = numpy.zeros(maxord + 1)
+
+    cp[0] = pp[0] = p[0] = 1.0
+    sp[1] = srlon
+    cp[1] = crlon
+    re = 6371.2
+
+    for m in range(2, maxord + 1):
+        sp[m] = sp[1] * cp[m - 1] + cp[1] * sp[m - 1]
+        cp[m] = cp[1] * cp[m - 1] - sp[1] * sp[m - 1]
+    aor = re / r
+    ar = aor * aor
+    br = bt = bp = bpp = 0.0
+    pole = st == 0.0
+    i = 0
+    for n in range(1, maxord + 1):
+        ar = ar * aor
+        fn = float(n + 1)
+
+        i += 1
+        p[i] = ct * p[i - n] - k[i] * p[i - 2 * n + 1]
+        dp[i] = ct * dp[i - n] - st * p[i - n] - k[i] * dp[i - 2 * n + 1]
+        j = 4 * i
+        gnm = c[j] + dt * c[j + 2]
+        par = ar * p[i]
+        bt = bt - ar * gnm * dp[i]
+        br += fn * gnm * par
+        for m in range(1, n):
+            i += 1
+            p[i] = ct * p[i - n] - k[i] * p[i - 2 * n + 1]
+            dp[i] = ct * dp[i - n] - st * p[i - n] - k[i] * dp[i - 2 * n + 1]
+            j = 4 * i
+            gnm = c[j] + dt * c[j + 2]
+            hnm = c[j + 1] + dt * c[j + 3]
+            par = ar * p[i]
+            temp1 = gnm * cp[m] + hnm * sp[m]
+            temp2 = gnm * sp[m] - hnm * cp[m]
+            bt = bt - ar * temp1 * dp[i]
+            bp += m * temp2 * par
+            br += fn * temp1 * par
+        i += 1
+        p[i] = st * p[i - n - 1]
+        dp[i] = st * dp[i - n - 1] + ct * p[i - n - 1]
+        j = 4 * i
+        gnm = c[j] + dt * c[j + 2]
+        hnm = c[j + 1] + dt * c[j + 3]
+        par = ar * p[i]
+        temp1 = gnm * cp[n] + hnm * sp[n]
+        temp2 = gnm * sp[n] - hnm * cp[n]
+        bt = bt - ar * temp1 * dp[i]
+        bp += n * temp2 * par
+        br += fn * temp1 * par
+
+        if pole:
+            i1 = i - n + 1
+            if n == 1:
+                pp[n] = pp[n - 1]
+            else:
+                pp[n] = ct * pp[n - 1] - k[i1] * pp[n - 2]
+            j = 4 * i1
+            gnm = c[j] + dt * c[j + 2]
+            hnm = c[j + 1] + dt * c[j + 3]
+            bpp += (gnm * sp[1] - hnm * cp[1]) * (ar * pp[n])
+
+    if pole:
+        bp = bpp
+    else:
+        bp /= st
+
+    return br, bt, bp
+
+
+@numba.njit(cache=True)
+def clenshaw_field(c, k, maxord, r, ct, st, srlon, crlon, dt):  # noqa: PLR0913,PLR0915 - Too many arguments,Too many statements
+    """Compiled version of ``GeoMag._calculate_clenshaw``."""
+    re = 6371.2
+
+    aor = re / r
+    ar = numpy.zeros(maxord + 1)
+    ar[0] = aor * aor
+    for n in range(1, maxord + 1):
+        ar[n] = ar[n - 1] * aor
+
+    alpha = 2.0 * st * crlon
+    beta = -st * st
+
+    za1 = za2 = zb1 = zb2 = zc1 = zc2 = zd1 = zd2 = ze1 = ze2 = zf1 = zf2 = 0.0
+
+    i = (maxord + 1) * (maxord + 2) // 2
+    for m in range(maxord, -1, -1):
+        yg1 = yg2 = yh1 = yh2 = rg1 = rg2 = rh1 = rh2 = 0.0
+        dg1 = dg2 = dh1 = dh2 = 0.0
+        for n in range(maxord, m - 1, -1):
+            i -= 1
+            an = k[2 * i]
+            bn = k[2 * i + 1]
+            at = an * ct
+
+            j = 4 * i
+            gnm = (c[j] + dt * c[j + 2]) * ar[n]
+            hnm = (c[j + 1] + dt * c[j + 3]) * ar[n]
+            fn = float(n + 1)
+
+            dg1, dg2 = an * yg1 + at * dg1 - bn * dg2, dg1
+            dh1, dh2 = an * yh1 + at * dh1 - bn * dh2, dh1
+            yg1, yg2 = gnm + at * yg1 - bn * yg2, yg1
+            yh1, yh2 = hnm + at * yh1 - bn * yh2, yh1
+            rg1, rg2 = fn * gnm + at * rg1 - bn * rg2, rg1
+            rh1, rh2 = fn * hnm + at * rh1 - bn * rh2, rh1
+
+        za1, za2 = rg1 + alpha * za1 + beta * za2, za1
+        zb1, zb2 = rh1 + alpha * zb1 + beta * zb2, zb1
+        zc1, zc2 = dg1 + alpha * zc1 + beta * zc2, zc1
+        zd1, zd2 = dh1 + alpha * zd1 + beta * zd2, zd1
+        if m > 0:
+            ze1, ze2 = m * yg1 + alpha * ze1 + beta * ze2, ze1
+            zf1, zf2 = m * yh1 + alpha * zf1 + beta * zf2, zf1
+
+    br = za1 - st * crlon * za2 + st * srlon * zb2
+    bt = -ct * (crlon * ze1 - st * ze2 + srlon * zf1) + st * (
+        zc1 - st * crlon * zc2 + st * srlon * zd2
+    )
+    bp = srlon * ze1 - crlon * zf1 + st * zf2
+
+    return br, bt, bp
+
+
+@numba.njit(cache=True)
+def legendre_field_batch(c, k, maxord, r, ct, st, srlon, crlon, dt, br, bt, bp):  # noqa: PLR0913 - Too many arguments
+    """Run ``legendre_field`` for every position, writing the results to ``br``, ``bt`` and ``bp``."""
+    for index in range(len(r)):
+        br[index], bt[index], bp[index] = legendre_field(
+            c,
+            k,
+            maxord,
+            r[index],
+            ct[index],
+            st[index],
+            srlon[index],
+            crlon[index],
+            dt[index],
+        )
+
+
+@numba.njit(cache=True)
+def clenshaw_field_batch(c, k, maxord, r, ct, st, srlon, crlon, dt, br, bt, bp):  # noqa: PLR0913 - Too many arguments
+    """Run ``clenshaw_field`` for every position, writing the results to ``br``, ``bt`` and ``bp``."""
+    for index in range(len(r)):
+        br[index], bt[index], bp[index] = clenshaw_field(
+            c,
+            k,
+            maxord,
+            r[index],
+            ct[index],
+            st[index],
+            srlon[index],
+            crlon[index],
+            dt[index],
+        )
+
+
+def calculate_field(  # noqa: PLR0913 - Too many arguments
+    evaluator: str,
+    maxord: int,
+    c: List,
+    k: List,
+    r: float,
+    ct: float,
+    st: float,
+    srlon: float,
+    crlon: float,
+    dt: float,
+) -> Tuple[float, float, float]:
+    """Calculate the spherical field components (br, bt, bp) with the compiled evaluator."""
+    if evaluator == EVALUATOR_CLENSHAW:
+        return clenshaw_field(c, k, maxord, r, ct, st, srlon, crlon, dt)
+    return legendre_field(c, k, maxord, r, ct, st, srlon, crlon, dt)
+
+
+def calculate_field_batch(  # noqa: PLR0913 - Too many arguments
+    evaluator: str,
+    maxord: int,
+    c: List,
+    k: List,
+    r: List,
+    ct: List,
+    st: List,
+    srlon: List,
+    crlon: List,
+    dt: List,
+    br: List,
+    bt: List,
+    bp: List,
+) -> None:
+    """Calculate the spherical field components for many positions with the compiled evaluator."""
+    if evaluator == EVALUATOR_CLENSHAW:
+        clenshaw_field_batch(c, k, maxord, r, ct, st, srlon, crlon, dt, br, bt, bp)
+    else:
+        legendre_field_batch(c, k, maxord, r, ct, st, srlon, crlon, dt, br, bt, bp)
@@ -0,0 +1,138 @@
+"""Select the engine ``GeoMag`` uses for the spherical harmonic summation.
+
+- ``python``: the reference implementation in ``pygeomag.geomag``, it works everywhere (including microcontrollers)
+- ``numba``: the same loops compiled with `Numba <https://numba.pydata.org/>`_, see ``pygeomag.accelerator``
+
+The fastest available backend is selected when ``pygeomag`` is imported, the ``PYGEOMAG_BACKEND`` environment variable
+can be used to override it (an unavailable backend is reported with a ``RuntimeWarning`` and the default is used). Both
+backends return the same values within 1e-9.
+
+The Numba kernels are compiled the first time they are called (about half a second, less once they are in the Numba
+cache), ``GeoMag.warmup`` (or ``preload_models``) pays this cost up front instead of on the first calculation.
+
+>>> from pygeomag import backend
+>>> backend.available_backends()[0]
+'python'
+"""
+
+import os
+import warnings
+from importlib.util import find_spec
+from typing import List, Tuple
+
+BACKEND_PYTHON = "python"
+BACKEND_NUMBA = "numba"
+
+_backend = BACKEND_PYTHON
+_numba_importable = None
+
+
+def _probe_numba() -> bool:
+    """Return True if Numba can be imported, a broken install is treated like a missing one."""
+    global _numba_importable  # noqa: PLW0603 - Using the global statement
+
+    if _numba_importable is None:
+        _numba_importable = False
+        if find_spec("numba") is not None:
+            try:
+                # Inline imports to only load Numba when it is installed
+                import numba  # noqa: F401
+            except Exception:  # noqa: BLE001 - Numba can fail with more than ImportError (e.g. a mismatched NumPy)
+                """Numba is installed but can not be used"""
+            else:
+                _numba_importable = True
+    return _numba_importable
+
+
+def available_backends() -> List[str]:
+    """Return the backends that can be used, the fastest last."""
+    backends = [BACKEND_PYTHON]
+    if _probe_numba():
+        backends.append(BACKEND_NUMBA)
+    return backends
+
+
+def get_backend() -> str:
+    """Return the name of the selected backend."""
+    return _backend
+
+
+def set_backend(name: str) -> None:
+    """Select the backend used by ``GeoMag``.
+
+    :param str name: One of ``available_backends()``
+    """
+    global _backend  # noqa: PLW0603 - Using the global statement
+
+    if name not in available_backends():
+        raise ValueError(f"Backend {name} is not available")
+    _backend = name
+
+
+def calculate_field(  # noqa: PLR0913 - Too many arguments
+    evaluator: str,
+    maxord: int,
+    c: List,
+    k: List,
+    r: float,
+    ct: float,
+    st: float,
+    srlon: float,
+    crlon: float,
+    dt: float,
+) -> Tuple[float, float, float]:
+    """Calculate the spherical field components (br, bt, bp) with the selected backend.
+
+    The arguments are the prepared coefficients from ``GeoMag._load_coefficients`` and the geocentric position.
+    """
+    # Inline imports to only load Numba when it is used
+    from pygeomag import accelerator
+
+    return accelerator.calculate_field(
+        evaluator, maxord, c, k, r, ct, st, srlon, crlon, dt
+    )
+
+
+def calculate_field_batch(  # noqa: PLR0913 - Too many arguments
+    evaluator: str,
+    maxord: int,
+    c: List,
+    k: List,
+    r: List,
+    ct: List,
+    st: List,
+    srlon: List,
+    crlon: List,
+    dt: List,
+    br: List,
+    bt: List,
+    bp: List,
+) -> None:
+    """Calculate the spherical field components for many positions with the selected backend.
+
+    The arguments are the same as ``calculate_field`` but columns, the results are written to ``br``, ``bt`` and
+    ``bp``.
+    """
+    # Inline imports to only load Numba when it is used
+    from pygeomag import accelerator
+
+    accelerator.calculate_field_batch(
+        evaluator, maxord, c, k, r, ct, st, srlon, crlon, dt, br, bt, bp
+    )
+
+
+def _select_default_backend() -> None:
+    """Select the ``PYGEOMAG_BACKEND`` backend if it is available, otherwise the fastest available one."""
+    default = available_backends()[-1]
+    name = os.environ.get("PYGEOMAG_BACKEND", default)
+    if name not in available_backends():
+        warnings.warn(
+            f"PYGEOMAG_BACKEND {name} is not available, using {default}",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+        name = default
+    set_backend(name)
+
+
+_select_default_backend()
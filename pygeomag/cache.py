@@ -0,0 +1,232 @@
+"""Cache the results of ``GeoMag.calculate`` for positions that are close to each other.
+
+Every position is snapped to a grid (``lat_resolution``, ``lon_resolution`` and ``alt_resolution`` and
+``time_resolution``), the result of the center of its grid cell is calculated once and returned for every position in
+that cell until it is evicted. With the default grid (0.01 degrees, 0.1 km and 1 day) the declination of 99% of the
+positions between 60 degrees South and North is within 0.01 degrees of the one calculated for the position itself
+(within 0.05 degrees for all of them), the difference grows near the magnetic poles. Grid cells don't extend past the
+geographic poles or across 55 degrees North and South (where the grid variation starts), a cell on such a boundary is
+split and the center of each part is calculated.
+
+>>> from pygeomag import GeoMag
+>>> from pygeomag.cache import ResultCache
+>>> cache = ResultCache(GeoMag(coefficients_file="wmm/WMM_2025.COF"))
+>>> first = cache.calculate(glat=47.6205, glon=-122.3493, alt=0, time=2025.25)
+>>> second = cache.calculate(glat=47.6214, glon=-122.3488, alt=0.01, time=2025.2501)
+>>> first is second, cache.hit_rate
+(True, 0.5)
+"""
+
+import sys
+import threading
+import time as _time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from pygeomag.geomag import GeoMag, GeoMagResult
+
+# The latitude bands the grid cells are split on: the antarctic and arctic (which have a grid variation) and between them
+LATITUDE_BANDS = {-1: (-90.0, -55.0), 0: (-55.0, 55.0), 1: (55.0, 90.0)}
+
+
+class ResultCache:
+    """A least recently used cache of ``GeoMagResult`` in front of a ``GeoMag`` instance.
+
+    :param GeoMag geo_mag: The model to calculate with
+    :param float lat_resolution: The size of a grid cell in latitude, in degrees
+    :param float lon_resolution: The size of a grid cell in longitude, in degrees
+    :param float alt_resolution: The size of a grid cell in altitude, in km
+    :param float time_resolution: The size of a grid cell in time, in decimal years
+    :param int max_entries: The maximum amount of cached results
+    :param int max_bytes: The maximum (estimated) memory used by the cached results, None for no limit
+    :param float ttl: Seconds a result is cached for, None to keep it until it is evicted
+    :param Callable clock: The clock used for ``ttl``, in seconds
+    """
+
+    def __init__(  # noqa: PLR0913 - Too many arguments
+        self,
+        geo_mag: GeoMag,
+        lat_resolution: float = 0.01,
+        lon_resolution: float = 0.01,
+        alt_resolution: float = 0.1,
+        time_resolution: float = 1.0 / 365.25,
+        max_entries: int = 100000,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[float] = None,
+        clock: Callable[[], float] = _time.monotonic,
+    ) -> None:
+        """Create a ResultCache instance."""
+        for name, resolution in (
+            ("lat_resolution", lat_resolution),
+            ("lon_resolution", lon_resolution),
+            ("alt_resolution", alt_resolution),
+            ("time_resolution", time_resolution),
+        ):
+            if resolution <= 0:
+                raise ValueError(f"{name} must be positive")
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+
+        self.geo_mag = geo_mag
+        self.lat_resolution = lat_resolution
+        self.lon_resolution = lon_resolution
+        self.alt_resolution = alt_resolution
+        self.time_resolution = time_resolution
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.clock = clock
+        self.hits = 0
+        """Calculations answered from the cache."""
+        self.misses = 0
+        """Calculations that were calculated by the model."""
+        self.evictions = 0
+        """Results removed to stay within ``max_entries`` and ``max_bytes``."""
+        self.expirations = 0
+        """Results removed because they were older than ``ttl``."""
+        self.bytes = 0
+        """The estimated memory used by the cached results."""
+        self._lock = threading.Lock()
+        self._entries: OrderedDict = OrderedDict()
+
+    def __len__(self) -> int:
+        """Return the amount of cached results."""
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of the calculations answered from the cache, 0.0 before the first one."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """Return the counters of the cache as a dict."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self.bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def clear(self) -> None:
+        """Remove every cached result, the counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def key(
+        self, glat: float, glon: float, alt: float, time: float
+    ) -> Tuple[int, int, int, int, int]:
+        """Return the grid cell of a position, and its latitude band (see ``LATITUDE_BANDS``)."""
+        if glat >= 55.0:  # noqa: PLR2004 Magic value used in comparison
+            band = 1
+        elif glat <= -55.0:  # noqa: PLR2004 Magic value used in comparison
+            band = -1
+        else:
+            band = 0
+        return (
+            round(glat / self.lat_resolution),
+            round(glon / self.lon_resolution),
+            round(alt / self.alt_resolution),
+            round(time / self.time_resolution),
+            band,
+        )
+
+    def center(
+        self, key: Tuple[int, int, int, int, int]
+    ) -> Tuple[float, float, float, float]:
+        """Return the position the result of a grid cell is calculated for.
+
+        The latitude is the middle of the part of the cell within its latitude band, so it is never past a pole or on
+        the other side of 55 degrees, and the longitude is wrapped to -180.00 to +180.00 degrees.
+        """
+        lower, upper = LATITUDE_BANDS[key[4]]
+        glat = key[0] * self.lat_resolution
+        low = (key[0] - 0.5) * self.lat_resolution
+        high = (key[0] + 0.5) * self.lat_resolution
+        if low < lower or high > upper:
+            glat = (max(lower, low) + min(upper, high)) / 2
+        glon = key[1] * self.lon_resolution
+        if not -180.0 <= glon <= 180.0:  # noqa: PLR2004 Magic value used in comparison
+            glon = (glon + 180.0) % 360.0 - 180.0
+        return (
+            glat,
+            glon,
+            key[2] * self.alt_resolution,
+            key[3] * self.time_resolution,
+        )
+
+    @classmethod
+    def _size(cls, key: Tuple, result: GeoMagResult) -> int:
+        """Estimate the memory used by an entry: the key, the result and its attributes."""
+        size = sys.getsizeof(key) + sum(sys.getsizeof(value) for value in key)
+        size += sys.getsizeof(result) + sys.getsizeof(result.__dict__)
+        return size + sum(sys.getsizeof(value) for value in result.__dict__.values())
+
+    def calculate(  # noqa: PLR0913 - Too many arguments
+        self,
+        glat: float,
+        glon: float,
+        alt: float,
+        time: float,
+        allow_date_outside_lifespan: bool = False,
+        raise_in_warning_zone: bool = False,
+    ) -> GeoMagResult:
+        """Return the result of the center of the grid cell of a position, see ``GeoMag.calculate``.
+
+        The returned result is shared by every position of the cell, and its ``glat``, ``glon``, ``alt`` and
+        ``time`` are the ones of the center of the cell. It must not be modified.
+        """
+        # The lifespan is checked for the position asked for, not the center of its cell
+        self.geo_mag._load_coefficients()
+        self.geo_mag._time_delta(time, allow_date_outside_lifespan)
+
+        key = self.key(glat, glon, alt, time)
+        now = self.clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and now - entry[1] > self.ttl:
+                self._remove(key)
+                self.expirations += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                result = entry[0]
+            else:
+                self.misses += 1
+
+        if entry is None:
+            result = self.geo_mag.calculate(
+                *self.center(key), allow_date_outside_lifespan=True
+            )
+            self._add(key, result, now)
+
+        if raise_in_warning_zone and (
+            result.in_blackout_zone or result.in_caution_zone
+        ):
+            # Calculating the extra values again raises the exception of the zone
+            result.calculate(raise_in_warning_zone)
+        return result
+
+    def _add(self, key: Tuple, result: GeoMagResult, now: float) -> None:
+        size = self._size(key, result)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (result, now, size)
+            self.bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None
+                and self.bytes > self.max_bytes
+                and len(self._entries) > 1
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: Tuple) -> None:
+        _, _, size = self._entries.pop(key)
+        self.bytes -= size
@@ -0,0 +1,326 @@
+r"""Command line tool to calculate the Magnetic Components for every row of a CSV or TSV file.
+
+Rows are read from a file (or stdin), calculated in chunks with ``GeoMag.calculate_batch`` and written (to a file or
+stdout) as soon as each chunk is done, so the memory used does not depend on the size of the input. The output has
+the columns of the input followed by the selected result columns. With NumPy installed the chunks are calculated by
+``pygeomag.vectorized`` (as in the example below), whose last digits can differ from ``GeoMag.calculate``.
+
+.. code-block:: bash
+
+    $ printf 'lat,lon,alt,time\n47.6205,-122.3493,0,2025.25\n' | pygeomag --columns d,i,f
+    lat,lon,alt,time,d,i,f
+    47.6205,-122.3493,0,2025.25,15.06562963851259,68.81958010064024,52767.09504054212
+
+The time column can hold decimal years or ISO 8601 dates (``2025-04-02`` or ``2025-04-02T12:00:00``), the time of the
+day is included and converted to UTC if it has a time zone.
+"""
+
+import argparse
+import csv
+import datetime
+import os
+import sys
+from collections import deque
+from typing import Iterator, List, Optional
+
+from pygeomag.geomag import GeoMag
+from pygeomag.time import decimal_year_from_date
+
+DELIMITERS = {"csv": ",", "tsv": "\t"}
+RESULT_COLUMNS = ("x", "y", "z", "h", "f", "i", "d", "gv")
+
+_worker_options = None
+_worker_geo_mag = None
+
+
+def create_geo_mag(
+    model: Optional[str], high_resolution: bool, evaluator: str
+) -> GeoMag:
+    """Create a GeoMag instance from the ``--model`` option.
+
+    :param str model: A year (``2020``) to select the model valid in that year, a path to a coefficients file or the
+        name of one of the coefficients files of this package (``WMM_2020.COF``), None for the latest model
+    :param bool high_resolution: use the high resolution dataset
+    :param str evaluator: ``"legendre"`` or ``"clenshaw"``
+    """
+    if model is None:
+        return GeoMag(high_resolution=high_resolution, evaluator=evaluator)
+    if model.isdigit():
+        return GeoMag(
+            base_year=int(model), high_resolution=high_resolution, evaluator=evaluator
+        )
+    if os.path.exists(model):
+        coefficients_file = os.path.abspath(model)
+    elif "/" in model or "\\" in model:
+        coefficients_file = model
+    else:
+        coefficients_file = f"wmm/{model}"
+    return GeoMag(
+        coefficients_file=coefficients_file,
+        high_resolution=high_resolution,
+        evaluator=evaluator,
+    )
+
+
+def parse_time(value: str) -> float:
+    """Parse a decimal year or an ISO 8601 date (and time of the day) to a decimal year."""
+    try:
+        return float(value)
+    except ValueError:
+        return decimal_year_from_date(
+            datetime.datetime.fromisoformat(value), precise=True
+        )
+
+
+def to_column(values: List[float]):
+    """Return values as a NumPy array if NumPy is installed, so ``GeoMag.calculate_batch`` uses ``pygeomag.vectorized``."""
+    try:
+        # Inline imports to only use NumPy when it is installed
+        import numpy
+    except ImportError:
+        return values
+    return numpy.array(values, dtype=float)
+
+
+def _column_index(header: List[str], name: str, required: bool) -> Optional[int]:
+    if name in header:
+        return header.index(name)
+    if required:
+        raise ValueError(f"Column {name} is not in the input")
+    return None
+
+
+def find_columns(options: argparse.Namespace, header: List[str]) -> None:
+    """Find the indexes of the input columns in the header, altitude and time are optional if given as options."""
+    options.lat_index = _column_index(header, options.lat_column, True)
+    options.lon_index = _column_index(header, options.lon_column, True)
+    options.alt_index = _column_index(header, options.alt_column, options.alt is None)
+    options.time_index = _column_index(
+        header, options.time_column, options.time is None
+    )
+
+
+def calculate_chunk(
+    geo_mag: GeoMag, options: argparse.Namespace, rows: List[List[str]]
+) -> List[List]:
+    """Calculate the Magnetic Components of a chunk of rows and return the rows extended with the result columns."""
+    lat = options.lat_index
+    lon = options.lon_index
+    alt = options.alt_index
+    time = options.time_index
+
+    glat = to_column([float(row[lat]) for row in rows])
+    glon = to_column([float(row[lon]) for row in rows])
+    if alt is None:
+        galt = float(options.alt)
+    else:
+        galt = to_column([float(row[alt]) for row in rows])
+    if time is None:
+        gtime = parse_time(options.time)
+    else:
+        gtime = to_column([parse_time(row[time]) for row in rows])
+
+    result = geo_mag.calculate_batch(
+        glat, glon, galt, gtime, options.allow_date_outside_lifespan
+    )
+    columns = []
+    for name in options.columns:
+        column = getattr(result, name)
+        # NumPy columns are written as Python floats, like the columns of the Python engine
+        columns.append(column.tolist() if hasattr(column, "tolist") else column)
+    return [
+        row + [column[index] for column in columns] for index, row in enumerate(rows)
+    ]
+
+
+def _initialize_worker(options: argparse.Namespace) -> None:
+    global _worker_options, _worker_geo_mag  # noqa: PLW0603 - Using the global statement
+
+    _worker_options = options
+    _worker_geo_mag = create_geo_mag(
+        options.model, options.high_resolution, options.evaluator
+    )
+
+
+def _calculate_worker_chunk(rows: List[List[str]]) -> List[List]:
+    return calculate_chunk(_worker_geo_mag, _worker_options, rows)
+
+
+def read_chunks(
+    reader: Iterator[List[str]], chunk_size: int
+) -> Iterator[List[List[str]]]:
+    """Group the rows of a reader into lists of at most chunk_size rows."""
+    chunk = []
+    for row in reader:
+        if not row:
+            continue
+        chunk.append(row)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def calculate_chunks(
+    options: argparse.Namespace, chunks: Iterator[List[List[str]]]
+) -> Iterator[List[List]]:
+    """Calculate the chunks in order, in this process or in ``options.workers`` processes.
+
+    At most 2 chunks per worker are queued at a time, to bound the memory used.
+    """
+    if options.workers <= 1:
+        geo_mag = create_geo_mag(
+            options.model, options.high_resolution, options.evaluator
+        )
+        for chunk in chunks:
+            yield calculate_chunk(geo_mag, options, chunk)
+        return
+
+    # Inline imports to only start processes when they are used
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(
+        options.workers, initializer=_initialize_worker, initargs=(options,)
+    ) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(_calculate_worker_chunk, chunk))
+            if len(pending) >= 2 * options.workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the parser of the command line options."""
+    parser = argparse.ArgumentParser(
+        prog="pygeomag",
+        description="Calculate the Magnetic Components for every row of a CSV or TSV file.",
+    )
+    parser.add_argument(
+        "input", nargs="?", default="-", help="input file (default: stdin)"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="output file (default: stdout)"
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(DELIMITERS),
+        default="csv",
+        help="input and output format",
+    )
+    parser.add_argument(
+        "--lat-column", default="lat", help="name of the latitude column (default: lat)"
+    )
+    parser.add_argument(
+        "--lon-column",
+        default="lon",
+        help="name of the longitude column (default: lon)",
+    )
+    parser.add_argument(
+        "--alt-column",
+        default="alt",
+        help="name of the altitude (km) column (default: alt)",
+    )
+    parser.add_argument(
+        "--time-column",
+        default="time",
+        help="name of the decimal year or date column (default: time)",
+    )
+    parser.add_argument(
+        "--alt", help="altitude (km) to use when there is no altitude column"
+    )
+    parser.add_argument(
+        "--time", help="decimal year or date to use when there is no time column"
+    )
+    parser.add_argument(
+        "--columns",
+        default=",".join(RESULT_COLUMNS),
+        help=f"comma separated result columns to add (default: {','.join(RESULT_COLUMNS)})",
+    )
+    parser.add_argument(
+        "--model",
+        help="year, coefficients file or name of a bundled coefficients file (WMM_2020.COF)",
+    )
+    parser.add_argument(
+        "--high-resolution", action="store_true", help="use the high resolution model"
+    )
+    parser.add_argument(
+        "--evaluator", choices=("legendre", "clenshaw"), default="legendre"
+    )
+    parser.add_argument("--allow-date-outside-lifespan", action="store_true")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=10000,
+        help="rows calculated at a time (default: 10000)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="processes used to calculate (default: 1)",
+    )
+    return parser
+
+
+def run(options: argparse.Namespace, input_file, output_file) -> None:
+    """Read the rows from input_file, calculate them and write them to output_file."""
+    delimiter = DELIMITERS[options.format]
+    reader = csv.reader(input_file, delimiter=delimiter)
+    writer = csv.writer(output_file, delimiter=delimiter, lineterminator="\n")
+
+    header = next(reader, None)
+    if header is None:
+        raise ValueError("The input is empty")
+    find_columns(options, header)
+    writer.writerow(header + options.columns)
+
+    for chunk in calculate_chunks(options, read_chunks(reader, options.chunk_size)):
+        writer.writerows(chunk)
+        output_file.flush()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of the ``pygeomag`` command."""
+    parser = create_parser()
+    options = parser.parse_args(argv)
+    options.columns = [column.strip() for column in options.columns.split(",")]
+    for column in options.columns:
+        if column not in RESULT_COLUMNS:
+            parser.error(
+                f"Unknown column {column}, choose from {','.join(RESULT_COLUMNS)}"
+            )
+    if options.chunk_size < 1 or options.workers < 1:
+        parser.error("--chunk-size and --workers must be at least 1")
+
+    input_file = output_file = None
+    try:
+        input_file = (
+            sys.stdin if options.input == "-" else open(options.input, newline="")
+        )
+        output_file = (
+            sys.stdout
+            if options.output == "-"
+            else open(options.output, "w", newline="")
+        )
+        run(options, input_file, output_file)
+    except (OSError, ValueError) as error:
+        print(f"pygeomag: error: {error}", file=sys.stderr)
+        return 1
+    except IndexError:
+        print(
+            "pygeomag: error: A row has fewer columns than the header", file=sys.stderr
+        )
+        return 1
+    finally:
+        if input_file not in (None, sys.stdin):
+            input_file.close()
+        if output_file not in (None, sys.stdout):
+            output_file.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+"""Calculate the Magnetic Components of positions stored in columnar files, without creating an object per row.
+
+Supported files (for input and output):
+
+- a directory of ``.npy`` files, one per column named after it (``lat.npy``), which are memory-mapped
+- a ``.npz`` file, every input column is read as a whole and the output columns are kept in memory until it is written
+- a ``.parquet`` file, read and written one chunk at a time, this requires `pyarrow <https://arrow.apache.org/>`_
+
+The positions are calculated in chunks of ``chunk_size`` rows by ``pygeomag.vectorized``, by default as many as fit in
+about 64 MB (about 25000 rows of the standard model, 2500 of the high resolution model). Importing this module
+requires `NumPy <https://numpy.org/>`_.
+
+.. code-block:: python
+
+    from pygeomag import GeoMag
+    from pygeomag.columnar import calculate_file
+
+    # positions.parquet has lat, lon, alt and time columns, fields/ will hold d.npy, i.npy and f.npy
+    geo_mag = GeoMag(coefficients_file="wmm/WMM_2025.COF")
+    rows = calculate_file(geo_mag, "positions.parquet", "fields", columns=("d", "i", "f"))
+"""
+
+import os
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy
+
+from pygeomag import vectorized
+from pygeomag.geomag import GeoMag
+
+RESULT_COLUMNS = ("x", "y", "z", "h", "f", "i", "d", "gv")
+
+
+def _format(path: str) -> str:
+    if path.endswith(".npz"):
+        return "npz"
+    if path.endswith(".parquet"):
+        return "parquet"
+    return "npy"
+
+
+def read_columns(
+    path: str, names: Sequence[str], chunk_size: int
+) -> Tuple[int, Iterator[Dict[str, numpy.ndarray]]]:
+    """Read the columns of a file in chunks.
+
+    :param str path: A directory of ``.npy`` files, a ``.npz`` file or a ``.parquet`` file
+    :param Sequence[str] names: The columns to read
+    :param int chunk_size: Maximum amount of rows in every chunk
+    :return: The amount of rows and an iterator of ``{name: column}`` chunks
+    """
+    file_format = _format(path)
+    if file_format == "parquet":
+        # Inline imports to only require pyarrow for Parquet files
+        import pyarrow.parquet
+
+        parquet_file = pyarrow.parquet.ParquetFile(path)
+        missing = [
+            name for name in names if name not in parquet_file.schema_arrow.names
+        ]
+        if missing:
+            raise ValueError(f"Column {missing[0]} is not in the input")
+
+        def parquet_chunks() -> Iterator[Dict[str, numpy.ndarray]]:
+            for batch in parquet_file.iter_batches(
+                batch_size=chunk_size, columns=list(names)
+            ):
+                yield {
+                    name: batch.column(name).to_numpy(zero_copy_only=False)
+                    for name in names
+                }
+
+        return parquet_file.metadata.num_rows, parquet_chunks()
+
+    if file_format == "npz":
+        with numpy.load(path) as npz_file:
+            missing = [name for name in names if name not in npz_file.files]
+            if missing:
+                raise ValueError(f"Column {missing[0]} is not in the input")
+            columns = {name: npz_file[name] for name in names}
+    else:
+        columns = {}
+        for name in names:
+            filename = os.path.join(path, f"{name}.npy")
+            if not os.path.exists(filename):
+                raise ValueError(f"Column {name} is not in the input")
+            columns[name] = numpy.load(filename, mmap_mode="r")
+
+    rows = len(next(iter(columns.values()))) if columns else 0
+    for column in columns.values():
+        if len(column) != rows:
+            raise ValueError("All columns must have the same length")
+
+    def array_chunks() -> Iterator[Dict[str, numpy.ndarray]]:
+        for start in range(0, rows, chunk_size):
+            yield {
+                name: column[start : start + chunk_size]
+                for name, column in columns.items()
+            }
+
+    return rows, array_chunks()
+
+
+class ColumnWriter:
+    """Write columns to a file one chunk at a time, see ``write_columns``."""
+
+    def __init__(self, path: str, names: Sequence[str], rows: int) -> None:
+        """Create the output file for rows rows of the columns names."""
+        self.path = path
+        self.names = list(names)
+        self.format = _format(path)
+        self.position = 0
+        self._writer = None
+        self._columns = {}
+        if self.format == "npy":
+            os.makedirs(path, exist_ok=True)
+            for name in self.names:
+                self._columns[name] = numpy.lib.format.open_memmap(
+                    os.path.join(path, f"{name}.npy"),
+                    mode="w+",
+                    dtype=numpy.float64,
+                    shape=(rows,),
+                )
+        elif self.format == "npz":
+            for name in self.names:
+                self._columns[name] = numpy.empty(rows)
+
+    def write(self, chunk: Dict[str, numpy.ndarray]) -> None:
+        """Write the next chunk of ``{name: column}``."""
+        if self.format == "parquet":
+            # Inline imports to only require pyarrow for Parquet files
+            import pyarrow
+            import pyarrow.parquet
+
+            table = pyarrow.table({name: chunk[name] for name in self.names})
+            if self._writer is None:
+                self._writer = pyarrow.parquet.ParquetWriter(self.path, table.schema)
+            self._writer.write_table(table)
+            return
+
+        end = self.position + len(chunk[self.names[0]])
+        for name in self.names:
+            self._columns[name][self.position : end] = chunk[name]
+        self.position = end
+
+    def close(self) -> None:
+        """Finish writing the file."""
+        if self.format == "parquet":
+            if self._writer is not None:
+                self._writer.close()
+        elif self.format == "npz":
+            numpy.savez(self.path, **self._columns)
+        else:
+            for column in self._columns.values():
+                column.flush()
+        self._columns = {}
+
+
+def write_columns(path: str, columns: Dict[str, numpy.ndarray]) -> None:
+    """Write whole columns to a directory of ``.npy`` files, a ``.npz`` file or a ``.parquet`` file."""
+    names = list(columns)
+    writer = ColumnWriter(path, names, len(columns[names[0]]))
+    writer.write(columns)
+    writer.close()
+
+
+def calculate_file(  # noqa: PLR0913 - Too many arguments
+    geo_mag: GeoMag,
+    input_path: str,
+    output_path: str,
+    columns: Sequence[str] = RESULT_COLUMNS,
+    lat_column: str = "lat",
+    lon_column: str = "lon",
+    alt_column: str = "alt",
+    time_column: str = "time",
+    alt: Optional[float] = None,
+    time: Optional[float] = None,
+    allow_date_outside_lifespan: bool = False,
+    chunk_size: Optional[int] = None,
+    dtype=numpy.float64,
+) -> int:
+    """Calculate the Magnetic Components of every row of a columnar file and write the result columns to another.
+
+    :param GeoMag geo_mag: The model to calculate with
+    :param str input_path: A directory of ``.npy`` files, a ``.npz`` file or a ``.parquet`` file
+    :param str output_path: A directory (for ``.npy`` files), a ``.npz`` file or a ``.parquet`` file
+    :param Sequence[str] columns: The result columns to write
+    :param str lat_column: The name of the latitude column
+    :param str lon_column: The name of the longitude column
+    :param str alt_column: The name of the altitude (km) column
+    :param str time_column: The name of the time (decimal year) column
+    :param float alt: The altitude (km) to use instead of a column
+    :param float time: The time (decimal year) to use instead of a column
+    :param bool allow_date_outside_lifespan: True, if you want an estimation outside the 5-year life span
+    :param int chunk_size: The amount of rows calculated at a time, None to size them from the degree of the model
+        with ``vectorized.rows_per_chunk``
+    :param dtype: ``numpy.float32`` to sum the field in single precision, see ``vectorized.calculate_batch``
+    :return: The amount of rows calculated
+    """
+    for column in columns:
+        if column not in RESULT_COLUMNS:
+            raise ValueError(f"Unknown column {column}")
+    names: List[str] = [lat_column, lon_column]
+    if alt is None:
+        names.append(alt_column)
+    if time is None:
+        names.append(time_column)
+
+    if chunk_size is None:
+        chunk_size = vectorized.rows_per_chunk(geo_mag, dtype=dtype)
+    rows, chunks = read_columns(input_path, names, chunk_size)
+    writer = ColumnWriter(output_path, columns, rows)
+    try:
+        for chunk in chunks:
+            result = vectorized.calculate_batch(
+                geo_mag,
+                chunk[lat_column],
+                chunk[lon_column],
+                chunk[alt_column] if alt is None else alt,
+                chunk[time_column] if time is None else time,
+                allow_date_outside_lifespan,
+                dtype,
+            )
+            writer.write({column: getattr(result, column) for column in columns})
+    finally:
+        writer.close()
+    return rows
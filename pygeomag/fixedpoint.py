@@ -0,0 +1,525 @@
+"""Fixed point (scaled integer) engine for the standard models, for microcontrollers without a floating point unit.
+
+``FixedPointGeoMag`` calculates the same values as ``GeoMag.calculate`` but with integer arithmetic only: the
+trigonometric functions are calculated with CORDIC, the square roots with Newton's method and the field is summed
+from integer tables of the coefficients and of the Schmidt normalized Legendre recursion constants. Only converting
+the arguments to integers and the result to floats uses floating point, about 20 operations instead of thousands.
+
+.. code-block:: python
+
+    from pygeomag.fixedpoint import FixedPointGeoMag
+    from pygeomag.wmm.wmm_2025_fixed import WMM_2025_FIXED
+
+    geo_mag = FixedPointGeoMag(WMM_2025_FIXED)
+    result = geo_mag.calculate(glat=47.6205, glon=-122.3493, alt=0, time=2025.25)
+    result.d  # 15.06562567... (15.06562963... with GeoMag)
+
+The tables of the bundled standard models are in ``pygeomag/wmm/wmm_*_fixed.py``, ``python -m pygeomag.fixedpoint``
+generates them again (or for other coefficients modules).
+
+Scales of the integers:
+
+- angles are radians, and trigonometric values, lengths (in equatorial radii) and times (in years) are scaled by
+  ``2 ** 30``
+- the Legendre functions and their recursion constants are scaled by ``2 ** 28``
+- the coefficients and the field components are in pT (0.001 nT), the sums of the field keep 6 more bits
+
+Every product of the calculation stays below ``2 ** 63``, so it can be ported as is to 64 bit integer arithmetic. In
+MicroPython and CircuitPython the products are long integers. With CPython, which has a floating point unit to use,
+it is about 4 times slower than ``GeoMag``.
+
+Compared to ``GeoMag.calculate`` for the bundled models (a 2 degree grid at -1, 0, 425 and 850 km, at the start,
+middle and end of the life span of the model), the maximum differences are:
+
+==========  ==========  ===========  ==========================================
+x, y, z     h, f        i            d (outside of 89 degrees latitude)
+==========  ==========  ===========  ==========================================
+0.0042 nT   0.0038 nT   0.0000071°   0.000075° (0.0057° where h < 2000 nT)
+==========  ==========  ===========  ==========================================
+"""
+
+import sys
+
+if not sys.implementation.name == "circuitpython":
+    from typing import List, Optional, Tuple
+
+try:
+    from pygeomag.geomag import WMM_SIZE_STANDARD, GeoMag, GeoMagResult
+except ImportError:
+    """A copy of this file next to geomag.py on a microcontroller imports it from there"""
+    from geomag import WMM_SIZE_STANDARD, GeoMag, GeoMagResult
+
+SHIFT = 30
+ONE = 1 << SHIFT
+HALF = 1 << (SHIFT - 1)
+LEGENDRE_SHIFT = 28
+LEGENDRE_ONE = 1 << LEGENDRE_SHIFT
+LEGENDRE_HALF = 1 << (LEGENDRE_SHIFT - 1)
+# Fractional bits kept in the field sums, in pT
+FIELD_SHIFT = 6
+
+PI = 3373259426
+HALF_PI = 1686629713
+TWO_PI = 6746518852
+
+# atan(2 ** -i) and the gain of the 30 CORDIC iterations
+CORDIC_ANGLES = (
+    843314857,
+    497837829,
+    263043837,
+    133525159,
+    67021687,
+    33543516,
+    16775851,
+    8388437,
+    4194283,
+    2097149,
+    1048576,
+    524288,
+    262144,
+    131072,
+    65536,
+    32768,
+    16384,
+    8192,
+    4096,
+    2048,
+    1024,
+    512,
+    256,
+    128,
+    64,
+    32,
+    16,
+    8,
+    4,
+    2,
+)
+CORDIC_GAIN = 652032874
+
+# WGS 84 ellipsoid, in equatorial radii: b ** 2, a ** 2 - b ** 2, a ** 4 - b ** 4 and the geomagnetic reference radius
+B2 = 1066553788
+C2 = 7188036
+C4 = 14327952
+RADIUS = 1072573999
+
+# Coefficients modules of pygeomag.wmm the tables are generated for
+FIXED_POINT_MODULES = ("wmm_2010", "wmm_2015", "wmm_2015v2", "wmm_2020", "wmm_2025")
+
+# Conversions of the arguments and of the results
+DEGREE = 18740330.14516947
+KILOMETER = 168347.24998851545
+RADIAN_DEGREES = 5.336085289072462e-08
+
+
+def isqrt(value: int) -> int:
+    """Return the integer square root of value (0 for negative values)."""
+    if value <= 0:
+        return 0
+    # Start from a power of two above the root, Newton's method then decreases to it
+    root = 1
+    rest = value
+    while rest > 0:
+        rest >>= 2
+        root <<= 1
+    while True:
+        following = (root + value // root) >> 1
+        if following >= root:
+            return root
+        root = following
+
+
+def sqrt(value: int) -> int:
+    """Return the square root of a value scaled by ``2 ** 30``."""
+    return isqrt(value << SHIFT)
+
+
+def sin_cos(angle: int) -> Tuple[int, int]:
+    """Return the sine and cosine of an angle in radians, all scaled by ``2 ** 30``."""
+    while angle > PI:
+        angle -= TWO_PI
+    while angle < -PI:
+        angle += TWO_PI
+    flip = False
+    if angle > HALF_PI:
+        angle = PI - angle
+        flip = True
+    elif angle < -HALF_PI:
+        angle = -PI - angle
+        flip = True
+
+    x = CORDIC_GAIN
+    y = 0
+    shift = 0
+    for step in CORDIC_ANGLES:
+        if angle >= 0:
+            x, y = x - (y >> shift), y + (x >> shift)
+            angle -= step
+        else:
+            x, y = x + (y >> shift), y - (x >> shift)
+            angle += step
+        shift += 1
+    return y, -x if flip else x
+
+
+def atan2(y: int, x: int) -> int:
+    """Return the angle of the vector (x, y) in radians scaled by ``2 ** 30``, x and y can have any scale."""
+    if x == 0 and y == 0:
+        return 0
+    angle = 0
+    if x < 0:
+        angle = PI if y >= 0 else -PI
+        x = -x
+        y = -y
+
+    # Use 29 bits for the largest coordinate, the iterations grow the vector by 1.65
+    largest = x if x > abs(y) else abs(y)
+    while largest >= ONE >> 1:
+        x >>= 1
+        y >>= 1
+        largest >>= 1
+    while largest < ONE >> 2:
+        x <<= 1
+        y <<= 1
+        largest <<= 1
+
+    shift = 0
+    for step in CORDIC_ANGLES:
+        if y > 0:
+            x, y = x + (y >> shift), y - (x >> shift)
+            angle += step
+        else:
+            x, y = x - (y >> shift), y + (x >> shift)
+            angle -= step
+        shift += 1
+    return angle
+
+
+class FixedPointGeoMag:
+    """Calculate the Magnetic Components of a standard model with integer arithmetic, see ``GeoMag.calculate``.
+
+    :param Tuple tables: The tables of a model, from a ``pygeomag/wmm/wmm_*_fixed.py`` module or ``generate_tables``
+    """
+
+    def __init__(self, tables: Tuple) -> None:
+        """Create a FixedPointGeoMag instance."""
+        (epoch, model, release_date, maxord), c, k = tables
+        self._epoch = epoch
+        self._model = model
+        self._release_date = release_date
+        self._maxord = maxord
+        self._c = c
+        self._k = k
+
+    @property
+    def model(self) -> str:
+        """The name of the model."""
+        return self._model
+
+    @property
+    def release_date(self) -> str:
+        """The release date of the model."""
+        return self._release_date
+
+    def calculate(  # noqa: PLR0913 - Too many arguments
+        self,
+        glat: float,
+        glon: float,
+        alt: float,
+        time: float,
+        allow_date_outside_lifespan: bool = False,
+        raise_in_warning_zone: bool = False,
+    ) -> GeoMagResult:
+        """Calculate the Magnetic Components from a latitude, longitude, altitude and date, see ``GeoMag.calculate``.
+
+        :param float glat: Geodetic Latitude, -90.00 to +90.00 degrees (North positive, South negative)
+        :param float glon: Geodetic Longitude, -180.00 to +180.00 degrees (East positive, West negative)
+        :param float alt: Altitude, -1 to 850km referenced to the WGS 84 ellipsoid OR the Mean Sea Level (MSL)
+        :param float time: Time (in decimal year)
+        :param bool allow_date_outside_lifespan: True, if you want an estimation outside the 5-year life span
+        :param bool raise_in_warning_zone: True if you want to raise a BlackoutZoneException or CautionZoneException
+            exception when the horizontal intensity is < 6000
+        :return: A GeoMagResult object
+        """
+        dt = time - self._epoch
+        if (dt < 0.0 or dt > 5.0) and not allow_date_outside_lifespan:  # noqa: PLR2004 Magic value used in comparison
+            raise ValueError("Time extends beyond model 5-year life span")
+
+        x, y, z, h, f, d, i = self.calculate_fixed(
+            int(glat * DEGREE), int(glon * DEGREE), int(alt * KILOMETER), int(dt * ONE)
+        )
+
+        result = GeoMagResult(time, alt, glat, glon)
+        result.x = x / 1000.0
+        result.y = y / 1000.0
+        result.z = z / 1000.0
+        result.h = h / 1000.0
+        result.f = f / 1000.0
+        result.d = d * RADIAN_DEGREES
+        result.i = i * RADIAN_DEGREES
+        result.gv = GeoMag._grid_variation(glat, glon, result.d)
+        result.check_zones(raise_in_warning_zone)
+        return result
+
+    def calculate_fixed(
+        self, lat: int, lon: int, alt: int, dt: int
+    ) -> Tuple[int, int, int, int, int, int, int]:
+        """Calculate the Magnetic Components from integer arguments.
+
+        :param int lat: Geodetic Latitude, in radians scaled by ``2 ** 30``
+        :param int lon: Geodetic Longitude, in radians scaled by ``2 ** 30``
+        :param int alt: Altitude, in equatorial radii (6378.137 km) scaled by ``2 ** 30``
+        :param int dt: Time since the epoch of the model, in years scaled by ``2 ** 30``
+        :return: x, y, z, h and f in pT, d and i in radians scaled by ``2 ** 30``
+        """
+        r, ct, st, srlon, crlon, ca, sa = self._geodetic_to_spherical(lat, lon, alt)
+        br, bt, bp = self._calculate_field(r, ct, st, srlon, crlon, dt)
+
+        # ROTATE MAGNETIC VECTOR COMPONENTS FROM SPHERICAL TO
+        # GEODETIC COORDINATES
+        half = 1 << (FIELD_SHIFT - 1)
+        bx = (-(bt * ca + br * sa) + (half << SHIFT)) >> (SHIFT + FIELD_SHIFT)
+        by = (bp + half) >> FIELD_SHIFT
+        bz = ((bt * sa - br * ca) + (half << SHIFT)) >> (SHIFT + FIELD_SHIFT)
+
+        bh = isqrt(bx * bx + by * by)
+        bf = isqrt(bh * bh + bz * bz)
+        return bx, by, bz, bh, bf, atan2(by, bx), atan2(bz, bh)
+
+    @classmethod
+    def _geodetic_to_spherical(
+        cls, lat: int, lon: int, alt: int
+    ) -> Tuple[int, int, int, int, int, int, int]:
+        """Convert a geodetic position to geocentric spherical coordinates, see ``GeoMag._geodetic_to_spherical``.
+
+        :return: r in equatorial radii, the others are scaled by ``2 ** 30``
+        """
+        srlat, crlat = sin_cos(lat)
+        srlon, crlon = sin_cos(lon)
+        srlat2 = srlat * srlat >> SHIFT
+        crlat2 = crlat * crlat >> SHIFT
+
+        q = sqrt(ONE - (C2 * srlat2 >> SHIFT))
+        q1 = alt * q >> SHIFT
+        ratio = ((q1 + ONE) << SHIFT) // (q1 + B2)
+        norm = sqrt((((ratio * ratio) >> SHIFT) * crlat2 >> SHIFT) + srlat2)
+        ct = (srlat << SHIFT) // norm
+        # sin(theta) from the same ratio as cos(theta), instead of sqrt(1 - ct * ct) which loses precision at the poles
+        st = (ratio * crlat) // norm
+        r2 = (
+            (alt * alt >> SHIFT)
+            + 2 * q1
+            + (((ONE - (C4 * srlat2 >> SHIFT)) << SHIFT) // (q * q >> SHIFT))
+        )
+        r = sqrt(r2)
+        d = sqrt(crlat2 + (B2 * srlat2 >> SHIFT))
+        ca = ((alt + d) << SHIFT) // r
+        sa = ((C2 * crlat >> SHIFT) * srlat) // (r * d >> SHIFT)
+        return r, ct, st, srlon, crlon, ca, sa
+
+    def _calculate_field(  # noqa: PLR0912,PLR0913,PLR0915 - Too many branches,Too many arguments,Too many statements
+        self, r: int, ct: int, st: int, srlon: int, crlon: int, dt: int
+    ) -> Tuple[int, int, int]:
+        """Sum the field in spherical coordinates, order by order.
+
+        The Schmidt normalized functions ``P(n, m)``, their derivative ``dP(n, m)`` and ``S(n, m) = P(n, m) / sin(theta)``
+        (for ``m > 0``, so the phi component needs no division at the poles) follow the recursions of degree:
+
+        - ``P(n, m) = a(n, m) * cos(theta) * P(n - 1, m) - b(n, m) * P(n - 2, m)`` (and the same for ``S``)
+        - ``dP(n, m) = a(n, m) * (cos(theta) * dP(n - 1, m) - sin(theta) * P(n - 1, m)) - b(n, m) * dP(n - 2, m)``
+
+        starting from the sectoral values ``P(m, m) = e(m) * sin(theta) * P(m - 1, m - 1)``.
+
+        :return: The radial, theta and phi components (br, bt, bp), in pT scaled by ``2 ** 4``
+        """
+        maxord = self._maxord
+        c = self._c
+        k = self._k
+        product_shift = SHIFT - FIELD_SHIFT
+        legendre_trig_shift = SHIFT + SHIFT - LEGENDRE_SHIFT
+
+        cp: List[int] = [ONE, crlon]
+        sp: List[int] = [0, srlon]
+        for m in range(2, maxord + 1):
+            sp.append((srlon * cp[m - 1] + crlon * sp[m - 1]) >> SHIFT)
+            cp.append((crlon * cp[m - 1] - srlon * sp[m - 1]) >> SHIFT)
+
+        # (a / r) ** (n + 2) of every degree
+        aor = (RADIUS << SHIFT) // r
+        power = aor * aor >> SHIFT
+        ar = [0] * (maxord + 1)
+        for n in range(1, maxord + 1):
+            power = power * aor >> SHIFT
+            ar[n] = power
+
+        br = 0
+        bt = 0
+        bp = 0
+        ct_legendre = ct >> (SHIFT - LEGENDRE_SHIFT)
+        st_legendre = st >> (SHIFT - LEGENDRE_SHIFT)
+        sectoral_s = sectoral_p = sectoral_dp = 0
+        for m in range(maxord + 1):
+            diagonal = m * (m + 1) // 2 + m
+            if m == 0:
+                s = p = LEGENDRE_ONE
+                dp = 0
+            else:
+                e = k[diagonal][0]
+                s = (
+                    LEGENDRE_ONE
+                    if m == 1
+                    else e * (st * sectoral_s >> SHIFT) >> LEGENDRE_SHIFT
+                )
+                p = st * s >> SHIFT
+                if m == 1:
+                    dp = ct_legendre
+                else:
+                    dp = (
+                        e * ((ct * sectoral_p + st * sectoral_dp) >> SHIFT)
+                        >> LEGENDRE_SHIFT
+                    )
+            sectoral_s, sectoral_p, sectoral_dp = s, p, dp
+
+            s2 = p2 = dp2 = 0
+            cpm = cp[m]
+            spm = sp[m]
+            for n in range(m, maxord + 1):
+                i = n * (n + 1) // 2 + m
+                if n > m:
+                    a, b = k[i]
+                    p1 = p
+                    if m == 0:
+                        p = (a * (ct * p1 >> SHIFT) - b * p2) >> LEGENDRE_SHIFT
+                    else:
+                        s1 = s
+                        s = (a * (ct * s1 >> SHIFT) - b * s2) >> LEGENDRE_SHIFT
+                        s2 = s1
+                        p = st * s >> SHIFT
+                    dp1 = dp
+                    dp = (
+                        a * ((ct * dp1 - st * p1) >> SHIFT) - b * dp2
+                    ) >> LEGENDRE_SHIFT
+                    p2 = p1
+                    dp2 = dp1
+                elif m == 0:
+                    # There is no coefficient of degree 0, P(0, 0) only starts the recursion
+                    continue
+
+                g, h, dg, dh = c[i]
+                gnm = g + ((dg * dt + HALF) >> SHIFT)
+                hnm = h + ((dh * dt + HALF) >> SHIFT)
+                temp1 = (gnm * cpm + hnm * spm) >> product_shift
+                temp2 = (gnm * spm - hnm * cpm) >> product_shift
+                temp1 = temp1 * ar[n] >> SHIFT
+                temp2 = temp2 * ar[n] >> SHIFT
+                br += (n + 1) * ((temp1 * p + LEGENDRE_HALF) >> LEGENDRE_SHIFT)
+                bt -= (temp1 * dp + LEGENDRE_HALF) >> LEGENDRE_SHIFT
+                if m > 0:
+                    bp += m * ((temp2 * s + LEGENDRE_HALF) >> LEGENDRE_SHIFT)
+
+        return br, bt, bp
+
+
+def generate_tables(coefficients_data: Tuple) -> Tuple:
+    """Generate the integer tables of a model from its coefficients data (the content of a ``pygeomag/wmm`` module).
+
+    :param Tuple coefficients_data: coefficients data from a python module, like ``GeoMag(coefficients_data=...)``
+    :return: ``((epoch, model, release_date, maxord), c, k)``, where ``c`` holds ``(g, h, dg, dh)`` in pT and ``k``
+        the recursion constants ``(a, b)`` (``(e, 0)`` for the sectoral values) scaled by ``2 ** 28``, both in the order
+        ``n * (n + 1) // 2 + m``
+    """
+    # Inline imports as the tables are generated on a computer, not on the microcontroller
+    import math
+
+    (epoch, model, release_date), coefficients = coefficients_data
+    maxord = max(n for n, _, _, _, _, _ in coefficients)
+    if maxord > WMM_SIZE_STANDARD:
+        raise ValueError(
+            f"Fixed point tables are only supported up to degree {WMM_SIZE_STANDARD}"
+        )
+
+    size = (maxord + 1) * (maxord + 2) // 2
+    c = [(0, 0, 0, 0)] * size
+    for n, m, gnm, hnm, dgnm, dhnm in coefficients:
+        if m > n or m < 0:
+            raise ValueError("Corrupt record in model file")
+        c[n * (n + 1) // 2 + m] = tuple(
+            int(round(value * 1000)) for value in (gnm, hnm, dgnm, dhnm)
+        )
+
+    k = [(0, 0)] * size
+    for m in range(maxord + 1):
+        e = math.sqrt((2 * m - 1) / (2 * m)) if m > 1 else 1.0
+        k[m * (m + 1) // 2 + m] = (int(round(e * LEGENDRE_ONE)), 0)
+        for n in range(m + 1, maxord + 1):
+            norm = math.sqrt(n * n - m * m)
+            a = (2 * n - 1) / norm
+            b = math.sqrt((n - 1) * (n - 1) - m * m) / norm
+            k[n * (n + 1) // 2 + m] = (
+                int(round(a * LEGENDRE_ONE)),
+                int(round(b * LEGENDRE_ONE)),
+            )
+
+    return (epoch, model, release_date, maxord), tuple(c), tuple(k)
+
+
+def format_tables(name: str, tables: Tuple) -> str:
+    """Return the source of a python module holding tables in the constant name."""
+    (epoch, model, release_date, maxord), c, k = tables
+    lines = [
+        f'"""Fixed point tables of {model}, generated by ``python -m pygeomag.fixedpoint``."""',
+        "",
+        f"{name} = (",
+        f"    ({epoch!r}, {model!r}, {release_date!r}, {maxord}),".replace("'", '"'),
+        "    (",
+    ]
+    lines.extend(f"        ({', '.join(str(value) for value in row)})," for row in c)
+    lines.append("    ),")
+    lines.append("    (")
+    lines.extend(f"        ({', '.join(str(value) for value in row)})," for row in k)
+    lines.append("    ),")
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Generate the ``pygeomag/wmm/wmm_*_fixed.py`` modules of the standard models."""
+    # Inline imports as the tables are generated on a computer, not on the microcontroller
+    import argparse
+    import importlib
+    import os
+
+    parser = argparse.ArgumentParser(
+        prog="python -m pygeomag.fixedpoint",
+        description="Generate the fixed point tables of coefficients modules.",
+    )
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        default=list(FIXED_POINT_MODULES),
+        help=f"coefficients modules of pygeomag.wmm (default: {' '.join(FIXED_POINT_MODULES)})",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "wmm"),
+        help="directory to write the modules to (default: the pygeomag/wmm directory)",
+    )
+    options = parser.parse_args(argv)
+
+    for module_name in options.modules:
+        module = importlib.import_module(f"pygeomag.wmm.{module_name}")
+        # The constant is named after the module, like WMM_2015v2 in wmm_2015v2
+        name = next(
+            attribute for attribute in dir(module) if attribute.lower() == module_name
+        )
+        tables = generate_tables(getattr(module, name))
+        filename = os.path.join(options.output, f"{module_name}_fixed.py")
+        with open(filename, "w", newline="\n") as file:
+            file.write(format_tables(f"{name}_FIXED", tables))
+        print(filename)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
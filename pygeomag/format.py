@@ -11,13 +11,68 @@ def round_to_digits(number, number_of_digits=0):
     45.8
     >>> round_to_digits(45.7625, 2)
     45.76
+
+    NaN and infinite numbers are returned unchanged.
     """
+    if math.isnan(number) or math.isinf(number):
+        return number
     multiplier = 10**number_of_digits
     abs_rounded_value = math.floor(abs(number) * multiplier + 0.5) / multiplier
     rounded_value = math.copysign(abs_rounded_value, number)
     return int(rounded_value) if number_of_digits == 0 else rounded_value
 
 
+def _is_ndarray(value):
+    """Return True if value is a NumPy array, without importing NumPy."""
+    return type(value).__module__ == "numpy"
+
+
+def round_to_digits_batch(numbers, number_of_digits=0):
+    """Round many numbers like ``round_to_digits``, half away from zero.
+
+    A NumPy array is rounded with array operations and a NumPy array is returned (of integers if number_of_digits is
+    `0` and every number is finite), any other sequence returns a list. NaN and infinite numbers are returned unchanged.
+
+    >>> from pygeomag import round_to_digits_batch
+    >>> round_to_digits_batch([45.7625, -0.5, 2.5], 0)
+    [46, -1, 3]
+    >>> round_to_digits_batch([45.7625, -45.7625], 3)
+    [45.763, -45.763]
+    """
+    multiplier = 10**number_of_digits
+    if _is_ndarray(numbers):
+        # Inline imports to only load NumPy when it is used
+        import numpy
+
+        numbers = numpy.asarray(numbers, dtype=numpy.float64)
+        rounded = numpy.copysign(
+            numpy.floor(numpy.abs(numbers) * multiplier + 0.5) / multiplier, numbers
+        )
+        finite = numpy.isfinite(numbers)
+        if not finite.all():
+            # Integers can't hold NaN and infinity, so the floats are returned
+            return numpy.where(finite, rounded, numbers)
+        return rounded.astype(numpy.int64) if number_of_digits == 0 else rounded
+
+    floor = math.floor
+    copysign = math.copysign
+    isnan = math.isnan
+    isinf = math.isinf
+    if number_of_digits == 0:
+        return [
+            number
+            if isnan(number) or isinf(number)
+            else int(copysign(floor(abs(number) + 0.5), number))
+            for number in numbers
+        ]
+    return [
+        number
+        if isnan(number) or isinf(number)
+        else copysign(floor(abs(number) * multiplier + 0.5) / multiplier, number)
+        for number in numbers
+    ]
+
+
 def decimal_degrees_to_degrees_minutes(decimal_degrees):
     """Convert decimal degrees to degrees and minutes.
 
@@ -80,6 +135,196 @@ def degrees_minutes_to_decimal_degrees(degrees, minutes):
     return degrees + minutes / 60
 
 
+def _columns(*values):
+    """Return the values as NumPy arrays if any is one, otherwise as lists with the numbers repeated."""
+    if any(_is_ndarray(value) for value in values):
+        # Inline imports to only load NumPy when it is used
+        import numpy
+
+        return [numpy.asarray(value, dtype=numpy.float64) for value in values]
+
+    count = None
+    for value in values:
+        if not isinstance(value, (int, float)):
+            if count is None:
+                count = len(value)
+            elif len(value) != count:
+                raise ValueError("All columns must have the same length")
+    if count is None:
+        raise TypeError("at least one value must be a list or an array")
+    return [
+        [value] * count if isinstance(value, (int, float)) else value
+        for value in values
+    ]
+
+
+def decimal_degrees_to_degrees_minutes_batch(decimal_degrees):
+    """Convert many decimal degrees to degrees and minutes, like ``decimal_degrees_to_degrees_minutes``.
+
+    :param decimal_degrees: A list, ``array`` or NumPy array of decimal degrees
+    :return: The degrees and the minutes, as NumPy arrays for a NumPy array and otherwise as lists
+
+    >>> from pygeomag import decimal_degrees_to_degrees_minutes_batch
+    >>> decimal_degrees_to_degrees_minutes_batch([45.7625, -122.3493])
+    ([45, -122], [45.75, 20.958])
+    """
+    if _is_ndarray(decimal_degrees):
+        # Inline imports to only load NumPy when it is used
+        import numpy
+
+        values = numpy.asarray(decimal_degrees, dtype=numpy.float64)
+        degrees = numpy.trunc(values)
+        minutes = round_to_digits_batch(numpy.abs(values - degrees) * 60, 12)
+        return degrees.astype(numpy.int64), minutes
+
+    values = [float(value) for value in decimal_degrees]
+    degrees = [int(value) for value in values]
+    minutes = round_to_digits_batch(
+        [abs(value - degree) * 60 for value, degree in zip(values, degrees)], 12
+    )
+    return degrees, minutes
+
+
+def decimal_degrees_to_degrees_minutes_seconds_batch(decimal_degrees):
+    """Convert many decimal degrees to degrees, minutes and seconds, like ``decimal_degrees_to_degrees_minutes_seconds``.
+
+    :param decimal_degrees: A list, ``array`` or NumPy array of decimal degrees
+    :return: The degrees, the minutes and the seconds, as NumPy arrays for a NumPy array and otherwise as lists
+
+    >>> from pygeomag import decimal_degrees_to_degrees_minutes_seconds_batch
+    >>> decimal_degrees_to_degrees_minutes_seconds_batch([45.7625, -122.3493])
+    ([45, -122], [45, 20], [45.0, 57.48])
+    """
+    degrees, decimal_minutes = decimal_degrees_to_degrees_minutes_batch(decimal_degrees)
+    if _is_ndarray(decimal_minutes):
+        # Inline imports to only load NumPy when it is used
+        import numpy
+
+        minutes = numpy.trunc(decimal_minutes)
+        seconds = round_to_digits_batch((decimal_minutes - minutes) * 60, 12)
+        return degrees, minutes.astype(numpy.int64), seconds
+
+    minutes = [int(minute) for minute in decimal_minutes]
+    seconds = round_to_digits_batch(
+        [(decimal - minute) * 60 for decimal, minute in zip(decimal_minutes, minutes)],
+        12,
+    )
+    return degrees, minutes, seconds
+
+
+def degrees_minutes_seconds_to_decimal_degrees_batch(degrees, minutes, seconds):
+    """Convert many degrees, minutes and seconds to decimal degrees, like ``degrees_minutes_seconds_to_decimal_degrees``.
+
+    Each argument can be a list, ``array``, NumPy array or a number used for every value.
+
+    :return: The decimal degrees, as a NumPy array if any argument is one and otherwise as a list
+    :raises ValueError: if the arguments do not have the same length
+
+    >>> from pygeomag import degrees_minutes_seconds_to_decimal_degrees_batch
+    >>> degrees_minutes_seconds_to_decimal_degrees_batch([45, 122], 45, [45, 57.48])
+    [45.7625, 122.76596666666667]
+    """
+    degrees, minutes, seconds = _columns(degrees, minutes, seconds)
+    if _is_ndarray(degrees):
+        return degrees + minutes / 60 + seconds / 3600
+    return [
+        degree + minute / 60 + second / 3600
+        for degree, minute, second in zip(degrees, minutes, seconds)
+    ]
+
+
+def degrees_minutes_to_decimal_degrees_batch(degrees, minutes):
+    """Convert many degrees and minutes to decimal degrees, like ``degrees_minutes_to_decimal_degrees``.
+
+    Each argument can be a list, ``array``, NumPy array or a number used for every value.
+
+    :return: The decimal degrees, as a NumPy array if any argument is one and otherwise as a list
+    :raises ValueError: if the arguments do not have the same length
+
+    >>> from pygeomag import degrees_minutes_to_decimal_degrees_batch
+    >>> degrees_minutes_to_decimal_degrees_batch([45, 122], [45.75, 20.958])
+    [45.7625, 122.3493]
+    """
+    degrees, minutes = _columns(degrees, minutes)
+    if _is_ndarray(degrees):
+        return degrees + minutes / 60
+    return [degree + minute / 60 for degree, minute in zip(degrees, minutes)]
+
+
+# Characters of the strings of ``pretty_print_degrees`` replaced by spaces and the words dropped by ``parse_degrees``
+_PARSE_TABLE = {ord(character): " " for character in "\xb0'\""}
+_UNIT_WORDS = ("degrees", "minutes", "seconds")
+_ORDINAL_SIGNS = {
+    "n": 1,
+    "north": 1,
+    "e": 1,
+    "east": 1,
+    "s": -1,
+    "south": -1,
+    "w": -1,
+    "west": -1,
+}
+
+
+def parse_degrees(text):
+    """Parse a string like the ones ``pretty_print_degrees`` returns to decimal degrees.
+
+    The degrees can be followed by minutes and seconds, with symbols (``45° 45' 45" N``) or full words
+    (``45 Degrees 45 Minutes 45 Seconds North``), and by an ordinal, ``S`` and ``W`` give negative values. Without an
+    ordinal the sign of the degrees is kept. Values rounded when they were formatted are not recovered.
+
+    :param str text: The string to parse
+    :return: The decimal degrees
+    :raises ValueError: if the string is not in a known format
+
+    >>> from pygeomag import parse_degrees
+    >>> parse_degrees("45° 45.75' S")
+    -45.7625
+    >>> parse_degrees("45 Degrees 45.75 Minutes North")
+    45.7625
+    """
+    parts = [
+        part
+        for part in text.translate(_PARSE_TABLE).split()
+        if part.lower() not in _UNIT_WORDS
+    ]
+    sign = 1
+    if parts and parts[-1].lower() in _ORDINAL_SIGNS:
+        sign = _ORDINAL_SIGNS[parts.pop().lower()]
+    if not 1 <= len(parts) <= 3:  # noqa: PLR2004 - Magic value used in comparison
+        raise ValueError(f"Unsupported degrees format: {text!r}")
+    try:
+        numbers = [float(part) for part in parts]
+    except ValueError:
+        raise ValueError(f"Unsupported degrees format: {text!r}") from None
+
+    degrees = numbers[0]
+    value = abs(degrees)
+    if len(numbers) > 1:
+        value += numbers[1] / 60
+    if len(numbers) > 2:  # noqa: PLR2004 - Magic value used in comparison
+        value += numbers[2] / 3600
+    if degrees < 0 or (degrees == 0 and parts[0].startswith("-")):
+        sign = -sign
+    return sign * value
+
+
+def parse_degrees_batch(texts):
+    """Parse many strings with ``parse_degrees``.
+
+    :param texts: A list or NumPy array of strings
+    :return: The decimal degrees, as a NumPy array for a NumPy array and otherwise as a list
+    :raises ValueError: if a string is not in a known format
+    """
+    values = [parse_degrees(text) for text in texts]
+    if _is_ndarray(texts):
+        # Inline imports to only load NumPy when it is used
+        import numpy
+
+        return numpy.array(values, dtype=numpy.float64)
+    return values
+
+
 def pretty_print_degrees(
     decimal_degrees,
     is_latitude,
@@ -104,45 +349,115 @@ def pretty_print_degrees(
     >>> pretty_print_degrees(decimal_degrees=45.7625, is_latitude=True, full_words=True, number_of_digits=2)
     '45 Degrees 45.75 Minutes North'
     """
+    template, positive_word, negative_word = _degrees_template(
+        is_latitude, show_seconds, full_words
+    )
+    ordinal_word = positive_word if decimal_degrees >= 0 else negative_word
+
     if show_seconds:
         degrees, minutes, seconds = decimal_degrees_to_degrees_minutes_seconds(
             decimal_degrees
         )
         seconds = round_to_digits(seconds, number_of_digits)
-        string_format = "{degrees}{degrees_word} {minutes}{minutes_word} {seconds}{seconds_word} {ordinal_word}"
-    else:
-        degrees, minutes = decimal_degrees_to_degrees_minutes(decimal_degrees)
-        minutes = round_to_digits(minutes, number_of_digits)
-        seconds = 0
-        string_format = "{degrees}{degrees_word} {minutes}{minutes_word} {ordinal_word}"
+        return template.format(abs(degrees), minutes, seconds, ordinal_word)
 
+    degrees, minutes = decimal_degrees_to_degrees_minutes(decimal_degrees)
+    minutes = round_to_digits(minutes, number_of_digits)
+    return template.format(abs(degrees), minutes, ordinal_word)
+
+
+def _degrees_template(is_latitude, show_seconds, full_words):
+    """Return the format string of ``pretty_print_degrees`` and its ordinal words for positive and negative values."""
     if full_words:
         degrees_word = " Degrees"
         minutes_word = " Minutes"
         seconds_word = " Seconds"
+        positive_word, negative_word = (
+            ("North", "South") if is_latitude else ("East", "West")
+        )
     else:
         degrees_word = "\xb0"
         minutes_word = "'"
         seconds_word = '"'
+        positive_word, negative_word = ("N", "S") if is_latitude else ("E", "W")
+
+    if show_seconds:
+        template = (
+            "{}" + degrees_word + " {}" + minutes_word + " {}" + seconds_word + " {}"
+        )
+    else:
+        template = "{}" + degrees_word + " {}" + minutes_word + " {}"
+    return template, positive_word, negative_word
+
+
+def _degrees_parts(decimal_degrees, show_seconds, number_of_digits):
+    """Split many decimal degrees like ``pretty_print_degrees``.
 
-    if is_latitude and decimal_degrees >= 0:
-        ordinal_word = "North"
-    elif is_latitude and decimal_degrees < 0:
-        ordinal_word = "South"
-    elif not is_latitude and decimal_degrees >= 0:
-        ordinal_word = "East"
+    :return: Lists of the absolute degrees, the minutes, the seconds (None without show_seconds) and whether each value
+        is positive
+    """
+    if _is_ndarray(decimal_degrees):
+        # Inline imports to only load NumPy when it is used
+        import numpy
+
+        values = numpy.asarray(decimal_degrees, dtype=numpy.float64)
+        positive = (values >= 0).tolist()
     else:
-        ordinal_word = "West"
-
-    if not full_words:
-        ordinal_word = ordinal_word[0]
-
-    return string_format.format(
-        degrees=abs(degrees),
-        degrees_word=degrees_word,
-        minutes=minutes,
-        minutes_word=minutes_word,
-        seconds=seconds,
-        seconds_word=seconds_word,
-        ordinal_word=ordinal_word,
+        values = [float(value) for value in decimal_degrees]
+        positive = [value >= 0 for value in values]
+
+    seconds = None
+    if show_seconds:
+        degrees, minutes, seconds = decimal_degrees_to_degrees_minutes_seconds_batch(
+            values
+        )
+        seconds = round_to_digits_batch(seconds, number_of_digits)
+    else:
+        degrees, minutes = decimal_degrees_to_degrees_minutes_batch(values)
+        minutes = round_to_digits_batch(minutes, number_of_digits)
+
+    if _is_ndarray(values):
+        degrees = abs(degrees).tolist()
+        minutes = minutes.tolist()
+        seconds = None if seconds is None else seconds.tolist()
+    else:
+        degrees = [abs(degree) for degree in degrees]
+    return degrees, minutes, seconds, positive
+
+
+def pretty_print_degrees_batch(
+    decimal_degrees,
+    is_latitude,
+    show_seconds=False,
+    full_words=False,
+    number_of_digits=0,
+):
+    """Format many decimal degrees into human-readable strings, like ``pretty_print_degrees`` does for one.
+
+    The format string is built once and the values are split into degrees, minutes and seconds all at once, with
+    array operations for a NumPy array.
+
+    :param decimal_degrees: A list or NumPy array of the decimal degrees you want converted
+    :param bool is_latitude: True for latitude, False for longitude
+    :param bool show_seconds: True to show seconds, False for just degrees and minutes
+    :param bool full_words: True to use full words like "North", False for single characters like "N"
+    :param int number_of_digits: The amount of digits to round the last value to
+    :return: An iterator of the human-readable strings
+
+    >>> from pygeomag import pretty_print_degrees_batch
+    >>> list(pretty_print_degrees_batch([45.7625, -122.3493], is_latitude=False))
+    ["45° 46' E", "122° 21' W"]
+    """
+    template, positive_word, negative_word = _degrees_template(
+        is_latitude, show_seconds, full_words
     )
+    degrees, minutes, seconds, positive = _degrees_parts(
+        decimal_degrees, show_seconds, number_of_digits
+    )
+    words = [negative_word, positive_word]
+    if show_seconds:
+        for values in zip(degrees, minutes, seconds, positive):
+            yield template.format(values[0], values[1], values[2], words[values[3]])
+    else:
+        for values in zip(degrees, minutes, positive):
+            yield template.format(values[0], values[1], words[values[2]])
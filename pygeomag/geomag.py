@@ -1,9 +1,26 @@
 import math
 import sys
 
+try:
+    from array import array
+except ImportError:
+    """Lightweight versions of Python might not have array, lists will be used instead"""
+
 if not sys.implementation.name == "circuitpython":
     import datetime
-    from typing import Any, List, Tuple, Union
+    from typing import Any, Dict, Iterable, Iterator, List, TextIO, Tuple, Union
+
+try:
+    from pygeomag import backend
+except ImportError:
+    """Lightweight versions of Python (or a copy of just this file) only have the python backend"""
+    backend = None
+
+try:
+    from pygeomag import instrumentation
+except ImportError:
+    """Lightweight versions of Python (or a copy of just this file) can not be instrumented"""
+    instrumentation = None
 
 WMM_MODEL_2015_LOWER = 2015.0
 WMM_MODEL_2015_UPPER = 2020.0
@@ -18,6 +35,12 @@ WMM_SIZE_HIGH_RESOLUTION = 133
 BLACKOUT_ZONE = 2000
 CAUTION_ZONE = 6000
 
+EVALUATOR_LEGENDRE = "legendre"
+EVALUATOR_CLENSHAW = "clenshaw"
+
+FRAME_SPHERICAL = "spherical"
+FRAME_ECEF = "ecef"
+
 
 class BlackoutZoneException(Exception):
     """Horizontal intensity is in a Blackout Zone.
@@ -181,20 +204,34 @@ class GeoMagResult:
         self.z = self.f * (math.sin(math.radians(self.i)))
         self.h = self.f * (math.cos(math.radians(self.i)))
 
-        # Check if in Caution or Blackout Zones
-        if self.h < BLACKOUT_ZONE:
+        self.check_zones(raise_in_warning_zone)
+
+    def check_zones(
+        self,
+        raise_in_warning_zone: bool,
+        blackout_zone: float = BLACKOUT_ZONE,
+        caution_zone: float = CAUTION_ZONE,
+    ) -> None:
+        """Check if the horizontal intensity is in a Caution or Blackout Zone.
+
+        :param bool raise_in_warning_zone: True if you want to raise a BlackoutZoneException or CautionZoneException
+            exception when the horizontal intensity is < caution_zone
+        :param float blackout_zone: The horizontal intensity (nT) below which a position is in a Blackout Zone
+        :param float caution_zone: The horizontal intensity (nT) below which a position is in a Caution Zone
+        """
+        if self.h < blackout_zone:
             if raise_in_warning_zone:
                 raise BlackoutZoneException(
                     f"The horizontal field strength at this location is {self.h:.1f}. Compass readings have VERY LARGE "
-                    "uncertainties in areas where H smaller than 2000 nT"
+                    f"uncertainties in areas where H smaller than {blackout_zone} nT"
                 )
             self.in_blackout_zone = True
 
-        elif self.h < CAUTION_ZONE:
+        elif self.h < caution_zone:
             if raise_in_warning_zone:
                 raise CautionZoneException(
                     f"The horizontal field strength at this location is {self.h:.1f}. Compass readings have large "
-                    "uncertainties in areas where H smaller than 6000 nT"
+                    f"uncertainties in areas where H smaller than {caution_zone} nT"
                 )
             self.in_caution_zone = True
 
@@ -219,6 +256,114 @@ class GeoMagResult:
         return GeoMagUncertaintyResult(self)
 
 
+class GeoMagBatchResult:
+    """The Magnetic Components values from ``GeoMag.calculate_batch()``, stored column by column.
+
+    Every value is a column with one entry per position, ``gv`` is ``nan`` when the position isn't in the arctic or
+    antarctic. Indexing returns the ``GeoMagResult`` of a single position.
+
+    Positions in a Blackout or Caution Zone don't raise an exception by default, they are marked in the
+    ``in_blackout_zone`` and ``in_caution_zone`` columns so a single position doesn't stop a large batch.
+    """
+
+    def __init__(
+        self,
+        time: List[float],
+        alt: List[float],
+        glat: List[float],
+        glon: List[float],
+    ) -> None:
+        self.time: List[float] = time
+        """Times (in decimal year)."""
+        self.alt: List[float] = alt
+        """Altitudes, -1 to 850km referenced to the WGS 84 ellipsoid OR the Mean Sea Level (MSL)."""
+        self.glat: List[float] = glat
+        """Geodetic Latitudes, -90.00 to +90.00 degrees (North positive, South negative)."""
+        self.glon: List[float] = glon
+        """Geodetic Longitudes, -180.00 to +180.00 degrees (East positive, West negative)."""
+        self.x: List[float] = None
+        """North Components."""
+        self.y: List[float] = None
+        """East Components."""
+        self.z: List[float] = None
+        """Vertical Components."""
+        self.h: List[float] = None
+        """Horizontal Intensities."""
+        self.f: List[float] = None
+        """Total Intensities."""
+        self.i: List[float] = None
+        """Geomagnetic Inclinations."""
+        self.d: List[float] = None
+        """Geomagnetic Declinations (Magnetic Variation)."""
+        self.gv: List[float] = None
+        """Magnetic grid variations, ``nan`` if the geodetic position is not in the arctic or antarctic."""
+        self.in_blackout_zone: List[bool] = None
+        """Horizontal intensities are in a Blackout Zone."""
+        self.in_caution_zone: List[bool] = None
+        """Horizontal intensities are in a Caution Zone."""
+        self.is_high_resolution: bool = False
+        """Are results from the high resolution model."""
+
+    def __len__(self) -> int:
+        """Return the amount of positions."""
+        return len(self.glat)
+
+    def __getitem__(self, index: int) -> GeoMagResult:
+        """Return the ``GeoMagResult`` of a single position."""
+        result = GeoMagResult(
+            self.time[index], self.alt[index], self.glat[index], self.glon[index]
+        )
+        result.is_high_resolution = self.is_high_resolution
+        result.f = self.f[index]
+        result.d = self.d[index]
+        result.i = self.i[index]
+        result.gv = None if math.isnan(self.gv[index]) else self.gv[index]
+        result.calculate(False)
+        if self.in_blackout_zone is not None:
+            result.in_blackout_zone = bool(self.in_blackout_zone[index])
+            result.in_caution_zone = bool(self.in_caution_zone[index])
+        return result
+
+    def check_zones(
+        self,
+        raise_in_warning_zone: bool,
+        blackout_zone: float = BLACKOUT_ZONE,
+        caution_zone: float = CAUTION_ZONE,
+    ) -> None:
+        """Mark the positions where the horizontal intensity is in a Caution or Blackout Zone.
+
+        :param bool raise_in_warning_zone: True if you want to raise the BlackoutZoneException or CautionZoneException
+            exception of the first position in a zone, False to only mark them
+        :param float blackout_zone: The horizontal intensity (nT) below which a position is in a Blackout Zone
+        :param float caution_zone: The horizontal intensity (nT) below which a position is in a Caution Zone
+        """
+        h = self.h
+        if hasattr(h, "dtype"):
+            # NumPy columns
+            self.in_blackout_zone = h < blackout_zone
+            self.in_caution_zone = (h >= blackout_zone) & (h < caution_zone)
+            in_zone = self.in_blackout_zone | self.in_caution_zone
+            first = int(in_zone.argmax()) if in_zone.any() else None
+        else:
+            self.in_blackout_zone = [value < blackout_zone for value in h]
+            self.in_caution_zone = [
+                blackout_zone <= value < caution_zone for value in h
+            ]
+            first = next(
+                (
+                    index
+                    for index in range(len(h))
+                    if self.in_blackout_zone[index] or self.in_caution_zone[index]
+                ),
+                None,
+            )
+        if raise_in_warning_zone and first is not None:
+            result = self[first]
+            # The horizontal intensity of the column, GeoMagResult.calculate rounds it differently
+            result.h = h[first]
+            result.check_zones(True, blackout_zone, caution_zone)
+
+
 class GeoMag:
     """Python port of the Legacy C code provided by NOAA for the World Magnetic Model (WMM).
 
@@ -241,12 +386,15 @@ class GeoMag:
        ==============  ==========  ===============  ==========
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913 - Too many arguments
         self,
         coefficients_file: str = None,
         coefficients_data: Tuple = None,
         base_year: Union[str, datetime.datetime] = None,
         high_resolution: bool = False,
+        evaluator: str = EVALUATOR_LEGENDRE,
+        max_degree: int = None,
+        memory_budget: int = None,
     ) -> None:
         """Create a GeoMag instance.
 
@@ -272,9 +420,18 @@ class GeoMag:
         Leaving all values as ``None`` will load the packages default coefficients file, supplying multiple will raise.
 
         :param str coefficients_file: Full or relative path to a coefficients file supplied by this package or WMM
-        :param Tuple coefficients_data: coefficients data from a python module
+        :param Tuple coefficients_data: coefficients data from a python module (or ``prepared_coefficients_data``)
         :param Union[str, datetime.datetime] base_year: a year you want to use to auto select the correct coefficients data
         :param bool high_resolution: use the high resolution dataset
+        :param str evaluator: ``"legendre"`` for the port of the legacy C code, or ``"clenshaw"`` to use Schmidt
+            normalized recursions with Clenshaw summation, which is numerically stable for the high resolution model
+        :param int max_degree: Only load and sum the coefficients up to this degree, to use less memory and time at the
+            cost of accuracy (None for every degree of the model: 12, or 133 for the high resolution model)
+        :param int memory_budget: The bytes the tables and the scratch buffers of a calculation may use (see
+            ``memory_footprint``), the coefficients are stored in single precision if they do not fit in double
+            precision, and their degree is lowered until they fit (None for no limit). The scratch buffers are
+            estimated for the backend using the most memory (the Python one), so the fit does not depend on the
+            selected ``pygeomag.backend``
         """
         if (
             len(
@@ -289,23 +446,29 @@ class GeoMag:
             raise ValueError(
                 "Only one of coefficients_file, coefficients_data, base_year can be set."
             )
+        if evaluator not in (EVALUATOR_LEGENDRE, EVALUATOR_CLENSHAW):
+            raise ValueError(f"Unknown evaluator {evaluator}")
 
         self._base_year = base_year
         self._coefficients_data = coefficients_data
         self._coefficients_file = coefficients_file
+        self._evaluator = evaluator
+        self._high_resolution = high_resolution
         if high_resolution:
             self._maxord = WMM_SIZE_HIGH_RESOLUTION
         else:
             self._maxord = WMM_SIZE_STANDARD
-        self._size = self._maxord + 1
+        if max_degree is not None:
+            if max_degree < 1 or max_degree > self._maxord:
+                raise ValueError(f"max_degree must be between 1 and {self._maxord}")
+            self._maxord = max_degree
+        self._typecode = "d"
+        if memory_budget is not None:
+            self._fit_memory_budget(memory_budget)
         self._epoch = None
         self._model = None
         self._release_date = None
         self._c = None
-        self._cd = None
-        self._p = None
-        self._fn = None
-        self._fm = None
         self._k = None
 
     @property
@@ -332,6 +495,91 @@ class GeoMag:
 
         return self._release_date
 
+    def preload(self) -> float:
+        """Load the coefficients now instead of on the first call to ``calculate``.
+
+        Loading the high resolution model takes a noticeable amount of time, this allows doing it up front (for
+        example before a service is marked as ready).
+
+        :return: The time it took to load the coefficients in seconds
+
+        >>> from pygeomag import GeoMag
+        >>> geo_mag = GeoMag(coefficients_file="wmm/WMM_2025.COF")
+        >>> seconds = geo_mag.preload()
+        >>> geo_mag.model
+        'WMM-2025'
+        """
+        # Inline imports to not fail on lightweight versions of Python
+        import time
+
+        start = time.monotonic()
+        self._load_coefficients()
+        return time.monotonic() - start
+
+    def prepared_coefficients_data(self) -> Tuple:
+        """Return the loaded coefficients in the layout of the evaluator, to use as ``coefficients_data``.
+
+        Loading prepared coefficients data copies the tables instead of normalizing the coefficients and calculating
+        the recursion constants, which shortens the start of a microcontroller. The ``pygeomag/wmm/wmm_*_prepared.py``
+        modules hold them for the standard models and the ``legendre`` evaluator (``python -m pygeomag.prepared``).
+
+        :return: ``((epoch, model, release_date), {"evaluator", "maxord", "c", "k"})``
+
+        >>> from pygeomag import GeoMag
+        >>> from pygeomag.wmm.wmm_2025 import WMM_2025
+        >>> prepared = GeoMag(coefficients_data=WMM_2025).prepared_coefficients_data()
+        >>> geo_mag = GeoMag(coefficients_data=prepared)
+        >>> print(geo_mag.calculate(glat=47.6205, glon=-122.3493, alt=0, time=2025.25).d)
+        15.065629638512593
+        """
+        self._load_coefficients()
+        return (
+            (self._epoch, self._model, self._release_date),
+            {
+                "evaluator": self._evaluator,
+                "maxord": self._maxord,
+                "c": tuple(self._c),
+                "k": tuple(self._k),
+            },
+        )
+
+    def memory_footprint(self) -> Dict[str, int]:
+        """Return the bytes used by the tables of the loaded model and by the scratch lists of a calculation.
+
+        The sizes are of the values only. The scratch buffers are created by every call to ``calculate`` (so there is
+        one per thread calculating), as float64 arrays by the compiled backends and as lists by the Python backend,
+        estimated with a pointer and a float object per value.
+
+        :return: ``degree`` and ``itemsize`` (bytes per value) of the tables, the bytes of the ``c`` (coefficients)
+            and ``k`` (recursion constants) tables and of the ``scratch`` buffers, and their ``total``
+
+        >>> from pygeomag import GeoMag
+        >>> geo_mag = GeoMag(coefficients_file="wmm/WMM_2025.COF")
+        >>> footprint = geo_mag.memory_footprint()
+        >>> footprint["degree"], footprint["itemsize"], footprint["c"], footprint["k"]
+        (12, 8, 2912, 728)
+        """
+        self._load_coefficients()
+        return self._estimate_memory(
+            self._maxord, self._evaluator, self._itemsize(self._c)
+        )
+
+    def warmup(self) -> float:
+        """Load the coefficients and run a dummy calculation at the epoch of the model.
+
+        With the Numba backend this also compiles the kernels of the evaluator (or loads them from the Numba cache),
+        which takes up to about half a second the first time instead of delaying the first real calculation.
+
+        :return: The time it took to load the coefficients and run the calculation in seconds
+        """
+        # Inline imports to not fail on lightweight versions of Python
+        import time
+
+        start = time.monotonic()
+        self._load_coefficients()
+        self.calculate(0.0, 0.0, 0.0, self._epoch)
+        return time.monotonic() - start
+
     @classmethod
     def _create_list(cls, length: int, default: Any = None) -> List:
         """Create a list of length with an optional default."""
@@ -342,6 +590,110 @@ class GeoMag:
         """Create a 2 dimensional matrix of length with an optional default."""
         return [[default for _ in range(columns)] for _ in range(rows)]
 
+    @classmethod
+    def _create_array(cls, length: int, typecode: str = "d") -> List:
+        """Create a contiguous array of floats of length, falling back to a list if ``array`` is not supported."""
+        try:
+            return array(typecode, [0.0]) * length
+        except (NameError, TypeError, ValueError):
+            return [0.0] * length
+
+    @classmethod
+    def _copy_array(cls, values: Iterable[float], typecode: str = "d") -> List:
+        """Copy values to a contiguous array of floats, falling back to a list if ``array`` is not supported."""
+        try:
+            return array(typecode, values)
+        except (NameError, TypeError, ValueError):
+            return list(values)
+
+    @classmethod
+    def _list_item_size(cls) -> int:
+        """Return the bytes used by a float in a list: a pointer and the float object (16 without ``sys.getsizeof``)."""
+        try:
+            return 8 + sys.getsizeof(1.0)
+        except AttributeError:
+            return 16
+
+    @classmethod
+    def _scratch_item_size(cls) -> int:
+        """Return the bytes used by a value of the scratch buffers of the selected ``pygeomag.backend``."""
+        if backend is not None and backend.get_backend() != backend.BACKEND_PYTHON:
+            # The compiled kernels use float64 arrays
+            return 8
+        return cls._list_item_size()
+
+    @classmethod
+    def _largest_scratch_item_size(cls) -> int:
+        """Return the bytes used by a value of the scratch buffers of the backend that uses the most of them."""
+        return max(8, cls._list_item_size())
+
+    @classmethod
+    def _itemsize(cls, values: List) -> int:
+        """Return the bytes used by a float in an array or a list."""
+        return getattr(values, "itemsize", cls._list_item_size())
+
+    @classmethod
+    def _estimate_memory(
+        cls,
+        maxord: int,
+        evaluator: str,
+        itemsize: int,
+        scratch_item_size: int = None,
+    ) -> Dict[str, int]:
+        """Estimate the bytes used by the tables of a model and the scratch buffers of a calculation.
+
+        The scratch buffers are estimated for the selected ``pygeomag.backend`` unless scratch_item_size is given.
+        """
+        size = cls._triangle_size(maxord)
+        if scratch_item_size is None:
+            scratch_item_size = cls._scratch_item_size()
+        c = 4 * size * itemsize
+        if evaluator == EVALUATOR_CLENSHAW:
+            k = 2 * size * itemsize
+            # (a / r) ** (n + 2) of every degree
+            scratch = (maxord + 1) * scratch_item_size
+        else:
+            k = size * itemsize
+            # The Legendre functions and their derivatives, and sin(m * lon), cos(m * lon) and the pole recursion
+            scratch = (2 * size + 3 * (maxord + 1)) * scratch_item_size
+        return {
+            "degree": maxord,
+            "itemsize": itemsize,
+            "c": c,
+            "k": k,
+            "scratch": scratch,
+            "total": c + k + scratch,
+        }
+
+    def _fit_memory_budget(self, memory_budget: int) -> None:
+        """Select the storage and degree of the coefficients so they fit in memory_budget bytes, see ``__init__``."""
+        # The backend can be changed after loading, so the scratch buffers are estimated for the one using the most
+        scratch_item_size = self._largest_scratch_item_size()
+        for typecode in ("d", "f"):
+            itemsize = self._itemsize(self._create_array(1, typecode))
+            maxord = self._maxord
+            # Only the most compact storage is truncated
+            lowest = 1 if typecode == "f" else maxord
+            while maxord >= lowest:
+                if (
+                    self._estimate_memory(
+                        maxord, self._evaluator, itemsize, scratch_item_size
+                    )["total"]
+                    <= memory_budget
+                ):
+                    self._maxord = maxord
+                    self._typecode = typecode
+                    return
+                maxord -= 1
+        raise ValueError(
+            f"A memory budget of {memory_budget} bytes is too small for the model"
+        )
+
+    @classmethod
+    def _triangle_size(cls, maxord: int) -> int:
+        """Return the amount of degree and order pairs up to maxord (including 0)."""
+        return (maxord + 1) * (maxord + 2) // 2
+
     @classmethod
     def _get_coefficients_year(cls, year: Union[str, datetime.datetime]) -> str:
         year_value = getattr(year, "year", year)
@@ -375,7 +727,7 @@ class GeoMag:
         else:
             year = ""
 
-        if self._maxord == WMM_SIZE_HIGH_RESOLUTION:
+        if self._high_resolution:
             hr = "HR"
         else:
             hr = ""
@@ -398,115 +750,680 @@ class GeoMag:
         except OSError:
             return wmm_filepath
 
-    def _load_coefficients(self) -> None:  # noqa: PLR0915 - Too many statements
-        """Load the coefficients model to calculate the Magnetic Components from."""
+    def _load_coefficients(self) -> None:
+        """Load the coefficients model to calculate the Magnetic Components from.
+
+        The coefficients are stored in flat arrays in the order the evaluator visits them, ``_c`` holds 4 values per
+        degree ``n`` and order ``m``: ``g``, ``h``, ``dg`` and ``dh``.
+
+        - ``"legendre"``: index ``n * (n + 1) // 2 + m``, the coefficients are unnormalized and ``_k`` holds the
+          constant of the Legendre recursion relation
+        - ``"clenshaw"``: index ``m * (maxord + 1) - m * (m - 1) // 2 + n - m``, the coefficients are Schmidt
+          normalized and scaled by the sectoral value of their order, and ``_k`` holds 2 values per index: the
+          recursion constants of degree ``n + 1`` and ``n + 2``
+
+        Coefficients data from ``prepared_coefficients_data`` is already in this layout and only copied.
+        """
         if self._epoch is not None:
             return
 
-        c = self._create_matrix(self._size, self._size)
-        cd = self._create_matrix(self._size, self._size)
-        snorm = self._create_list(self._size**2)
-        fn = self._create_list(self._size)
-        fm = self._create_list(self._size)
-        k = self._create_matrix(self._size, self._size)
+        stats = instrumentation.active() if instrumentation else None
+        if stats is not None:
+            start = stats.clock()
 
         if self._coefficients_data:
             (epoch, model, release_date), coefficients = self._coefficients_data
+            if isinstance(coefficients, dict):
+                c, k = self._load_prepared_coefficients(coefficients)
+            else:
+                c, k = self._prepare_coefficients(coefficients)
         else:
-            (epoch, model, release_date), coefficients = (
-                self._read_coefficients_data_from_file()
-            )
+            with open(self._get_model_filename()) as coefficients_file:
+                (epoch, model, release_date), coefficients = (
+                    self._read_coefficients_data_from_file(coefficients_file)
+                )
+                c, k = self._prepare_coefficients(coefficients)
 
-        # READ WORLD MAGNETIC MODEL SPHERICAL HARMONIC COEFFICIENTS
-        c[0][0] = 0.0
-        cd[0][0] = 0.0
+        # _epoch marks the coefficients as loaded, so it is set last for calculations running in other threads
+        self._model = model
+        self._release_date = release_date
+        self._c = c
+        self._k = k
+        self._epoch = epoch
+
+        if stats is not None:
+            stats.record(model, instrumentation.PHASE_LOAD, start, 0)
+
+    def _prepare_coefficients(self, coefficients: Iterable) -> Tuple[List, List]:
+        """Store the records of a model in the layout of the evaluator and return it with its recursion constants.
 
+        The records are stored one at a time in arrays of the final size, and the ones after the last degree are not
+        read: the records are ordered by degree.
+        """
+        maxord = self._maxord
+        clenshaw = self._evaluator == EVALUATOR_CLENSHAW
+        c = self._create_array(4 * self._triangle_size(maxord), self._typecode)
+
+        # READ WORLD MAGNETIC MODEL SPHERICAL HARMONIC COEFFICIENTS
         for n, m, gnm, hnm, dgnm, dhnm in coefficients:
-            if m > self._maxord:
-                break
             if m > n or m < 0:
                 raise ValueError("Corrupt record in model file")
-            if m <= n:
-                c[m][n] = gnm
-                cd[m][n] = dgnm
-                if m != 0:
-                    c[n][m - 1] = hnm
-                    cd[n][m - 1] = dhnm
+            if n > maxord:
+                break
+            if clenshaw:
+                i = 4 * (m * (maxord + 1) - m * (m - 1) // 2 + n - m)
+            else:
+                i = 4 * (n * (n + 1) // 2 + m)
+            c[i] = gnm
+            c[i + 1] = hnm
+            c[i + 2] = dgnm
+            c[i + 3] = dhnm
+
+        if clenshaw:
+            return c, self._prepare_clenshaw(c)
+        return c, self._prepare_legendre(c)
+
+    def _load_prepared_coefficients(self, prepared: Dict) -> Tuple[List, List]:
+        """Return the coefficients and recursion constants of ``prepared_coefficients_data`` as arrays.
+
+        The ``legendre`` layout is ordered by degree, so it is truncated to a lower ``max_degree`` by only copying the
+        start of the tables.
+        """
+        maxord = self._maxord
+        if (
+            prepared["evaluator"] != self._evaluator
+            or prepared["maxord"] < maxord
+            or (self._evaluator == EVALUATOR_CLENSHAW and prepared["maxord"] != maxord)
+        ):
+            raise ValueError(
+                f"The coefficients data is prepared for the {prepared['evaluator']} evaluator up to degree "
+                f"{prepared['maxord']}"
+            )
+        size = self._triangle_size(maxord)
+        if self._evaluator == EVALUATOR_CLENSHAW:
+            return (
+                self._copy_array(prepared["c"], self._typecode),
+                self._copy_array(prepared["k"], self._typecode),
+            )
+        return (
+            self._copy_array(prepared["c"][: 4 * size], self._typecode),
+            self._copy_array(prepared["k"][:size], self._typecode),
+        )
+
+    def _prepare_legendre(self, c: List) -> List:
+        """Convert the coefficients to unnormalized and return the Legendre recursion constants."""
+        maxord = self._maxord
+        k = self._create_array(self._triangle_size(maxord), self._typecode)
 
         # CONVERT SCHMIDT NORMALIZED GAUSS COEFFICIENTS TO UNNORMALIZED
-        snorm[0] = 1.0
-        fm[0] = 0.0
-        for n in range(1, self._maxord + 1):
-            snorm[n] = snorm[n - 1] * float(2 * n - 1) / float(n)
+        snorm_n0 = 1.0
+        for n in range(1, maxord + 1):
+            snorm_n0 = snorm_n0 * float(2 * n - 1) / float(n)
+            snorm = snorm_n0
             j = 2
-            m = 0
-            D1 = 1
-            D2 = (n - m + D1) / D1
-            while D2 > 0:
-                k[m][n] = float(((n - 1) * (n - 1)) - (m * m)) / float(
+            for m in range(n + 1):
+                i = n * (n + 1) // 2 + m
+                k[i] = float(((n - 1) * (n - 1)) - (m * m)) / float(
                     (2 * n - 1) * (2 * n - 3)
                 )
                 if m > 0:
                     flnmj = float((n - m + 1) * j) / float(n + m)
-                    snorm[n + m * self._size] = snorm[
-                        n + (m - 1) * self._size
-                    ] * math.sqrt(flnmj)
+                    snorm = snorm * math.sqrt(flnmj)
                     j = 1
-                    c[n][m - 1] = snorm[n + m * self._size] * c[n][m - 1]
-                    cd[n][m - 1] = snorm[n + m * self._size] * cd[n][m - 1]
-                c[m][n] = snorm[n + m * self._size] * c[m][n]
-                cd[m][n] = snorm[n + m * self._size] * cd[m][n]
-                D2 -= 1
-                m += D1
-            fn[n] = float(n + 1)
-            fm[n] = float(n)
-        k[1][1] = 0.0
+                c[4 * i] = snorm * c[4 * i]
+                c[4 * i + 1] = snorm * c[4 * i + 1]
+                c[4 * i + 2] = snorm * c[4 * i + 2]
+                c[4 * i + 3] = snorm * c[4 * i + 3]
+        if maxord > 0:
+            k[2] = 0.0
 
-        self._epoch = epoch
-        self._model = model
-        self._release_date = release_date
-        self._c = c
-        self._cd = cd
-        self._p = snorm
-        self._fn = fn
-        self._fm = fm
-        self._k = k
+        return k
 
-    def _read_coefficients_data_from_file(self) -> Tuple[Tuple[str, str, str], list]:
-        """Read coefficients data from file to be processed by ``_load_coefficients``."""
-        data = []
+    def _prepare_clenshaw(self, c: List) -> List:
+        """Scale the coefficients by their sectoral value and return the Clenshaw recursion constants.
 
-        model_filename = self._get_model_filename()
+        The Schmidt normalized functions of order ``m`` are ``P(n, m) = sin(theta) ** m * Q(n, m)`` where:
 
-        with open(model_filename) as coefficients_file:
-            # READ WORLD MAGNETIC MODEL SPHERICAL HARMONIC COEFFICIENTS
-            line_data = coefficients_file.readline()
-            line_values = line_data.split()
-            if len(line_values) != 3:  # noqa: PLR2004 Magic value used in comparison
-                raise ValueError("Invalid header in model file")
-            epoch, model, release_date = (
-                t(s) for t, s in zip((float, str, str), line_values)
+        - ``Q(m, m)`` is the sectoral value: ``1`` for ``m`` of 0 and 1, then ``Q(m - 1, m - 1) * sqrt((2m - 1) / 2m)``
+        - ``Q(n, m) = a(n, m) * cos(theta) * Q(n - 1, m) - b(n, m) * Q(n - 2, m)``
+        - ``a(n, m) = (2n - 1) / sqrt(n * n - m * m)``
+        - ``b(n, m) = sqrt((n - 1) * (n - 1) - m * m) / sqrt(n * n - m * m)``
+        """
+        maxord = self._maxord
+        k = self._create_array(2 * self._triangle_size(maxord), self._typecode)
+
+        sectoral = 1.0
+        i = 0
+        for m in range(maxord + 1):
+            if m > 1:
+                sectoral = sectoral * math.sqrt(float(2 * m - 1) / float(2 * m))
+            for n in range(m, maxord + 1):
+                c[4 * i] = sectoral * c[4 * i]
+                c[4 * i + 1] = sectoral * c[4 * i + 1]
+                c[4 * i + 2] = sectoral * c[4 * i + 2]
+                c[4 * i + 3] = sectoral * c[4 * i + 3]
+                if n + 1 <= maxord:
+                    k[2 * i] = float(2 * n + 1) / math.sqrt(
+                        float((n + 1) * (n + 1) - m * m)
+                    )
+                if n + 2 <= maxord:
+                    k[2 * i + 1] = math.sqrt(
+                        float((n + 1) * (n + 1) - m * m)
+                        / float((n + 2) * (n + 2) - m * m)
+                    )
+                i += 1
+
+        return k
+
+    def _time_delta(self, time: float, allow_date_outside_lifespan: bool) -> float:
+        """Return the time since the epoch of the loaded model, raising if it is outside the 5-year life span."""
+        dt = time - self._epoch
+        # TODO #1: Legacy C code static vars for speed
+        # if otime < 0.0 and (dt < 0.0 or dt > 5.0) and not allow_date_past_lifespan:
+        if True and (dt < 0.0 or dt > 5.0) and not allow_date_outside_lifespan:  # noqa: PLR2004 Magic value used in comparison
+            raise ValueError("Time extends beyond model 5-year life span")
+        return dt
+
+    @classmethod
+    def _geodetic_to_spherical(
+        cls, glat: float, glon: float, alt: float
+    ) -> Tuple[float, float, float, float, float, float, float]:
+        """Convert a geodetic position to geocentric spherical coordinates.
+
+        :return: The radius, cos/sin of the colatitude, sin/cos of the longitude and cos/sin of the angle between the
+            geodetic and geocentric vertical (r, ct, st, srlon, crlon, ca, sa)
+        """
+        # INITIALIZE CONSTANTS
+        a = 6378.137
+        b = 6356.7523142
+        a2 = a * a
+        b2 = b * b
+        c2 = a2 - b2
+        a4 = a2 * a2
+        b4 = b2 * b2
+        c4 = a4 - b4
+
+        rlon = math.radians(glon)
+        rlat = math.radians(glat)
+        srlon = math.sin(rlon)
+        srlat = math.sin(rlat)
+        crlon = math.cos(rlon)
+        crlat = math.cos(rlat)
+        srlat2 = srlat * srlat
+        crlat2 = crlat * crlat
+
+        # CONVERT FROM GEODETIC COORDINATES TO SPHERICAL COORDINATES
+        # TODO #1: Legacy C code static vars for speed
+        # if alt != oalt or glat != olat:
+        if True:
+            q = math.sqrt(a2 - c2 * srlat2)
+            q1 = alt * q
+            q2 = ((q1 + a2) / (q1 + b2)) * ((q1 + a2) / (q1 + b2))
+            ct = srlat / math.sqrt(q2 * crlat2 + srlat2)
+            st = math.sqrt(1.0 - (ct * ct))
+            r2 = (alt * alt) + 2.0 * q1 + (a4 - c4 * srlat2) / (q * q)
+            r = math.sqrt(r2)
+            d = math.sqrt(a2 * crlat2 + b2 * srlat2)
+            ca = (alt + d) / r
+            sa = c2 * crlat * srlat / (r * d)
+
+        return r, ct, st, srlon, crlon, ca, sa
+
+    @classmethod
+    def _ecef_to_spherical(
+        cls, x: float, y: float, z: float
+    ) -> Tuple[float, float, float, float, float]:
+        """Convert an Earth-centered, Earth-fixed position to geocentric spherical coordinates.
+
+        :return: The radius, cos/sin of the colatitude and sin/cos of the longitude (r, ct, st, srlon, crlon)
+        """
+        rho = math.sqrt(x * x + y * y)
+        r = math.sqrt(rho * rho + z * z)
+        if rho == 0.0:
+            return r, math.copysign(1.0, z), 0.0, 0.0, 1.0
+        return r, z / r, rho / r, y / rho, x / rho
+
+    @classmethod
+    def _spherical_to_ecef(  # noqa: PLR0913 - Too many arguments
+        cls,
+        br: float,
+        bt: float,
+        bp: float,
+        ct: float,
+        st: float,
+        srlon: float,
+        crlon: float,
+    ) -> Tuple[float, float, float]:
+        """Rotate spherical (radial, theta, phi) field components to Earth-centered, Earth-fixed components."""
+        bxy = br * st + bt * ct
+        return (
+            bxy * crlon - bp * srlon,
+            bxy * srlon + bp * crlon,
+            br * ct - bt * st,
+        )
+
+    @classmethod
+    def _grid_variation(cls, glat: float, glon: float, d: float) -> float:
+        """Return the magnetic grid variation, or None if the position isn't in the arctic or antarctic."""
+        # COMPUTE MAGNETIC GRID VARIATION IF THE CURRENT
+        # GEODETIC POSITION IS IN THE ARCTIC OR ANTARCTIC
+        # (I.E. GLAT > +55 DEGREES OR GLAT < -55 DEGREES)
+        #
+        # OTHERWISE, SET MAGNETIC GRID VARIATION TO -999.0
+        gv = gv_default = -999.0
+        if math.fabs(glat) >= 55.0:  # noqa: PLR2004 Magic value used in comparison
+            if glat > 0.0 and glon >= 0.0:
+                gv = d - glon
+            if glat > 0.0 and glon < 0.0:
+                gv = d + math.fabs(glon)
+            if glat < 0.0 and glon >= 0.0:
+                gv = d + glon
+            if glat < 0.0 and glon < 0.0:
+                gv = d - math.fabs(glon)
+            if gv > +180.0:  # noqa: PLR2004 Magic value used in comparison
+                gv -= 360.0
+            if gv < -180.0:  # noqa: PLR2004 Magic value used in comparison
+                gv += 360.0
+        if gv == gv_default:
+            return None
+        return gv
+
+    @classmethod
+    def _is_ndarray(cls, value: Any) -> bool:
+        """Return True if value is a NumPy array, without importing NumPy."""
+        return type(value).__module__ == "numpy"
+
+    @classmethod
+    def _broadcast(cls, value: Union[float, List[float]], count: int) -> List[float]:
+        """Return value as is if it is a column, otherwise a list of count times value."""
+        if isinstance(value, (int, float)):
+            return [value] * count
+        if len(value) != count:
+            raise ValueError("All columns must have the same length")
+        return value
+
+    def _calculate_field_batch(  # noqa: PLR0913 - Too many arguments
+        self,
+        r: List[float],
+        ct: List[float],
+        st: List[float],
+        srlon: List[float],
+        crlon: List[float],
+        dt: List[float],
+    ) -> Tuple[List[float], List[float], List[float]]:
+        """Calculate the spherical field components for many positions with the selected ``pygeomag.backend``.
+
+        :return: The radial, theta and phi component columns (br, bt, bp) of the field
+        """
+        count = len(r)
+        br = self._create_array(count)
+        bt = self._create_array(count)
+        bp = self._create_array(count)
+        if backend is not None and backend.get_backend() != backend.BACKEND_PYTHON:
+            backend.calculate_field_batch(
+                self._evaluator,
+                self._maxord,
+                self._c,
+                self._k,
+                r,
+                ct,
+                st,
+                srlon,
+                crlon,
+                dt,
+                br,
+                bt,
+                bp,
+            )
+            return br, bt, bp
+
+        for index in range(count):
+            br[index], bt[index], bp[index] = self._calculate_field(
+                r[index], ct[index], st[index], srlon[index], crlon[index], dt[index]
             )
+        return br, bt, bp
 
-            while True:
-                line_data = coefficients_file.readline()
+    def _calculate_field(  # noqa: PLR0913 - Too many arguments
+        self, r: float, ct: float, st: float, srlon: float, crlon: float, dt: float
+    ) -> Tuple[float, float, float]:
+        """Calculate the spherical field components with the selected evaluator and ``pygeomag.backend``.
 
-                # CHECK FOR LAST LINE IN FILE
-                if line_data[:4] == "9999":
-                    break
+        :return: The radial, theta and phi components (br, bt, bp) of the field
+        """
+        if backend is not None and backend.get_backend() != backend.BACKEND_PYTHON:
+            return backend.calculate_field(
+                self._evaluator,
+                self._maxord,
+                self._c,
+                self._k,
+                r,
+                ct,
+                st,
+                srlon,
+                crlon,
+                dt,
+            )
+        if self._evaluator == EVALUATOR_CLENSHAW:
+            return self._calculate_clenshaw(r, ct, st, srlon, crlon, dt)
+        return self._calculate_legendre(r, ct, st, srlon, crlon, dt)
 
-                # END OF FILE NOT ENCOUNTERED, GET VALUES
-                line_values = line_data.split()
-                if len(line_values) != 6:  # noqa: PLR2004 Magic value used in comparison
-                    raise ValueError("Corrupt record in model file")
-                n, m, gnm, hnm, dgnm, dhnm = (
-                    t(s)
-                    for t, s in zip((int, int, float, float, float, float), line_values)
-                )
+    def _calculate_legendre(  # noqa: PLR0913,PLR0915 - Too many arguments,Too many statements
+        self, r: float, ct: float, st: float, srlon: float, crlon: float, dt: float
+    ) -> Tuple[float, float, float]:
+        """Calculate the spherical field components by building every unnormalized associated Legendre function.
+
+        :return: The radial, theta and phi components (br, bt, bp) of the field
+        """
+        maxord = self._maxord
+        p = self._create_list(self._triangle_size(maxord), 0.0)
+        dp = self._create_list(self._triangle_size(maxord), 0.0)
+        sp = self._create_list(maxord + 1)
+        cp = self._create_list(maxord + 1)
+        pp = self._create_list(maxord + 1)
+
+        sp[0] = 0.0
+        cp[0] = pp[0] = p[0] = 1.0
+        dp[0] = 0.0
+        sp[1] = srlon
+        cp[1] = crlon
+        re = 6371.2
+
+        # TODO #1: Legacy C code static vars for speed
+        # if glon != olon:
+        if True:
+            for m in range(2, maxord + 1):
+                sp[m] = sp[1] * cp[m - 1] + cp[1] * sp[m - 1]
+                cp[m] = cp[1] * cp[m - 1] - sp[1] * sp[m - 1]
+        c = self._c
+        k = self._k
+        aor = re / r
+        ar = aor * aor
+        br = bt = bp = bpp = 0.0
+        # SPECIAL CASE:  NORTH/SOUTH GEOGRAPHIC POLES, checked once instead of for every term
+        pole = st == 0.0
+        i = 0
+        for n in range(1, maxord + 1):
+            ar = ar * aor
+            fn = float(n + 1)
+
+            # COMPUTE UNNORMALIZED ASSOCIATED LEGENDRE POLYNOMIALS
+            # AND DERIVATIVES VIA RECURSION RELATIONS,
+            # TIME ADJUST THE GAUSS COEFFICIENTS
+            # AND ACCUMULATE TERMS OF THE SPHERICAL HARMONIC EXPANSIONS
+            # m = 0 has no h coefficient and no phi component, as sin(0 * lon) is 0
+            i += 1
+            # k is 0.0 when m == n - 1, so the (n - 2) term is dropped without a branch
+            p[i] = ct * p[i - n] - k[i] * p[i - 2 * n + 1]
+            dp[i] = ct * dp[i - n] - st * p[i - n] - k[i] * dp[i - 2 * n + 1]
+            j = 4 * i
+            gnm = c[j] + dt * c[j + 2]
+            par = ar * p[i]
+            bt = bt - ar * gnm * dp[i]
+            br += fn * gnm * par
+            for m in range(1, n):
+                i += 1
+                p[i] = ct * p[i - n] - k[i] * p[i - 2 * n + 1]
+                dp[i] = ct * dp[i - n] - st * p[i - n] - k[i] * dp[i - 2 * n + 1]
+                j = 4 * i
+                gnm = c[j] + dt * c[j + 2]
+                hnm = c[j + 1] + dt * c[j + 3]
+                par = ar * p[i]
+                temp1 = gnm * cp[m] + hnm * sp[m]
+                temp2 = gnm * sp[m] - hnm * cp[m]
+                bt = bt - ar * temp1 * dp[i]
+                bp += m * temp2 * par
+                br += fn * temp1 * par
+            # m = n
+            i += 1
+            p[i] = st * p[i - n - 1]
+            dp[i] = st * dp[i - n - 1] + ct * p[i - n - 1]
+            j = 4 * i
+            gnm = c[j] + dt * c[j + 2]
+            hnm = c[j + 1] + dt * c[j + 3]
+            par = ar * p[i]
+            temp1 = gnm * cp[n] + hnm * sp[n]
+            temp2 = gnm * sp[n] - hnm * cp[n]
+            bt = bt - ar * temp1 * dp[i]
+            bp += n * temp2 * par
+            br += fn * temp1 * par
+
+            if pole:
+                # The order 1 term of this degree, from the recursion of P(n, 1) / sin(theta)
+                i1 = i - n + 1
+                if n == 1:
+                    pp[n] = pp[n - 1]
+                else:
+                    pp[n] = ct * pp[n - 1] - k[i1] * pp[n - 2]
+                j = 4 * i1
+                gnm = c[j] + dt * c[j + 2]
+                hnm = c[j + 1] + dt * c[j + 3]
+                bpp += (gnm * sp[1] - hnm * cp[1]) * (ar * pp[n])
+
+        if pole:
+            bp = bpp
+        else:
+            bp /= st
+
+        return br, bt, bp
+
+    def _legendre_tables(self, ct: float, st: float) -> Tuple[List, List, List]:
+        """Return the unnormalized associated Legendre functions and their derivatives, see ``_calculate_legendre``.
+
+        :return: The functions and derivatives (in the ``_c`` order) and the order 1 recursion used at the geographic
+            poles (p, dp, pp)
+        """
+        maxord = self._maxord
+        k = self._k
+        p = self._create_list(self._triangle_size(maxord), 0.0)
+        dp = self._create_list(self._triangle_size(maxord), 0.0)
+        pp = self._create_list(maxord + 1, 1.0)
+        p[0] = 1.0
+        i = 0
+        for n in range(1, maxord + 1):
+            for m in range(n + 1):
+                i += 1
+                if n == m:
+                    p[i] = st * p[i - n - 1]
+                    dp[i] = st * dp[i - n - 1] + ct * p[i - n - 1]
+                else:
+                    # k is 0.0 when m == n - 1, so the (n - 2) term is dropped without a branch
+                    p[i] = ct * p[i - n] - k[i] * p[i - 2 * n + 1]
+                    dp[i] = ct * dp[i - n] - st * p[i - n] - k[i] * dp[i - 2 * n + 1]
+            if n > 1:
+                pp[n] = ct * pp[n - 1] - k[n * (n + 1) // 2 + 1] * pp[n - 2]
+        return p, dp, pp
+
+    @classmethod
+    def _longitude_series(
+        cls, maxord: int, srlon: float, crlon: float
+    ) -> Tuple[List, List]:
+        """Return sin(m * lon) and cos(m * lon) for every order, built with the angle addition formulas."""
+        sp = cls._create_list(maxord + 1)
+        cp = cls._create_list(maxord + 1)
+        sp[0] = 0.0
+        cp[0] = 1.0
+        sp[1] = srlon
+        cp[1] = crlon
+        for m in range(2, maxord + 1):
+            sp[m] = srlon * cp[m - 1] + crlon * sp[m - 1]
+            cp[m] = crlon * cp[m - 1] - srlon * sp[m - 1]
+        return sp, cp
+
+    def _sum_legendre(  # noqa: PLR0913 - Too many arguments
+        self,
+        tables: Tuple[List, List, List],
+        r: float,
+        st: float,
+        sp: List,
+        cp: List,
+        dt: float,
+    ) -> Tuple[float, float, float]:
+        """Sum the field from the tables of ``_legendre_tables`` and the series of ``_longitude_series``.
+
+        :return: The radial, theta and phi components (br, bt, bp) of the field
+        """
+        p, dp, pp = tables
+        c = self._c
+        re = 6371.2
+        aor = re / r
+        ar = aor * aor
+        br = bt = bp = bpp = 0.0
+        i = 0
+        pole = st == 0.0
+        for n in range(1, self._maxord + 1):
+            ar = ar * aor
+            fn = float(n + 1)
+            # m = 0 has no h coefficient and no phi component
+            i += 1
+            j = 4 * i
+            gnm = c[j] + dt * c[j + 2]
+            par = ar * p[i]
+            bt = bt - ar * gnm * dp[i]
+            br += fn * gnm * par
+            for m in range(1, n + 1):
+                i += 1
+                j = 4 * i
+                gnm = c[j] + dt * c[j + 2]
+                hnm = c[j + 1] + dt * c[j + 3]
+                par = ar * p[i]
+                temp1 = gnm * cp[m] + hnm * sp[m]
+                temp2 = gnm * sp[m] - hnm * cp[m]
+                bt = bt - ar * temp1 * dp[i]
+                bp += m * temp2 * par
+                br += fn * temp1 * par
+            if pole:
+                # SPECIAL CASE:  NORTH/SOUTH GEOGRAPHIC POLES, the order 1 term of this degree
+                j = 4 * (n * (n + 1) // 2 + 1)
+                gnm = c[j] + dt * c[j + 2]
+                hnm = c[j + 1] + dt * c[j + 3]
+                bpp += (gnm * sp[1] - hnm * cp[1]) * ar * pp[n]
+
+        if pole:
+            bp = bpp
+        else:
+            bp /= st
+
+        return br, bt, bp
+
+    def _calculate_clenshaw(  # noqa: PLR0913,PLR0915 - Too many arguments,Too many statements
+        self, r: float, ct: float, st: float, srlon: float, crlon: float, dt: float
+    ) -> Tuple[float, float, float]:
+        """Calculate the spherical field components using Clenshaw summation.
 
-                data.append((n, m, gnm, hnm, dgnm, dhnm))
+        For every order ``m`` (highest first) the sums over the degree ``n`` and their derivatives are found with
+        Clenshaw's backward recurrence using the ``Q(n, m)`` recursion from ``_prepare_clenshaw``. Those are then summed
+        over ``m`` with Clenshaw's recurrence for ``sin(theta) ** m * cos(m * lon)`` and ``sin(theta) ** m * sin(m * lon)``,
+        so no power of ``sin(theta)`` is ever formed, and nothing is divided by it at the geographic poles.
 
-        return (epoch, model, release_date), data
+        That takes six recurrences per term (the sums of ``g Q`` and ``h Q``, their ``(n + 1)`` weighted versions for
+        the radial component and the sums of the derivatives), about as many operations as ``_calculate_legendre``.
+
+        :return: The radial, theta and phi components (br, bt, bp) of the field
+        """
+        maxord = self._maxord
+        c = self._c
+        k = self._k
+        re = 6371.2
+
+        # (re / r) ** (n + 2) for every degree
+        aor = re / r
+        ar = self._create_list(maxord + 1)
+        ar[0] = aor * aor
+        for n in range(1, maxord + 1):
+            ar[n] = ar[n - 1] * aor
+
+        # Clenshaw constants for the sum over m
+        alpha = 2.0 * st * crlon
+        beta = -st * st
+
+        # Clenshaw values for the sum over m of (Br cos), (Br sin), (dQ cos), (dQ sin), (m Q for Bt and Bp)
+        za1 = za2 = zb1 = zb2 = zc1 = zc2 = zd1 = zd2 = ze1 = ze2 = zf1 = zf2 = 0.0
+
+        i = self._triangle_size(maxord)
+        for m in range(maxord, -1, -1):
+            # Clenshaw values for the sum over n of: g Q, h Q, (n + 1) g Q, (n + 1) h Q, g dQ, h dQ
+            yg1 = yg2 = yh1 = yh2 = rg1 = rg2 = rh1 = rh2 = 0.0
+            dg1 = dg2 = dh1 = dh2 = 0.0
+            for n in range(maxord, m - 1, -1):
+                i -= 1
+                an = k[2 * i]
+                bn = k[2 * i + 1]
+                at = an * ct
+
+                # TIME ADJUST THE GAUSS COEFFICIENTS
+                j = 4 * i
+                gnm = (c[j] + dt * c[j + 2]) * ar[n]
+                hnm = (c[j + 1] + dt * c[j + 3]) * ar[n]
+                fn = float(n + 1)
+
+                dg1, dg2 = an * yg1 + at * dg1 - bn * dg2, dg1
+                dh1, dh2 = an * yh1 + at * dh1 - bn * dh2, dh1
+                yg1, yg2 = gnm + at * yg1 - bn * yg2, yg1
+                yh1, yh2 = hnm + at * yh1 - bn * yh2, yh1
+                rg1, rg2 = fn * gnm + at * rg1 - bn * rg2, rg1
+                rh1, rh2 = fn * hnm + at * rh1 - bn * rh2, rh1
+
+            za1, za2 = rg1 + alpha * za1 + beta * za2, za1
+            zb1, zb2 = rh1 + alpha * zb1 + beta * zb2, zb1
+            zc1, zc2 = dg1 + alpha * zc1 + beta * zc2, zc1
+            zd1, zd2 = dh1 + alpha * zd1 + beta * zd2, zd1
+            if m > 0:
+                ze1, ze2 = m * yg1 + alpha * ze1 + beta * ze2, ze1
+                zf1, zf2 = m * yh1 + alpha * zf1 + beta * zf2, zf1
+
+        # za1..zd1 are the values for m = 0 and za2..zd2 for m = 1, ze1/zf1 are for m = 1 and ze2/zf2 for m = 2
+        br = za1 - st * crlon * za2 + st * srlon * zb2
+        bt = -ct * (crlon * ze1 - st * ze2 + srlon * zf1) + st * (
+            zc1 - st * crlon * zc2 + st * srlon * zd2
+        )
+        bp = srlon * ze1 - crlon * zf1 + st * zf2
+
+        return br, bt, bp
+
+    def _read_coefficients_data_from_file(
+        self, coefficients_file: TextIO
+    ) -> Tuple[
+        Tuple[float, str, str], Iterator[Tuple[int, int, float, float, float, float]]
+    ]:
+        """Read the header of an open coefficients file and return it with an iterator of its records.
+
+        The records are read from the file as they are iterated, so the whole file is never held in memory and the
+        records after the last degree used are never read.
+        """
+        # READ WORLD MAGNETIC MODEL SPHERICAL HARMONIC COEFFICIENTS
+        line_data = coefficients_file.readline()
+        line_values = line_data.split()
+        if len(line_values) != 3:  # noqa: PLR2004 Magic value used in comparison
+            raise ValueError("Invalid header in model file")
+        epoch, model, release_date = (
+            t(s) for t, s in zip((float, str, str), line_values)
+        )
+        return (epoch, model, release_date), self._read_records(coefficients_file)
+
+    @classmethod
+    def _read_records(
+        cls, coefficients_file: TextIO
+    ) -> Iterator[Tuple[int, int, float, float, float, float]]:
+        """Yield the records of a coefficients file after its header, see ``_read_coefficients_data_from_file``."""
+        while True:
+            line_data = coefficients_file.readline()
+
+            # CHECK FOR LAST LINE IN FILE
+            if line_data[:4] == "9999":
+                break
+
+            # END OF FILE NOT ENCOUNTERED, GET VALUES
+            line_values = line_data.split()
+            if len(line_values) != 6:  # noqa: PLR2004 Magic value used in comparison
+                raise ValueError("Corrupt record in model file")
+            yield (
+                int(line_values[0]),
+                int(line_values[1]),
+                float(line_values[2]),
+                float(line_values[3]),
+                float(line_values[4]),
+                float(line_values[5]),
+            )
 
     def calculate(  # noqa: PLR0912,PLR0913,PLR0915 - Too many branches,Too many arguments,Too many statements
         self,
@@ -544,26 +1461,6 @@ class GeoMag:
         >>> print(result.d)
         16.415602225952366
         """
-        tc = self._create_matrix(self._size, self._size)
-        dp = self._create_matrix(self._size, self._size)
-        sp = self._create_list(self._size)
-        cp = self._create_list(self._size)
-        pp = self._create_list(self._size)
-
-        # INITIALIZE CONSTANTS
-        sp[0] = 0.0
-        cp[0] = pp[0] = 1.0
-        dp[0][0] = 0.0
-        a = 6378.137
-        b = 6356.7523142
-        re = 6371.2
-        a2 = a * a
-        b2 = b * b
-        c2 = a2 - b2
-        a4 = a2 * a2
-        b4 = b2 * b2
-        c4 = a4 - b4
-
         self._load_coefficients()
 
         # TODO #1: Legacy C code static vars for speed
@@ -573,123 +1470,18 @@ class GeoMag:
         #   2. Remove them
         # otime = oalt = olat = olon = -1000.0
 
-        dt = time - self._epoch
-        # TODO #1: Legacy C code static vars for speed
-        # if otime < 0.0 and (dt < 0.0 or dt > 5.0) and not allow_date_past_lifespan:
-        if True and (dt < 0.0 or dt > 5.0) and not allow_date_outside_lifespan:  # noqa: PLR2004 Magic value used in comparison
-            raise ValueError("Time extends beyond model 5-year life span")
-
-        rlon = math.radians(glon)
-        rlat = math.radians(glat)
-        srlon = math.sin(rlon)
-        srlat = math.sin(rlat)
-        crlon = math.cos(rlon)
-        crlat = math.cos(rlat)
-        srlat2 = srlat * srlat
-        crlat2 = crlat * crlat
-        sp[1] = srlon
-        cp[1] = crlon
+        stats = instrumentation.active() if instrumentation else None
+        if stats is not None:
+            start = stats.clock()
 
-        # CONVERT FROM GEODETIC COORDINATES TO SPHERICAL COORDINATES
-        # TODO #1: Legacy C code static vars for speed
-        # if alt != oalt or glat != olat:
-        if True:
-            q = math.sqrt(a2 - c2 * srlat2)
-            q1 = alt * q
-            q2 = ((q1 + a2) / (q1 + b2)) * ((q1 + a2) / (q1 + b2))
-            ct = srlat / math.sqrt(q2 * crlat2 + srlat2)
-            st = math.sqrt(1.0 - (ct * ct))
-            r2 = (alt * alt) + 2.0 * q1 + (a4 - c4 * srlat2) / (q * q)
-            r = math.sqrt(r2)
-            d = math.sqrt(a2 * crlat2 + b2 * srlat2)
-            ca = (alt + d) / r
-            sa = c2 * crlat * srlat / (r * d)
-        # TODO #1: Legacy C code static vars for speed
-        # if glon != olon:
-        if True:
-            for m in range(2, self._maxord + 1):
-                sp[m] = sp[1] * cp[m - 1] + cp[1] * sp[m - 1]
-                cp[m] = cp[1] * cp[m - 1] - sp[1] * sp[m - 1]
-        aor = re / r
-        ar = aor * aor
-        br = bt = bp = bpp = 0.0
-        for n in range(1, self._maxord + 1):
-            ar = ar * aor
-            m = 0
-            D3 = 1
-            D4 = (n + m + D3) / D3
-            while D4 > 0:
-                # COMPUTE UNNORMALIZED ASSOCIATED LEGENDRE POLYNOMIALS
-                # AND DERIVATIVES VIA RECURSION RELATIONS
-                # TODO #1: Legacy C code static vars for speed
-                # if alt != oalt or glat != olat:
-                if True:
-                    if n == m:
-                        self._p[n + m * self._size] = (
-                            st * self._p[n - 1 + (m - 1) * self._size]
-                        )
-                        dp[m][n] = (
-                            st * dp[m - 1][n - 1]
-                            + ct * self._p[n - 1 + (m - 1) * self._size]
-                        )
-                    elif n == 1 and m == 0:
-                        self._p[n + m * self._size] = (
-                            ct * self._p[n - 1 + m * self._size]
-                        )
-                        dp[m][n] = (
-                            ct * dp[m][n - 1] - st * self._p[n - 1 + m * self._size]
-                        )
-                    elif n > 1 and n != m:
-                        if m > n - 2:
-                            self._p[n - 2 + m * self._size] = 0.0
-                        if m > n - 2:
-                            dp[m][n - 2] = 0.0
-                        self._p[n + m * self._size] = (
-                            ct * self._p[n - 1 + m * self._size]
-                            - self._k[m][n] * self._p[n - 2 + m * self._size]
-                        )
-                        dp[m][n] = (
-                            ct * dp[m][n - 1]
-                            - st * self._p[n - 1 + m * self._size]
-                            - self._k[m][n] * dp[m][n - 2]
-                        )
+        dt = self._time_delta(time, allow_date_outside_lifespan)
+        r, ct, st, srlon, crlon, ca, sa = self._geodetic_to_spherical(glat, glon, alt)
+        if stats is not None:
+            start = stats.record(self._model, instrumentation.PHASE_CONVERT, start)
 
-                # TIME ADJUST THE GAUSS COEFFICIENTS
-                # TODO #1: Legacy C code static vars for speed
-                # if time != otime:
-                if True:
-                    tc[m][n] = self._c[m][n] + dt * self._cd[m][n]
-                    if m != 0:
-                        tc[n][m - 1] = self._c[n][m - 1] + dt * self._cd[n][m - 1]
-
-                # ACCUMULATE TERMS OF THE SPHERICAL HARMONIC EXPANSIONS
-                par = ar * self._p[n + m * self._size]
-                if m == 0:
-                    temp1 = tc[m][n] * cp[m]
-                    temp2 = tc[m][n] * sp[m]
-                else:
-                    temp1 = tc[m][n] * cp[m] + tc[n][m - 1] * sp[m]
-                    temp2 = tc[m][n] * sp[m] - tc[n][m - 1] * cp[m]
-                bt = bt - ar * temp1 * dp[m][n]
-                bp += self._fm[m] * temp2 * par
-                br += self._fn[n] * temp1 * par
-
-                # SPECIAL CASE:  NORTH/SOUTH GEOGRAPHIC POLES
-                if st == 0.0 and m == 1:
-                    if n == 1:
-                        pp[n] = pp[n - 1]
-                    else:
-                        pp[n] = ct * pp[n - 1] - self._k[m][n] * pp[n - 2]
-                    parp = ar * pp[n]
-                    bpp += self._fm[m] * temp2 * parp
-
-                D4 -= 1
-                m += D3
-
-        if st == 0.0:
-            bp = bpp
-        else:
-            bp /= st
+        br, bt, bp = self._calculate_field(r, ct, st, srlon, crlon, dt)
+        if stats is not None:
+            start = stats.record(self._model, instrumentation.PHASE_FIELD, start)
 
         # ROTATE MAGNETIC VECTOR COMPONENTS FROM SPHERICAL TO
         # GEODETIC COORDINATES
@@ -698,7 +1490,7 @@ class GeoMag:
         bz = bt * sa - br * ca
 
         result = GeoMagResult(time, alt, glat, glon)
-        result.is_high_resolution = self._maxord == WMM_SIZE_HIGH_RESOLUTION
+        result.is_high_resolution = self._high_resolution
 
         # COMPUTE DECLINATION (DEC), INCLINATION (DIP) AND
         # TOTAL INTENSITY (TI)
@@ -706,30 +1498,11 @@ class GeoMag:
         result.f = math.sqrt((bh * bh) + (bz * bz))
         result.d = math.degrees(math.atan2(by, bx))
         result.i = math.degrees(math.atan2(bz, bh))
-
-        # COMPUTE MAGNETIC GRID VARIATION IF THE CURRENT
-        # GEODETIC POSITION IS IN THE ARCTIC OR ANTARCTIC
-        # (I.E. GLAT > +55 DEGREES OR GLAT < -55 DEGREES)
-        #
-        # OTHERWISE, SET MAGNETIC GRID VARIATION TO -999.0
-        result.gv = gv_default = -999.0
-        if math.fabs(glat) >= 55.0:  # noqa: PLR2004 Magic value used in comparison
-            if glat > 0.0 and glon >= 0.0:
-                result.gv = result.d - glon
-            if glat > 0.0 and glon < 0.0:
-                result.gv = result.d + math.fabs(glon)
-            if glat < 0.0 and glon >= 0.0:
-                result.gv = result.d + glon
-            if glat < 0.0 and glon < 0.0:
-                result.gv = result.d - math.fabs(glon)
-            if result.gv > +180.0:  # noqa: PLR2004 Magic value used in comparison
-                result.gv -= 360.0
-            if result.gv < -180.0:  # noqa: PLR2004 Magic value used in comparison
-                result.gv += 360.0
-        if result.gv == gv_default:
-            result.gv = None
+        result.gv = self._grid_variation(glat, glon, result.d)
 
         result.calculate(raise_in_warning_zone)
+        if stats is not None:
+            stats.record(self._model, instrumentation.PHASE_RESULT, start)
 
         # TODO #1: Legacy C code static vars for speed
         # otime = time
@@ -738,3 +1511,627 @@ class GeoMag:
         # olon = glon
 
         return result
+
+    def calculate_batch(  # noqa: PLR0913,PLR0915 - Too many arguments,Too many statements
+        self,
+        glat: List[float],
+        glon: Union[float, List[float]],
+        alt: Union[float, List[float]],
+        time: Union[float, List[float]],
+        allow_date_outside_lifespan: bool = False,
+        raise_in_warning_zone: bool = False,
+        blackout_zone: float = BLACKOUT_ZONE,
+        caution_zone: float = CAUTION_ZONE,
+    ) -> "GeoMagBatchResult":
+        """Calculate the Magnetic Components for many latitudes, longitudes, altitudes and dates at once.
+
+        The field is summed for every position in a single call to the selected ``pygeomag.backend``, the results are
+        stored column by column.
+
+        :param List[float] glat: Geodetic Latitudes, -90.00 to +90.00 degrees (North positive, South negative)
+        :param Union[float, List[float]] glon: Geodetic Longitude(s), -180.00 to +180.00 degrees (East positive, West
+            negative)
+        :param Union[float, List[float]] alt: Altitude(s), -1 to 850km referenced to the WGS 84 ellipsoid OR the Mean
+            Sea Level (MSL)
+        :param Union[float, List[float]] time: Time(s) (in decimal year)
+        :param bool allow_date_outside_lifespan: True, if you want an estimation outside the 5-year life span
+        :param bool raise_in_warning_zone: True if you want to raise a BlackoutZoneException or CautionZoneException
+            exception when the horizontal intensity of any position is < caution_zone, otherwise these positions are
+            marked in the ``in_blackout_zone`` and ``in_caution_zone`` columns
+        :param float blackout_zone: The horizontal intensity (nT) below which a position is in a Blackout Zone
+        :param float caution_zone: The horizontal intensity (nT) below which a position is in a Caution Zone
+        :return: A GeoMagBatchResult object
+        :raises ValueError: if a column does not have as many values as glat
+
+        >>> from pygeomag import GeoMag
+        >>> geo_mag = GeoMag(coefficients_file="wmm/WMM_2025.COF")
+        >>> result = geo_mag.calculate_batch(glat=[47.6205, 0.0], glon=[-122.3493, 0.0], alt=0, time=2025.25)
+        >>> print(round(result.d[0], 6))
+        15.06563
+
+        When any of the columns is a NumPy array, the calculation is done by ``pygeomag.vectorized`` and the result
+        columns are NumPy arrays.
+        """
+        if any(self._is_ndarray(value) for value in (glat, glon, alt, time)):
+            # Inline imports to only load NumPy when it is used
+            from pygeomag import vectorized
+
+            return vectorized.calculate_batch(
+                self,
+                glat,
+                glon,
+                alt,
+                time,
+                allow_date_outside_lifespan,
+                raise_in_warning_zone=raise_in_warning_zone,
+                blackout_zone=blackout_zone,
+                caution_zone=caution_zone,
+            )
+
+        count = len(glat)
+        glon = self._broadcast(glon, count)
+        alt = self._broadcast(alt, count)
+        time = self._broadcast(time, count)
+
+        self._load_coefficients()
+
+        stats = instrumentation.active() if instrumentation else None
+        if stats is not None:
+            start = stats.clock()
+
+        r = self._create_array(count)
+        ct = self._create_array(count)
+        st = self._create_array(count)
+        srlon = self._create_array(count)
+        crlon = self._create_array(count)
+        ca = self._create_array(count)
+        sa = self._create_array(count)
+        dt = self._create_array(count)
+        for index in range(count):
+            dt[index] = self._time_delta(time[index], allow_date_outside_lifespan)
+            (
+                r[index],
+                ct[index],
+                st[index],
+                srlon[index],
+                crlon[index],
+                ca[index],
+                sa[index],
+            ) = self._geodetic_to_spherical(glat[index], glon[index], alt[index])
+        if stats is not None:
+            start = stats.record(
+                self._model, instrumentation.PHASE_CONVERT, start, count
+            )
+
+        br, bt, bp = self._calculate_field_batch(r, ct, st, srlon, crlon, dt)
+        if stats is not None:
+            start = stats.record(self._model, instrumentation.PHASE_FIELD, start, count)
+
+        for index in range(count):
+            # ROTATE MAGNETIC VECTOR COMPONENTS FROM SPHERICAL TO
+            # GEODETIC COORDINATES, in place
+            bx = -bt[index] * ca[index] - br[index] * sa[index]
+            bz = bt[index] * sa[index] - br[index] * ca[index]
+            br[index] = bx
+            bt[index] = bz
+        result = self._create_batch_result(time, alt, glat, glon, br, bp, bt)
+        result.check_zones(raise_in_warning_zone, blackout_zone, caution_zone)
+        if stats is not None:
+            stats.record(self._model, instrumentation.PHASE_RESULT, start, count)
+
+        return result
+
+    def calculate_track(  # noqa: PLR0912,PLR0913,PLR0915 - Too many branches,Too many arguments,Too many statements
+        self,
+        points: "Iterable[Tuple[float, float, float, float]]",
+        allow_date_outside_lifespan: bool = False,
+        lat_tolerance: float = 0.0,
+        alt_tolerance: float = 0.0,
+        max_error: float = None,
+        max_interval: int = 64,
+    ) -> "GeoMagBatchResult":
+        """Calculate the Magnetic Components along a track of nearby positions, reusing work between them.
+
+        - With the ``legendre`` evaluator and the ``python`` backend the Legendre functions are only calculated again
+          when the latitude or the altitude moved by more than ``lat_tolerance`` degrees or ``alt_tolerance`` km since
+          they were last calculated (by default only when they changed), and ``sin(m * lon)`` and ``cos(m * lon)``
+          only when the longitude changed.
+        - With ``max_error`` the field is only calculated for some of the positions: the track is split in intervals of
+          at most ``max_interval`` positions, and an interval is halved until the field at its middle is within
+          ``max_error`` nT (for x, y and z) of the linear interpolation of its ends. The positions within it are then
+          interpolated between its ends and its middle. This assumes the positions are about evenly spaced, like the
+          fixes of a sensor; the interpolated values are within ``max_error`` of the field as long as it has no
+          features smaller than the intervals.
+
+        :param Iterable points: ``(glat, glon, alt, time)`` tuples, in the order of the track
+        :param bool allow_date_outside_lifespan: True, if you want an estimation outside the 5-year life span
+        :param float lat_tolerance: Latitude change, in degrees, under which the Legendre functions are reused
+        :param float alt_tolerance: Altitude change, in km, under which the Legendre functions are reused
+        :param float max_error: Maximum interpolation error in nT, None to calculate every position
+        :param int max_interval: Maximum amount of positions interpolated between two calculated ones
+        :return: A GeoMagBatchResult object
+
+        >>> from pygeomag import GeoMag
+        >>> geo_mag = GeoMag(coefficients_file="wmm/WMM_2025.COF")
+        >>> track = [(47.6205, -122.3493 + index * 0.001, 0, 2025.25) for index in range(3)]
+        >>> result = geo_mag.calculate_track(track)
+        >>> print(round(result.d[0], 6))
+        15.06563
+        """
+        if max_interval < 1:
+            raise ValueError("max_interval must be at least 1")
+
+        self._load_coefficients()
+
+        glat = []
+        glon = []
+        alt = []
+        time = []
+        for point_glat, point_glon, point_alt, point_time in points:
+            glat.append(point_glat)
+            glon.append(point_glon)
+            alt.append(point_alt)
+            time.append(point_time)
+        count = len(glat)
+        dt = self._create_array(count)
+        for index in range(count):
+            dt[index] = self._time_delta(time[index], allow_date_outside_lifespan)
+
+        stats = instrumentation.active() if instrumentation else None
+        if stats is not None:
+            start = stats.clock()
+
+        reuse = self._evaluator == EVALUATOR_LEGENDRE and (
+            backend is None or backend.get_backend() == backend.BACKEND_PYTHON
+        )
+        state = {}
+
+        def field(index: int) -> Tuple[float, float, float]:
+            """Calculate the geodetic field components of a position, reusing what did not change."""
+            point_glat = glat[index]
+            point_alt = alt[index]
+            point_glon = glon[index]
+            if (
+                not state
+                or math.fabs(point_glat - state["glat"]) > lat_tolerance
+                or math.fabs(point_alt - state["alt"]) > alt_tolerance
+            ):
+                r, ct, st, _, _, ca, sa = self._geodetic_to_spherical(
+                    point_glat, point_glon, point_alt
+                )
+                state.update(
+                    glat=point_glat, alt=point_alt, spherical=(r, ct, st, ca, sa)
+                )
+                if reuse:
+                    state["tables"] = self._legendre_tables(ct, st)
+            if state.get("glon") != point_glon:
+                rlon = math.radians(point_glon)
+                srlon = math.sin(rlon)
+                crlon = math.cos(rlon)
+                state.update(glon=point_glon, srlon=srlon, crlon=crlon)
+                if reuse:
+                    state["series"] = self._longitude_series(self._maxord, srlon, crlon)
+
+            r, ct, st, ca, sa = state["spherical"]
+            if reuse:
+                sp, cp = state["series"]
+                br, bt, bp = self._sum_legendre(
+                    state["tables"], r, st, sp, cp, dt[index]
+                )
+            else:
+                br, bt, bp = self._calculate_field(
+                    r, ct, st, state["srlon"], state["crlon"], dt[index]
+                )
+            # ROTATE MAGNETIC VECTOR COMPONENTS FROM SPHERICAL TO
+            # GEODETIC COORDINATES
+            return -bt * ca - br * sa, bp, bt * sa - br * ca
+
+        x = self._create_array(count)
+        y = self._create_array(count)
+        z = self._create_array(count)
+        calculated = 0
+
+        if max_error is None:
+            for index in range(count):
+                x[index], y[index], z[index] = field(index)
+            calculated = count
+        elif count:
+            ends = list(range(0, count - 1, max_interval)) + [count - 1]
+            for index in ends:
+                x[index], y[index], z[index] = field(index)
+                calculated += 1
+            intervals = list(zip(ends[:-1], ends[1:]))
+            while intervals:
+                first, last = intervals.pop()
+                if last - first < 2:  # noqa: PLR2004 Magic value used in comparison
+                    continue
+                middle = (first + last) // 2
+                x[middle], y[middle], z[middle] = field(middle)
+                calculated += 1
+                weight = (middle - first) / (last - first)
+                if (
+                    max(
+                        math.fabs(
+                            column[first]
+                            + weight * (column[last] - column[first])
+                            - column[middle]
+                        )
+                        for column in (x, y, z)
+                    )
+                    > max_error
+                ):
+                    intervals.append((first, middle))
+                    intervals.append((middle, last))
+                    continue
+                for low, high in ((first, middle), (middle, last)):
+                    for index in range(low + 1, high):
+                        weight = (index - low) / (high - low)
+                        for column in (x, y, z):
+                            column[index] = column[low] + weight * (
+                                column[high] - column[low]
+                            )
+
+        if stats is not None:
+            start = stats.record(
+                self._model, instrumentation.PHASE_FIELD, start, calculated
+            )
+
+        result = self._create_batch_result(time, alt, glat, glon, x, y, z)
+        result.check_zones(False)
+        if stats is not None:
+            stats.record(self._model, instrumentation.PHASE_RESULT, start, count)
+        return result
+
+    def _create_batch_result(  # noqa: PLR0913 - Too many arguments
+        self,
+        time: List[float],
+        alt: List[float],
+        glat: List[float],
+        glon: List[float],
+        x: List[float],
+        y: List[float],
+        z: List[float],
+    ) -> "GeoMagBatchResult":
+        """Create the GeoMagBatchResult of the geodetic field component columns, calculating the derived values."""
+        count = len(x)
+        result = GeoMagBatchResult(time, alt, glat, glon)
+        result.is_high_resolution = self._high_resolution
+        result.x = x
+        result.y = y
+        result.z = z
+        result.h = self._create_array(count)
+        result.f = self._create_array(count)
+        result.i = self._create_array(count)
+        result.d = self._create_array(count)
+        result.gv = self._create_array(count)
+        for index in range(count):
+            bx = x[index]
+            by = y[index]
+            bz = z[index]
+            bh = math.sqrt((bx * bx) + (by * by))
+            d = math.degrees(math.atan2(by, bx))
+            gv = self._grid_variation(glat[index], glon[index], d)
+
+            result.h[index] = bh
+            result.f[index] = math.sqrt((bh * bh) + (bz * bz))
+            result.i[index] = math.degrees(math.atan2(bz, bh))
+            result.d[index] = d
+            result.gv[index] = float("nan") if gv is None else gv
+        return result
+
+    def calculate_geocentric(  # noqa: PLR0913 - Too many arguments
+        self,
+        r: float,
+        theta: float,
+        phi: float,
+        time: float,
+        allow_date_outside_lifespan: bool = False,
+        frame: str = FRAME_SPHERICAL,
+    ) -> Tuple[float, float, float]:
+        """Calculate the magnetic field vector at a geocentric spherical position.
+
+        The position is used as is, skipping the conversion from geodetic coordinates (and back) of ``calculate``.
+
+        :param float r: Distance from the center of the Earth in km
+        :param float theta: Geocentric colatitude, 0.00 to 180.00 degrees (0 at the North pole)
+        :param float phi: Longitude, -180.00 to +180.00 degrees (East positive, West negative)
+        :param float time: Time (in decimal year)
+        :param bool allow_date_outside_lifespan: True, if you want an estimation outside the 5-year life span
+        :param str frame: ``"spherical"`` to return (radial, theta, phi) components or ``"ecef"`` to return (x, y, z)
+            Earth-centered, Earth-fixed components
+        :return: The field components in nT
+
+        >>> from pygeomag import GeoMag
+        >>> geo_mag = GeoMag(coefficients_file="wmm/WMM_2025.COF")
+        >>> br, btheta, bphi = geo_mag.calculate_geocentric(r=6371.2, theta=90, phi=0, time=2025.0)
+        """
+        self._load_coefficients()
+        dt = self._time_delta(time, allow_date_outside_lifespan)
+        rtheta = math.radians(theta)
+        rphi = math.radians(phi)
+        ct = math.cos(rtheta)
+        st = math.sin(rtheta)
+        srlon = math.sin(rphi)
+        crlon = math.cos(rphi)
+        return self._calculate_in_frame(r, ct, st, srlon, crlon, dt, frame)
+
+    def calculate_ecef(  # noqa: PLR0913 - Too many arguments
+        self,
+        x: float,
+        y: float,
+        z: float,
+        time: float,
+        allow_date_outside_lifespan: bool = False,
+        frame: str = FRAME_ECEF,
+    ) -> Tuple[float, float, float]:
+        """Calculate the magnetic field vector at an Earth-centered, Earth-fixed position.
+
+        :param float x: Distance along the axis through the equator at the prime meridian in km
+        :param float y: Distance along the axis through the equator at 90 degrees East in km
+        :param float z: Distance along the axis through the North pole in km
+        :param float time: Time (in decimal year)
+        :param bool allow_date_outside_lifespan: True, if you want an estimation outside the 5-year life span
+        :param str frame: ``"ecef"`` to return (x, y, z) components or ``"spherical"`` to return (radial, theta, phi)
+            components
+        :return: The field components in nT
+
+        >>> from pygeomag import GeoMag
+        >>> geo_mag = GeoMag(coefficients_file="wmm/WMM_2025.COF")
+        >>> bx, by, bz = geo_mag.calculate_ecef(x=6371.2, y=0, z=0, time=2025.0)
+        """
+        self._load_coefficients()
+        dt = self._time_delta(time, allow_date_outside_lifespan)
+        r, ct, st, srlon, crlon = self._ecef_to_spherical(x, y, z)
+        return self._calculate_in_frame(r, ct, st, srlon, crlon, dt, frame)
+
+    def calculate_geocentric_batch(  # noqa: PLR0913 - Too many arguments
+        self,
+        r: List[float],
+        theta: List[float],
+        phi: List[float],
+        time: Union[float, List[float]],
+        allow_date_outside_lifespan: bool = False,
+        frame: str = FRAME_SPHERICAL,
+    ) -> Tuple[List[float], List[float], List[float]]:
+        """Calculate the magnetic field vector at many geocentric spherical positions, see ``calculate_geocentric``.
+
+        :return: The three field component columns in nT
+        """
+        count = len(r)
+        radius = self._create_array(count)
+        ct = self._create_array(count)
+        st = self._create_array(count)
+        srlon = self._create_array(count)
+        crlon = self._create_array(count)
+        for index in range(count):
+            radius[index] = r[index]
+            rtheta = math.radians(theta[index])
+            rphi = math.radians(phi[index])
+            ct[index] = math.cos(rtheta)
+            st[index] = math.sin(rtheta)
+            srlon[index] = math.sin(rphi)
+            crlon[index] = math.cos(rphi)
+        return self._calculate_in_frame_batch(
+            radius, ct, st, srlon, crlon, time, allow_date_outside_lifespan, frame
+        )
+
+    def calculate_ecef_batch(  # noqa: PLR0913 - Too many arguments
+        self,
+        x: List[float],
+        y: List[float],
+        z: List[float],
+        time: Union[float, List[float]],
+        allow_date_outside_lifespan: bool = False,
+        frame: str = FRAME_ECEF,
+    ) -> Tuple[List[float], List[float], List[float]]:
+        """Calculate the magnetic field vector at many Earth-centered, Earth-fixed positions, see ``calculate_ecef``.
+
+        :return: The three field component columns in nT
+        """
+        count = len(x)
+        r = self._create_array(count)
+        ct = self._create_array(count)
+        st = self._create_array(count)
+        srlon = self._create_array(count)
+        crlon = self._create_array(count)
+        for index in range(count):
+            r[index], ct[index], st[index], srlon[index], crlon[index] = (
+                self._ecef_to_spherical(x[index], y[index], z[index])
+            )
+        return self._calculate_in_frame_batch(
+            r, ct, st, srlon, crlon, time, allow_date_outside_lifespan, frame
+        )
+
+    async def acalculate(  # noqa: PLR0913 - Too many arguments
+        self,
+        glat: float,
+        glon: float,
+        alt: float,
+        time: float,
+        allow_date_outside_lifespan: bool = False,
+        raise_in_warning_zone: bool = False,
+        executor: Any = None,
+    ) -> GeoMagResult:
+        """Calculate the Magnetic Components in an executor, without blocking the asyncio event loop.
+
+        The arguments are the same as ``calculate``. Once the coefficients are loaded a ``GeoMag`` instance can be used
+        by several threads at once. With a ``ProcessPoolExecutor`` the instance is pickled for every call, so preload
+        it (or pass a small model) only when that is cheaper than loading it in each process.
+
+        :param Executor executor: A ``concurrent.futures`` executor, None for the default executor of the event loop
+        :return: A GeoMagResult object
+
+        >>> import asyncio
+        >>> from pygeomag import GeoMag
+        >>> geo_mag = GeoMag(coefficients_file="wmm/WMM_2025.COF")
+        >>> result = asyncio.run(geo_mag.acalculate(glat=47.6205, glon=-122.3493, alt=0, time=2025.25))
+        >>> print(round(result.d, 6))
+        15.06563
+        """
+        # Inline imports to not fail on lightweight versions of Python
+        import asyncio
+
+        return await asyncio.get_running_loop().run_in_executor(
+            executor,
+            self.calculate,
+            glat,
+            glon,
+            alt,
+            time,
+            allow_date_outside_lifespan,
+            raise_in_warning_zone,
+        )
+
+    async def acalculate_many(  # noqa: PLR0913 - Too many arguments
+        self,
+        points: "Iterable[Tuple[float, float, float, float]]",
+        allow_date_outside_lifespan: bool = False,
+        raise_in_warning_zone: bool = False,
+        executor: Any = None,
+        max_concurrency: int = 8,
+    ) -> List[GeoMagResult]:
+        """Calculate the Magnetic Components of many positions in an executor, see ``acalculate``.
+
+        At most ``max_concurrency`` positions are submitted to the executor at a time, the next one is only taken from
+        ``points`` once one of them is done, so a large (or endless) iterable does not flood the executor. If a
+        calculation raises, or the awaiting task is cancelled, the positions that did not start yet are cancelled (the
+        running ones finish in their thread or process) and the exception is raised.
+
+        :param Iterable points: ``(glat, glon, alt, time)`` tuples
+        :param bool allow_date_outside_lifespan: True, if you want an estimation outside the 5-year life span
+        :param bool raise_in_warning_zone: True if you want to raise a BlackoutZoneException or CautionZoneException
+            exception when the horizontal intensity is < 6000
+        :param Executor executor: A ``concurrent.futures`` executor, None for the default executor of the event loop
+        :param int max_concurrency: The maximum amount of positions calculated at the same time
+        :return: A list of GeoMagResult objects in the order of points
+        """
+        # Inline imports to not fail on lightweight versions of Python
+        import asyncio
+
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        tasks = []
+        failed = []
+
+        def check(task: "asyncio.Task") -> None:
+            if not task.cancelled() and task.exception() is not None:
+                failed.append(task)
+
+        async def run(point: Tuple[float, float, float, float]) -> GeoMagResult:
+            try:
+                return await self.acalculate(
+                    *point,
+                    allow_date_outside_lifespan,
+                    raise_in_warning_zone,
+                    executor,
+                )
+            finally:
+                semaphore.release()
+
+        try:
+            for point in points:
+                await semaphore.acquire()
+                if failed:
+                    # Stop submitting, gather raises the exception
+                    break
+                task = asyncio.ensure_future(run(point))
+                task.add_done_callback(check)
+                tasks.append(task)
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            raise
+
+    def _calculate_in_frame(  # noqa: PLR0913 - Too many arguments
+        self,
+        r: float,
+        ct: float,
+        st: float,
+        srlon: float,
+        crlon: float,
+        dt: float,
+        frame: str,
+    ) -> Tuple[float, float, float]:
+        """Calculate the field at a geocentric position and return it in the requested frame."""
+        if frame not in (FRAME_SPHERICAL, FRAME_ECEF):
+            raise ValueError(f"Unknown frame {frame}")
+
+        stats = instrumentation.active() if instrumentation else None
+        if stats is not None:
+            start = stats.clock()
+
+        br, bt, bp = self._calculate_field(r, ct, st, srlon, crlon, dt)
+        if stats is not None:
+            stats.record(self._model, instrumentation.PHASE_FIELD, start)
+
+        if frame == FRAME_ECEF:
+            return self._spherical_to_ecef(br, bt, bp, ct, st, srlon, crlon)
+        return br, bt, bp
+
+    def _calculate_in_frame_batch(  # noqa: PLR0913 - Too many arguments
+        self,
+        r: List[float],
+        ct: List[float],
+        st: List[float],
+        srlon: List[float],
+        crlon: List[float],
+        time: Union[float, List[float]],
+        allow_date_outside_lifespan: bool,
+        frame: str,
+    ) -> Tuple[List[float], List[float], List[float]]:
+        """Calculate the field at many geocentric positions and return the columns in the requested frame."""
+        if frame not in (FRAME_SPHERICAL, FRAME_ECEF):
+            raise ValueError(f"Unknown frame {frame}")
+
+        count = len(r)
+        time = self._broadcast(time, count)
+        self._load_coefficients()
+        dt = self._create_array(count)
+        for index in range(count):
+            dt[index] = self._time_delta(time[index], allow_date_outside_lifespan)
+
+        stats = instrumentation.active() if instrumentation else None
+        if stats is not None:
+            start = stats.clock()
+
+        br, bt, bp = self._calculate_field_batch(r, ct, st, srlon, crlon, dt)
+        if stats is not None:
+            stats.record(self._model, instrumentation.PHASE_FIELD, start, count)
+
+        if frame == FRAME_ECEF:
+            for index in range(count):
+                br[index], bt[index], bp[index] = self._spherical_to_ecef(
+                    br[index],
+                    bt[index],
+                    bp[index],
+                    ct[index],
+                    st[index],
+                    srlon[index],
+                    crlon[index],
+                )
+        return br, bt, bp
+
+
+def preload_models(models: List, warmup: bool = True) -> List[Tuple[GeoMag, float]]:
+    """Load (and optionally warm up) several models up front.
+
+    Each entry can either be a ``GeoMag`` instance or a ``dict`` of keyword arguments used to create one.
+
+    :param List models: ``GeoMag`` instances or ``dict`` of arguments for ``GeoMag``
+    :param bool warmup: True to also run a dummy calculation on each model
+    :return: A list of ``(GeoMag, seconds)`` tuples in the same order as ``models``
+
+    >>> from pygeomag import GeoMag, preload_models
+    >>> loaded = preload_models([{"base_year": 2025}, {"base_year": 2025, "high_resolution": True}])
+    >>> [geo_mag.model for geo_mag, seconds in loaded]
+    ['WMM-2025', 'WMMHR-2025']
+    """
+    loaded = []
+    for model in models:
+        geo_mag = GeoMag(**model) if isinstance(model, dict) else model
+        seconds = geo_mag.warmup() if warmup else geo_mag.preload()
+        loaded.append((geo_mag, seconds))
+    return loaded
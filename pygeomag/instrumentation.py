@@ -0,0 +1,146 @@
+"""Opt in recording of the time ``GeoMag`` spends in each phase of a calculation.
+
+The phases are recorded per model:
+
+- ``load``: reading and preparing the coefficients (only when they are actually loaded)
+- ``convert``: converting the time and position to the inputs of the spherical harmonic summation
+- ``field``: the Legendre recursion and the summation of the field (run as one loop by every evaluator and backend)
+- ``result``: rotating the field back to geodetic components and calculating the derived values
+
+While nothing is being recorded ``GeoMag`` only checks ``active()`` once per phase.
+
+>>> from pygeomag import GeoMag, instrument
+>>> geo_mag = GeoMag(coefficients_file="wmm/WMM_2025.COF")
+>>> with instrument() as stats:
+...     result = geo_mag.calculate(glat=47.6205, glon=-122.3493, alt=0, time=2025.25)
+>>> stats.as_dict()["WMM-2025"]["field"]["calls"]
+1
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+PHASE_LOAD = "load"
+PHASE_CONVERT = "convert"
+PHASE_FIELD = "field"
+PHASE_RESULT = "result"
+
+_active = None
+
+
+class Instrumentation:
+    """Calls, positions and cumulative seconds of each phase, per model.
+
+    :param Callable callback: Called with ``(model, phase, seconds, points)`` every time a phase is recorded
+    """
+
+    def __init__(self, callback: Optional[Callable] = None) -> None:
+        """Create an Instrumentation instance, it records once it is started."""
+        self.callback = callback
+        self._lock = threading.Lock()
+        self._phases = {}
+        self._previous = None
+
+    clock = staticmethod(time.perf_counter)
+
+    def record(self, model: str, phase: str, start: float, points: int = 1) -> float:
+        """Record a phase of model that started at ``start`` (a value of ``clock()``).
+
+        :param str model: The name of the model
+        :param str phase: One of the ``PHASE_`` constants
+        :param float start: The value of ``clock()`` when the phase started
+        :param int points: The amount of positions evaluated
+        :return: The value of ``clock()`` now, to be used as the start of the next phase
+        """
+        now = self.clock()
+        seconds = now - start
+        with self._lock:
+            entry = self._phases.get((model, phase))
+            if entry is None:
+                entry = self._phases[(model, phase)] = [0, 0, 0.0]
+            entry[0] += 1
+            entry[1] += points
+            entry[2] += seconds
+        if self.callback is not None:
+            self.callback(model, phase, seconds, points)
+        return now
+
+    def reset(self) -> None:
+        """Forget everything that was recorded."""
+        with self._lock:
+            self._phases = {}
+
+    def start(self) -> None:
+        """Start recording the calculations of every ``GeoMag`` instance (in every thread)."""
+        global _active  # noqa: PLW0603 - Using the global statement
+
+        self._previous = _active
+        _active = self
+
+    def stop(self) -> None:
+        """Stop recording, the previously started instance (if any) records again."""
+        global _active  # noqa: PLW0603 - Using the global statement
+
+        _active = self._previous
+        self._previous = None
+
+    def __enter__(self) -> "Instrumentation":
+        """Start recording."""
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        """Stop recording."""
+        self.stop()
+
+    def as_dict(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """Return what was recorded as ``{model: {phase: {"calls": ..., "points": ..., "seconds": ...}}}``."""
+        result = {}
+        with self._lock:
+            for (model, phase), (calls, points, seconds) in self._phases.items():
+                result.setdefault(model, {})[phase] = {
+                    "calls": calls,
+                    "points": points,
+                    "seconds": seconds,
+                }
+        return result
+
+    def to_prometheus(self, prefix: str = "pygeomag") -> str:
+        """Return what was recorded in the Prometheus text exposition format.
+
+        >>> stats = Instrumentation()
+        >>> _ = stats.record("WMM-2025", PHASE_FIELD, stats.clock())
+        >>> print(stats.to_prometheus().splitlines()[2])
+        pygeomag_phase_calls_total{model="WMM-2025",phase="field"} 1
+        """
+        metrics = (
+            ("calls", "Calls of each phase of a calculation"),
+            ("points", "Positions evaluated by each phase of a calculation"),
+            ("seconds", "Seconds spent in each phase of a calculation"),
+        )
+        stats = self.as_dict()
+        lines = []
+        for name, description in metrics:
+            lines.append(f"# HELP {prefix}_phase_{name}_total {description}")
+            lines.append(f"# TYPE {prefix}_phase_{name}_total counter")
+            for model in sorted(stats):
+                for phase in sorted(stats[model]):
+                    lines.append(
+                        f'{prefix}_phase_{name}_total{{model="{model}",phase="{phase}"}} '
+                        f"{stats[model][phase][name]}"
+                    )
+        return "\n".join(lines) + "\n"
+
+
+def instrument(callback: Optional[Callable] = None) -> Instrumentation:
+    """Return an ``Instrumentation`` to use as a context manager (or ``start()`` and ``stop()``).
+
+    :param Callable callback: Called with ``(model, phase, seconds, points)`` every time a phase is recorded
+    """
+    return Instrumentation(callback)
+
+
+def active() -> Optional[Instrumentation]:
+    """Return the ``Instrumentation`` that is recording, or None."""
+    return _active
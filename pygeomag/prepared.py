@@ -0,0 +1,99 @@
+"""Generate the ``pygeomag/wmm/wmm_*_prepared.py`` modules, see ``GeoMag.prepared_coefficients_data``.
+
+The prepared modules hold the coefficients of a model already unnormalized, with the recursion constants, in the
+layout of the evaluator, so ``GeoMag(coefficients_data=...)`` only copies them when it loads:
+
+.. code-block:: python
+
+    from pygeomag import GeoMag
+    from pygeomag.wmm.wmm_2025_prepared import WMM_2025_PREPARED
+
+    geo_mag = GeoMag(coefficients_data=WMM_2025_PREPARED)
+
+``python -m pygeomag.prepared`` generates them again (or for other coefficients modules and evaluators).
+"""
+
+import argparse
+import importlib
+import os
+from typing import List, Optional, Tuple
+
+from pygeomag.geomag import EVALUATOR_CLENSHAW, EVALUATOR_LEGENDRE, GeoMag
+
+# Coefficients modules of pygeomag.wmm the prepared modules are generated for
+PREPARED_MODULES = ("wmm_2010", "wmm_2015", "wmm_2015v2", "wmm_2020", "wmm_2025")
+
+
+def format_prepared(name: str, prepared: Tuple) -> str:
+    """Return the source of a python module holding prepared coefficients data in the constant name."""
+    (epoch, model, release_date), tables = prepared
+    lines = [
+        f'"""Coefficients of {model} prepared for the {tables["evaluator"]} evaluator, generated by '
+        '``python -m pygeomag.prepared``."""',
+        "",
+        f"{name} = (",
+        f"    ({epoch!r}, {model!r}, {release_date!r}),".replace("'", '"'),
+        "    {",
+        f'        "evaluator": "{tables["evaluator"]}",',
+        f'        "maxord": {tables["maxord"]},',
+    ]
+    for key in ("c", "k"):
+        lines.append(f'        "{key}": (')
+        lines.extend(f"            {value!r}," for value in tables[key])
+        lines.append("        ),")
+    lines.append("    },")
+    lines.append(")")
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Generate the ``pygeomag/wmm/wmm_*_prepared.py`` modules."""
+    parser = argparse.ArgumentParser(
+        prog="python -m pygeomag.prepared",
+        description="Generate the prepared coefficients data of coefficients modules.",
+    )
+    parser.add_argument(
+        "modules",
+        nargs="*",
+        default=list(PREPARED_MODULES),
+        help=f"coefficients modules of pygeomag.wmm (default: {' '.join(PREPARED_MODULES)})",
+    )
+    parser.add_argument(
+        "--evaluator",
+        choices=(EVALUATOR_LEGENDRE, EVALUATOR_CLENSHAW),
+        default=EVALUATOR_LEGENDRE,
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "wmm"),
+        help="directory to write the modules to (default: the pygeomag/wmm directory)",
+    )
+    options = parser.parse_args(argv)
+
+    suffix = "" if options.evaluator == EVALUATOR_LEGENDRE else f"_{options.evaluator}"
+    for module_name in options.modules:
+        module = importlib.import_module(f"pygeomag.wmm.{module_name}")
+        # The constant is named after the module, like WMM_2015v2 in wmm_2015v2
+        name = next(
+            attribute for attribute in dir(module) if attribute.lower() == module_name
+        )
+        geo_mag = GeoMag(
+            coefficients_data=getattr(module, name),
+            high_resolution=module_name.startswith("wmmhr"),
+            evaluator=options.evaluator,
+        )
+        filename = os.path.join(options.output, f"{module_name}{suffix}_prepared.py")
+        with open(filename, "w", newline="\n") as file:
+            file.write(
+                format_prepared(
+                    f"{name}{suffix.upper()}_PREPARED",
+                    geo_mag.prepared_coefficients_data(),
+                )
+            )
+        print(filename)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,427 @@
+"""A small HTTP service calculating the Magnetic Components, using only the standard library.
+
+Run it with ``python -m pygeomag.server`` (see ``--help``), the models are loaded and warmed up before it starts
+listening. Every endpoint answers with JSON:
+
+- ``GET /health``: ``{"status": "ok"}``
+- ``GET /models``: the names of the loaded models, the first one is the default
+- ``GET /calculate?lat=47.6205&lon=-122.3493&alt=0&time=2025.25`` (or ``POST`` the same as a JSON object): the
+  result of a single position, ``alt`` defaults to 0, ``time`` (a decimal year) to now and ``model`` to the default
+- ``POST /calculate_batch`` with a JSON object of ``lat``, ``lon``, ``alt`` and ``time`` columns (``alt`` and
+  ``time`` can also be single values): the result columns, with the ``in_blackout_zone`` and ``in_caution_zone``
+  columns
+
+Both calculate endpoints accept ``model`` and ``allow_date_outside_lifespan``. The single position requests that arrive
+within ``window`` seconds of each other (or until ``max_batch`` of them are waiting) are calculated together with one
+call to ``GeoMag.calculate_batch``, which keeps the server fast when thousands of them arrive every second.
+
+.. code-block:: shell
+
+    $ python -m pygeomag.server --port 8080 --model 2025 --model WMMHR_2025.COF &
+    $ curl 'http://localhost:8080/calculate?lat=47.6205&lon=-122.3493&time=2025.25'
+    {"model": "WMM-2025", "time": 2025.25, "alt": 0.0, "glat": 47.6205, "glon": -122.3493, "x": 18409.774296136347, ...}
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import math
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from pygeomag.cli import create_geo_mag, to_column
+from pygeomag.geomag import GeoMag, preload_models
+from pygeomag.time import decimal_year_from_date
+
+RESULT_COLUMNS = ("x", "y", "z", "h", "f", "i", "d", "gv")
+MAX_BODY_SIZE = 64 * 1024 * 1024
+
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+    500: "Internal Server Error",
+}
+
+
+class HTTPError(Exception):
+    """An error answered with status and ``{"error": message}``."""
+
+    def __init__(self, status: int, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def _number(value) -> Optional[float]:
+    """Return a JSON friendly float, None for nan."""
+    value = float(value)
+    return None if math.isnan(value) else value
+
+
+class Coalescer:
+    """Collect single positions for a model and calculate them together.
+
+    :param GeoMag geo_mag: The model to calculate with
+    :param float window: The time to wait for more positions after the first one arrives, in seconds
+    :param int max_batch: Calculate right away once this many positions are waiting
+    """
+
+    def __init__(self, geo_mag: GeoMag, window: float, max_batch: int) -> None:
+        """Create a Coalescer instance."""
+        self.geo_mag = geo_mag
+        self.window = window
+        self.max_batch = max_batch
+        self._pending = []
+        self._handle = None
+        self._tasks = set()
+
+    def submit(
+        self, glat: float, glon: float, alt: float, time: float
+    ) -> "asyncio.Future":
+        """Queue a position, the returned future is set to the ``GeoMagBatchResult`` and the index of the position."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((glat, glon, alt, time, future))
+        if len(self._pending) >= self.max_batch:
+            self.flush()
+        elif self._handle is None:
+            self._handle = loop.call_later(self.window, self.flush)
+        return future
+
+    def flush(self) -> None:
+        """Calculate the waiting positions now."""
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        pending, self._pending = self._pending, []
+        if pending:
+            # Keep a reference until it is done, the event loop only keeps weak ones
+            task = asyncio.get_running_loop().create_task(self._calculate(pending))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _calculate(self, pending: List[Tuple]) -> None:
+        glat, glon, alt, time, futures = zip(*pending)
+        glat, glon, alt, time = (
+            to_column(list(column)) for column in (glat, glon, alt, time)
+        )
+        try:
+            # The lifespan of every position was checked when it was submitted
+            result = await asyncio.get_running_loop().run_in_executor(
+                None, self.geo_mag.calculate_batch, glat, glon, alt, time, True
+            )
+        except Exception as error:
+            for future in futures:
+                if not future.done():
+                    future.set_exception(error)
+            return
+        for index, future in enumerate(futures):
+            if not future.done():
+                future.set_result((result, index))
+
+
+class Server:
+    """Serve the calculations of one or more models over HTTP.
+
+    :param List[GeoMag] models: The models to serve (loaded on ``start``), the first one is the default
+    :param str host: The address to listen on
+    :param int port: The port to listen on, 0 to pick a free one
+    :param float window: The time single positions are collected for, in seconds
+    :param int max_batch: The maximum amount of single positions calculated together
+    """
+
+    def __init__(  # noqa: PLR0913 - Too many arguments
+        self,
+        models: Sequence[GeoMag],
+        host: str = "127.0.0.1",
+        port: int = 8080,
+        window: float = 0.002,
+        max_batch: int = 1000,
+    ) -> None:
+        """Create a Server instance."""
+        if not models:
+            raise ValueError("At least one model is required")
+        self.models = list(models)
+        self.host = host
+        self.port = port
+        self.window = window
+        self.max_batch = max_batch
+        self._geo_mags: Dict[str, GeoMag] = {}
+        self._coalescers: Dict[str, Coalescer] = {}
+        self._server = None
+
+    async def start(self) -> None:
+        """Load and warm up the models, then start listening."""
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, preload_models, self.models)
+        for geo_mag in self.models:
+            self._geo_mags[geo_mag.model] = geo_mag
+            self._coalescers[geo_mag.model] = Coalescer(
+                geo_mag, self.window, self.max_batch
+            )
+        self._server = await asyncio.start_server(
+            self._handle_connection, self.host, self.port
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def stop(self) -> None:
+        """Stop listening."""
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def serve_forever(self) -> None:
+        """Start (if not started yet) and serve until cancelled."""
+        if self._server is None:
+            await self.start()
+        await self._server.serve_forever()
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                keep_alive = await self._handle_request(request_line, reader, writer)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            """The client went away"""
+        finally:
+            writer.close()
+
+    async def _handle_request(
+        self,
+        request_line: bytes,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> bool:
+        """Read the rest of a request, answer it and return if the connection should be kept open."""
+        parts = request_line.decode("latin-1").split()
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = line.decode("latin-1").partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        keep_alive = False
+        try:
+            if len(parts) != 3:  # noqa: PLR2004 Magic value used in comparison
+                raise HTTPError(400, "Invalid request line")
+            method, target, version = parts
+            connection = headers.get("connection", "").lower()
+            keep_alive = (version == "HTTP/1.1" and connection != "close") or (
+                connection == "keep-alive"
+            )
+            try:
+                length = int(headers.get("content-length", 0))
+            except ValueError:
+                raise HTTPError(400, "Invalid Content-Length") from None
+            if length > MAX_BODY_SIZE:
+                keep_alive = False
+                raise HTTPError(413, "Request body is too large")
+            body = await reader.readexactly(length) if length else b""
+            status, payload = 200, await self._dispatch(method, target, body)
+        except HTTPError as error:
+            status, payload = error.status, {"error": str(error)}
+        except (TypeError, ValueError) as error:
+            # Raised for parameters of the wrong type, such as a null value or a scalar in a batch
+            status, payload = 400, {"error": str(error)}
+        except Exception as error:
+            status, payload = 500, {"error": str(error)}
+
+        content = json.dumps(payload).encode()
+        writer.write(
+            (
+                f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(content)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+                "\r\n"
+            ).encode("latin-1")
+            + content
+        )
+        return keep_alive
+
+    async def _dispatch(self, method: str, target: str, body: bytes) -> Dict:
+        url = urlsplit(target)
+        if url.path == "/health":
+            return {"status": "ok"}
+        if url.path == "/models":
+            return {"models": list(self._geo_mags)}
+        if url.path not in ("/calculate", "/calculate_batch"):
+            raise HTTPError(404, f"Unknown path {url.path}")
+
+        if method == "GET" and url.path == "/calculate":
+            params = dict(parse_qsl(url.query))
+        elif method == "POST":
+            try:
+                params = json.loads(body or b"{}")
+            except ValueError:
+                raise HTTPError(400, "The body is not valid JSON") from None
+            if not isinstance(params, dict):
+                raise HTTPError(400, "The body must be a JSON object")
+        else:
+            raise HTTPError(405, f"Method {method} is not allowed")
+
+        model = params.get("model")
+        if model is None:
+            model = self.models[0].model
+        if model not in self._geo_mags:
+            raise HTTPError(404, f"Unknown model {model}")
+
+        if url.path == "/calculate":
+            return await self._calculate(model, params)
+        return await self._calculate_batch(model, params)
+
+    @classmethod
+    def _allow_date_outside_lifespan(cls, params: Dict) -> bool:
+        value = params.get("allow_date_outside_lifespan", False)
+        if isinstance(value, str):
+            return value.lower() in ("1", "true", "yes")
+        return bool(value)
+
+    @classmethod
+    def _now(cls) -> float:
+        return decimal_year_from_date(datetime.datetime.now(datetime.timezone.utc))
+
+    def _check_time(self, model: str, time: float, params: Dict) -> None:
+        start, end = self._geo_mags[model].life_span
+        if not self._allow_date_outside_lifespan(params) and not start <= time <= end:
+            raise ValueError("Time extends beyond model 5-year life span")
+
+    async def _calculate(self, model: str, params: Dict) -> Dict:
+        try:
+            glat = float(params["lat"])
+            glon = float(params["lon"])
+        except KeyError as error:
+            raise HTTPError(400, f"Missing parameter {error.args[0]}") from None
+        alt = float(params.get("alt", 0.0))
+        time = float(params["time"]) if "time" in params else self._now()
+        self._check_time(model, time, params)
+
+        result, index = await self._coalescers[model].submit(glat, glon, alt, time)
+        response = {
+            "model": model,
+            "time": time,
+            "alt": alt,
+            "glat": glat,
+            "glon": glon,
+        }
+        for column in RESULT_COLUMNS:
+            response[column] = _number(getattr(result, column)[index])
+        response["in_blackout_zone"] = bool(result.in_blackout_zone[index])
+        response["in_caution_zone"] = bool(result.in_caution_zone[index])
+        return response
+
+    async def _calculate_batch(self, model: str, params: Dict) -> Dict:
+        try:
+            glat = to_column([float(value) for value in params["lat"]])
+            glon = to_column([float(value) for value in params["lon"]])
+        except KeyError as error:
+            raise HTTPError(400, f"Missing parameter {error.args[0]}") from None
+        alt = params.get("alt", 0.0)
+        time = params.get("time", self._now())
+        if isinstance(alt, (int, float)):
+            alt = float(alt)
+        else:
+            alt = to_column([float(value) for value in alt])
+        if isinstance(time, (int, float)):
+            time = float(time)
+        else:
+            time = to_column([float(value) for value in time])
+
+        result = await asyncio.get_running_loop().run_in_executor(
+            None,
+            self._geo_mags[model].calculate_batch,
+            glat,
+            glon,
+            alt,
+            time,
+            self._allow_date_outside_lifespan(params),
+        )
+        response = {"model": model}
+        for column in RESULT_COLUMNS:
+            response[column] = [_number(value) for value in getattr(result, column)]
+        for column in ("in_blackout_zone", "in_caution_zone"):
+            response[column] = [bool(value) for value in getattr(result, column)]
+        return response
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Entry point of ``python -m pygeomag.server``."""
+    parser = argparse.ArgumentParser(
+        prog="python -m pygeomag.server",
+        description="Serve the Magnetic Components calculations over HTTP.",
+    )
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="address to listen on (default: 127.0.0.1)"
+    )
+    parser.add_argument(
+        "--port", type=int, default=8080, help="port to listen on (default: 8080)"
+    )
+    parser.add_argument(
+        "--model",
+        action="append",
+        help="year, coefficients file or name of a bundled coefficients file (WMM_2020.COF) to serve, can be repeated"
+        " and the first one is the default (default: the latest model)",
+    )
+    parser.add_argument(
+        "--high-resolution",
+        action="store_true",
+        help="use the high resolution models (implied for coefficients files with HR in their name)",
+    )
+    parser.add_argument(
+        "--evaluator", choices=("legendre", "clenshaw"), default="legendre"
+    )
+    parser.add_argument(
+        "--window",
+        type=float,
+        default=0.002,
+        help="seconds to collect single positions for before calculating them together (default: 0.002)",
+    )
+    parser.add_argument(
+        "--max-batch",
+        type=int,
+        default=1000,
+        help="maximum amount of single positions calculated together (default: 1000)",
+    )
+    options = parser.parse_args(argv)
+
+    models = [
+        create_geo_mag(
+            model,
+            options.high_resolution or (model is not None and "HR" in model.upper()),
+            options.evaluator,
+        )
+        for model in (options.model or [None])
+    ]
+    server = Server(
+        models, options.host, options.port, options.window, options.max_batch
+    )
+
+    async def serve() -> None:
+        await server.start()
+        print(
+            f"Serving {', '.join(model.model for model in models)} on http://{options.host}:{server.port}",
+            flush=True,
+        )
+        await server.serve_forever()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        """Stopped"""
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,57 +1,130 @@
 SECONDS_PER_DAY = 86400
 
+# Days of the year before the first of each month, in a year that is not a leap year
+DAYS_BEFORE_MONTH = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
 
-def decimal_year_from_struct_time(date):
+_year_table = {}
+
+
+def _year(year):
+    """Return the days from 1970-01-01 to January 1st of year and the length of year in days, memoized per year."""
+    entry = _year_table.get(year)
+    if entry is None:
+        previous = year - 1
+        start = (
+            365 * previous + previous // 4 - previous // 100 + previous // 400 - 719162
+        )
+        leap = year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+        entry = _year_table[year] = (start, 366 if leap else 365)
+    return entry
+
+
+def _year_of_day(day):
+    """Return the year of a day counted from 1970-01-01."""
+    year = 1970 + day * 400 // 146097
+    start, length = _year(year)
+    while day < start:
+        year -= 1
+        start, length = _year(year)
+    while day >= start + length:
+        year += 1
+        start, length = _year(year)
+    return year
+
+
+def _day_of_year(year, month, day):
+    """Return the days passed in year before month/day."""
+    days = DAYS_BEFORE_MONTH[month - 1] + day - 1
+    if month > 2 and _year(year)[1] == 366:  # noqa: PLR2004 - Magic value used in comparison
+        days += 1
+    return days
+
+
+def _decimal_year_from_epoch(seconds, precise):
+    """Calculate the decimal year of Unix time (UTC) seconds, truncated to the day unless precise."""
+    day = int(seconds // SECONDS_PER_DAY)
+    year = _year_of_day(day)
+    start, length = _year(year)
+    if precise:
+        return year + (seconds / SECONDS_PER_DAY - start) / length
+    return year + float(day - start) / length
+
+
+def _is_ndarray(value):
+    """Return True if value is a NumPy array, without importing NumPy."""
+    return type(value).__module__ == "numpy"
+
+
+def _decimal_year(year, month, day, seconds, precise):
+    """Calculate the decimal year of a day and the seconds passed in it, which are ignored unless precise."""
+    passed = _day_of_year(year, month, day)
+    if precise:
+        passed += seconds / SECONDS_PER_DAY
+    return year + float(passed) / _year(year)[1]
+
+
+def decimal_year_from_struct_time(date, precise=False):
     """Calculate the decimal year (2022.5) from a 'time.struct_time'.
 
+    The fields of the value are used as they are, like ``time.gmtime`` returns them for UTC, ``tm_wday``, ``tm_yday``
+    and ``tm_isdst`` are ignored.
+
+    :param date: The 'time.struct_time'
+    :param bool precise: True to include the time of the day, otherwise only the days passed are counted
+
     >>> import time
     >>> from pygeomag import decimal_year_from_struct_time
-    >>> value = time.struct_time((2020, 7, 2, 0, 0, 0, 0, 0, 0))
+    >>> value = time.struct_time((2020, 7, 2, 12, 0, 0, 0, 0, 0))
     >>> decimal_year_from_struct_time(value)
     2020.5
+    >>> round((decimal_year_from_struct_time(value, precise=True) - 2020.5) * 366, 6)
+    0.5
     """
-    # Inline imports to not fail on lightweight versions of Python
-    import time
+    seconds = date.tm_hour * 3600 + date.tm_min * 60 + date.tm_sec
+    return _decimal_year(date.tm_year, date.tm_mon, date.tm_mday, seconds, precise)
 
-    # we want to clear out tm_wday, tm_yday, and tm_isdst because they can mess with the result from mktime
-    # For instance, if tm_isdst is 1 it would subtract an hour from 2022-07-02T00:00:00 making it 2022-07-01T23:00:00
-    # and thus a different day
-    date = time.struct_time(tuple(date[:6]) + (0, 0, 0))
-    year = date.tm_year
-    current_year = time.mktime(time.struct_time((year, 1, 1, 0, 0, 0, 0, 0, 0)))
-    following_year = time.mktime(time.struct_time((year + 1, 1, 1, 0, 0, 0, 0, 0, 0)))
-    days_in_year = (following_year - current_year) / SECONDS_PER_DAY
-    days_passed = int((time.mktime(date) - current_year) / SECONDS_PER_DAY)
-    return year + float(days_passed) / days_in_year
 
-
-def decimal_year_from_date(date):
+def decimal_year_from_date(date, precise=False):
     """Calculate the decimal year (2022.5) from a 'datetime.date' or 'datetime.datetime'.
 
+    :param date: The 'datetime.date' or 'datetime.datetime'
+    :param bool precise: True to include the time of the day of a 'datetime.datetime', converted to UTC if it has a
+        time zone, otherwise only the days passed are counted
+
     >>> import datetime
     >>> from pygeomag import decimal_year_from_date
-    >>> value = datetime.datetime(2020, 7, 2)
+    >>> value = datetime.datetime(2020, 7, 2, 12)
     >>> decimal_year_from_date(value)
     2020.5
+    >>> round((decimal_year_from_date(value, precise=True) - 2020.5) * 366, 6)
+    0.5
     """
-    # Inline imports to not fail on lightweight versions of Python
-    import datetime
-
-    if isinstance(date, datetime.datetime):
-        date = date.date()
-    year = date.year
-    current_year = datetime.date(year + 1, 1, 1)
-    following_year = datetime.date(year, 1, 1)
-    days_in_year = (current_year - following_year).days
-    days_passed = (date - datetime.date(year, 1, 1)).days
-    return year + float(days_passed) / days_in_year
+    seconds = 0
+    if hasattr(date, "hour"):
+        if precise:
+            offset = date.utcoffset()
+            if offset:
+                date = date - offset
+            seconds = (
+                date.hour * 3600
+                + date.minute * 60
+                + date.second
+                + date.microsecond / 1e6
+            )
+    return _decimal_year(date.year, date.month, date.day, seconds, precise)
 
 
-def calculate_decimal_year(date):
+def calculate_decimal_year(date, precise=False):
     """Calculate the decimal year (2022.5) from a value (i.e. 'datetime.datetime' or 'time.struct_time').
 
     If you know using either date format will work in your version of Python, you can use this wrapper method.
 
+    Numbers below 3000 are decimal years, others are Unix times which are read in the local time zone, or as UTC if
+    precise.
+
+    :param date: The value to convert
+    :param bool precise: True to include the time of the day, otherwise only the days passed are counted
+
     >>> import datetime
     >>> from pygeomag import calculate_decimal_year
     >>> calculate_decimal_year(datetime.datetime(2020, 7, 2))
@@ -64,11 +137,120 @@ def calculate_decimal_year(date):
     if isinstance(date, (float, int)):
         if date < 3000:  # noqa: PLR2004 - Magic value used in comparison
             return float(date)
+        elif precise:
+            return _decimal_year_from_epoch(date, precise)
         else:
             return decimal_year_from_struct_time(time.localtime(date))
     elif isinstance(date, datetime.date):
-        return decimal_year_from_date(date)
+        return decimal_year_from_date(date, precise)
     elif isinstance(date, time.struct_time):
-        return decimal_year_from_struct_time(date)
+        return decimal_year_from_struct_time(date, precise)
 
     raise TypeError("Unsupported date format")
+
+
+def decimal_years_from_epoch(seconds, precise=False):
+    """Calculate the decimal years of many Unix times (seconds since 1970-01-01 UTC).
+
+    The years are found in a table of the start and length of every year, which is only calculated once per year.
+    A NumPy array is converted with array operations and a NumPy array is returned (NaN and infinite values are
+    returned unchanged), any other sequence of numbers returns a list.
+
+    :param seconds: A list, ``array`` or NumPy array of Unix times
+    :param bool precise: True to include the time of the day, otherwise the days passed are counted like
+        ``decimal_year_from_date``
+
+    >>> from pygeomag.time import decimal_years_from_epoch
+    >>> decimal_years_from_epoch([1593648000, 1593691200])
+    [2020.5, 2020.5]
+    >>> round((decimal_years_from_epoch([1593691200], precise=True)[0] - 2020.5) * 366, 6)
+    0.5
+    """
+    if _is_ndarray(seconds):
+        # Inline imports to only load NumPy when it is used
+        import numpy
+
+        seconds = numpy.asarray(seconds, dtype=numpy.float64)
+        # NaN and infinity can't be cast to days, they are returned unchanged
+        finite = numpy.isfinite(seconds)
+        days = numpy.floor(numpy.where(finite, seconds, 0.0) / SECONDS_PER_DAY)
+        # NumPy finds the year of every day and the first day of the year (and of the next one) as datetime64
+        years = days.astype(numpy.int64).astype("datetime64[D]").astype("datetime64[Y]")
+        start = years.astype("datetime64[D]").astype(numpy.int64)
+        length = (years + 1).astype("datetime64[D]").astype(numpy.int64) - start
+        passed = seconds / SECONDS_PER_DAY if precise else days
+        decimal_years = years.astype(numpy.int64) + 1970 + (passed - start) / length
+        return numpy.where(finite, decimal_years, seconds)
+
+    return [_decimal_year_from_epoch(value, precise) for value in seconds]
+
+
+def decimal_years_from_datetime64(values, precise=False):
+    """Calculate the decimal years of a NumPy ``datetime64`` array (as UTC), see ``decimal_years_from_epoch``.
+
+    ``NaT`` values return ``nan``.
+
+    :param values: A NumPy ``datetime64`` array of any unit
+    :param bool precise: True to include the time of the day
+    """
+    # Inline imports to only load NumPy when it is used
+    import numpy
+
+    values = numpy.asarray(values)
+    if values.dtype.kind != "M":
+        raise TypeError("Unsupported date format")
+    seconds = (values - numpy.datetime64(0, "s")) / numpy.timedelta64(1, "s")
+    nat = numpy.isnat(values)
+    if nat.any():
+        result = numpy.full(values.shape, numpy.nan)
+        result[~nat] = decimal_years_from_epoch(seconds[~nat], precise)
+        return result
+    return decimal_years_from_epoch(seconds, precise)
+
+
+def calculate_decimal_years(dates, precise=False):
+    """Calculate the decimal years of many values, see ``calculate_decimal_year``.
+
+    - NumPy ``datetime64`` arrays are converted by ``decimal_years_from_datetime64``
+    - NumPy number arrays keep values below 3000 (decimal years) and convert the others as Unix times (UTC), NaN values
+      stay NaN
+    - Any other sequence can mix numbers, ``datetime.date``, ``datetime.datetime`` and ``time.struct_time`` values, a
+      list is returned
+
+    Unix times are always read as UTC, ``calculate_decimal_year`` only reads them as UTC if precise.
+
+    :param dates: The values to convert
+    :param bool precise: True to include the time of the day
+
+    >>> import datetime
+    >>> from pygeomag.time import calculate_decimal_years
+    >>> calculate_decimal_years([2025.25, datetime.date(2020, 7, 2), 1593648000])
+    [2025.25, 2020.5, 2020.5]
+    """
+    if _is_ndarray(dates):
+        # Inline imports to only load NumPy when it is used
+        import numpy
+
+        if dates.dtype.kind == "M":
+            return decimal_years_from_datetime64(dates, precise)
+        dates = numpy.asarray(dates, dtype=numpy.float64)
+        years = dates < 3000  # noqa: PLR2004 - Magic value used in comparison
+        return numpy.where(years, dates, decimal_years_from_epoch(dates, precise))
+
+    # Inline imports to not fail on lightweight versions of Python
+    import datetime
+
+    years = []
+    for date in dates:
+        if isinstance(date, (float, int)):
+            if date < 3000:  # noqa: PLR2004 - Magic value used in comparison
+                years.append(float(date))
+            else:
+                years.append(_decimal_year_from_epoch(date, precise))
+        elif isinstance(date, datetime.date):
+            years.append(decimal_year_from_date(date, precise))
+        elif hasattr(date, "tm_year"):
+            years.append(decimal_year_from_struct_time(date, precise))
+        else:
+            raise TypeError("Unsupported date format")
+    return years
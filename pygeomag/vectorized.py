@@ -0,0 +1,461 @@
+"""NumPy versions of the ``GeoMag`` calculations, working on whole columns at once.
+
+``GeoMag.calculate_batch`` uses these when it is given NumPy arrays, every step (the time and position conversions, the
+field summation and the derived values) is done with array operations instead of a Python loop per position. When the
+Numba backend is selected the field is summed by its compiled batch kernels instead. Importing this module requires
+`NumPy <https://numpy.org/>`_.
+
+.. code-block:: python
+
+    import numpy
+    from pygeomag import GeoMag
+    geo_mag = GeoMag(coefficients_file="wmm/WMM_2025.COF")
+    result = geo_mag.calculate_batch(numpy.array([47.6205, 0.0]), numpy.array([-122.3493, 0.0]), 0.0, 2025.25)
+    result.d  # array([15.06562964, -3.9854325 ])
+
+``calculate_batch`` can sum the field in single precision (``dtype=numpy.float32``), which halves the memory of the
+intermediate columns and is about twice as fast. ``precision_report`` measures the error this adds, for the bundled
+models the maximum error over a 1 degree grid at sea level (in the middle of their life span) is:
+
+==========================  =========  ========  ==========  =========
+Model                       x, y, z    h, f      i           d
+==========================  =========  ========  ==========  =========
+WMM 2010 to 2025            0.05 nT    0.05 nT   0.00003°    0.001°
+WMMHR 2025 (``legendre``)   0.1 nT     0.1 nT    0.00006°    0.001°
+WMMHR 2025 (``clenshaw``)   0.04 nT    0.04 nT   0.00003°    0.0005°
+==========================  =========  ========  ==========  =========
+"""
+
+from typing import Dict, Optional, Tuple
+
+import numpy
+
+from pygeomag import backend, instrumentation
+from pygeomag.geomag import (
+    BLACKOUT_ZONE,
+    CAUTION_ZONE,
+    EVALUATOR_CLENSHAW,
+    GeoMag,
+    GeoMagBatchResult,
+)
+
+# Peak bytes used per position and per degree of the model by calculate_batch (measured with tracemalloc, the
+# clenshaw evaluator uses the most)
+BYTES_PER_ROW_AND_DEGREE = 200
+
+
+def rows_per_chunk(
+    geo_mag: GeoMag, memory: int = 64 * 1024 * 1024, dtype=numpy.float64
+) -> int:
+    """Return how many positions ``calculate_batch`` can calculate at once using about memory bytes.
+
+    The intermediate columns grow with the degree of the model, 10000 positions of the high resolution model use about
+    260 MB while 10000 positions of the standard model use about 26 MB (half of it with ``dtype=numpy.float32``).
+
+    :param GeoMag geo_mag: The model to calculate with
+    :param int memory: The bytes the calculation of a chunk may use
+    :param dtype: The precision of the field summation, see ``calculate_batch``
+    """
+    row_bytes = BYTES_PER_ROW_AND_DEGREE * numpy.dtype(dtype).itemsize // 8
+    return max(1, memory // (row_bytes * (geo_mag._maxord + 1)))
+
+
+def broadcast(value, count: int) -> numpy.ndarray:
+    """Return value as a float64 column of count values."""
+    column = numpy.asarray(value, dtype=numpy.float64)
+    if column.ndim == 0:
+        return numpy.full(count, column)
+    if column.shape != (count,):
+        raise ValueError("All columns must have the same length")
+    return column
+
+
+def time_delta(
+    geo_mag: GeoMag, time: numpy.ndarray, allow_date_outside_lifespan: bool
+) -> numpy.ndarray:
+    """Return the times since the epoch of the loaded model, raising if any is outside the 5-year life span."""
+    dt = time - geo_mag._epoch
+    if not allow_date_outside_lifespan and ((dt < 0.0) | (dt > 5.0)).any():  # noqa: PLR2004 Magic value used in comparison
+        raise ValueError("Time extends beyond model 5-year life span")
+    return dt
+
+
+def geodetic_to_spherical(
+    glat: numpy.ndarray, glon: numpy.ndarray, alt: numpy.ndarray
+) -> Tuple[numpy.ndarray, ...]:
+    """Convert geodetic positions to geocentric spherical coordinates, see ``GeoMag._geodetic_to_spherical``.
+
+    :return: The columns (r, ct, st, srlon, crlon, ca, sa)
+    """
+    a = 6378.137
+    b = 6356.7523142
+    a2 = a * a
+    b2 = b * b
+    c2 = a2 - b2
+    a4 = a2 * a2
+    b4 = b2 * b2
+    c4 = a4 - b4
+
+    rlon = numpy.radians(glon)
+    rlat = numpy.radians(glat)
+    srlon = numpy.sin(rlon)
+    srlat = numpy.sin(rlat)
+    crlon = numpy.cos(rlon)
+    crlat = numpy.cos(rlat)
+    srlat2 = srlat * srlat
+    crlat2 = crlat * crlat
+
+    q = numpy.sqrt(a2 - c2 * srlat2)
+    q1 = alt * q
+    q2 = ((q1 + a2) / (q1 + b2)) * ((q1 + a2) / (q1 + b2))
+    ct = srlat / numpy.sqrt(q2 * crlat2 + srlat2)
+    st = numpy.sqrt(1.0 - (ct * ct))
+    r2 = (alt * alt) + 2.0 * q1 + (a4 - c4 * srlat2) / (q * q)
+    r = numpy.sqrt(r2)
+    d = numpy.sqrt(a2 * crlat2 + b2 * srlat2)
+    ca = (alt + d) / r
+    sa = c2 * crlat * srlat / (r * d)
+
+    return r, ct, st, srlon, crlon, ca, sa
+
+
+def legendre_field(  # noqa: PLR0913 - Too many arguments
+    geo_mag: GeoMag,
+    r: numpy.ndarray,
+    ct: numpy.ndarray,
+    st: numpy.ndarray,
+    srlon: numpy.ndarray,
+    crlon: numpy.ndarray,
+    dt: numpy.ndarray,
+) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Sum the field of the ``legendre`` evaluator, every order of a degree at once for every position.
+
+    The recursions are the ones of ``GeoMag._calculate_legendre``, keeping only the last two degrees. The columns are
+    summed in the precision of ``r``.
+
+    ``P(n, m)`` has a factor ``sin(theta) ** m``, so close to the geographic poles the functions of high degrees are
+    subnormal numbers (in single precision from about 0.0001 degrees of a pole with the high resolution model) and
+    dividing the phi component by ``sin(theta)`` magnifies their rounding errors. Instead of ``P(n, m)`` the orders
+    ``m > 0`` keep ``P(n, m) / sin(theta)``, which follows the same recursion (it is the pole recursion of
+    ``GeoMag._calculate_legendre`` for order 1), so nothing is divided and the poles need no special case.
+    """
+    maxord = geo_mag._maxord
+    dtype = r.dtype
+    c = numpy.asarray(geo_mag._c, dtype=dtype)
+    k = numpy.asarray(geo_mag._k, dtype=dtype)
+    count = len(r)
+
+    cp = numpy.empty((maxord + 1, count), dtype=dtype)
+    sp = numpy.empty((maxord + 1, count), dtype=dtype)
+    cp[0] = 1.0
+    sp[0] = 0.0
+    cp[1] = crlon
+    sp[1] = srlon
+    for m in range(2, maxord + 1):
+        sp[m] = sp[1] * cp[m - 1] + cp[1] * sp[m - 1]
+        cp[m] = cp[1] * cp[m - 1] - sp[1] * sp[m - 1]
+
+    # P(n, 0) and P(n, m) / sin(theta), and the derivatives dP(n, m) / dtheta, of degree n - 2, n - 1 and n, rotated
+    # every degree
+    p2, p1, p = (numpy.zeros((maxord + 1, count), dtype=dtype) for _ in range(3))
+    dp2, dp1, dp = (numpy.zeros((maxord + 1, count), dtype=dtype) for _ in range(3))
+    p1[0] = 1.0
+    st2 = st * st
+    orders = numpy.arange(maxord + 1, dtype=dtype)[:, None]
+
+    aor = 6371.2 / r
+    ar = aor * aor
+    br = numpy.zeros(count, dtype=dtype)
+    bt = numpy.zeros(count, dtype=dtype)
+    bp = numpy.zeros(count, dtype=dtype)
+    for n in range(1, maxord + 1):
+        ar = ar * aor
+        i = n * (n + 1) // 2
+        kn = k[i : i + n, None]
+        p[:n] = ct * p1[:n] - kn * p2[:n]
+        dp[0] = ct * dp1[0] - st * p1[0] - kn[0] * dp2[0]
+        dp[1:n] = ct * dp1[1:n] - st2 * p1[1:n] - kn[1:] * dp2[1:n]
+        # P(n, n) / sin(theta) is P(n - 1, n - 1)
+        p[n] = p1[0] if n == 1 else st * p1[n - 1]
+        dp[n] = st * dp1[n - 1] + ct * p[n]
+
+        gnm = (
+            c[4 * i : 4 * (i + n + 1) : 4, None]
+            + dt * c[4 * i + 2 : 4 * (i + n + 1) : 4, None]
+        )
+        hnm = (
+            c[4 * i + 1 : 4 * (i + n + 1) : 4, None]
+            + dt * c[4 * i + 3 : 4 * (i + n + 1) : 4, None]
+        )
+        temp1 = gnm * cp[: n + 1] + hnm * sp[: n + 1]
+        temp2 = gnm * sp[: n + 1] - hnm * cp[: n + 1]
+        bt -= ar * (temp1 * dp[: n + 1]).sum(axis=0)
+        bp += ar * (orders[1 : n + 1] * temp2[1:] * p[1 : n + 1]).sum(axis=0)
+        br += (
+            (n + 1)
+            * ar
+            * (temp1[0] * p[0] + st * (temp1[1:] * p[1 : n + 1]).sum(axis=0))
+        )
+
+        p2, p1, p = p1, p, p2
+        dp2, dp1, dp = dp1, dp, dp2
+
+    return br, bt, bp
+
+
+def clenshaw_field(  # noqa: PLR0913 - Too many arguments
+    geo_mag: GeoMag,
+    r: numpy.ndarray,
+    ct: numpy.ndarray,
+    st: numpy.ndarray,
+    srlon: numpy.ndarray,
+    crlon: numpy.ndarray,
+    dt: numpy.ndarray,
+) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Sum the field of the ``clenshaw`` evaluator, every order of a degree at once for every position.
+
+    The sums over ``n`` of ``GeoMag._calculate_clenshaw`` are independent for every order, so they are run side by side
+    from the highest degree down, order ``m`` joining in at degree ``m``. The sum over ``m`` is then done as before. The
+    columns are summed in the precision of ``r``.
+    """
+    maxord = geo_mag._maxord
+    dtype = r.dtype
+    c = numpy.asarray(geo_mag._c, dtype=dtype)
+    k = numpy.asarray(geo_mag._k, dtype=dtype)
+    count = len(r)
+
+    aor = 6371.2 / r
+    ar = aor * aor
+
+    # Clenshaw values of every order for the sums over n of: g Q, h Q, (n + 1) g Q, (n + 1) h Q, g dQ, h dQ
+    yg1, yg2, yh1, yh2, rg1, rg2, rh1, rh2, dg1, dg2, dh1, dh2 = (
+        numpy.zeros((maxord + 1, count), dtype=dtype) for _ in range(12)
+    )
+    powers = [ar]
+    for _ in range(maxord):
+        powers.append(powers[-1] * aor)
+    for n in range(maxord, -1, -1):
+        m = numpy.arange(n + 1)
+        i = m * (maxord + 1) - m * (m - 1) // 2 + n - m
+        an = k[2 * i, None]
+        bn = k[2 * i + 1, None]
+        at = an * ct
+        gnm = (c[4 * i, None] + dt * c[4 * i + 2, None]) * powers[n]
+        hnm = (c[4 * i + 1, None] + dt * c[4 * i + 3, None]) * powers[n]
+        fn = float(n + 1)
+        rows = slice(0, n + 1)
+
+        dg = an * yg1[rows] + at * dg1[rows] - bn * dg2[rows]
+        dh = an * yh1[rows] + at * dh1[rows] - bn * dh2[rows]
+        yg = gnm + at * yg1[rows] - bn * yg2[rows]
+        yh = hnm + at * yh1[rows] - bn * yh2[rows]
+        rg = fn * gnm + at * rg1[rows] - bn * rg2[rows]
+        rh = fn * hnm + at * rh1[rows] - bn * rh2[rows]
+        dg2[rows], dg1[rows] = dg1[rows], dg
+        dh2[rows], dh1[rows] = dh1[rows], dh
+        yg2[rows], yg1[rows] = yg1[rows], yg
+        yh2[rows], yh1[rows] = yh1[rows], yh
+        rg2[rows], rg1[rows] = rg1[rows], rg
+        rh2[rows], rh1[rows] = rh1[rows], rh
+
+    alpha = 2.0 * st * crlon
+    beta = -st * st
+    za1, za2, zb1, zb2, zc1, zc2, zd1, zd2, ze1, ze2, zf1, zf2 = (
+        numpy.zeros(count, dtype=dtype) for _ in range(12)
+    )
+    for m in range(maxord, -1, -1):
+        za1, za2 = rg1[m] + alpha * za1 + beta * za2, za1
+        zb1, zb2 = rh1[m] + alpha * zb1 + beta * zb2, zb1
+        zc1, zc2 = dg1[m] + alpha * zc1 + beta * zc2, zc1
+        zd1, zd2 = dh1[m] + alpha * zd1 + beta * zd2, zd1
+        if m > 0:
+            ze1, ze2 = m * yg1[m] + alpha * ze1 + beta * ze2, ze1
+            zf1, zf2 = m * yh1[m] + alpha * zf1 + beta * zf2, zf1
+
+    br = za1 - st * crlon * za2 + st * srlon * zb2
+    bt = -ct * (crlon * ze1 - st * ze2 + srlon * zf1) + st * (
+        zc1 - st * crlon * zc2 + st * srlon * zd2
+    )
+    bp = srlon * ze1 - crlon * zf1 + st * zf2
+    return br, bt, bp
+
+
+def calculate_field(  # noqa: PLR0913 - Too many arguments
+    geo_mag: GeoMag,
+    r: numpy.ndarray,
+    ct: numpy.ndarray,
+    st: numpy.ndarray,
+    srlon: numpy.ndarray,
+    crlon: numpy.ndarray,
+    dt: numpy.ndarray,
+) -> Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]:
+    """Calculate the spherical field components columns with the selected evaluator and ``pygeomag.backend``.
+
+    Single precision columns are always summed with NumPy, the compiled kernels work in double precision.
+
+    :return: The radial, theta and phi component columns (br, bt, bp) of the field
+    """
+    if backend.get_backend() != backend.BACKEND_PYTHON and r.dtype == numpy.float64:
+        br = numpy.empty(len(r))
+        bt = numpy.empty(len(r))
+        bp = numpy.empty(len(r))
+        backend.calculate_field_batch(
+            geo_mag._evaluator,
+            geo_mag._maxord,
+            geo_mag._c,
+            geo_mag._k,
+            r,
+            ct,
+            st,
+            srlon,
+            crlon,
+            dt,
+            br,
+            bt,
+            bp,
+        )
+        return br, bt, bp
+    if geo_mag._evaluator == EVALUATOR_CLENSHAW:
+        return clenshaw_field(geo_mag, r, ct, st, srlon, crlon, dt)
+    return legendre_field(geo_mag, r, ct, st, srlon, crlon, dt)
+
+
+def grid_variation(
+    glat: numpy.ndarray, glon: numpy.ndarray, d: numpy.ndarray
+) -> numpy.ndarray:
+    """Return the magnetic grid variations, ``nan`` where the position isn't in the arctic or antarctic."""
+    gv = numpy.where(glat > 0.0, d - glon, d + glon)
+    gv = numpy.where(gv > 180.0, gv - 360.0, gv)  # noqa: PLR2004 Magic value used in comparison
+    gv = numpy.where(gv < -180.0, gv + 360.0, gv)  # noqa: PLR2004 Magic value used in comparison
+    return numpy.where(numpy.fabs(glat) >= 55.0, gv, numpy.nan)  # noqa: PLR2004 Magic value used in comparison
+
+
+def calculate_batch(  # noqa: PLR0913 - Too many arguments
+    geo_mag: GeoMag,
+    glat,
+    glon,
+    alt,
+    time,
+    allow_date_outside_lifespan: bool = False,
+    dtype=numpy.float64,
+    raise_in_warning_zone: bool = False,
+    blackout_zone: float = BLACKOUT_ZONE,
+    caution_zone: float = CAUTION_ZONE,
+) -> GeoMagBatchResult:
+    """Calculate the Magnetic Components for columns of positions, see ``GeoMag.calculate_batch``.
+
+    The positions are always converted in double precision, the field and the values derived from it are calculated
+    in the precision of dtype.
+
+    :param dtype: ``numpy.float64``, or ``numpy.float32`` to sum the field in single precision (see
+        ``precision_report``)
+    :param bool raise_in_warning_zone: True to raise the exception of the first position in a Blackout or Caution Zone,
+        otherwise they are marked in the boolean ``in_blackout_zone`` and ``in_caution_zone`` columns
+    :param float blackout_zone: The horizontal intensity (nT) below which a position is in a Blackout Zone
+    :param float caution_zone: The horizontal intensity (nT) below which a position is in a Caution Zone
+    :return: A GeoMagBatchResult object with NumPy columns
+    """
+    dtype = numpy.dtype(dtype)
+    if dtype not in (numpy.float32, numpy.float64):
+        raise ValueError("dtype must be float32 or float64")
+
+    glat = numpy.asarray(glat, dtype=numpy.float64)
+    count = len(glat)
+    glon = broadcast(glon, count)
+    alt = broadcast(alt, count)
+    time = broadcast(time, count)
+
+    geo_mag._load_coefficients()
+
+    stats = instrumentation.active()
+    if stats is not None:
+        start = stats.clock()
+
+    dt = time_delta(geo_mag, time, allow_date_outside_lifespan)
+    r, ct, st, srlon, crlon, ca, sa = geodetic_to_spherical(glat, glon, alt)
+    if dtype != numpy.float64:
+        r, ct, st, srlon, crlon, ca, sa, dt = (
+            column.astype(dtype) for column in (r, ct, st, srlon, crlon, ca, sa, dt)
+        )
+
+    if stats is not None:
+        start = stats.record(
+            geo_mag._model, instrumentation.PHASE_CONVERT, start, count
+        )
+
+    br, bt, bp = calculate_field(geo_mag, r, ct, st, srlon, crlon, dt)
+
+    if stats is not None:
+        start = stats.record(geo_mag._model, instrumentation.PHASE_FIELD, start, count)
+
+    # ROTATE MAGNETIC VECTOR COMPONENTS FROM SPHERICAL TO
+    # GEODETIC COORDINATES
+    bx = -bt * ca - br * sa
+    by = bp
+    bz = bt * sa - br * ca
+
+    result = GeoMagBatchResult(time, alt, glat, glon)
+    result.is_high_resolution = geo_mag._high_resolution
+    result.x = bx
+    result.y = by
+    result.z = bz
+    result.h = numpy.sqrt((bx * bx) + (by * by))
+    result.f = numpy.sqrt((result.h * result.h) + (bz * bz))
+    result.i = numpy.degrees(numpy.arctan2(bz, result.h))
+    result.d = numpy.degrees(numpy.arctan2(by, bx))
+    result.gv = grid_variation(glat.astype(dtype), glon.astype(dtype), result.d)
+    result.check_zones(raise_in_warning_zone, blackout_zone, caution_zone)
+
+    if stats is not None:
+        stats.record(geo_mag._model, instrumentation.PHASE_RESULT, start, count)
+    return result
+
+
+PRECISION_COLUMNS = ("x", "y", "z", "h", "f", "i", "d")
+
+
+def precision_report(
+    geo_mag: GeoMag,
+    step: float = 1.0,
+    alt: float = 0.0,
+    time: Optional[float] = None,
+    dtype=numpy.float32,
+) -> Dict[str, Dict[str, float]]:
+    """Measure the error of ``calculate_batch`` in the precision of dtype against double precision, over a global grid.
+
+    Declinations are only compared within 89 degrees of the equator, where the horizontal intensity is large
+    enough for them to be meaningful.
+
+    :param GeoMag geo_mag: The model to measure
+    :param float step: The spacing of the grid, in degrees
+    :param float alt: The altitude of the grid, in km
+    :param float time: The time (decimal year), None for the middle of the life span of the model
+    :param dtype: The precision to measure
+    :return: The maximum, mean and root mean square absolute error of every column (nT, or degrees for ``i`` and
+        ``d``), ``{"d": {"max": ..., "mean": ..., "rms": ...}, ...}``
+    """
+    geo_mag._load_coefficients()
+    if time is None:
+        time = geo_mag._epoch + 2.5
+    lat, lon = numpy.meshgrid(
+        numpy.arange(-90.0, 90.0 + step / 2, step),
+        numpy.arange(-180.0, 180.0, step),
+    )
+    lat = lat.ravel()
+    lon = lon.ravel()
+    expected = calculate_batch(geo_mag, lat, lon, alt, time, True)
+    result = calculate_batch(geo_mag, lat, lon, alt, time, True, dtype)
+
+    report = {}
+    for column in PRECISION_COLUMNS:
+        error = numpy.abs(
+            getattr(result, column).astype(numpy.float64) - getattr(expected, column)
+        )
+        if column == "d":
+            error = numpy.minimum(error, 360.0 - error)[numpy.fabs(lat) <= 89.0]  # noqa: PLR2004 Magic value used in comparison
+        report[column] = {
+            "max": float(error.max()),
+            "mean": float(error.mean()),
+            "rms": float(numpy.sqrt((error * error).mean())),
+        }
+    return report
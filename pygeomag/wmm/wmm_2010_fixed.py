@@ -0,0 +1,191 @@
+"""Fixed point tables of WMM-2010, generated by ``python -m pygeomag.fixedpoint``."""
+
+WMM_2010_FIXED = (
+    (2010.0, "WMM-2010", "11/20/2009", 12),
+    (
+        (0, 0, 0, 0),
+        (-29496600, 0, 11600, 0),
+        (-1586300, 4944400, 16500, -25900),
+        (-2396600, 0, -12100, 0),
+        (3026100, -2707700, -4400, -22500),
+        (1668600, -576100, 1900, -11800),
+        (1340100, 0, 400, 0),
+        (-2326200, -160200, -4100, 7300),
+        (1231900, 251900, -2900, -3900),
+        (634000, -536600, -7700, -2600),
+        (912600, 0, -1800, 0),
+        (808900, 286400, 2300, 1100),
+        (166700, -211200, -8700, 2700),
+        (-357100, 164300, 4600, 3900),
+        (89400, -309100, -2100, -800),
+        (-230900, 0, -1000, 0),
+        (357200, 44600, 600, 400),
+        (200300, 188900, -1800, 1800),
+        (-141100, -118200, -1000, 1200),
+        (-163000, 0, 900, 4000),
+        (-7800, 100900, 1000, -600),
+        (72800, 0, -200, 0),
+        (68600, -20800, -200, -200),
+        (76000, 44100, -100, -2100),
+        (-141400, 61500, 2000, -400),
+        (-22800, -66300, -1700, -600),
+        (13200, 3100, -300, 500),
+        (-77900, 55000, 1700, 900),
+        (80500, 0, 100, 0),
+        (-75100, -57900, -100, 700),
+        (-4700, -21100, -600, 300),
+        (45300, 6500, 1300, -100),
+        (13900, 24900, 400, -100),
+        (10400, 7000, 300, -800),
+        (1700, -27700, -700, -300),
+        (4900, -3300, 600, 300),
+        (24400, 0, -100, 0),
+        (8100, 11000, 100, -100),
+        (-14500, -20000, -600, 200),
+        (-5600, 11900, 200, 400),
+        (-19300, -17400, -200, 400),
+        (11500, 16700, 300, 100),
+        (10900, 7000, 300, -100),
+        (-14100, -10800, -600, 400),
+        (-3700, 1700, 200, 300),
+        (5400, 0, 0, 0),
+        (9400, -20500, -100, 0),
+        (3400, 11500, 0, -200),
+        (-5200, 12800, 300, 0),
+        (3100, -7200, -400, -100),
+        (-12400, -7400, -300, 100),
+        (-700, 8000, 100, 0),
+        (8400, 2100, -100, -200),
+        (-8500, -6100, -400, 300),
+        (-10100, 7000, -200, 200),
+        (-2000, 0, 0, 0),
+        (-6300, 2800, 0, 100),
+        (900, -100, -100, -100),
+        (-1100, 4700, 200, 0),
+        (-200, 4400, 0, -100),
+        (2500, -7200, -100, -100),
+        (-300, -1000, -200, 0),
+        (2200, -3900, 0, -100),
+        (3100, -2000, -100, -200),
+        (-1000, -2000, -200, 0),
+        (-2800, -8300, -200, -100),
+        (3000, 0, 0, 0),
+        (-1500, 200, 0, 0),
+        (-2100, 1700, 0, 100),
+        (1700, -600, 100, 0),
+        (-500, -1800, 0, 100),
+        (500, 900, 0, 0),
+        (-800, -400, 0, 100),
+        (400, -2500, 0, 0),
+        (1800, -1300, 0, -100),
+        (100, -2100, 0, -100),
+        (700, -1900, -100, 0),
+        (3800, -1800, 0, -100),
+        (-2200, 0, 0, 0),
+        (-200, -900, 0, 0),
+        (300, 300, 100, 0),
+        (1000, 2100, 100, 0),
+        (-600, -2500, -100, 0),
+        (900, 500, 0, 0),
+        (-100, 600, 0, 100),
+        (500, 0, 0, 0),
+        (-400, 100, 0, 0),
+        (-400, 300, 0, 0),
+        (200, -900, 0, 0),
+        (-800, -200, -100, 0),
+        (0, 900, 100, 0),
+    ),
+    (
+        (268435456, 0),
+        (268435456, 0),
+        (268435456, 0),
+        (402653184, 134217728),
+        (464943848, 0),
+        (232471924, 0),
+        (447392427, 178956971),
+        (474531328, 164382474),
+        (600239927, 0),
+        (245046924, 0),
+        (469762048, 201326592),
+        (485168157, 196037539),
+        (542434490, 173274342),
+        (710213460, 0),
+        (251098377, 0),
+        (483183821, 214748365),
+        (493147422, 212216861),
+        (527196770, 202918131),
+        (603979776, 177553365),
+        (805306368, 0),
+        (254660234, 0),
+        (492131669, 223696213),
+        (499112609, 222285676),
+        (521984461, 217457573),
+        (568264704, 206641710),
+        (660263920, 180071978),
+        (890299688, 0),
+        (257007382, 0),
+        (498522990, 230087534),
+        (503689169, 229220408),
+        (520207937, 226364652),
+        (551763840, 220542232),
+        (607471994, 208976719),
+        (712324054, 181731663),
+        (967857801, 0),
+        (258670878, 0),
+        (503316480, 234881024),
+        (507295328, 234309675),
+        (519823025, 232471924),
+        (542937443, 228922526),
+        (581179810, 222574922),
+        (644761110, 210578097),
+        (760942992, 182907932),
+        (1039646051, 0),
+        (259911513, 0),
+        (507044750, 238609294),
+        (510203938, 238212836),
+        (520048008, 236957326),
+        (537802172, 234614568),
+        (566020449, 230676747),
+        (609810343, 224015551),
+        (680271917, 211744743),
+        (806703258, 183785193),
+        (1106787739, 0),
+        (260872372, 0),
+        (510027366, 241591910),
+        (512596790, 241305530),
+        (520544501, 240408393),
+        (534653955, 238773118),
+        (556485479, 236133125),
+        (588928875, 231954745),
+        (637534208, 225089973),
+        (714181163, 212632566),
+        (850045611, 184464623),
+        (1170083026, 0),
+        (261638518, 0),
+        (512467689, 244032233),
+        (514598541, 243818611),
+        (521154200, 243154642),
+        (532660095, 241964450),
+        (550128980, 240095971),
+        (575338659, 237265664),
+        (611434177, 232927305),
+        (664343859, 225922101),
+        (746658039, 213330868),
+        (891310818, 185006371),
+        (1230125796, 0),
+        (262263701, 0),
+        (514501291, 246065835),
+        (516297112, 245902239),
+        (521799546, 245396741),
+        (531374648, 244501769),
+        (545711027, 243124958),
+        (565971072, 241102667),
+        (594094917, 238142804),
+        (633440624, 233692258),
+        (690275916, 226585604),
+        (777852837, 213894491),
+        (930767856, 185448441),
+        (1287371222, 0),
+        (262783550, 0),
+    ),
+)
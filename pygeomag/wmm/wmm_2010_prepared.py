@@ -0,0 +1,468 @@
+"""Coefficients of WMM-2010 prepared for the legendre evaluator, generated by ``python -m pygeomag.prepared``."""
+
+WMM_2010_PREPARED = (
+    (2010.0, "WMM-2010", "11/20/2009"),
+    {
+        "evaluator": "legendre",
+        "maxord": 12,
+        "c": (
+            0.0,
+            0.0,
+            0.0,
+            0.0,
+            -29496.6,
+            0.0,
+            11.6,
+            0.0,
+            -1586.3,
+            4944.4,
+            16.5,
+            -25.9,
+            -3594.8999999999996,
+            0.0,
+            -18.15,
+            0.0,
+            5241.358948784179,
+            -4689.873971654249,
+            -7.62102355330306,
+            -38.97114317029974,
+            1445.0499887547141,
+            -498.9172351202151,
+            1.6454482671904334,
+            -10.219099764656375,
+            3350.25,
+            0.0,
+            1.0,
+            0.0,
+            -7122.503799577786,
+            -490.51032099233134,
+            -12.553634931763787,
+            22.3515939028965,
+            2385.564092096459,
+            487.8022524548242,
+            -5.6158258520007545,
+            -7.552317525104463,
+            501.22100913668817,
+            -424.21954811158815,
+            -6.08738449582413,
+            -2.055480479109447,
+            3992.625,
+            0.0,
+            -7.875,
+            0.0,
+            4476.441198792853,
+            1584.9335632763916,
+            12.728167582177726,
+            6.08738449582413,
+            652.3169307361261,
+            -826.4507244839223,
+            -34.044134957434295,
+            10.565421193686507,
+            -746.928238688296,
+            343.65810589887155,
+            9.621590305141869,
+            8.157435258707237,
+            66.11219157613822,
+            -228.58253261951143,
+            -1.5529709430636494,
+            -0.5916079783099616,
+            -1818.3375,
+            0.0,
+            -7.875,
+            0.0,
+            3631.5028345713845,
+            453.42952525723337,
+            6.099948770276682,
+            4.066632513517788,
+            1539.3481788162806,
+            1451.736749767326,
+            -13.833383534045456,
+            13.833383534045456,
+            -664.046604809764,
+            -556.2743351418434,
+            -4.706212649254174,
+            5.647455179105008,
+            -361.6203767419639,
+            0.0,
+            1.9966769267961197,
+            8.874119674649421,
+            -5.472173928156888,
+            70.78748068602948,
+            0.7015607600201138,
+            -0.42093645601206825,
+            1051.05,
+            0.0,
+            -2.8875,
+            0.0,
+            1296.7543572801287,
+            -393.18499462721104,
+            -3.780624948338568,
+            -3.780624948338568,
+            1135.7616524825974,
+            659.0406430852966,
+            -1.494423226950786,
+            -31.382887765966505,
+            -1408.7429619389407,
+            612.7135230498221,
+            19.925643026010476,
+            -3.9851286052020956,
+            -124.41645540281236,
+            -361.7899558423885,
+            -9.27666553442022,
+            -3.27411724744243,
+            30.713942273827364,
+            7.213122806732184,
+            -0.6980441425869855,
+            1.1634069043116426,
+            -52.32490724281076,
+            36.94313091597678,
+            1.1418785919483732,
+            0.6045239604432565,
+            2158.40625,
+            0.0,
+            2.6812500000000004,
+            0.0,
+            -2663.767223898371,
+            -2053.690043458265,
+            -3.546960351395967,
+            24.828722459771768,
+            -136.1158069812476,
+            -611.0730909158137,
+            -17.376485997606075,
+            8.688242998803037,
+            927.6708466985763,
+            133.10950338942044,
+            26.62190067788409,
+            -2.0478385136833914,
+            171.65013915938871,
+            307.48837878192654,
+            4.939572349910467,
+            -1.2348930874776167,
+            64.21444054883607,
+            43.22125806171658,
+            1.852339631216425,
+            -4.939572349910467,
+            4.117101813624483,
+            -67.08454131611659,
+            -1.6952772173747872,
+            -0.7265473788749088,
+            3.171573261509973,
+            -2.1359575026495734,
+            0.38835590957264976,
+            0.19417795478632488,
+            1226.671875,
+            0.0,
+            -5.02734375,
+            0.0,
+            542.953125,
+            737.34375,
+            6.703125,
+            -6.703125,
+            -813.1943273523776,
+            -1121.647348072245,
+            -33.64942044216735,
+            11.21647348072245,
+            -231.94961063774173,
+            492.89292260520125,
+            8.283914665633635,
+            16.56782933126727,
+            -516.0090386242226,
+            -465.2102213503354,
+            -5.347243923567074,
+            10.694487847134148,
+            170.55174208584216,
+            247.67079068117948,
+            4.44917588050023,
+            1.4830586268334103,
+            74.83097897955808,
+            48.05659200522078,
+            2.059568228795176,
+            -0.6865227429317255,
+            -35.34625529913848,
+            -27.0737274631699,
+            -1.5040959701761054,
+            1.0027306467840702,
+            -2.3188146206881624,
+            1.0654013122080745,
+            0.12534133084800878,
+            0.18801199627201318,
+            512.7890625,
+            0.0,
+            -0.0,
+            0.0,
+            1197.5925886180944,
+            -2611.77107092244,
+            -12.740346687426538,
+            -0.0,
+            369.4101414914306,
+            1249.4754785739563,
+            0.0,
+            -21.73000832302533,
+            -431.51076796656395,
+            1062.1803519176958,
+            24.894851998070994,
+            0.0,
+            174.76478895223582,
+            -405.90531627616065,
+            -22.55029534867559,
+            -5.6375738371688975,
+            -417.7677513199992,
+            -249.31301288451567,
+            -10.107284306129012,
+            3.369094768709671,
+            -12.178551402273277,
+            139.18344459740888,
+            1.739793057467611,
+            -0.0,
+            63.28160937397954,
+            15.820402343494885,
+            -0.7533524925473755,
+            -1.506704985094751,
+            -21.963810719527746,
+            -15.762264163425794,
+            -1.0335910926836587,
+            0.775193319512744,
+            -6.1513988609727885,
+            4.263345745228666,
+            -0.12180987843510474,
+            0.12180987843510474,
+            -360.8515625,
+            0.0,
+            0.0,
+            0.0,
+            -1532.7022649850196,
+            681.2010066600087,
+            -0.0,
+            24.3286073807146,
+            189.6227282735679,
+            -21.069192030396437,
+            -21.069192030396437,
+            -21.069192030396437,
+            -181.8083745053654,
+            776.8176001592885,
+            33.05606809188462,
+            0.0,
+            -23.374169907135876,
+            514.2317379569893,
+            -0.0,
+            -11.687084953567938,
+            184.78903830578943,
+            -532.1924303206736,
+            -7.391561532231577,
+            -7.391561532231577,
+            -12.396025534456733,
+            -41.32008511485578,
+            -8.264017022971156,
+            -0.0,
+            44.09500774749851,
+            -78.16842282511098,
+            0.0,
+            -2.0043185339772047,
+            25.36604806627813,
+            -16.3651923008246,
+            -0.81825961504123,
+            -1.63651923008246,
+            -2.65478475211798,
+            -5.30956950423596,
+            -0.530956950423596,
+            0.0,
+            -1.6621581679824051,
+            -4.927111712233558,
+            -0.11872558342731465,
+            -0.059362791713657326,
+            1033.34765625,
+            0.0,
+            0.0,
+            0.0,
+            -699.5796703929632,
+            93.27728938572844,
+            0.0,
+            -0.0,
+            -859.0007440872433,
+            695.3815547372922,
+            -0.0,
+            40.90479733748778,
+            557.5456137662437,
+            -196.78080485867423,
+            32.79680080977904,
+            0.0,
+            -119.75698411679785,
+            -431.12514282047226,
+            -0.0,
+            23.951396823359573,
+            79.21179943403982,
+            142.58123898127167,
+            0.0,
+            0.0,
+            -75.29411384100062,
+            -37.64705692050031,
+            -0.0,
+            9.411764230125078,
+            19.841741178464254,
+            -124.01088236540159,
+            -0.0,
+            0.0,
+            40.9680685235441,
+            -29.588049489226293,
+            -0.0,
+            -2.276003806863561,
+            0.8814924839887255,
+            -18.511342163763235,
+            0.0,
+            -0.8814924839887255,
+            1.9042414054421237,
+            -5.168655243342908,
+            -0.272034486491732,
+            -0.0,
+            2.20392200095178,
+            -1.0439630530824222,
+            -0.0,
+            -0.0579979473934679,
+            -1452.4275390625,
+            0.0,
+            -0.0,
+            0.0,
+            -179.4054923170496,
+            -807.3247154267233,
+            0.0,
+            -0.0,
+            238.53895820923987,
+            238.53895820923987,
+            79.51298606974663,
+            0.0,
+            649.2208126530203,
+            1363.3637065713426,
+            64.92208126530203,
+            -0.0,
+            -292.1493656938591,
+            -1217.289023724413,
+            -48.69156094897652,
+            0.0,
+            300.6192172006695,
+            167.01067622259416,
+            -0.0,
+            -0.0,
+            -20.829891011946017,
+            124.97934607167608,
+            0.0,
+            20.829891011946017,
+            58.52694113574506,
+            -0.0,
+            0.0,
+            0.0,
+            -23.410776454298027,
+            5.852694113574507,
+            -0.0,
+            0.0,
+            -10.217300493286722,
+            7.662975369965041,
+            0.0,
+            -0.0,
+            1.8864941272538016,
+            -8.489223572642107,
+            0.0,
+            -0.0,
+            -2.225187075176208,
+            -0.556296768794052,
+            -0.278148384397026,
+            0.0,
+            0.0,
+            0.5109912109141708,
+            0.056776801212685635,
+            0.0,
+        ),
+        "k": (
+            0.0,
+            -0.0,
+            0.0,
+            0.3333333333333333,
+            0.0,
+            -1.0,
+            0.26666666666666666,
+            0.2,
+            0.0,
+            -0.3333333333333333,
+            0.2571428571428571,
+            0.22857142857142856,
+            0.14285714285714285,
+            0.0,
+            -0.2,
+            0.25396825396825395,
+            0.23809523809523808,
+            0.19047619047619047,
+            0.1111111111111111,
+            0.0,
+            -0.14285714285714285,
+            0.25252525252525254,
+            0.24242424242424243,
+            0.21212121212121213,
+            0.16161616161616163,
+            0.09090909090909091,
+            0.0,
+            -0.1111111111111111,
+            0.2517482517482518,
+            0.24475524475524477,
+            0.22377622377622378,
+            0.1888111888111888,
+            0.13986013986013987,
+            0.07692307692307693,
+            0.0,
+            -0.09090909090909091,
+            0.2512820512820513,
+            0.24615384615384617,
+            0.23076923076923078,
+            0.20512820512820512,
+            0.16923076923076924,
+            0.12307692307692308,
+            0.06666666666666667,
+            0.0,
+            -0.07692307692307693,
+            0.25098039215686274,
+            0.24705882352941178,
+            0.23529411764705882,
+            0.21568627450980393,
+            0.18823529411764706,
+            0.15294117647058825,
+            0.10980392156862745,
+            0.058823529411764705,
+            0.0,
+            -0.06666666666666667,
+            0.25077399380804954,
+            0.2476780185758514,
+            0.23839009287925697,
+            0.22291021671826625,
+            0.20123839009287925,
+            0.17337461300309598,
+            0.1393188854489164,
+            0.09907120743034056,
+            0.05263157894736842,
+            0.0,
+            -0.058823529411764705,
+            0.2506265664160401,
+            0.24812030075187969,
+            0.24060150375939848,
+            0.22807017543859648,
+            0.21052631578947367,
+            0.18796992481203006,
+            0.16040100250626566,
+            0.12781954887218044,
+            0.09022556390977443,
+            0.047619047619047616,
+            0.0,
+            -0.05263157894736842,
+            0.2505175983436853,
+            0.2484472049689441,
+            0.2422360248447205,
+            0.2318840579710145,
+            0.21739130434782608,
+            0.19875776397515527,
+            0.17598343685300208,
+            0.14906832298136646,
+            0.11801242236024845,
+            0.08281573498964803,
+            0.043478260869565216,
+            0.0,
+            -0.047619047619047616,
+        ),
+    },
+)
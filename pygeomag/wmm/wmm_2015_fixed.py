@@ -0,0 +1,191 @@
+"""Fixed point tables of WMM-2015, generated by ``python -m pygeomag.fixedpoint``."""
+
+WMM_2015_FIXED = (
+    (2015.0, "WMM-2015", "12/15/2014", 12),
+    (
+        (0, 0, 0, 0),
+        (-29438500, 0, 10700, 0),
+        (-1501100, 4796200, 17900, -26800),
+        (-2445300, 0, -8600, 0),
+        (3012500, -2845600, -3300, -27100),
+        (1676600, -642000, 2400, -13300),
+        (1351100, 0, 3100, 0),
+        (-2352300, -115300, -6200, 8400),
+        (1225600, 245000, -400, -400),
+        (581900, -538300, -10400, 2300),
+        (907200, 0, -400, 0),
+        (813700, 283400, 800, -600),
+        (120300, -188600, -9200, 5300),
+        (-335000, 180900, 4000, 3000),
+        (70300, -329500, -4200, -5300),
+        (-232600, 0, -200, 0),
+        (360100, 47400, 100, 400),
+        (192400, 196900, -1400, 1600),
+        (-141000, -119400, 0, -1100),
+        (-157400, 16100, 1300, 3300),
+        (4300, 100100, 3800, 100),
+        (69500, 0, -500, 0),
+        (67400, -20700, -200, 0),
+        (72800, 33200, -600, -2200),
+        (-129800, 58800, 2400, -700),
+        (-29000, -66500, -1100, 100),
+        (13200, 7300, 300, 1000),
+        (-70900, 62500, 1500, 1300),
+        (81600, 0, 200, 0),
+        (-76100, -54100, -200, 700),
+        (-6800, -19400, -400, 500),
+        (51900, 5600, 1300, -200),
+        (15000, 24400, 200, -100),
+        (9300, 3300, -400, -700),
+        (-2800, -27500, -900, 100),
+        (6700, -2300, 300, 100),
+        (24000, 0, 0, 0),
+        (8600, 10200, 100, -300),
+        (-16900, -18100, -500, 300),
+        (-3200, 13200, 500, 300),
+        (-20600, -14600, -200, 600),
+        (13300, 16200, 400, -100),
+        (11700, 5700, 200, -200),
+        (-16000, -9100, -400, 300),
+        (-2000, 2200, 300, 0),
+        (5400, 0, 0, 0),
+        (8800, -21600, -100, -200),
+        (3100, 10800, -100, -100),
+        (-3100, 11700, 400, -200),
+        (600, -6800, -500, 100),
+        (-13300, -6900, -200, 100),
+        (-100, 7800, 100, 0),
+        (8700, 1000, 0, -200),
+        (-9100, -3900, -200, 400),
+        (-10500, 8500, -100, 300),
+        (-1900, 0, 0, 0),
+        (-6500, 3300, 0, 100),
+        (200, -300, -100, -100),
+        (600, 4600, 300, 0),
+        (-600, 4400, -100, 0),
+        (1700, -7900, -100, -200),
+        (-700, -600, -100, 100),
+        (2100, -4100, 0, -100),
+        (2300, -2800, -200, -200),
+        (-1800, -1100, -100, 100),
+        (-3600, -8700, -200, -100),
+        (3100, 0, 0, 0),
+        (-1500, -100, 0, 0),
+        (-2300, 2100, -100, 100),
+        (2100, -700, 100, 0),
+        (-900, -1100, 0, 100),
+        (600, 700, 0, 0),
+        (-700, -200, 0, 0),
+        (200, -2100, 0, 100),
+        (1700, -1500, 0, 0),
+        (-200, -2500, 0, -100),
+        (400, -2000, -100, 0),
+        (3500, -2300, -100, -100),
+        (-2000, 0, 100, 0),
+        (-300, -1000, 0, 0),
+        (400, 500, 0, 0),
+        (1300, 1800, 100, -100),
+        (-900, -2200, -100, 0),
+        (900, 300, 0, 0),
+        (100, 700, 100, 0),
+        (500, -100, 0, 0),
+        (-400, 300, 0, 0),
+        (-400, 200, 0, 0),
+        (200, -900, 0, 0),
+        (-900, -200, 0, 0),
+        (0, 700, 0, 0),
+    ),
+    (
+        (268435456, 0),
+        (268435456, 0),
+        (268435456, 0),
+        (402653184, 134217728),
+        (464943848, 0),
+        (232471924, 0),
+        (447392427, 178956971),
+        (474531328, 164382474),
+        (600239927, 0),
+        (245046924, 0),
+        (469762048, 201326592),
+        (485168157, 196037539),
+        (542434490, 173274342),
+        (710213460, 0),
+        (251098377, 0),
+        (483183821, 214748365),
+        (493147422, 212216861),
+        (527196770, 202918131),
+        (603979776, 177553365),
+        (805306368, 0),
+        (254660234, 0),
+        (492131669, 223696213),
+        (499112609, 222285676),
+        (521984461, 217457573),
+        (568264704, 206641710),
+        (660263920, 180071978),
+        (890299688, 0),
+        (257007382, 0),
+        (498522990, 230087534),
+        (503689169, 229220408),
+        (520207937, 226364652),
+        (551763840, 220542232),
+        (607471994, 208976719),
+        (712324054, 181731663),
+        (967857801, 0),
+        (258670878, 0),
+        (503316480, 234881024),
+        (507295328, 234309675),
+        (519823025, 232471924),
+        (542937443, 228922526),
+        (581179810, 222574922),
+        (644761110, 210578097),
+        (760942992, 182907932),
+        (1039646051, 0),
+        (259911513, 0),
+        (507044750, 238609294),
+        (510203938, 238212836),
+        (520048008, 236957326),
+        (537802172, 234614568),
+        (566020449, 230676747),
+        (609810343, 224015551),
+        (680271917, 211744743),
+        (806703258, 183785193),
+        (1106787739, 0),
+        (260872372, 0),
+        (510027366, 241591910),
+        (512596790, 241305530),
+        (520544501, 240408393),
+        (534653955, 238773118),
+        (556485479, 236133125),
+        (588928875, 231954745),
+        (637534208, 225089973),
+        (714181163, 212632566),
+        (850045611, 184464623),
+        (1170083026, 0),
+        (261638518, 0),
+        (512467689, 244032233),
+        (514598541, 243818611),
+        (521154200, 243154642),
+        (532660095, 241964450),
+        (550128980, 240095971),
+        (575338659, 237265664),
+        (611434177, 232927305),
+        (664343859, 225922101),
+        (746658039, 213330868),
+        (891310818, 185006371),
+        (1230125796, 0),
+        (262263701, 0),
+        (514501291, 246065835),
+        (516297112, 245902239),
+        (521799546, 245396741),
+        (531374648, 244501769),
+        (545711027, 243124958),
+        (565971072, 241102667),
+        (594094917, 238142804),
+        (633440624, 233692258),
+        (690275916, 226585604),
+        (777852837, 213894491),
+        (930767856, 185448441),
+        (1287371222, 0),
+        (262783550, 0),
+    ),
+)
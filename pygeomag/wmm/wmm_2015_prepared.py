@@ -0,0 +1,468 @@
+"""Coefficients of WMM-2015 prepared for the legendre evaluator, generated by ``python -m pygeomag.prepared``."""
+
+WMM_2015_PREPARED = (
+    (2015.0, "WMM-2015", "12/15/2014"),
+    {
+        "evaluator": "legendre",
+        "maxord": 12,
+        "c": (
+            0.0,
+            0.0,
+            0.0,
+            0.0,
+            -29438.5,
+            0.0,
+            10.7,
+            0.0,
+            -1501.1,
+            4796.2,
+            17.9,
+            -26.8,
+            -3667.9500000000003,
+            0.0,
+            -12.899999999999999,
+            0.0,
+            5217.803057801242,
+            -4928.723778017997,
+            -5.715767664977294,
+            -46.938576885116575,
+            1451.9781919849897,
+            -555.9883092296096,
+            2.0784609690826525,
+            -11.518137870333033,
+            3377.75,
+            0.0,
+            7.75,
+            0.0,
+            -7202.4184024360875,
+            -353.0327091786255,
+            -18.98354550656963,
+            25.71964229922337,
+            2373.3641945559048,
+            474.4404599104086,
+            -0.7745966692414834,
+            -0.7745966692414834,
+            460.03234261299497,
+            -425.5635161171596,
+            -8.221921916437788,
+            1.818309654596818,
+            3969.0,
+            0.0,
+            -1.75,
+            0.0,
+            4503.004331138268,
+            1568.3316055605076,
+            4.427188724235731,
+            -3.320391543176798,
+            470.74821096314326,
+            -738.0142359738056,
+            -36.00069443774661,
+            20.73953049131055,
+            -700.7027722222883,
+            378.3794970000357,
+            8.366600265340756,
+            6.274950199005566,
+            51.987551093987875,
+            -243.66853606641544,
+            -3.1059418861272987,
+            -3.9194028563034955,
+            -1831.725,
+            0.0,
+            -1.5750000000000002,
+            0.0,
+            3660.9859202943885,
+            481.8959528518578,
+            1.016658128379447,
+            4.066632513517788,
+            1478.63499552797,
+            1513.2184543630835,
+            -10.759298304257577,
+            12.296340919151518,
+            -663.5759835448386,
+            -561.9217903209484,
+            0.0,
+            -5.176833914179592,
+            -349.19660919745473,
+            35.71833169046392,
+            2.884088894261062,
+            7.321148731585772,
+            3.0167112680864894,
+            70.22623207801338,
+            2.6659308880764323,
+            0.07015607600201139,
+            1003.40625,
+            0.0,
+            -7.21875,
+            0.0,
+            1274.0706075900976,
+            -391.2946821530418,
+            -3.780624948338568,
+            0.0,
+            1087.9401092201722,
+            496.148511347661,
+            -8.966539361704715,
+            -32.877310992917295,
+            -1293.17423238808,
+            585.813904964708,
+            23.910771631212572,
+            -6.973975059103666,
+            -158.2490002930508,
+            -362.8813282582027,
+            -6.002548286977789,
+            0.5456862079070718,
+            30.713942273827364,
+            16.98574080294998,
+            0.6980441425869855,
+            2.3268138086232852,
+            -47.62305421714098,
+            41.980830586337255,
+            1.007539934072094,
+            0.8732012761958149,
+            2187.8999999999996,
+            0.0,
+            5.362500000000001,
+            0.0,
+            -2699.2368274123305,
+            -1918.905550105218,
+            -7.093920702791934,
+            24.828722459771768,
+            -196.93350797286885,
+            -561.8397139225964,
+            -11.584323998404052,
+            14.480404998005064,
+            1062.82818860168,
+            114.6789567662699,
+            26.62190067788409,
+            -4.095677027366783,
+            185.23396312164252,
+            301.3139133445385,
+            2.4697861749552334,
+            -1.2348930874776167,
+            57.42252856770918,
+            20.375735943380676,
+            -2.4697861749552334,
+            -4.322125806171658,
+            -6.781108869499149,
+            -66.60017639686664,
+            -2.1796421366247265,
+            0.24218245962496965,
+            4.336640990227923,
+            -1.488697653361824,
+            0.19417795478632488,
+            0.06472598492877496,
+            1206.5625,
+            0.0,
+            0.0,
+            0.0,
+            576.46875,
+            683.71875,
+            6.703125,
+            -20.109375,
+            -947.792009121047,
+            -1015.0908500053819,
+            -28.041183701806126,
+            16.824710221083674,
+            -132.54263465013815,
+            546.7383679318198,
+            20.709786664084085,
+            12.42587199845045,
+            -550.7661241274087,
+            -390.3488064203964,
+            -5.347243923567074,
+            16.041731770701222,
+            197.24679736884357,
+            240.25549754701245,
+            5.932234507333641,
+            -1.4830586268334103,
+            80.32316092301187,
+            39.131796347108356,
+            1.373045485863451,
+            -1.373045485863451,
+            -40.10922587136281,
+            -22.8121222143376,
+            -1.0027306467840702,
+            0.7520479850880527,
+            -1.2534133084800878,
+            1.3787546393280967,
+            0.18801199627201318,
+            0.0,
+            512.7890625,
+            0.0,
+            0.0,
+            0.0,
+            1121.1505084935352,
+            -2751.914884484132,
+            -12.740346687426538,
+            -25.480693374853075,
+            336.8151290068926,
+            1173.4204494433677,
+            -10.865004161512665,
+            -10.865004161512665,
+            -257.24680398006694,
+            970.8992279247688,
+            33.193135997427994,
+            -16.596567998713997,
+            33.825443023013385,
+            -383.35502092748504,
+            -28.187869185844487,
+            5.6375738371688975,
+            -448.08960423838624,
+            -232.4675390409673,
+            -6.738189537419342,
+            3.369094768709671,
+            -1.739793057467611,
+            135.70385848247366,
+            1.739793057467611,
+            0.0,
+            65.54166685162166,
+            7.533524925473754,
+            0.0,
+            -1.506704985094751,
+            -23.514197358553233,
+            -10.077513153665672,
+            -0.5167955463418293,
+            1.0335910926836587,
+            -6.395018617842998,
+            5.176919833491951,
+            -0.06090493921755237,
+            0.1827148176526571,
+            -342.80898437499997,
+            0.0,
+            0.0,
+            0.0,
+            -1581.3594797464489,
+            802.8440435635817,
+            0.0,
+            24.3286073807146,
+            42.13838406079287,
+            -63.207576091189296,
+            -21.069192030396437,
+            -21.069192030396437,
+            99.16820427565385,
+            760.2895661133462,
+            49.584102137826925,
+            0.0,
+            -70.12250972140762,
+            514.2317379569893,
+            -11.687084953567938,
+            0.0,
+            125.65654604793681,
+            -583.9333610462946,
+            -7.391561532231577,
+            -14.783123064463155,
+            -28.924059580399042,
+            -24.792051068913466,
+            -4.132008511485578,
+            4.132008511485578,
+            42.0906892135213,
+            -82.17705989306539,
+            0.0,
+            -2.0043185339772047,
+            18.819971145948287,
+            -22.911269221154438,
+            -1.63651923008246,
+            -1.63651923008246,
+            -4.778612553812365,
+            -2.9202632273297784,
+            -0.265478475211798,
+            0.265478475211798,
+            -2.1370605016916637,
+            -5.164562879088187,
+            -0.11872558342731465,
+            -0.059362791713657326,
+            1067.792578125,
+            0.0,
+            0.0,
+            0.0,
+            -699.5796703929632,
+            -46.63864469286422,
+            0.0,
+            0.0,
+            -940.8103387622187,
+            859.0007440872433,
+            -40.90479733748778,
+            40.90479733748778,
+            688.7328170053598,
+            -229.57760566845326,
+            32.79680080977904,
+            0.0,
+            -215.56257141023613,
+            -263.4653650569553,
+            0.0,
+            23.951396823359573,
+            95.05415932084777,
+            110.89651920765574,
+            0.0,
+            0.0,
+            -65.88234961087554,
+            -18.823528460250156,
+            0.0,
+            0.0,
+            9.920870589232127,
+            -104.16914118693732,
+            0.0,
+            4.9604352946160635,
+            38.692064716680534,
+            -34.14005710295341,
+            0.0,
+            0.0,
+            -1.762984967977451,
+            -22.037312099718136,
+            0.0,
+            -0.8814924839887255,
+            1.088137945966928,
+            -5.44068972983464,
+            -0.272034486491732,
+            0.0,
+            2.0299281587713764,
+            -1.3339527900497614,
+            -0.0579979473934679,
+            -0.0579979473934679,
+            -1320.388671875,
+            0.0,
+            66.01943359375001,
+            0.0,
+            -269.1082384755744,
+            -897.027461585248,
+            0.0,
+            0.0,
+            318.0519442789865,
+            397.5649303487331,
+            0.0,
+            0.0,
+            843.9870564489264,
+            1168.5974627754365,
+            64.92208126530203,
+            -64.92208126530203,
+            -438.22404854078866,
+            -1071.2143408774834,
+            -48.69156094897652,
+            0.0,
+            300.6192172006695,
+            100.2064057335565,
+            0.0,
+            0.0,
+            20.829891011946017,
+            145.8092370836221,
+            20.829891011946017,
+            0.0,
+            58.52694113574506,
+            -11.705388227149014,
+            0.0,
+            0.0,
+            -23.410776454298027,
+            17.55808234072352,
+            0.0,
+            0.0,
+            -10.217300493286722,
+            5.108650246643361,
+            0.0,
+            0.0,
+            1.8864941272538016,
+            -8.489223572642107,
+            0.0,
+            0.0,
+            -2.5033354595732336,
+            -0.556296768794052,
+            0.0,
+            0.0,
+            0.0,
+            0.39743760848879944,
+            0.0,
+            0.0,
+        ),
+        "k": (
+            0.0,
+            -0.0,
+            0.0,
+            0.3333333333333333,
+            0.0,
+            -1.0,
+            0.26666666666666666,
+            0.2,
+            0.0,
+            -0.3333333333333333,
+            0.2571428571428571,
+            0.22857142857142856,
+            0.14285714285714285,
+            0.0,
+            -0.2,
+            0.25396825396825395,
+            0.23809523809523808,
+            0.19047619047619047,
+            0.1111111111111111,
+            0.0,
+            -0.14285714285714285,
+            0.25252525252525254,
+            0.24242424242424243,
+            0.21212121212121213,
+            0.16161616161616163,
+            0.09090909090909091,
+            0.0,
+            -0.1111111111111111,
+            0.2517482517482518,
+            0.24475524475524477,
+            0.22377622377622378,
+            0.1888111888111888,
+            0.13986013986013987,
+            0.07692307692307693,
+            0.0,
+            -0.09090909090909091,
+            0.2512820512820513,
+            0.24615384615384617,
+            0.23076923076923078,
+            0.20512820512820512,
+            0.16923076923076924,
+            0.12307692307692308,
+            0.06666666666666667,
+            0.0,
+            -0.07692307692307693,
+            0.25098039215686274,
+            0.24705882352941178,
+            0.23529411764705882,
+            0.21568627450980393,
+            0.18823529411764706,
+            0.15294117647058825,
+            0.10980392156862745,
+            0.058823529411764705,
+            0.0,
+            -0.06666666666666667,
+            0.25077399380804954,
+            0.2476780185758514,
+            0.23839009287925697,
+            0.22291021671826625,
+            0.20123839009287925,
+            0.17337461300309598,
+            0.1393188854489164,
+            0.09907120743034056,
+            0.05263157894736842,
+            0.0,
+            -0.058823529411764705,
+            0.2506265664160401,
+            0.24812030075187969,
+            0.24060150375939848,
+            0.22807017543859648,
+            0.21052631578947367,
+            0.18796992481203006,
+            0.16040100250626566,
+            0.12781954887218044,
+            0.09022556390977443,
+            0.047619047619047616,
+            0.0,
+            -0.05263157894736842,
+            0.2505175983436853,
+            0.2484472049689441,
+            0.2422360248447205,
+            0.2318840579710145,
+            0.21739130434782608,
+            0.19875776397515527,
+            0.17598343685300208,
+            0.14906832298136646,
+            0.11801242236024845,
+            0.08281573498964803,
+            0.043478260869565216,
+            0.0,
+            -0.047619047619047616,
+        ),
+    },
+)
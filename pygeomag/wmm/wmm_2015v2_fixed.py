@@ -0,0 +1,191 @@
+"""Fixed point tables of WMM-2015v2, generated by ``python -m pygeomag.fixedpoint``."""
+
+WMM_2015v2_FIXED = (
+    (2015.0, "WMM-2015v2", "09/18/2018", 12),
+    (
+        (0, 0, 0, 0),
+        (-29438200, 0, 7000, 0),
+        (-1493500, 4796300, 9000, -30200),
+        (-2444500, 0, -11000, 0),
+        (3014700, -2842400, -6200, -29600),
+        (1679000, -638800, 300, -17300),
+        (1351800, 0, 2400, 0),
+        (-2351600, -113700, -5700, 6500),
+        (1223600, 246500, 2000, -800),
+        (582300, -537400, -11000, -2000),
+        (907500, 0, -800, 0),
+        (814800, 283300, -900, -400),
+        (117800, -188600, -6500, 5800),
+        (-335600, 180700, 5200, 3800),
+        (69700, -330000, -4000, -3500),
+        (-232900, 0, -300, 0),
+        (360100, 46900, 600, 200),
+        (191700, 196500, -800, 2300),
+        (-141300, -119900, 100, 0),
+        (-157200, 16000, 1200, 3300),
+        (7700, 100600, 1400, -600),
+        (69400, 0, -800, 0),
+        (67700, -20100, -500, 300),
+        (72300, 32800, -100, -1500),
+        (-129100, 59100, 1600, -1200),
+        (-28400, -67100, -1600, 400),
+        (13600, 8100, 0, 200),
+        (-70300, 61900, 1200, 1300),
+        (81700, 0, -300, 0),
+        (-75900, -54300, -200, 600),
+        (-7100, -19500, -300, 500),
+        (52200, 6000, 900, -800),
+        (15000, 24500, 100, -200),
+        (9100, 3500, -600, -1100),
+        (-3000, -27700, -900, 100),
+        (5900, -2900, 700, 200),
+        (24200, 0, -100, 0),
+        (8900, 10100, 200, -400),
+        (-16900, -18300, -200, 600),
+        (-3100, 13300, 500, -100),
+        (-20700, -14500, -100, 600),
+        (13300, 16200, 400, -200),
+        (11600, 6000, 400, -500),
+        (-16300, -9200, -100, 500),
+        (-2100, 2400, 400, 100),
+        (5500, 0, -100, 0),
+        (8800, -21800, -100, -300),
+        (3000, 10700, 0, 100),
+        (-3200, 11800, 400, -400),
+        (600, -6800, -400, 300),
+        (-13200, -6900, 0, 100),
+        (-100, 7900, 300, 0),
+        (8700, 1000, 0, -100),
+        (-9100, -3900, 0, 500),
+        (-10400, 8500, -300, 200),
+        (-2000, 0, 0, 0),
+        (-6100, 3300, 0, 0),
+        (200, -400, -100, 100),
+        (600, 4600, 200, -200),
+        (-500, 4400, -100, 100),
+        (1800, -7900, -200, -100),
+        (-700, -600, 0, 100),
+        (2200, -4200, -100, 0),
+        (2400, -2900, -200, -100),
+        (-1800, -1100, -100, 200),
+        (-3600, -8800, 0, 0),
+        (3000, 0, 0, 0),
+        (-1400, 0, 0, 0),
+        (-2300, 2100, 0, 100),
+        (2100, -600, 0, 0),
+        (-800, -1100, 0, 100),
+        (600, 700, -100, 0),
+        (-700, -200, 0, 0),
+        (100, -2100, 0, 100),
+        (1700, -1500, 0, 0),
+        (-200, -2600, -100, -100),
+        (400, -2000, 0, 0),
+        (3500, -2300, -100, -100),
+        (-2000, 0, 0, 0),
+        (-100, -1000, 0, 0),
+        (500, 300, 0, 0),
+        (1200, 1800, 0, -100),
+        (-900, -2200, -100, 100),
+        (900, 300, 0, 0),
+        (100, 700, 0, 0),
+        (600, -100, 0, 0),
+        (-400, 300, 0, 0),
+        (-500, 200, 0, 0),
+        (200, -900, 0, 0),
+        (-900, -200, 0, 0),
+        (0, 800, -100, -100),
+    ),
+    (
+        (268435456, 0),
+        (268435456, 0),
+        (268435456, 0),
+        (402653184, 134217728),
+        (464943848, 0),
+        (232471924, 0),
+        (447392427, 178956971),
+        (474531328, 164382474),
+        (600239927, 0),
+        (245046924, 0),
+        (469762048, 201326592),
+        (485168157, 196037539),
+        (542434490, 173274342),
+        (710213460, 0),
+        (251098377, 0),
+        (483183821, 214748365),
+        (493147422, 212216861),
+        (527196770, 202918131),
+        (603979776, 177553365),
+        (805306368, 0),
+        (254660234, 0),
+        (492131669, 223696213),
+        (499112609, 222285676),
+        (521984461, 217457573),
+        (568264704, 206641710),
+        (660263920, 180071978),
+        (890299688, 0),
+        (257007382, 0),
+        (498522990, 230087534),
+        (503689169, 229220408),
+        (520207937, 226364652),
+        (551763840, 220542232),
+        (607471994, 208976719),
+        (712324054, 181731663),
+        (967857801, 0),
+        (258670878, 0),
+        (503316480, 234881024),
+        (507295328, 234309675),
+        (519823025, 232471924),
+        (542937443, 228922526),
+        (581179810, 222574922),
+        (644761110, 210578097),
+        (760942992, 182907932),
+        (1039646051, 0),
+        (259911513, 0),
+        (507044750, 238609294),
+        (510203938, 238212836),
+        (520048008, 236957326),
+        (537802172, 234614568),
+        (566020449, 230676747),
+        (609810343, 224015551),
+        (680271917, 211744743),
+        (806703258, 183785193),
+        (1106787739, 0),
+        (260872372, 0),
+        (510027366, 241591910),
+        (512596790, 241305530),
+        (520544501, 240408393),
+        (534653955, 238773118),
+        (556485479, 236133125),
+        (588928875, 231954745),
+        (637534208, 225089973),
+        (714181163, 212632566),
+        (850045611, 184464623),
+        (1170083026, 0),
+        (261638518, 0),
+        (512467689, 244032233),
+        (514598541, 243818611),
+        (521154200, 243154642),
+        (532660095, 241964450),
+        (550128980, 240095971),
+        (575338659, 237265664),
+        (611434177, 232927305),
+        (664343859, 225922101),
+        (746658039, 213330868),
+        (891310818, 185006371),
+        (1230125796, 0),
+        (262263701, 0),
+        (514501291, 246065835),
+        (516297112, 245902239),
+        (521799546, 245396741),
+        (531374648, 244501769),
+        (545711027, 243124958),
+        (565971072, 241102667),
+        (594094917, 238142804),
+        (633440624, 233692258),
+        (690275916, 226585604),
+        (777852837, 213894491),
+        (930767856, 185448441),
+        (1287371222, 0),
+        (262783550, 0),
+    ),
+)
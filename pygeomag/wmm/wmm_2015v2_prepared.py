@@ -0,0 +1,468 @@
+"""Coefficients of WMM-2015v2 prepared for the legendre evaluator, generated by ``python -m pygeomag.prepared``."""
+
+WMM_2015v2_PREPARED = (
+    (2015.0, "WMM-2015v2", "09/18/2018"),
+    {
+        "evaluator": "legendre",
+        "maxord": 12,
+        "c": (
+            0.0,
+            0.0,
+            0.0,
+            0.0,
+            -29438.2,
+            0.0,
+            7.0,
+            0.0,
+            -1493.5,
+            4796.3,
+            9.0,
+            -30.2,
+            -3666.75,
+            0.0,
+            -16.5,
+            0.0,
+            5221.613569577894,
+            -4923.181215433777,
+            -10.73871500692704,
+            -51.268703904038766,
+            1454.0566529540724,
+            -553.2170279374993,
+            0.25980762113533157,
+            -14.982239485470789,
+            3379.5,
+            0.0,
+            6.0,
+            0.0,
+            -7200.275098911152,
+            -348.1337296930592,
+            -17.452614417330143,
+            19.90210416011332,
+            2369.4912112096977,
+            477.34519742006415,
+            3.872983346207417,
+            -1.5491933384829668,
+            460.3485703790118,
+            -424.8520036436218,
+            -8.696263565463044,
+            -1.5811388300841898,
+            3970.3125,
+            0.0,
+            -3.5,
+            0.0,
+            4509.091715634092,
+            1567.7782069699783,
+            -4.980587314765198,
+            -2.2135943621178655,
+            460.96541356158167,
+            -738.0142359738056,
+            -25.43527324406011,
+            22.696089971622865,
+            -701.9577622620894,
+            377.9611669867686,
+            10.876580344942983,
+            7.948270252073717,
+            51.54384511025541,
+            -244.03829105285917,
+            -2.958039891549808,
+            -2.588284905106082,
+            -1834.0875,
+            0.0,
+            -2.3625,
+            0.0,
+            3660.9859202943885,
+            476.8126622099606,
+            6.099948770276682,
+            2.033316256758894,
+            1473.255346375841,
+            1510.1443691332956,
+            -6.148170459575759,
+            17.675990071280303,
+            -664.9878473396149,
+            -564.2748966455755,
+            0.4706212649254174,
+            -0.0,
+            -348.7529032137222,
+            35.496478698597684,
+            2.6622359023948263,
+            7.321148731585772,
+            5.402017852154876,
+            70.57701245802345,
+            0.9821850640281593,
+            -0.42093645601206825,
+            1001.9625000000001,
+            0.0,
+            -11.55,
+            0.0,
+            1279.7415450126052,
+            -379.9528073080261,
+            -9.45156237084642,
+            5.670937422507851,
+            1080.4679930854181,
+            490.1708184398577,
+            -1.494423226950786,
+            -22.41634840426179,
+            -1286.2002573289762,
+            588.8027514186095,
+            15.940514420808382,
+            -11.955385815606286,
+            -154.97488304560835,
+            -366.1554455056451,
+            -8.730979326513149,
+            2.182744831628287,
+            31.64466779727668,
+            18.84719184984861,
+            0.0,
+            0.46536276172465707,
+            -47.22003824351214,
+            41.577814612708416,
+            0.8060319472576752,
+            0.8732012761958149,
+            2190.58125,
+            0.0,
+            -8.04375,
+            0.0,
+            -2692.142906709539,
+            -1925.9994708080098,
+            -7.093920702791934,
+            21.2817621083758,
+            -205.6217509716719,
+            -564.7357949221974,
+            -8.688242998803037,
+            14.480404998005064,
+            1068.9717041427305,
+            122.87031082100349,
+            18.430546623150523,
+            -16.38270810946713,
+            185.23396312164252,
+            302.5488064320161,
+            1.2348930874776167,
+            -2.4697861749552334,
+            56.187635480231556,
+            21.61062903085829,
+            -3.70467926243285,
+            -6.791911981126892,
+            -7.265473788749089,
+            -67.08454131611659,
+            -2.1796421366247265,
+            0.24218245962496965,
+            3.8188331107977227,
+            -1.8770535629344738,
+            0.45308189450142466,
+            0.12945196985754992,
+            1216.6171875,
+            0.0,
+            -5.02734375,
+            0.0,
+            596.578125,
+            677.015625,
+            13.40625,
+            -26.8125,
+            -947.792009121047,
+            -1026.3073234861042,
+            -11.21647348072245,
+            33.64942044216735,
+            -128.40067731732134,
+            550.8803252646367,
+            20.709786664084085,
+            -4.141957332816817,
+            -553.4397460891921,
+            -387.6751844586129,
+            -2.673621961783537,
+            16.041731770701222,
+            197.24679736884357,
+            240.25549754701245,
+            5.932234507333641,
+            -2.9661172536668206,
+            79.63663818008015,
+            41.19136457590353,
+            2.746090971726902,
+            -3.4326137146586273,
+            -40.861273856450865,
+            -23.062804876033614,
+            -0.25068266169601755,
+            1.2534133084800878,
+            -1.3160839739040922,
+            1.5040959701761054,
+            0.25068266169601755,
+            0.06267066542400439,
+            522.28515625,
+            0.0,
+            -9.49609375,
+            0.0,
+            1121.1505084935352,
+            -2777.395577858985,
+            -12.740346687426538,
+            -38.221040062279606,
+            325.95012484537995,
+            1162.5554452818549,
+            -0.0,
+            10.865004161512665,
+            -265.54508797942395,
+            979.1975119241258,
+            33.193135997427994,
+            -33.193135997427994,
+            33.825443023013385,
+            -383.35502092748504,
+            -22.55029534867559,
+            16.912721511506692,
+            -444.72050946967653,
+            -232.4675390409673,
+            0.0,
+            3.369094768709671,
+            -1.739793057467611,
+            137.44365153994127,
+            5.2193791724028324,
+            -0.0,
+            65.54166685162166,
+            7.533524925473754,
+            0.0,
+            -0.7533524925473755,
+            -23.514197358553233,
+            -10.077513153665672,
+            -0.0,
+            1.2919888658545733,
+            -6.334113678625447,
+            5.176919833491951,
+            -0.1827148176526571,
+            0.12180987843510474,
+            -360.8515625,
+            0.0,
+            0.0,
+            0.0,
+            -1484.0450502235904,
+            802.8440435635817,
+            -0.0,
+            0.0,
+            42.13838406079287,
+            -84.27676812158575,
+            -21.069192030396437,
+            21.069192030396437,
+            99.16820427565385,
+            760.2895661133462,
+            33.05606809188462,
+            -33.05606809188462,
+            -58.435424767839685,
+            514.2317379569893,
+            -11.687084953567938,
+            11.687084953567938,
+            133.0481075801684,
+            -583.9333610462946,
+            -14.783123064463155,
+            -7.391561532231577,
+            -28.924059580399042,
+            -24.792051068913466,
+            -0.0,
+            4.132008511485578,
+            44.09500774749851,
+            -84.1813784270426,
+            -2.0043185339772047,
+            -0.0,
+            19.63823076098952,
+            -23.72952883619567,
+            -1.63651923008246,
+            -0.81825961504123,
+            -4.778612553812365,
+            -2.9202632273297784,
+            -0.265478475211798,
+            0.530956950423596,
+            -2.1370605016916637,
+            -5.223925670801845,
+            -0.0,
+            -0.0,
+            1033.34765625,
+            0.0,
+            -0.0,
+            0.0,
+            -652.941025700099,
+            -0.0,
+            0.0,
+            0.0,
+            -940.8103387622187,
+            859.0007440872433,
+            -0.0,
+            40.90479733748778,
+            688.7328170053598,
+            -196.78080485867423,
+            0.0,
+            0.0,
+            -191.6111745868766,
+            -263.4653650569553,
+            -0.0,
+            23.951396823359573,
+            95.05415932084777,
+            110.89651920765574,
+            -15.842359886807964,
+            -0.0,
+            -65.88234961087554,
+            -18.823528460250156,
+            0.0,
+            -0.0,
+            4.9604352946160635,
+            -104.16914118693732,
+            -0.0,
+            4.9604352946160635,
+            38.692064716680534,
+            -34.14005710295341,
+            -0.0,
+            -0.0,
+            -1.762984967977451,
+            -22.918804583706862,
+            -0.8814924839887255,
+            -0.8814924839887255,
+            1.088137945966928,
+            -5.44068972983464,
+            -0.0,
+            -0.0,
+            2.0299281587713764,
+            -1.3339527900497614,
+            -0.0579979473934679,
+            -0.0579979473934679,
+            -1320.388671875,
+            0.0,
+            0.0,
+            0.0,
+            -89.7027461585248,
+            -897.027461585248,
+            0.0,
+            -0.0,
+            397.5649303487331,
+            238.53895820923987,
+            -0.0,
+            0.0,
+            779.0649751836244,
+            1168.5974627754365,
+            0.0,
+            -64.92208126530203,
+            -438.22404854078866,
+            -1071.2143408774834,
+            -48.69156094897652,
+            48.69156094897652,
+            300.6192172006695,
+            100.2064057335565,
+            -0.0,
+            -0.0,
+            20.829891011946017,
+            145.8092370836221,
+            0.0,
+            0.0,
+            70.23232936289408,
+            -11.705388227149014,
+            -0.0,
+            -0.0,
+            -23.410776454298027,
+            17.55808234072352,
+            0.0,
+            0.0,
+            -12.771625616608402,
+            5.108650246643361,
+            -0.0,
+            0.0,
+            1.8864941272538016,
+            -8.489223572642107,
+            -0.0,
+            -0.0,
+            -2.5033354595732336,
+            -0.556296768794052,
+            -0.0,
+            0.0,
+            -0.0,
+            0.4542144097014851,
+            -0.056776801212685635,
+            -0.056776801212685635,
+        ),
+        "k": (
+            0.0,
+            -0.0,
+            0.0,
+            0.3333333333333333,
+            0.0,
+            -1.0,
+            0.26666666666666666,
+            0.2,
+            0.0,
+            -0.3333333333333333,
+            0.2571428571428571,
+            0.22857142857142856,
+            0.14285714285714285,
+            0.0,
+            -0.2,
+            0.25396825396825395,
+            0.23809523809523808,
+            0.19047619047619047,
+            0.1111111111111111,
+            0.0,
+            -0.14285714285714285,
+            0.25252525252525254,
+            0.24242424242424243,
+            0.21212121212121213,
+            0.16161616161616163,
+            0.09090909090909091,
+            0.0,
+            -0.1111111111111111,
+            0.2517482517482518,
+            0.24475524475524477,
+            0.22377622377622378,
+            0.1888111888111888,
+            0.13986013986013987,
+            0.07692307692307693,
+            0.0,
+            -0.09090909090909091,
+            0.2512820512820513,
+            0.24615384615384617,
+            0.23076923076923078,
+            0.20512820512820512,
+            0.16923076923076924,
+            0.12307692307692308,
+            0.06666666666666667,
+            0.0,
+            -0.07692307692307693,
+            0.25098039215686274,
+            0.24705882352941178,
+            0.23529411764705882,
+            0.21568627450980393,
+            0.18823529411764706,
+            0.15294117647058825,
+            0.10980392156862745,
+            0.058823529411764705,
+            0.0,
+            -0.06666666666666667,
+            0.25077399380804954,
+            0.2476780185758514,
+            0.23839009287925697,
+            0.22291021671826625,
+            0.20123839009287925,
+            0.17337461300309598,
+            0.1393188854489164,
+            0.09907120743034056,
+            0.05263157894736842,
+            0.0,
+            -0.058823529411764705,
+            0.2506265664160401,
+            0.24812030075187969,
+            0.24060150375939848,
+            0.22807017543859648,
+            0.21052631578947367,
+            0.18796992481203006,
+            0.16040100250626566,
+            0.12781954887218044,
+            0.09022556390977443,
+            0.047619047619047616,
+            0.0,
+            -0.05263157894736842,
+            0.2505175983436853,
+            0.2484472049689441,
+            0.2422360248447205,
+            0.2318840579710145,
+            0.21739130434782608,
+            0.19875776397515527,
+            0.17598343685300208,
+            0.14906832298136646,
+            0.11801242236024845,
+            0.08281573498964803,
+            0.043478260869565216,
+            0.0,
+            -0.047619047619047616,
+        ),
+    },
+)
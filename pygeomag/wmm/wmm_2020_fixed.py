@@ -0,0 +1,191 @@
+"""Fixed point tables of WMM-2020, generated by ``python -m pygeomag.fixedpoint``."""
+
+WMM_2020_FIXED = (
+    (2020.0, "WMM-2020", "12/10/2019", 12),
+    (
+        (0, 0, 0, 0),
+        (-29404500, 0, 6700, 0),
+        (-1450700, 4652900, 7700, -25100),
+        (-2500000, 0, -11500, 0),
+        (2982000, -2991600, -7100, -30200),
+        (1676800, -734800, -2200, -23900),
+        (1363900, 0, 2800, 0),
+        (-2381000, -82200, -6200, 5700),
+        (1236200, 241800, 3400, -1000),
+        (525700, -542900, -12200, 1100),
+        (903100, 0, -1100, 0),
+        (809400, 282000, -1600, 200),
+        (86200, -158400, -6000, 6900),
+        (-309400, 199800, 5400, 3700),
+        (47900, -350100, -5500, -5600),
+        (-234400, 0, -300, 0),
+        (363100, 47700, 600, 100),
+        (187800, 208400, -700, 2500),
+        (-140700, -121300, 100, -900),
+        (-151200, 32200, 1200, 3000),
+        (13700, 99100, 1000, 500),
+        (65900, 0, -600, 0),
+        (65600, -19100, -400, 100),
+        (73000, 25000, 500, -1800),
+        (-121500, 52700, 1400, -1400),
+        (-36200, -64400, -1400, 900),
+        (13500, 9000, 0, 100),
+        (-64700, 68100, 800, 1000),
+        (80600, 0, -100, 0),
+        (-76800, -51400, -300, 500),
+        (-8300, -16800, -100, 600),
+        (56500, 2300, 700, -700),
+        (15800, 23500, 200, -200),
+        (6400, -2200, -500, -1200),
+        (-7200, -27200, -800, 200),
+        (9800, -1900, 1000, 300),
+        (23600, 0, -100, 0),
+        (9800, 8400, 100, -300),
+        (-17500, -15300, -100, 700),
+        (-400, 12800, 500, -200),
+        (-21100, -11800, -100, 500),
+        (15300, 14900, 400, -300),
+        (13700, 3600, 500, -500),
+        (-16500, -6900, 0, 400),
+        (-300, 2800, 400, 100),
+        (5000, 0, -100, 0),
+        (8200, -23300, -200, -300),
+        (2900, 11100, 0, 200),
+        (-1400, 9800, 400, -400),
+        (-1100, -5100, -300, 400),
+        (-13300, -6200, 0, 100),
+        (1100, 7800, 300, 0),
+        (8900, 400, 0, -200),
+        (-9300, -1500, 0, 500),
+        (-11900, 9700, -400, 200),
+        (-1900, 0, 0, 0),
+        (-6200, 3400, 0, 0),
+        (-100, -200, 0, 100),
+        (1700, 3500, 200, -300),
+        (-900, 4800, -100, 100),
+        (600, -8600, -200, -200),
+        (-900, -100, 0, 100),
+        (1900, -4200, -100, 0),
+        (1400, -3400, -200, -100),
+        (-2400, -100, -100, 200),
+        (-3900, -8800, 0, 0),
+        (3000, 0, 0, 0),
+        (-1400, 0, -100, 0),
+        (-2500, 2600, 0, 100),
+        (2400, -500, 0, 0),
+        (-900, -400, 0, 200),
+        (300, 600, -100, 0),
+        (-700, -200, 0, 0),
+        (-100, -1700, 0, 100),
+        (1400, -1600, -100, 0),
+        (-600, -3000, -100, -100),
+        (200, -2000, -100, 0),
+        (3100, -2600, -100, 0),
+        (-2000, 0, 0, 0),
+        (-100, -1200, 0, 0),
+        (500, 500, 0, 0),
+        (1300, 1300, 0, -100),
+        (-1200, -1800, 0, 100),
+        (700, 100, 0, 0),
+        (300, 700, 0, 0),
+        (500, -100, 0, 0),
+        (-200, 600, 0, 100),
+        (-500, 200, 0, 0),
+        (100, -900, 0, 0),
+        (-1100, 0, 0, 0),
+        (-300, 500, -100, -100),
+    ),
+    (
+        (268435456, 0),
+        (268435456, 0),
+        (268435456, 0),
+        (402653184, 134217728),
+        (464943848, 0),
+        (232471924, 0),
+        (447392427, 178956971),
+        (474531328, 164382474),
+        (600239927, 0),
+        (245046924, 0),
+        (469762048, 201326592),
+        (485168157, 196037539),
+        (542434490, 173274342),
+        (710213460, 0),
+        (251098377, 0),
+        (483183821, 214748365),
+        (493147422, 212216861),
+        (527196770, 202918131),
+        (603979776, 177553365),
+        (805306368, 0),
+        (254660234, 0),
+        (492131669, 223696213),
+        (499112609, 222285676),
+        (521984461, 217457573),
+        (568264704, 206641710),
+        (660263920, 180071978),
+        (890299688, 0),
+        (257007382, 0),
+        (498522990, 230087534),
+        (503689169, 229220408),
+        (520207937, 226364652),
+        (551763840, 220542232),
+        (607471994, 208976719),
+        (712324054, 181731663),
+        (967857801, 0),
+        (258670878, 0),
+        (503316480, 234881024),
+        (507295328, 234309675),
+        (519823025, 232471924),
+        (542937443, 228922526),
+        (581179810, 222574922),
+        (644761110, 210578097),
+        (760942992, 182907932),
+        (1039646051, 0),
+        (259911513, 0),
+        (507044750, 238609294),
+        (510203938, 238212836),
+        (520048008, 236957326),
+        (537802172, 234614568),
+        (566020449, 230676747),
+        (609810343, 224015551),
+        (680271917, 211744743),
+        (806703258, 183785193),
+        (1106787739, 0),
+        (260872372, 0),
+        (510027366, 241591910),
+        (512596790, 241305530),
+        (520544501, 240408393),
+        (534653955, 238773118),
+        (556485479, 236133125),
+        (588928875, 231954745),
+        (637534208, 225089973),
+        (714181163, 212632566),
+        (850045611, 184464623),
+        (1170083026, 0),
+        (261638518, 0),
+        (512467689, 244032233),
+        (514598541, 243818611),
+        (521154200, 243154642),
+        (532660095, 241964450),
+        (550128980, 240095971),
+        (575338659, 237265664),
+        (611434177, 232927305),
+        (664343859, 225922101),
+        (746658039, 213330868),
+        (891310818, 185006371),
+        (1230125796, 0),
+        (262263701, 0),
+        (514501291, 246065835),
+        (516297112, 245902239),
+        (521799546, 245396741),
+        (531374648, 244501769),
+        (545711027, 243124958),
+        (565971072, 241102667),
+        (594094917, 238142804),
+        (633440624, 233692258),
+        (690275916, 226585604),
+        (777852837, 213894491),
+        (930767856, 185448441),
+        (1287371222, 0),
+        (262783550, 0),
+    ),
+)
@@ -0,0 +1,468 @@
+"""Coefficients of WMM-2020 prepared for the legendre evaluator, generated by ``python -m pygeomag.prepared``."""
+
+WMM_2020_PREPARED = (
+    (2020.0, "WMM-2020", "12/10/2019"),
+    {
+        "evaluator": "legendre",
+        "maxord": 12,
+        "c": (
+            0.0,
+            0.0,
+            0.0,
+            0.0,
+            -29404.5,
+            0.0,
+            6.7,
+            0.0,
+            -1450.7,
+            4652.9,
+            7.7,
+            -25.1,
+            -3750.0,
+            0.0,
+            -17.25,
+            0.0,
+            5164.975508170392,
+            -5181.603195923053,
+            -12.297560733739028,
+            -52.30793438858009,
+            1452.1513970657466,
+            -636.3554667008054,
+            -1.905255888325765,
+            -20.69800715044808,
+            3409.75,
+            0.0,
+            7.0,
+            0.0,
+            -7290.293846958433,
+            -251.68507107097156,
+            -18.98354550656963,
+            17.452614417330143,
+            2393.8910062908044,
+            468.24368655647675,
+            6.5840716885526085,
+            -1.9364916731037085,
+            415.6023414876293,
+            -429.2001354263533,
+            -9.644946863513557,
+            0.8696263565463045,
+            3951.0625,
+            0.0,
+            -4.8125,
+            0.0,
+            4479.208191745501,
+            1560.5840252930952,
+            -8.854377448471462,
+            1.1067971810589328,
+            337.3108544058433,
+            -619.8380433629418,
+            -23.47871376374779,
+            27.000520828309963,
+            -647.1565305241074,
+            417.9116832537708,
+            11.294910358210021,
+            7.739105245440199,
+            35.42252770130895,
+            -258.902441507897,
+            -4.067304850880986,
+            -4.141255848169731,
+            -1845.9,
+            0.0,
+            -2.3625,
+            0.0,
+            3691.4856641457723,
+            484.9459272369962,
+            6.099948770276682,
+            1.016658128379447,
+            1443.2830153854093,
+            1601.5984047194852,
+            -5.379649152128788,
+            19.213032686174245,
+            -662.1641197500622,
+            -570.8635943545313,
+            0.4706212649254174,
+            -4.235591384328757,
+            -335.4417237017481,
+            71.43666338092784,
+            2.6622359023948263,
+            6.655589755987066,
+            9.611382412275558,
+            69.52467131799328,
+            0.7015607600201138,
+            0.3507803800100569,
+            951.4312500000001,
+            0.0,
+            -8.6625,
+            0.0,
+            1240.0449830550501,
+            -361.0496825663333,
+            -7.561249896677136,
+            1.890312474169284,
+            1090.9289556740737,
+            373.60580673769647,
+            7.4721161347539296,
+            -26.899618085114145,
+            -1210.4828138301364,
+            525.0406937353761,
+            13.947950118207332,
+            -13.947950118207332,
+            -197.53840726235998,
+            -351.4219178921542,
+            -7.639606910699004,
+            4.911175871163645,
+            31.41198641641435,
+            20.941324277609567,
+            -0.0,
+            0.23268138086232854,
+            -43.45855582297633,
+            45.74231300687307,
+            0.5373546315051169,
+            0.671693289381396,
+            2161.0874999999996,
+            0.0,
+            -2.6812500000000004,
+            0.0,
+            -2724.0655498721026,
+            -1823.1376206175269,
+            -10.6408810541879,
+            17.734801756979834,
+            -240.37472296688406,
+            -486.5416079329702,
+            -2.896080999601013,
+            17.376485997606075,
+            1157.0287602311162,
+            47.100285814718,
+            14.334869595783738,
+            -14.334869595783738,
+            195.11310782146344,
+            290.1998755572399,
+            2.4697861749552334,
+            -2.4697861749552334,
+            39.516578799283735,
+            -13.583823962253785,
+            -3.087232718694042,
+            -7.4093585248657,
+            -17.437137092997812,
+            -65.87362901799173,
+            -1.9374596769997572,
+            0.4843649192499393,
+            6.343146523019946,
+            -1.229793713646724,
+            0.6472598492877496,
+            0.19417795478632488,
+            1186.453125,
+            0.0,
+            -5.02734375,
+            0.0,
+            656.90625,
+            563.0625,
+            6.703125,
+            -20.109375,
+            -981.4414295632145,
+            -858.0602212752675,
+            -5.608236740361225,
+            39.257657182528575,
+            -16.56782933126727,
+            530.1705386005526,
+            20.709786664084085,
+            -8.283914665633635,
+            -564.1342339363264,
+            -315.4873914904574,
+            -2.673621961783537,
+            13.368109808917685,
+            226.90796990551178,
+            220.97573539817813,
+            5.932234507333641,
+            -4.44917588050023,
+            94.05361578164639,
+            24.714818745542118,
+            3.4326137146586273,
+            -3.4326137146586273,
+            -41.3626391798429,
+            -17.29710365702521,
+            0.0,
+            1.0027306467840702,
+            -0.18801199627201318,
+            1.7547786318721228,
+            0.25068266169601755,
+            0.06267066542400439,
+            474.8046875,
+            0.0,
+            -9.49609375,
+            0.0,
+            1044.7084283689758,
+            -2968.500778170383,
+            -25.480693374853075,
+            -38.221040062279606,
+            315.0851206838672,
+            1206.0154619279056,
+            -0.0,
+            21.73000832302533,
+            -116.17597599099797,
+            813.2318319369858,
+            33.193135997427994,
+            -33.193135997427994,
+            -62.013312208857876,
+            -287.51626569561375,
+            -16.912721511506692,
+            22.55029534867559,
+            -448.08960423838624,
+            -208.8838756599996,
+            -0.0,
+            3.369094768709671,
+            19.13772363214372,
+            135.70385848247366,
+            5.2193791724028324,
+            -0.0,
+            67.04837183671641,
+            3.013409970189502,
+            -0.0,
+            -1.506704985094751,
+            -24.030992904895065,
+            -3.87596659756372,
+            -0.0,
+            1.2919888658545733,
+            -7.247687766888732,
+            5.90777910410258,
+            -0.24361975687020948,
+            0.12180987843510474,
+            -342.80898437499997,
+            0.0,
+            0.0,
+            0.0,
+            -1508.3736576043052,
+            827.1726509442963,
+            -0.0,
+            -0.0,
+            -21.069192030396437,
+            -42.13838406079287,
+            -0.0,
+            21.069192030396437,
+            280.9765787810192,
+            578.4811916079808,
+            33.05606809188462,
+            -49.584102137826925,
+            -105.18376458211144,
+            560.980077771261,
+            -11.687084953567938,
+            11.687084953567938,
+            44.349369193389464,
+            -635.6742917719156,
+            -14.783123064463155,
+            -14.783123064463155,
+            -37.1880766033702,
+            -4.132008511485578,
+            -0.0,
+            4.132008511485578,
+            38.08205214556689,
+            -84.1813784270426,
+            -2.0043185339772047,
+            -0.0,
+            11.455634610577219,
+            -27.820826911401817,
+            -1.63651923008246,
+            -0.81825961504123,
+            -6.371483405083152,
+            -0.265478475211798,
+            -0.265478475211798,
+            0.530956950423596,
+            -2.3151488768326356,
+            -5.223925670801845,
+            -0.0,
+            -0.0,
+            1033.34765625,
+            0.0,
+            -0.0,
+            0.0,
+            -652.941025700099,
+            -0.0,
+            -46.63864469286422,
+            -0.0,
+            -1022.6199334371944,
+            1063.5247307746822,
+            -0.0,
+            40.90479733748778,
+            787.1232194346969,
+            -163.9840040488952,
+            0.0,
+            0.0,
+            -215.56257141023613,
+            -95.8055872934383,
+            -0.0,
+            47.90279364671915,
+            47.52707966042389,
+            95.05415932084777,
+            -15.842359886807964,
+            -0.0,
+            -65.88234961087554,
+            -18.823528460250156,
+            0.0,
+            0.0,
+            -4.9604352946160635,
+            -84.32740000847308,
+            -0.0,
+            4.9604352946160635,
+            31.86405329608985,
+            -36.41606090981698,
+            -2.276003806863561,
+            -0.0,
+            -5.2889549039323525,
+            -26.444774519661763,
+            -0.8814924839887255,
+            -0.8814924839887255,
+            0.544068972983464,
+            -5.44068972983464,
+            -0.272034486491732,
+            0.0,
+            1.7979363691975048,
+            -1.5079466322301653,
+            -0.0579979473934679,
+            -0.0,
+            -1320.388671875,
+            0.0,
+            0.0,
+            0.0,
+            -89.7027461585248,
+            -1076.4329539022976,
+            -0.0,
+            -0.0,
+            397.5649303487331,
+            397.5649303487331,
+            -0.0,
+            0.0,
+            843.9870564489264,
+            843.9870564489264,
+            0.0,
+            -64.92208126530203,
+            -584.2987313877182,
+            -876.4480970815773,
+            -0.0,
+            48.69156094897652,
+            233.8149467116318,
+            33.40213524451883,
+            -0.0,
+            -0.0,
+            62.48967303583804,
+            145.8092370836221,
+            0.0,
+            0.0,
+            58.52694113574506,
+            -11.705388227149014,
+            -0.0,
+            -0.0,
+            -11.705388227149014,
+            35.11616468144704,
+            0.0,
+            5.852694113574507,
+            -12.771625616608402,
+            5.108650246643361,
+            -0.0,
+            -0.0,
+            0.9432470636269008,
+            -8.489223572642107,
+            -0.0,
+            -0.0,
+            -3.0596322283672857,
+            -0.0,
+            -0.0,
+            0.0,
+            -0.1703304036380569,
+            0.2838840060634282,
+            -0.056776801212685635,
+            -0.056776801212685635,
+        ),
+        "k": (
+            0.0,
+            -0.0,
+            0.0,
+            0.3333333333333333,
+            0.0,
+            -1.0,
+            0.26666666666666666,
+            0.2,
+            0.0,
+            -0.3333333333333333,
+            0.2571428571428571,
+            0.22857142857142856,
+            0.14285714285714285,
+            0.0,
+            -0.2,
+            0.25396825396825395,
+            0.23809523809523808,
+            0.19047619047619047,
+            0.1111111111111111,
+            0.0,
+            -0.14285714285714285,
+            0.25252525252525254,
+            0.24242424242424243,
+            0.21212121212121213,
+            0.16161616161616163,
+            0.09090909090909091,
+            0.0,
+            -0.1111111111111111,
+            0.2517482517482518,
+            0.24475524475524477,
+            0.22377622377622378,
+            0.1888111888111888,
+            0.13986013986013987,
+            0.07692307692307693,
+            0.0,
+            -0.09090909090909091,
+            0.2512820512820513,
+            0.24615384615384617,
+            0.23076923076923078,
+            0.20512820512820512,
+            0.16923076923076924,
+            0.12307692307692308,
+            0.06666666666666667,
+            0.0,
+            -0.07692307692307693,
+            0.25098039215686274,
+            0.24705882352941178,
+            0.23529411764705882,
+            0.21568627450980393,
+            0.18823529411764706,
+            0.15294117647058825,
+            0.10980392156862745,
+            0.058823529411764705,
+            0.0,
+            -0.06666666666666667,
+            0.25077399380804954,
+            0.2476780185758514,
+            0.23839009287925697,
+            0.22291021671826625,
+            0.20123839009287925,
+            0.17337461300309598,
+            0.1393188854489164,
+            0.09907120743034056,
+            0.05263157894736842,
+            0.0,
+            -0.058823529411764705,
+            0.2506265664160401,
+            0.24812030075187969,
+            0.24060150375939848,
+            0.22807017543859648,
+            0.21052631578947367,
+            0.18796992481203006,
+            0.16040100250626566,
+            0.12781954887218044,
+            0.09022556390977443,
+            0.047619047619047616,
+            0.0,
+            -0.05263157894736842,
+            0.2505175983436853,
+            0.2484472049689441,
+            0.2422360248447205,
+            0.2318840579710145,
+            0.21739130434782608,
+            0.19875776397515527,
+            0.17598343685300208,
+            0.14906832298136646,
+            0.11801242236024845,
+            0.08281573498964803,
+            0.043478260869565216,
+            0.0,
+            -0.047619047619047616,
+        ),
+    },
+)
@@ -0,0 +1,191 @@
+"""Fixed point tables of WMM-2025, generated by ``python -m pygeomag.fixedpoint``."""
+
+WMM_2025_FIXED = (
+    (2025.0, "WMM-2025", "11/13/2024", 12),
+    (
+        (0, 0, 0, 0),
+        (-29351800, 0, 12000, 0),
+        (-1410800, 4545400, 9700, -21500),
+        (-2556600, 0, -11600, 0),
+        (2951100, -3133600, -5200, -27700),
+        (1649300, -815100, -8000, -12100),
+        (1361000, 0, -1300, 0),
+        (-2404100, -56600, -4200, 4000),
+        (1243800, 237500, 400, -300),
+        (453600, -549500, -15600, -4100),
+        (895000, 0, -1600, 0),
+        (799500, 278600, -2400, -1100),
+        (55700, -133900, -6000, 4100),
+        (-281100, 212000, 5600, 1600),
+        (12100, -375600, -7000, -4400),
+        (-233200, 0, 600, 0),
+        (368900, 45400, 1400, -500),
+        (187200, 220200, 0, 2200),
+        (-138700, -122900, 600, 400),
+        (-142000, 43000, 2200, 1700),
+        (20900, 106100, 900, 1900),
+        (64400, 0, -200, 0),
+        (63800, -18400, -400, 300),
+        (76900, 16800, 900, -1600),
+        (-115700, 48800, 1200, -400),
+        (-40900, -59800, -900, 900),
+        (14900, 10900, 300, 700),
+        (-60700, 72700, 900, 900),
+        (79500, 0, 0, 0),
+        (-77000, -48900, -100, 600),
+        (-8800, -14400, -100, 500),
+        (59300, -1000, 500, -800),
+        (15800, 23400, -100, 0),
+        (2500, -7400, -800, -1000),
+        (-11100, -25100, -800, 600),
+        (14200, -2300, 800, -200),
+        (23200, 0, -100, 0),
+        (10800, 7100, 200, -200),
+        (-17500, -12600, 0, 500),
+        (2000, 11400, 500, -400),
+        (-21700, -9700, -100, 400),
+        (16900, 12700, 300, -500),
+        (15000, 700, 200, -600),
+        (-16800, -5200, 0, 300),
+        (900, 3900, 200, 200),
+        (4600, 0, 0, 0),
+        (7800, -24800, -100, -300),
+        (3000, 12200, 100, 300),
+        (-200, 8300, 300, -300),
+        (-2500, -3300, -300, 300),
+        (-13100, -5200, 0, 200),
+        (2400, 7200, 300, -100),
+        (8600, -600, -100, -200),
+        (-8700, 800, 100, 400),
+        (-12900, 10000, -100, 100),
+        (-1300, 0, 100, 0),
+        (-6400, 3300, 0, 0),
+        (200, 0, 100, 0),
+        (2000, 2400, 100, -200),
+        (-1000, 5300, 0, 100),
+        (-600, -9100, -300, -100),
+        (-900, 400, 0, 100),
+        (1500, -4200, -100, 0),
+        (900, -3800, -100, -100),
+        (-2700, 900, 0, 200),
+        (-3900, -9100, 0, 0),
+        (2900, 0, 0, 0),
+        (-1500, 0, 0, 0),
+        (-2500, 2900, 0, 100),
+        (2400, -600, 0, 0),
+        (-600, 200, 0, 100),
+        (-100, 500, -100, 0),
+        (-600, -300, 0, 0),
+        (-100, -1200, 0, 100),
+        (1100, -1700, -100, 0),
+        (-1000, -2900, -100, 0),
+        (-200, -1800, -100, 0),
+        (2600, -2300, -100, 0),
+        (-2000, 0, 0, 0),
+        (-200, -1300, 0, 0),
+        (300, 700, 0, 0),
+        (1200, 1000, 0, -100),
+        (-1300, -1400, 0, 100),
+        (600, 0, 0, 0),
+        (600, 600, 100, 0),
+        (500, -100, 0, 0),
+        (-100, 800, 0, 0),
+        (-400, 100, 0, 0),
+        (-200, -1000, -100, 0),
+        (-1300, 100, 0, 0),
+        (-700, 200, -100, -100),
+    ),
+    (
+        (268435456, 0),
+        (268435456, 0),
+        (268435456, 0),
+        (402653184, 134217728),
+        (464943848, 0),
+        (232471924, 0),
+        (447392427, 178956971),
+        (474531328, 164382474),
+        (600239927, 0),
+        (245046924, 0),
+        (469762048, 201326592),
+        (485168157, 196037539),
+        (542434490, 173274342),
+        (710213460, 0),
+        (251098377, 0),
+        (483183821, 214748365),
+        (493147422, 212216861),
+        (527196770, 202918131),
+        (603979776, 177553365),
+        (805306368, 0),
+        (254660234, 0),
+        (492131669, 223696213),
+        (499112609, 222285676),
+        (521984461, 217457573),
+        (568264704, 206641710),
+        (660263920, 180071978),
+        (890299688, 0),
+        (257007382, 0),
+        (498522990, 230087534),
+        (503689169, 229220408),
+        (520207937, 226364652),
+        (551763840, 220542232),
+        (607471994, 208976719),
+        (712324054, 181731663),
+        (967857801, 0),
+        (258670878, 0),
+        (503316480, 234881024),
+        (507295328, 234309675),
+        (519823025, 232471924),
+        (542937443, 228922526),
+        (581179810, 222574922),
+        (644761110, 210578097),
+        (760942992, 182907932),
+        (1039646051, 0),
+        (259911513, 0),
+        (507044750, 238609294),
+        (510203938, 238212836),
+        (520048008, 236957326),
+        (537802172, 234614568),
+        (566020449, 230676747),
+        (609810343, 224015551),
+        (680271917, 211744743),
+        (806703258, 183785193),
+        (1106787739, 0),
+        (260872372, 0),
+        (510027366, 241591910),
+        (512596790, 241305530),
+        (520544501, 240408393),
+        (534653955, 238773118),
+        (556485479, 236133125),
+        (588928875, 231954745),
+        (637534208, 225089973),
+        (714181163, 212632566),
+        (850045611, 184464623),
+        (1170083026, 0),
+        (261638518, 0),
+        (512467689, 244032233),
+        (514598541, 243818611),
+        (521154200, 243154642),
+        (532660095, 241964450),
+        (550128980, 240095971),
+        (575338659, 237265664),
+        (611434177, 232927305),
+        (664343859, 225922101),
+        (746658039, 213330868),
+        (891310818, 185006371),
+        (1230125796, 0),
+        (262263701, 0),
+        (514501291, 246065835),
+        (516297112, 245902239),
+        (521799546, 245396741),
+        (531374648, 244501769),
+        (545711027, 243124958),
+        (565971072, 241102667),
+        (594094917, 238142804),
+        (633440624, 233692258),
+        (690275916, 226585604),
+        (777852837, 213894491),
+        (930767856, 185448441),
+        (1287371222, 0),
+        (262783550, 0),
+    ),
+)
@@ -0,0 +1,468 @@
+"""Coefficients of WMM-2025 prepared for the legendre evaluator, generated by ``python -m pygeomag.prepared``."""
+
+WMM_2025_PREPARED = (
+    (2025.0, "WMM-2025", "11/13/2024"),
+    {
+        "evaluator": "legendre",
+        "maxord": 12,
+        "c": (
+            0.0,
+            0.0,
+            0.0,
+            0.0,
+            -29351.8,
+            0.0,
+            12.0,
+            0.0,
+            -1410.8,
+            4545.4,
+            9.7,
+            -21.5,
+            -3834.8999999999996,
+            0.0,
+            -17.4,
+            0.0,
+            5111.455138216514,
+            -5427.554410597833,
+            -9.00666419935816,
+            -47.977807369657896,
+            1428.3356984616746,
+            -705.897306624696,
+            -6.928203230275509,
+            -10.478907385791707,
+            3402.5,
+            0.0,
+            -3.25,
+            0.0,
+            -7361.022863281298,
+            -173.30139930190984,
+            -12.859821149611685,
+            12.24744871391589,
+            2408.6083430063927,
+            459.91677236213076,
+            0.7745966692414834,
+            -0.5809475019311126,
+            358.6022866630943,
+            -434.4178935656311,
+            -12.33288287465668,
+            -3.241334601672589,
+            3915.625,
+            0.0,
+            -7.0,
+            0.0,
+            4424.421731283083,
+            1541.7684732150933,
+            -13.281566172707192,
+            -6.08738449582413,
+            217.960726106792,
+            -523.9666288276383,
+            -23.47871376374779,
+            16.04378773856099,
+            -587.9628336468217,
+            443.42981406306006,
+            11.713240371477058,
+            3.3466401061363023,
+            8.948070671938169,
+            -277.759945816527,
+            -5.176569810212164,
+            -3.253843880704789,
+            -1836.4499999999998,
+            0.0,
+            4.725,
+            0.0,
+            3750.4518355917794,
+            461.5627902842689,
+            14.233213797312256,
+            -5.083290641897235,
+            1438.6718875407273,
+            1692.2839189982274,
+            0.0,
+            16.907468763833336,
+            -652.7516944515538,
+            -578.393534593338,
+            2.823727589552504,
+            1.8824850597016696,
+            -315.0312484500545,
+            95.39678650248128,
+            4.880765821057182,
+            3.771500861726004,
+            14.662619884420378,
+            74.43559663813407,
+            0.6314046840181025,
+            1.3329654440382162,
+            929.7750000000001,
+            0.0,
+            -2.8875,
+            0.0,
+            1206.0193585200032,
+            -347.8174952471482,
+            -7.561249896677136,
+            5.670937422507851,
+            1149.2114615251544,
+            251.06310212773204,
+            13.449809042557073,
+            -23.910771631212576,
+            -1152.698449054706,
+            486.1856898346556,
+            11.955385815606286,
+            -3.9851286052020956,
+            -223.18565903399232,
+            -326.3203523284289,
+            -4.911175871163645,
+            4.911175871163645,
+            34.669525748486954,
+            25.36227051399381,
+            0.6980441425869855,
+            1.6287696660362996,
+            -40.77178266545074,
+            48.832102138027494,
+            0.6045239604432565,
+            0.6045239604432565,
+            2131.59375,
+            0.0,
+            -0.0,
+            0.0,
+            -2731.1594705748944,
+            -1734.4636118326277,
+            -3.546960351395967,
+            21.2817621083758,
+            -254.85512796488914,
+            -417.03566394254585,
+            -2.896080999601013,
+            14.480404998005064,
+            1214.3682386142511,
+            -20.478385136833914,
+            10.239192568416957,
+            -16.38270810946713,
+            195.11310782146344,
+            288.9649824697623,
+            -1.2348930874776167,
+            0.0,
+            15.436163593470209,
+            -45.69104423667182,
+            -4.939572349910467,
+            -6.174465437388084,
+            -26.882253018371628,
+            -60.78779736586738,
+            -1.9374596769997572,
+            1.4530947577498177,
+            9.191089859886043,
+            -1.488697653361824,
+            0.5178078794301997,
+            -0.12945196985754992,
+            1166.34375,
+            0.0,
+            -5.02734375,
+            0.0,
+            723.9375,
+            475.921875,
+            13.40625,
+            -13.40625,
+            -981.4414295632145,
+            -706.6378292855144,
+            0.0,
+            28.041183701806126,
+            82.83914665633634,
+            472.18313594111714,
+            20.709786664084085,
+            -16.56782933126727,
+            -580.1759657070276,
+            -259.34133029300307,
+            -2.673621961783537,
+            10.694487847134148,
+            250.6369079348463,
+            188.34844560784308,
+            4.44917588050023,
+            -7.415293134167051,
+            102.97841143975882,
+            4.8056592005220775,
+            1.373045485863451,
+            -4.119136457590352,
+            -42.11468716493095,
+            -13.035498408192913,
+            -0.0,
+            0.7520479850880527,
+            0.5640359888160396,
+            2.444155951536171,
+            0.12534133084800878,
+            0.12534133084800878,
+            436.82031249999994,
+            0.0,
+            -0.0,
+            0.0,
+            993.7470416192698,
+            -3159.605978481781,
+            -12.740346687426538,
+            -38.221040062279606,
+            325.95012484537995,
+            1325.530507704545,
+            10.865004161512665,
+            32.59501248453799,
+            -16.596567998713997,
+            688.757571946631,
+            24.894851998070994,
+            -24.894851998070994,
+            -140.93934592922244,
+            -186.03993662657362,
+            -16.912721511506692,
+            16.912721511506692,
+            -441.35141470096687,
+            -175.1929279729029,
+            0.0,
+            6.738189537419342,
+            41.75503337922266,
+            125.265100137668,
+            5.2193791724028324,
+            -1.739793057467611,
+            64.78831435907429,
+            -4.520114955284252,
+            -0.7533524925473755,
+            -1.506704985094751,
+            -22.480606265869575,
+            2.0671821853673173,
+            0.25839777317091467,
+            1.0335910926836587,
+            -7.856737159064256,
+            6.090493921755237,
+            -0.06090493921755237,
+            0.06090493921755237,
+            -234.55351562500002,
+            0.0,
+            18.042578125000002,
+            0.0,
+            -1557.0308723657345,
+            802.8440435635817,
+            0.0,
+            0.0,
+            42.13838406079287,
+            0.0,
+            21.069192030396437,
+            -0.0,
+            330.5606809188462,
+            396.6728171026154,
+            16.52803404594231,
+            -33.05606809188462,
+            -116.87084953567937,
+            619.4155025391007,
+            -0.0,
+            11.687084953567938,
+            -44.349369193389464,
+            -672.6320994330736,
+            -22.174684596694732,
+            -7.391561532231577,
+            -37.1880766033702,
+            16.528034045942313,
+            0.0,
+            4.132008511485578,
+            30.06477800965807,
+            -84.1813784270426,
+            -2.0043185339772047,
+            0.0,
+            7.36433653537107,
+            -31.093865371566736,
+            -0.81825961504123,
+            -0.81825961504123,
+            -7.167918830718547,
+            2.3893062769061824,
+            -0.0,
+            0.530956950423596,
+            -2.3151488768326356,
+            -5.402014045942816,
+            -0.0,
+            -0.0,
+            998.902734375,
+            0.0,
+            0.0,
+            0.0,
+            -699.5796703929632,
+            0.0,
+            -0.0,
+            -0.0,
+            -1022.6199334371944,
+            1186.2391227871456,
+            0.0,
+            40.90479733748778,
+            787.1232194346969,
+            -196.78080485867423,
+            0.0,
+            -0.0,
+            -143.7083809401574,
+            47.90279364671915,
+            0.0,
+            23.951396823359573,
+            -15.842359886807964,
+            79.21179943403982,
+            -15.842359886807964,
+            -0.0,
+            -56.47058538075046,
+            -28.23529269037523,
+            0.0,
+            -0.0,
+            -4.9604352946160635,
+            -59.525223535392755,
+            -0.0,
+            4.9604352946160635,
+            25.036041875499173,
+            -38.692064716680534,
+            -2.276003806863561,
+            -0.0,
+            -8.814924839887254,
+            -25.563282035673037,
+            -0.8814924839887255,
+            0.0,
+            -0.544068972983464,
+            -4.896620756851176,
+            -0.272034486491732,
+            0.0,
+            1.5079466322301653,
+            -1.3339527900497614,
+            -0.0579979473934679,
+            0.0,
+            -1320.388671875,
+            0.0,
+            0.0,
+            0.0,
+            -179.4054923170496,
+            -1166.1357000608225,
+            0.0,
+            -0.0,
+            238.53895820923987,
+            556.5909024882263,
+            -0.0,
+            0.0,
+            779.0649751836244,
+            649.2208126530203,
+            -0.0,
+            -64.92208126530203,
+            -632.9902923366948,
+            -681.6818532856712,
+            -0.0,
+            48.69156094897652,
+            200.412811467113,
+            -0.0,
+            -0.0,
+            -0.0,
+            124.97934607167608,
+            124.97934607167608,
+            20.829891011946017,
+            -0.0,
+            58.52694113574506,
+            -11.705388227149014,
+            -0.0,
+            -0.0,
+            -5.852694113574507,
+            46.821552908596054,
+            0.0,
+            0.0,
+            -10.217300493286722,
+            2.5543251233216804,
+            0.0,
+            -0.0,
+            -1.8864941272538016,
+            -9.432470636269008,
+            -0.9432470636269008,
+            -0.0,
+            -3.6159289971613378,
+            0.278148384397026,
+            -0.0,
+            0.0,
+            -0.39743760848879944,
+            0.11355360242537127,
+            -0.056776801212685635,
+            -0.056776801212685635,
+        ),
+        "k": (
+            0.0,
+            -0.0,
+            0.0,
+            0.3333333333333333,
+            0.0,
+            -1.0,
+            0.26666666666666666,
+            0.2,
+            0.0,
+            -0.3333333333333333,
+            0.2571428571428571,
+            0.22857142857142856,
+            0.14285714285714285,
+            0.0,
+            -0.2,
+            0.25396825396825395,
+            0.23809523809523808,
+            0.19047619047619047,
+            0.1111111111111111,
+            0.0,
+            -0.14285714285714285,
+            0.25252525252525254,
+            0.24242424242424243,
+            0.21212121212121213,
+            0.16161616161616163,
+            0.09090909090909091,
+            0.0,
+            -0.1111111111111111,
+            0.2517482517482518,
+            0.24475524475524477,
+            0.22377622377622378,
+            0.1888111888111888,
+            0.13986013986013987,
+            0.07692307692307693,
+            0.0,
+            -0.09090909090909091,
+            0.2512820512820513,
+            0.24615384615384617,
+            0.23076923076923078,
+            0.20512820512820512,
+            0.16923076923076924,
+            0.12307692307692308,
+            0.06666666666666667,
+            0.0,
+            -0.07692307692307693,
+            0.25098039215686274,
+            0.24705882352941178,
+            0.23529411764705882,
+            0.21568627450980393,
+            0.18823529411764706,
+            0.15294117647058825,
+            0.10980392156862745,
+            0.058823529411764705,
+            0.0,
+            -0.06666666666666667,
+            0.25077399380804954,
+            0.2476780185758514,
+            0.23839009287925697,
+            0.22291021671826625,
+            0.20123839009287925,
+            0.17337461300309598,
+            0.1393188854489164,
+            0.09907120743034056,
+            0.05263157894736842,
+            0.0,
+            -0.058823529411764705,
+            0.2506265664160401,
+            0.24812030075187969,
+            0.24060150375939848,
+            0.22807017543859648,
+            0.21052631578947367,
+            0.18796992481203006,
+            0.16040100250626566,
+            0.12781954887218044,
+            0.09022556390977443,
+            0.047619047619047616,
+            0.0,
+            -0.05263157894736842,
+            0.2505175983436853,
+            0.2484472049689441,
+            0.2422360248447205,
+            0.2318840579710145,
+            0.21739130434782608,
+            0.19875776397515527,
+            0.17598343685300208,
+            0.14906832298136646,
+            0.11801242236024845,
+            0.08281573498964803,
+            0.043478260869565216,
+            0.0,
+            -0.047619047619047616,
+        ),
+    },
+)
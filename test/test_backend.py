@@ -0,0 +1,93 @@
+import os
+import unittest
+from unittest import TestCase
+from unittest.mock import patch
+
+from pygeomag import GeoMag, backend
+from pygeomag.wmm.wmm_2025 import WMM_2025
+from pygeomag.wmm.wmmhr_2025 import WMMHR_2025
+
+HAS_NUMBA = backend.BACKEND_NUMBA in backend.available_backends()
+
+TEST_POINTS = (
+    (47.6205, -122.3493, 0, 2025.25),
+    (89, -121, 28, 2026.5),
+    (90, 0, 0, 2027),
+    (-90, 45, 100, 2028),
+    (-45.5, 170.25, 850, 2029.75),
+)
+
+
+class TestBackend(TestCase):
+    def setUp(self):
+        self.previous_backend = backend.get_backend()
+
+    def tearDown(self):
+        backend.set_backend(self.previous_backend)
+
+    def test_available_backends(self):
+        self.assertEqual(backend.available_backends()[0], backend.BACKEND_PYTHON)
+
+    def test_available_backends_without_numba(self):
+        with patch("pygeomag.backend._numba_importable", None), patch(
+            "pygeomag.backend.find_spec", return_value=None
+        ):
+            self.assertEqual(backend.available_backends(), [backend.BACKEND_PYTHON])
+
+    def test_available_backends_with_broken_numba(self):
+        with patch("pygeomag.backend._numba_importable", None), patch.dict(
+            "sys.modules", {"numba": None}
+        ):
+            self.assertEqual(backend.available_backends(), [backend.BACKEND_PYTHON])
+
+    def test_unavailable_environment_backend_falls_back(self):
+        with patch.dict(os.environ, {"PYGEOMAG_BACKEND": "invalid"}):
+            with self.assertWarnsRegex(
+                RuntimeWarning, "PYGEOMAG_BACKEND invalid is not available"
+            ):
+                backend._select_default_backend()
+        self.assertEqual(backend.get_backend(), backend.available_backends()[-1])
+
+    def test_environment_backend(self):
+        with patch.dict(os.environ, {"PYGEOMAG_BACKEND": backend.BACKEND_PYTHON}):
+            backend._select_default_backend()
+        self.assertEqual(backend.get_backend(), backend.BACKEND_PYTHON)
+
+    def test_set_backend(self):
+        backend.set_backend(backend.BACKEND_PYTHON)
+        self.assertEqual(backend.get_backend(), backend.BACKEND_PYTHON)
+
+    def test_set_backend_unavailable_raises(self):
+        with self.assertRaisesRegex(ValueError, "Backend invalid is not available"):
+            backend.set_backend("invalid")
+
+    def test_default_backend_is_fastest_available(self):
+        if "PYGEOMAG_BACKEND" in os.environ:
+            self.skipTest("PYGEOMAG_BACKEND is set")
+        self.assertEqual(self.previous_backend, backend.available_backends()[-1])
+
+    def assert_backends_match(self, geo_mag):
+        for point in TEST_POINTS:
+            backend.set_backend(backend.BACKEND_PYTHON)
+            expected = geo_mag.calculate(*point)
+            backend.set_backend(backend.BACKEND_NUMBA)
+            result = geo_mag.calculate(*point)
+            self.assertAlmostEqual(result.x, expected.x, delta=1e-9)
+            self.assertAlmostEqual(result.y, expected.y, delta=1e-9)
+            self.assertAlmostEqual(result.z, expected.z, delta=1e-9)
+
+    @unittest.skipUnless(HAS_NUMBA, "Numba is not installed")
+    def test_numba_legendre(self):
+        self.assert_backends_match(GeoMag(coefficients_data=WMM_2025))
+
+    @unittest.skipUnless(HAS_NUMBA, "Numba is not installed")
+    def test_numba_clenshaw(self):
+        self.assert_backends_match(
+            GeoMag(coefficients_data=WMM_2025, evaluator="clenshaw")
+        )
+
+    @unittest.skipUnless(HAS_NUMBA, "Numba is not installed")
+    def test_numba_high_resolution(self):
+        self.assert_backends_match(
+            GeoMag(coefficients_data=WMMHR_2025, high_resolution=True)
+        )
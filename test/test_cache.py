@@ -0,0 +1,130 @@
+from unittest import TestCase
+
+from pygeomag import BlackoutZoneException, GeoMag
+from pygeomag.cache import ResultCache
+from pygeomag.wmm.wmm_2025 import WMM_2025
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResultCache(TestCase):
+    def setUp(self):
+        self.geo_mag = GeoMag(coefficients_data=WMM_2025)
+
+    def test_quantized_hit(self):
+        cache = ResultCache(self.geo_mag)
+        first = cache.calculate(47.6205, -122.3493, 0, 2025.25)
+        second = cache.calculate(47.6214, -122.3488, 0.01, 2025.2501)
+        self.assertIs(first, second)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.hit_rate, 0.5)
+        self.assertAlmostEqual(first.glat, 47.62, 9)
+        expected = self.geo_mag.calculate(first.glat, first.glon, first.alt, first.time)
+        self.assertAlmostEqual(first.d, expected.d, 9)
+        self.assertAlmostEqual(
+            first.d, self.geo_mag.calculate(47.6205, -122.3493, 0, 2025.25).d, 2
+        )
+
+    def test_different_cells_miss(self):
+        cache = ResultCache(self.geo_mag, lat_resolution=1.0)
+        cache.calculate(10.4, 0, 0, 2026)
+        cache.calculate(10.6, 0, 0, 2026)
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_cells_stay_in_range(self):
+        # 0.7 doesn't divide 90, the cell of 90 degrees is 89.95 to 90.65 degrees
+        cache = ResultCache(self.geo_mag, lat_resolution=0.7, lon_resolution=1.1)
+        result = cache.calculate(90, 10, 0, 2026)
+        self.assertAlmostEqual(result.glat, 89.975, 9)
+        center = self.geo_mag.calculate(89.975, 9.9, 0, result.time)
+        self.assertAlmostEqual(result.d, center.d, 9)
+        self.assertAlmostEqual(cache.calculate(-90, 10, 0, 2026).glat, -89.975, 9)
+        # The cell of 180 degrees is centered on 180.4 degrees
+        self.assertAlmostEqual(cache.calculate(0, 180, 0, 2026).glon, -179.6, 9)
+
+    def test_cells_split_at_grid_variation(self):
+        # The cell of 55.3 degrees is 54.95 to 55.65 degrees
+        cache = ResultCache(self.geo_mag, lat_resolution=0.7)
+        south = cache.calculate(54.97, 10, 0, 2026)
+        north = cache.calculate(55.2, 10, 0, 2026)
+        self.assertIsNot(south, north)
+        self.assertAlmostEqual(south.glat, 54.975, 9)
+        self.assertIsNone(south.gv)
+        self.assertAlmostEqual(north.glat, 55.325, 9)
+        self.assertIsNotNone(north.gv)
+        self.assertIs(cache.calculate(55.6, 10, 0, 2026), north)
+        self.assertIsNotNone(cache.calculate(-55.2, 10, 0, 2026).gv)
+
+    def test_lru_eviction(self):
+        cache = ResultCache(self.geo_mag, max_entries=2)
+        cache.calculate(1, 0, 0, 2026)
+        cache.calculate(2, 0, 0, 2026)
+        cache.calculate(1, 0, 0, 2026)
+        cache.calculate(3, 0, 0, 2026)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.evictions, 1)
+        cache.calculate(1, 0, 0, 2026)
+        self.assertEqual(cache.hits, 2)
+        cache.calculate(2, 0, 0, 2026)
+        self.assertEqual(cache.misses, 4)
+
+    def test_max_bytes(self):
+        cache = ResultCache(self.geo_mag)
+        cache.calculate(1, 0, 0, 2026)
+        size = cache.bytes
+        self.assertGreater(size, 0)
+
+        cache = ResultCache(self.geo_mag, max_bytes=3 * size)
+        for lat in range(10):
+            cache.calculate(lat, 0, 0, 2026)
+        self.assertEqual(len(cache), 3)
+        self.assertLessEqual(cache.bytes, 3 * size)
+        self.assertEqual(cache.evictions, 7)
+
+    def test_ttl(self):
+        clock = Clock()
+        cache = ResultCache(self.geo_mag, ttl=10, clock=clock)
+        first = cache.calculate(1, 0, 0, 2026)
+        clock.now = 10
+        self.assertIs(cache.calculate(1, 0, 0, 2026), first)
+        clock.now = 10.5
+        self.assertIsNot(cache.calculate(1, 0, 0, 2026), first)
+        self.assertEqual(cache.expirations, 1)
+        self.assertEqual(cache.stats()["misses"], 2)
+
+    def test_clear(self):
+        cache = ResultCache(self.geo_mag)
+        cache.calculate(1, 0, 0, 2026)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.bytes, 0)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_lifespan_of_the_position(self):
+        cache = ResultCache(self.geo_mag, time_resolution=1.0)
+        with self.assertRaisesRegex(
+            ValueError, "Time extends beyond model 5-year life span"
+        ):
+            cache.calculate(1, 0, 0, 2030.2)
+        result = cache.calculate(1, 0, 0, 2029.6)
+        self.assertEqual(result.time, 2030.0)
+
+    def test_raise_in_warning_zone(self):
+        cache = ResultCache(self.geo_mag)
+        result = cache.calculate(89, -121, 28, 2026.5)
+        self.assertTrue(result.in_blackout_zone)
+        with self.assertRaises(BlackoutZoneException):
+            cache.calculate(89, -121, 28, 2026.5, raise_in_warning_zone=True)
+
+    def test_invalid_options(self):
+        with self.assertRaisesRegex(ValueError, "lat_resolution must be positive"):
+            ResultCache(self.geo_mag, lat_resolution=0)
+        with self.assertRaisesRegex(ValueError, "max_entries must be at least 1"):
+            ResultCache(self.geo_mag, max_entries=0)
@@ -0,0 +1,154 @@
+import io
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import patch
+
+from pygeomag import GeoMag
+from pygeomag.cli import create_geo_mag, main, parse_time, read_chunks
+
+INPUT = "lat,lon,alt,time\n47.6205,-122.3493,0,2025.25\n\n0,0,0,2025-07-02\n89,-121,28,2026.5\n"
+
+
+class TestCli(TestCase):
+    def run_main(self, argv, stdin=INPUT):
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+        with patch("sys.stdin", io.StringIO(stdin)), patch("sys.stdout", stdout), patch(
+            "sys.stderr", stderr
+        ):
+            code = main(argv)
+        return code, stdout.getvalue(), stderr.getvalue()
+
+    def test_stdin_to_stdout(self):
+        code, stdout, _ = self.run_main(["--columns", "d,i,f", "--chunk-size", "2"])
+        self.assertEqual(code, 0)
+        lines = stdout.splitlines()
+        self.assertEqual(lines[0], "lat,lon,alt,time,d,i,f")
+        self.assertEqual(len(lines), 4)
+        d = float(lines[1].split(",")[4])
+        expected = GeoMag().calculate(47.6205, -122.3493, 0, 2025.25)
+        self.assertAlmostEqual(d, expected.d, places=9)
+
+    def test_workers_keep_order(self):
+        _, expected, _ = self.run_main(["--chunk-size", "1"])
+        code, stdout, _ = self.run_main(["--chunk-size", "1", "--workers", "2"])
+        self.assertEqual(code, 0)
+        self.assertEqual(stdout, expected)
+
+    def test_tsv_with_constant_alt_and_time(self):
+        code, stdout, _ = self.run_main(
+            ["--format", "tsv", "--alt", "28", "--time", "2026.5", "--columns", "d"],
+            stdin="latitude\tlongitude\n89\t-121\n",
+        )
+        self.assertEqual(code, 1)
+        code, stdout, _ = self.run_main(
+            [
+                "--format",
+                "tsv",
+                "--lat-column",
+                "latitude",
+                "--lon-column",
+                "longitude",
+                "--alt",
+                "28",
+                "--time",
+                "2026.5",
+                "--columns",
+                "d",
+            ],
+            stdin="latitude\tlongitude\n89\t-121\n",
+        )
+        self.assertEqual(code, 0)
+        header, row = stdout.splitlines()
+        self.assertEqual(header, "latitude\tlongitude\td")
+        self.assertAlmostEqual(float(row.split("\t")[2]), -96.0801160139698, places=9)
+
+    def test_files(self):
+        with tempfile.TemporaryDirectory() as directory:
+            input_path = os.path.join(directory, "input.csv")
+            output_path = os.path.join(directory, "output.csv")
+            with open(input_path, "w") as input_file:
+                input_file.write(INPUT)
+            code, _, _ = self.run_main(
+                [
+                    input_path,
+                    "-o",
+                    output_path,
+                    "--model",
+                    "2020",
+                    "--allow-date-outside-lifespan",
+                ]
+            )
+            self.assertEqual(code, 0)
+            with open(output_path) as output_file:
+                lines = output_file.read().splitlines()
+        self.assertEqual(lines[0], "lat,lon,alt,time,x,y,z,h,f,i,d,gv")
+        self.assertEqual(len(lines), 4)
+
+    def test_missing_column(self):
+        code, stdout, stderr = self.run_main([], stdin="lat,lon\n1,2\n")
+        self.assertEqual(code, 1)
+        self.assertEqual(stdout, "")
+        self.assertEqual(stderr, "pygeomag: error: Column alt is not in the input\n")
+
+    def test_empty_input(self):
+        code, _, stderr = self.run_main([], stdin="")
+        self.assertEqual(code, 1)
+        self.assertEqual(stderr, "pygeomag: error: The input is empty\n")
+
+    def test_short_row(self):
+        code, _, stderr = self.run_main([], stdin="lat,lon,alt,time\n1,2,0\n")
+        self.assertEqual(code, 1)
+        self.assertEqual(
+            stderr, "pygeomag: error: A row has fewer columns than the header\n"
+        )
+
+    def test_missing_input_file(self):
+        code, _, stderr = self.run_main(["does-not-exist.csv"])
+        self.assertEqual(code, 1)
+        self.assertIn("No such file or directory", stderr)
+        self.assertTrue(stderr.startswith("pygeomag: error: "))
+
+    def test_missing_coefficients_file(self):
+        code, _, stderr = self.run_main(
+            ["--model", "missing/WMM.COF"], stdin="lat,lon,alt,time\n1,2,0,2026\n"
+        )
+        self.assertEqual(code, 1)
+        self.assertTrue(stderr.startswith("pygeomag: error: "))
+
+    def test_unknown_column(self):
+        with self.assertRaises(SystemExit):
+            self.run_main(["--columns", "q"])
+
+    def test_invalid_workers(self):
+        with self.assertRaises(SystemExit):
+            self.run_main(["--workers", "0"])
+
+    def test_create_geo_mag(self):
+        self.assertEqual(create_geo_mag(None, False, "legendre").model, "WMM-2025")
+        self.assertEqual(create_geo_mag("2020", False, "legendre").model, "WMM-2020")
+        self.assertEqual(
+            create_geo_mag("WMM_2015.COF", False, "legendre").model, "WMM-2015"
+        )
+        self.assertEqual(
+            create_geo_mag("wmm/WMM_2010.COF", False, "legendre").model, "WMM-2010"
+        )
+        path = os.path.join(
+            os.path.dirname(__file__), "..", "pygeomag", "wmm", "WMM_2020.COF"
+        )
+        self.assertEqual(create_geo_mag(path, False, "clenshaw").model, "WMM-2020")
+
+    def test_parse_time(self):
+        self.assertEqual(parse_time("2025.25"), 2025.25)
+        self.assertEqual(parse_time("2020-07-02"), 2020.5)
+        self.assertAlmostEqual(
+            parse_time("2020-07-02T12:00:00"), 2020.5 + 0.5 / 366, 12
+        )
+        self.assertAlmostEqual(
+            parse_time("2020-07-02T14:00:00+02:00"), 2020.5 + 0.5 / 366, 12
+        )
+
+    def test_read_chunks(self):
+        chunks = list(read_chunks(iter([["1"], [], ["2"], ["3"]]), 2))
+        self.assertEqual(chunks, [[["1"], ["2"]], [["3"]]])
@@ -0,0 +1,149 @@
+import os
+import tempfile
+import unittest
+from unittest import TestCase
+
+from pygeomag import GeoMag
+from pygeomag.wmm.wmm_2025 import WMM_2025
+
+try:
+    import numpy
+
+    from pygeomag.columnar import calculate_file, read_columns, write_columns
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+INPUT = {
+    "lat": [47.6205, 0.0, 89.0, -80.0, 10.0],
+    "lon": [-122.3493, 0.0, -121.0, 120.0, 20.0],
+    "alt": [0.0, 0.0, 28.0, 100.0, 850.0],
+    "time": [2025.25, 2026.0, 2026.5, 2027.0, 2029.75],
+}
+
+
+@unittest.skipUnless(numpy, "NumPy is not installed")
+class TestColumnar(TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.geo_mag = GeoMag(coefficients_data=WMM_2025)
+        self.expected = self.geo_mag.calculate_batch(
+            INPUT["lat"], INPUT["lon"], INPUT["alt"], INPUT["time"]
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def write_input(self, name):
+        write_columns(
+            self.path(name), {key: numpy.array(value) for key, value in INPUT.items()}
+        )
+        return self.path(name)
+
+    def read_output(self, name, columns):
+        rows, chunks = read_columns(self.path(name), columns, 100)
+        chunk = next(chunks)
+        self.assertEqual(rows, len(INPUT["lat"]))
+        return chunk
+
+    def assert_output(self, name, columns=("x", "y", "z", "h", "f", "i", "d", "gv")):
+        output = self.read_output(name, columns)
+        for column in columns:
+            numpy.testing.assert_allclose(
+                output[column], getattr(self.expected, column), rtol=0, atol=1e-9
+            )
+
+    def test_npy_directory(self):
+        input_path = self.write_input("input")
+        self.assertEqual(
+            calculate_file(self.geo_mag, input_path, self.path("output"), chunk_size=2),
+            5,
+        )
+        self.assert_output("output")
+
+    def test_npz(self):
+        input_path = self.write_input("input.npz")
+        calculate_file(
+            self.geo_mag,
+            input_path,
+            self.path("output.npz"),
+            columns=("d", "i"),
+            chunk_size=3,
+        )
+        self.assert_output("output.npz", ("d", "i"))
+        with numpy.load(self.path("output.npz")) as output:
+            self.assertEqual(sorted(output.files), ["d", "i"])
+
+    @unittest.skipUnless(pyarrow, "pyarrow is not installed")
+    def test_parquet(self):
+        input_path = self.write_input("input.parquet")
+        calculate_file(
+            self.geo_mag, input_path, self.path("output.parquet"), chunk_size=2
+        )
+        self.assert_output("output.parquet")
+
+    def test_float32(self):
+        input_path = self.write_input("input")
+        calculate_file(
+            self.geo_mag,
+            input_path,
+            self.path("output"),
+            columns=("f", "d"),
+            dtype=numpy.float32,
+        )
+        output = self.read_output("output", ("f", "d"))
+        numpy.testing.assert_allclose(output["f"], self.expected.f, rtol=0, atol=0.1)
+        numpy.testing.assert_allclose(output["d"], self.expected.d, rtol=0, atol=1e-3)
+
+    def test_constant_alt_and_time(self):
+        write_columns(
+            self.path("input"),
+            {"latitude": numpy.array([47.6205]), "longitude": numpy.array([-122.3493])},
+        )
+        calculate_file(
+            self.geo_mag,
+            self.path("input"),
+            self.path("output"),
+            columns=("d",),
+            lat_column="latitude",
+            lon_column="longitude",
+            alt=0,
+            time=2025.25,
+        )
+        d = numpy.load(self.path(os.path.join("output", "d.npy")))
+        self.assertAlmostEqual(float(d[0]), 15.065629638512593, places=9)
+
+    def test_missing_column_raises(self):
+        write_columns(
+            self.path("input"), {"lat": numpy.zeros(1), "lon": numpy.zeros(1)}
+        )
+        with self.assertRaisesRegex(ValueError, "Column alt is not in the input"):
+            calculate_file(self.geo_mag, self.path("input"), self.path("output"))
+        write_columns(self.path("input.npz"), {"lat": numpy.zeros(1)})
+        with self.assertRaisesRegex(ValueError, "Column lon is not in the input"):
+            calculate_file(self.geo_mag, self.path("input.npz"), self.path("output"))
+
+    def test_unknown_column_raises(self):
+        with self.assertRaisesRegex(ValueError, "Unknown column q"):
+            calculate_file(
+                self.geo_mag, self.path("input"), self.path("output"), columns=("q",)
+            )
+
+    def test_length_mismatch_raises(self):
+        write_columns(
+            self.path("input"), {"lat": numpy.zeros(1), "lon": numpy.zeros(1)}
+        )
+        write_columns(
+            self.path("input"), {"alt": numpy.zeros(2), "time": numpy.zeros(2)}
+        )
+        with self.assertRaisesRegex(
+            ValueError, "All columns must have the same length"
+        ):
+            calculate_file(self.geo_mag, self.path("input"), self.path("output"))
@@ -0,0 +1,171 @@
+import contextlib
+import importlib
+import io
+import math
+import os
+import tempfile
+from unittest import TestCase
+
+from pygeomag import BlackoutZoneException, GeoMag, fixedpoint
+from pygeomag.fixedpoint import FIXED_POINT_MODULES, FixedPointGeoMag, generate_tables
+from pygeomag.wmm.wmm_2025 import WMM_2025
+from pygeomag.wmm.wmm_2025_fixed import WMM_2025_FIXED
+from pygeomag.wmm.wmmhr_2025 import WMMHR_2025
+
+
+class TestFixedPointGeoMag(TestCase):
+    def setUp(self):
+        self.geo_mag = GeoMag(coefficients_data=WMM_2025)
+        self.fixed = FixedPointGeoMag(WMM_2025_FIXED)
+
+    def assert_close(self, expected, result):
+        for name in ("x", "y", "z", "h", "f"):
+            self.assertAlmostEqual(
+                getattr(expected, name), getattr(result, name), delta=0.01
+            )
+        self.assertAlmostEqual(expected.i, result.i, delta=0.0001)
+        if abs(expected.glat) <= 89:  # noqa: PLR2004 - Magic value used in comparison
+            self.assertAlmostEqual(expected.d, result.d, delta=0.0001)
+
+    def test_space_needle(self):
+        result = self.fixed.calculate(glat=47.6205, glon=-122.3493, alt=0, time=2025.25)
+        self.assertAlmostEqual(result.d, 15.065629638512593, 4)
+        self.assertEqual(self.fixed.model, "WMM-2025")
+        self.assertEqual(self.fixed.release_date, "11/13/2024")
+        self.assert_close(
+            self.geo_mag.calculate(47.6205, -122.3493, 0, 2025.25), result
+        )
+
+    def test_matches_float(self):
+        for glat in (-90, -89.5, -60, -23.5, 0, 10, 45, 80, 89.99, 90):
+            for glon in (-180, -122.3, 0, 45, 179.9):
+                for alt, time in ((-1, 2025.0), (0, 2027.5), (850, 2030.0)):
+                    self.assert_close(
+                        self.geo_mag.calculate(glat, glon, alt, time),
+                        self.fixed.calculate(glat, glon, alt, time),
+                    )
+
+    def test_grid_variation_and_zones(self):
+        expected = self.geo_mag.calculate(80, 100, 0, 2026)
+        result = self.fixed.calculate(80, 100, 0, 2026)
+        self.assertAlmostEqual(expected.gv, result.gv, 4)
+        self.assertIsNone(self.fixed.calculate(10, 0, 0, 2026).gv)
+
+        result = self.fixed.calculate(-64, 137, 0, 2026)
+        self.assertTrue(result.in_blackout_zone)
+        with self.assertRaises(BlackoutZoneException):
+            self.fixed.calculate(-64, 137, 0, 2026, raise_in_warning_zone=True)
+
+    def test_lifespan(self):
+        with self.assertRaises(ValueError):
+            self.fixed.calculate(0, 0, 0, 2031)
+        result = self.fixed.calculate(0, 0, 0, 2031, allow_date_outside_lifespan=True)
+        expected = self.geo_mag.calculate(
+            0, 0, 0, 2031, allow_date_outside_lifespan=True
+        )
+        self.assert_close(expected, result)
+
+    def test_calculate_fixed(self):
+        glat, glon, alt, dt = 47.6205, -122.3493, 10.0, 0.25
+        x, y, z, h, f, d, i = self.fixed.calculate_fixed(
+            round(math.radians(glat) * 2**30),
+            round(math.radians(glon) * 2**30),
+            round(alt / 6378.137 * 2**30),
+            round(dt * 2**30),
+        )
+        for value in (x, y, z, h, f, d, i):
+            self.assertIsInstance(value, int)
+        expected = self.geo_mag.calculate(glat, glon, alt, 2025.25)
+        self.assertAlmostEqual(x / 1000, expected.x, delta=0.01)
+        self.assertAlmostEqual(f / 1000, expected.f, delta=0.01)
+        self.assertAlmostEqual(math.degrees(d / 2**30), expected.d, delta=0.0001)
+        self.assertAlmostEqual(math.degrees(i / 2**30), expected.i, delta=0.0001)
+
+
+class TestFixedPointHelpers(TestCase):
+    def test_constants(self):
+        one = 2**30
+        self.assertEqual(fixedpoint.PI, round(math.pi * one))
+        self.assertEqual(fixedpoint.HALF_PI, round(math.pi / 2 * one))
+        self.assertEqual(fixedpoint.TWO_PI, round(2 * math.pi * one))
+        self.assertEqual(
+            fixedpoint.CORDIC_ANGLES,
+            tuple(round(math.atan(2.0**-index) * one) for index in range(30)),
+        )
+        gain = 1.0
+        for index in range(30):
+            gain *= math.sqrt(1 + 2.0 ** (-2 * index))
+        self.assertEqual(fixedpoint.CORDIC_GAIN, round(one / gain))
+
+        a = 6378.137
+        b = 6356.7523142
+        self.assertEqual(fixedpoint.B2, round((b / a) ** 2 * one))
+        self.assertEqual(fixedpoint.C2, round((a * a - b * b) / (a * a) * one))
+        self.assertEqual(fixedpoint.C4, round((a**4 - b**4) / a**4 * one))
+        self.assertEqual(fixedpoint.RADIUS, round(6371.2 / a * one))
+
+    def test_sin_cos(self):
+        for degrees in range(-720, 721, 7):
+            angle = round(math.radians(degrees) * 2**30)
+            sin, cos = fixedpoint.sin_cos(angle)
+            self.assertAlmostEqual(
+                sin / 2**30, math.sin(math.radians(degrees)), delta=1e-8
+            )
+            self.assertAlmostEqual(
+                cos / 2**30, math.cos(math.radians(degrees)), delta=1e-8
+            )
+
+    def test_atan2(self):
+        for y, x in (
+            (0, 1),
+            (1, 0),
+            (0, -5),
+            (-3, -4),
+            (3, -4),
+            (123456789012, 5),
+            (-7, 2),
+        ):
+            self.assertAlmostEqual(
+                fixedpoint.atan2(y, x) / 2**30, math.atan2(y, x), delta=1e-8
+            )
+        self.assertEqual(fixedpoint.atan2(0, 0), 0)
+
+    def test_isqrt(self):
+        for value in (0, 1, 2, 3, 4, 15, 16, 17, 10**12, 2**62 - 1, 2**62):
+            root = fixedpoint.isqrt(value)
+            self.assertLessEqual(root * root, value)
+            self.assertGreater((root + 1) * (root + 1), value)
+        self.assertEqual(fixedpoint.isqrt(-4), 0)
+
+
+class TestGenerateTables(TestCase):
+    def test_generated_modules(self):
+        for module_name in FIXED_POINT_MODULES:
+            module = importlib.import_module(f"pygeomag.wmm.{module_name}")
+            fixed_module = importlib.import_module(f"pygeomag.wmm.{module_name}_fixed")
+            name = next(
+                attribute
+                for attribute in dir(module)
+                if attribute.lower() == module_name
+            )
+            self.assertEqual(
+                getattr(fixed_module, f"{name}_FIXED"),
+                generate_tables(getattr(module, name)),
+            )
+
+    def test_high_resolution(self):
+        with self.assertRaises(ValueError):
+            generate_tables(WMMHR_2025)
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                self.assertEqual(
+                    fixedpoint.main(["wmm_2025", "--output", directory]), 0
+                )
+            self.assertIn("wmm_2025_fixed.py", output.getvalue())
+            with open(os.path.join(directory, "wmm_2025_fixed.py")) as file:
+                source = file.read()
+        namespace = {}
+        exec(source, namespace)
+        self.assertEqual(namespace["WMM_2025_FIXED"], WMM_2025_FIXED)
@@ -1,14 +1,30 @@
-from unittest import TestCase
+import itertools
+import math
+import random
+from unittest import TestCase, skipUnless
 
 from pygeomag import (
     decimal_degrees_to_degrees_minutes,
+    decimal_degrees_to_degrees_minutes_batch,
     decimal_degrees_to_degrees_minutes_seconds,
+    decimal_degrees_to_degrees_minutes_seconds_batch,
     degrees_minutes_seconds_to_decimal_degrees,
+    degrees_minutes_seconds_to_decimal_degrees_batch,
     degrees_minutes_to_decimal_degrees,
+    degrees_minutes_to_decimal_degrees_batch,
+    parse_degrees,
+    parse_degrees_batch,
     pretty_print_degrees,
+    pretty_print_degrees_batch,
     round_to_digits,
+    round_to_digits_batch,
 )
 
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
 
 class TestFormat(TestCase):
     def test_round_precision(self):
@@ -30,6 +46,8 @@ class TestFormat(TestCase):
         self.assertEqual(round_to_digits(1.5, 1), 1.5)
         self.assertEqual(round_to_digits(1.4, 0), 1)
         self.assertEqual(round_to_digits(1.5, 0), 2)
+        self.assertTrue(math.isnan(round_to_digits(math.nan, 0)))
+        self.assertEqual(round_to_digits(-math.inf, 2), -math.inf)
 
     def test_decimal_degrees_to_degrees_minutes(self):
         self.assertEqual(decimal_degrees_to_degrees_minutes(45.7625), (45, 45.75))
@@ -102,3 +120,197 @@ class TestFormat(TestCase):
             ),
             "45 Degrees 45.75 Minutes North",
         )
+
+
+class TestFormatBatch(TestCase):
+    def setUp(self):
+        rng = random.Random(0)
+        self.values = [rng.uniform(-180, 180) for _ in range(500)]
+        self.values += [round(value, rng.randint(0, 6)) for value in self.values[:100]]
+        self.values += [
+            0.0,
+            -0.0,
+            45,
+            -45,
+            45.7625,
+            45.9999999,
+            -0.99999999,
+            1e-13,
+            -1e-13,
+            0.5 / 60,
+        ]
+
+    def assert_same_as_scalar(self, values):
+        for (
+            is_latitude,
+            show_seconds,
+            full_words,
+            number_of_digits,
+        ) in itertools.product(
+            (True, False), (True, False), (True, False), (0, 1, 2, 5)
+        ):
+            expected = [
+                pretty_print_degrees(
+                    value, is_latitude, show_seconds, full_words, number_of_digits
+                )
+                for value in self.values
+            ]
+            strings = pretty_print_degrees_batch(
+                values, is_latitude, show_seconds, full_words, number_of_digits
+            )
+            self.assertEqual(expected, list(strings))
+
+    def test_round_to_digits_batch(self):
+        for number_of_digits in (0, 1, 3, 6):
+            rounded = round_to_digits_batch(self.values, number_of_digits)
+            self.assertEqual(
+                [round_to_digits(value, number_of_digits) for value in self.values],
+                rounded,
+            )
+        self.assertEqual([3, -3, 1, -1], round_to_digits_batch([2.5, -2.5, 0.5, -0.5]))
+        self.assertEqual([], round_to_digits_batch([], 2))
+        for number_of_digits in (0, 2):
+            rounded = round_to_digits_batch([1.5, math.nan, math.inf], number_of_digits)
+            self.assertEqual(
+                [round_to_digits(1.5, number_of_digits), math.inf],
+                [rounded[0], rounded[2]],
+            )
+            self.assertTrue(math.isnan(rounded[1]))
+
+    def test_pretty_print_degrees_batch(self):
+        self.assertEqual(
+            ["45° 45' 45\" N", "45° 45' 45\" S"],
+            list(
+                pretty_print_degrees_batch(
+                    [45.7625, -45.7625], is_latitude=True, show_seconds=True
+                )
+            ),
+        )
+        self.assert_same_as_scalar(self.values)
+        self.assert_same_as_scalar(tuple(self.values))
+
+    def test_decimal_degrees_to_degrees_minutes_batch(self):
+        degrees, minutes = decimal_degrees_to_degrees_minutes_batch(self.values)
+        expected = [decimal_degrees_to_degrees_minutes(value) for value in self.values]
+        self.assertEqual(expected, list(zip(degrees, minutes)))
+
+        degrees, minutes, seconds = decimal_degrees_to_degrees_minutes_seconds_batch(
+            self.values
+        )
+        expected = [
+            decimal_degrees_to_degrees_minutes_seconds(value) for value in self.values
+        ]
+        self.assertEqual(expected, list(zip(degrees, minutes, seconds)))
+
+    def test_degrees_minutes_seconds_to_decimal_degrees_batch(self):
+        parts = [
+            decimal_degrees_to_degrees_minutes_seconds(value) for value in self.values
+        ]
+        degrees, minutes, seconds = (list(column) for column in zip(*parts))
+        self.assertEqual(
+            [degrees_minutes_seconds_to_decimal_degrees(*part) for part in parts],
+            degrees_minutes_seconds_to_decimal_degrees_batch(degrees, minutes, seconds),
+        )
+        self.assertEqual(
+            [
+                degrees_minutes_to_decimal_degrees(degree, minute)
+                for degree, minute, _ in parts
+            ],
+            degrees_minutes_to_decimal_degrees_batch(degrees, minutes),
+        )
+        self.assertEqual(
+            [45.7625, 10.7625],
+            degrees_minutes_seconds_to_decimal_degrees_batch([45, 10], 45, 45),
+        )
+
+    def test_degrees_minutes_seconds_to_decimal_degrees_batch_exception(self):
+        with self.assertRaisesRegex(ValueError, "same length"):
+            degrees_minutes_to_decimal_degrees_batch([1, 2], [3])
+        with self.assertRaises(TypeError):
+            degrees_minutes_to_decimal_degrees_batch(1, 2)
+
+    def test_parse_degrees(self):
+        self.assertEqual(-45.7625, parse_degrees("45° 45' 45\" S"))
+        self.assertEqual(
+            -45.7625, parse_degrees("45 Degrees 45 Minutes 45 Seconds west")
+        )
+        self.assertEqual(45.5, parse_degrees("45° 30'"))
+        self.assertEqual(-0.5, parse_degrees("-0 30"))
+        self.assertEqual(0.5, parse_degrees("-0 30 S"))
+        self.assertEqual(-122.0, parse_degrees("-122"))
+        for text in ("", "N", "1 2 3 4 N", "45° 3x' N", "45 Degrees North South"):
+            with self.assertRaisesRegex(ValueError, "Unsupported degrees format"):
+                parse_degrees(text)
+
+    def test_parse_degrees_batch(self):
+        for is_latitude, show_seconds, full_words in itertools.product(
+            (True, False), repeat=3
+        ):
+            strings = list(
+                pretty_print_degrees_batch(
+                    self.values, is_latitude, show_seconds, full_words, 12
+                )
+            )
+            for value, parsed in zip(self.values, parse_degrees_batch(strings)):
+                self.assertAlmostEqual(value, parsed, 12)
+
+    @skipUnless(numpy, "NumPy is not installed")
+    def test_degrees_minutes_batch_array(self):
+        values = numpy.array(self.values)
+        degrees, minutes, seconds = decimal_degrees_to_degrees_minutes_seconds_batch(
+            values
+        )
+        self.assertEqual(numpy.int64, degrees.dtype)
+        self.assertEqual(
+            list(zip(*decimal_degrees_to_degrees_minutes_seconds_batch(self.values))),
+            list(zip(degrees.tolist(), minutes.tolist(), seconds.tolist())),
+        )
+        self.assertEqual(
+            list(zip(*decimal_degrees_to_degrees_minutes_batch(self.values))),
+            list(
+                zip(
+                    *(
+                        column.tolist()
+                        for column in decimal_degrees_to_degrees_minutes_batch(values)
+                    )
+                )
+            ),
+        )
+        converted = degrees_minutes_seconds_to_decimal_degrees_batch(
+            degrees, minutes.tolist(), 0
+        )
+        self.assertIsInstance(converted, numpy.ndarray)
+        self.assertEqual(
+            degrees_minutes_seconds_to_decimal_degrees_batch(
+                degrees.tolist(), minutes.tolist(), 0
+            ),
+            converted.tolist(),
+        )
+        parsed = parse_degrees_batch(
+            numpy.array(["45° 45' 45\" S", "1 Degrees 30 Minutes East"])
+        )
+        self.assertEqual([-45.7625, 1.5], parsed.tolist())
+
+    @skipUnless(numpy, "NumPy is not installed")
+    def test_round_to_digits_batch_array(self):
+        values = numpy.array(self.values)
+        rounded = round_to_digits_batch(values, 0)
+        self.assertEqual(numpy.int64, rounded.dtype)
+        self.assertEqual(round_to_digits_batch(self.values, 0), rounded.tolist())
+        self.assertEqual(
+            round_to_digits_batch(self.values, 4),
+            round_to_digits_batch(values, 4).tolist(),
+        )
+        for number_of_digits in (0, 2):
+            rounded = round_to_digits_batch(
+                numpy.array([1.5, numpy.nan, -numpy.inf]), number_of_digits
+            )
+            self.assertEqual(
+                [round_to_digits(1.5, number_of_digits), -numpy.inf],
+                [rounded[0], rounded[2]],
+            )
+            self.assertTrue(numpy.isnan(rounded[1]))
+
+    @skipUnless(numpy, "NumPy is not installed")
+    def test_pretty_print_degrees_batch_array(self):
+        self.assert_same_as_scalar(numpy.array(self.values))
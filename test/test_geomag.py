@@ -1,20 +1,32 @@
+import asyncio
 import datetime
+import math
 import os
+import tempfile
+import threading
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from decimal import Decimal
-from unittest import TestCase
+from unittest import IsolatedAsyncioTestCase, TestCase
 from unittest.mock import DEFAULT, mock_open, patch
 
+import pygeomag
 from pygeomag import (
     BlackoutZoneException,
     CautionZoneException,
     GeoMag,
     GeoMagResult,
     GeoMagUncertaintyResult,
+    backend,
+    instrument,
+    preload_models,
 )
 from pygeomag.wmm.wmm_2015 import WMM_2015
 from pygeomag.wmm.wmm_2015v2 import WMM_2015v2
 from pygeomag.wmm.wmm_2020 import WMM_2020
 from pygeomag.wmm.wmm_2025 import WMM_2025
+from pygeomag.wmm.wmm_2025_prepared import WMM_2025_PREPARED
 from pygeomag.wmm.wmmhr_2025 import WMMHR_2025
 
 TEST_STYLE_0 = 0
@@ -377,6 +389,43 @@ class TestGeoMagCoefficients(TestCase):
             TEST_STYLE_2,
         )
 
+    def test_calculate_declination_from_2025_wmm_style_2_prepared(self):
+        self.run_tests(
+            GeoMag(coefficients_data=WMM_2025_PREPARED),
+            "test_values/WMM2025_TEST_VALUES.txt",
+            TEST_STYLE_2,
+        )
+
+    def test_calculate_declination_from_2010_wmm_style_0_clenshaw(self):
+        self.run_tests(
+            GeoMag(coefficients_file="wmm/WMM_2010.COF", evaluator="clenshaw"),
+            "test_values/WMM2010testvalues.txt",
+            TEST_STYLE_0,
+        )
+
+    def test_calculate_declination_from_2020_wmm_style_1_clenshaw(self):
+        self.run_tests(
+            GeoMag(coefficients_data=WMM_2020, evaluator="clenshaw"),
+            "test_values/WMM2020testvalues.txt",
+            TEST_STYLE_1,
+        )
+
+    def test_calculate_declination_from_2025_wmm_style_2_clenshaw(self):
+        self.run_tests(
+            GeoMag(coefficients_data=WMM_2025, evaluator="clenshaw"),
+            "test_values/WMM2025_TEST_VALUES.txt",
+            TEST_STYLE_2,
+        )
+
+    def test_calculate_declination_from_2025_wmm_hr_style_2_clenshaw(self):
+        self.run_tests(
+            GeoMag(
+                coefficients_data=WMMHR_2025, high_resolution=True, evaluator="clenshaw"
+            ),
+            "test_values/WMMHR2025_TEST_VALUES.txt",
+            TEST_STYLE_2,
+        )
+
 
 class TestGeoMag(TestCase):
     def test_calculate(self):
@@ -403,6 +452,39 @@ class TestGeoMag(TestCase):
         self.assertAlmostEqual(result.f, 56128.516957, 4)
         self.assertTrue(result.is_high_resolution)
 
+    def test_calculate_clenshaw_matches_legendre(self):
+        legendre = GeoMag(coefficients_data=WMM_2025)
+        clenshaw = GeoMag(coefficients_data=WMM_2025, evaluator="clenshaw")
+        previous_backend = backend.get_backend()
+        try:
+            for backend_name in backend.available_backends():
+                backend.set_backend(backend_name)
+                for glat, glon, alt in (
+                    (89, -121, 28),
+                    (-90, 45, 0),
+                    (90, 0, 100),
+                    (0, 0, 0),
+                ):
+                    expected = legendre.calculate(glat, glon, alt, 2027.5)
+                    result = clenshaw.calculate(glat, glon, alt, 2027.5)
+                    self.assertAlmostEqual(result.x, expected.x, 6)
+                    self.assertAlmostEqual(result.y, expected.y, 6)
+                    self.assertAlmostEqual(result.z, expected.z, 6)
+        finally:
+            backend.set_backend(previous_backend)
+
+    def test_check_zones_thresholds(self):
+        result = GeoMag(coefficients_data=WMM_2025).calculate(-70, 140, 0, 2026)
+        self.assertTrue(result.in_caution_zone)
+        result.in_caution_zone = False
+        result.check_zones(False, blackout_zone=5000, caution_zone=8000)
+        self.assertTrue(result.in_blackout_zone)
+        self.assertFalse(result.in_caution_zone)
+        with self.assertRaisesRegex(
+            BlackoutZoneException, "where H smaller than 5000 nT"
+        ):
+            result.check_zones(True, blackout_zone=5000)
+
     def test_calculate_declination_time_beyond_model_bypass(self):
         geo_mag = GeoMag(coefficients_file="wmm/WMM_2020.COF")
         result = geo_mag.calculate(0, 80, 0, 2030, allow_date_outside_lifespan=True)
@@ -420,6 +502,10 @@ class TestGeoMag(TestCase):
         self.assertEqual(GeoMag._create_list(3, 0), [0, 0, 0])
         self.assertNotEqual(GeoMag._create_list(4, 0), [1, 1, 1, 1])
 
+    def test_create_array(self):
+        self.assertEqual(list(GeoMag._create_array(3)), [0.0, 0.0, 0.0])
+        self.assertEqual(len(GeoMag._create_array(0)), 0)
+
     def test_create_matrix(self):
         self.assertEqual(GeoMag._create_matrix(2, 2), [[None, None], [None, None]])
         self.assertEqual(GeoMag._create_matrix(2, 3, 0), [[0, 0, 0], [0, 0, 0]])
@@ -551,6 +637,175 @@ class TestGeoMag(TestCase):
         result = geo_mag.calculate(0, 80, 0, 2020)
         self.assertAlmostEqual(result.d, maxord_12_value, 4)
 
+    def test_max_degree(self):
+        geo_mag = GeoMag(coefficients_file="wmm/WMM_2020.COF", max_degree=11)
+        self.assertAlmostEqual(geo_mag.calculate(0, 80, 0, 2020).d, -3.4655, 4)
+        self.assertEqual(len(geo_mag._c), 4 * 78)
+
+        geo_mag = GeoMag(base_year=2025, high_resolution=True, max_degree=12)
+        result = geo_mag.calculate(0, 80, 0, 2026)
+        self.assertTrue(result.is_high_resolution)
+        self.assertEqual(len(geo_mag._c), 4 * 91)
+        # Without high_resolution the records of the high resolution model are read up to degree 12 too
+        truncated = GeoMag(coefficients_data=WMMHR_2025)
+        self.assertEqual(result.d, truncated.calculate(0, 80, 0, 2026).d)
+
+        for max_degree in (0, 13):
+            with self.assertRaisesRegex(
+                ValueError, "max_degree must be between 1 and 12"
+            ):
+                GeoMag(max_degree=max_degree)
+
+    def test_load_coefficients_streams_file(self):
+        # Reading stops at the first record after the last degree, the corrupt record after it is never read
+        with open(
+            os.path.join(os.path.dirname(pygeomag.__file__), "wmm", "WMM_2025.COF")
+        ) as file:
+            lines = file.readlines()
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "WMM_2025_PLUS.COF")
+            with open(filename, "w") as file:
+                file.writelines(lines[:-2])
+                file.write(" 13  0       0.1       0.0        0.0        0.0\n")
+                file.write("corrupt\n")
+            geo_mag = GeoMag(coefficients_file=filename)
+            self.assertAlmostEqual(
+                geo_mag.calculate(47.6205, -122.3493, 0, 2025.25).d,
+                15.065629638512593,
+                12,
+            )
+            with self.assertRaisesRegex(ValueError, "Corrupt record in model file"):
+                GeoMag(coefficients_file=filename, high_resolution=True).preload()
+
+    def test_load_coefficients_peak_memory(self):
+        geo_mag = GeoMag(base_year=2025, high_resolution=True)
+        tracemalloc.start()
+        try:
+            geo_mag.preload()
+            size, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        # The records are not accumulated before they are stored, the peak is about the size of the tables
+        self.assertLess(peak, 1.2 * size)
+
+    def test_memory_footprint(self):
+        previous_backend = backend.get_backend()
+        backend.set_backend(backend.BACKEND_PYTHON)
+        try:
+            item = GeoMag._list_item_size()
+            footprint = GeoMag(coefficients_data=WMM_2025).memory_footprint()
+            self.assertEqual(
+                footprint,
+                {
+                    "degree": 12,
+                    "itemsize": 8,
+                    "c": 4 * 91 * 8,
+                    "k": 91 * 8,
+                    "scratch": (2 * 91 + 3 * 13) * item,
+                    "total": 5 * 91 * 8 + (2 * 91 + 3 * 13) * item,
+                },
+            )
+            footprint = GeoMag(
+                coefficients_data=WMM_2025, evaluator="clenshaw"
+            ).memory_footprint()
+            self.assertEqual(
+                (footprint["k"], footprint["scratch"]), (2 * 91 * 8, 13 * item)
+            )
+
+            # The estimates match the memory allocated when loading and calculating
+            geo_mag = GeoMag(base_year=2025, high_resolution=True)
+            geo_mag.calculate(0, 0, 0, 2026)
+            footprint = geo_mag.memory_footprint()
+            tracemalloc.start()
+            try:
+                loaded = GeoMag(base_year=2025, high_resolution=True)
+                loaded.preload()
+                tables, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+                start, _ = tracemalloc.get_traced_memory()
+                geo_mag.calculate(10, 10, 0, 2026)
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            self.assertAlmostEqual(
+                tables, footprint["c"] + footprint["k"], delta=0.01 * tables
+            )
+            self.assertAlmostEqual(
+                peak - start, footprint["scratch"], delta=0.05 * footprint["scratch"]
+            )
+        finally:
+            backend.set_backend(previous_backend)
+
+    def test_memory_budget(self):
+        previous_backend = backend.get_backend()
+        backend.set_backend(backend.BACKEND_PYTHON)
+        try:
+            self._test_memory_budget()
+        finally:
+            backend.set_backend(previous_backend)
+
+    def _test_memory_budget(self):
+        full = GeoMag(coefficients_data=WMM_2025).memory_footprint()["total"]
+        geo_mag = GeoMag(coefficients_data=WMM_2025, memory_budget=full)
+        self.assertEqual(
+            geo_mag.memory_footprint(),
+            GeoMag(coefficients_data=WMM_2025).memory_footprint(),
+        )
+
+        # Single precision coefficients are within a few pT of double precision
+        geo_mag = GeoMag(coefficients_data=WMM_2025, memory_budget=full - 1)
+        footprint = geo_mag.memory_footprint()
+        self.assertEqual((footprint["degree"], footprint["itemsize"]), (12, 4))
+        self.assertLessEqual(footprint["total"], full - 1)
+        expected = GeoMag(coefficients_data=WMM_2025).calculate(
+            47.6205, -122.3493, 0, 2025.25
+        )
+        result = geo_mag.calculate(47.6205, -122.3493, 0, 2025.25)
+        self.assertAlmostEqual(result.f, expected.f, delta=0.01)
+        self.assertAlmostEqual(result.d, expected.d, delta=0.0001)
+
+        # Then the degree is lowered until it fits, also for prepared coefficients
+        for coefficients_data in (WMM_2025, WMM_2025_PREPARED):
+            geo_mag = GeoMag(
+                coefficients_data=coefficients_data, memory_budget=full // 2
+            )
+            footprint = geo_mag.memory_footprint()
+            self.assertLess(footprint["degree"], 12)
+            self.assertLessEqual(footprint["total"], full // 2)
+            self.assertEqual(
+                len(geo_mag._c), 4 * GeoMag._triangle_size(footprint["degree"])
+            )
+            self.assertAlmostEqual(
+                geo_mag.calculate(47.6205, -122.3493, 0, 2025.25).d,
+                expected.d,
+                delta=0.5,
+            )
+
+        with self.assertRaisesRegex(
+            ValueError, "A memory budget of 100 bytes is too small for the model"
+        ):
+            GeoMag(coefficients_data=WMM_2025, memory_budget=100)
+
+    def test_memory_budget_does_not_depend_on_the_backend(self):
+        previous_backend = backend.get_backend()
+        try:
+            fits = set()
+            for backend_name in backend.available_backends():
+                backend.set_backend(backend_name)
+                footprint = GeoMag(
+                    coefficients_data=WMM_2025, memory_budget=2500
+                ).memory_footprint()
+                fits.add((footprint["degree"], footprint["itemsize"]))
+            self.assertEqual(len(fits), 1)
+
+            # A model fitted with a compiled backend still fits after switching to the Python backend
+            backend.set_backend(backend.available_backends()[-1])
+            geo_mag = GeoMag(coefficients_data=WMM_2025, memory_budget=2500)
+            backend.set_backend(backend.BACKEND_PYTHON)
+            self.assertLessEqual(geo_mag.memory_footprint()["total"], 2500)
+        finally:
+            backend.set_backend(previous_backend)
+
     def test_load_coefficients_missing_file(self):
         geo_mag = GeoMag(coefficients_file="missing.cof")
         with self.assertRaisesRegex(FileNotFoundError, "No such file or directory"):
@@ -582,6 +837,10 @@ class TestGeoMag(TestCase):
                 base_year=2020,
             )
 
+    def test_unknown_evaluator_raises(self):
+        with self.assertRaisesRegex(ValueError, "Unknown evaluator invalid"):
+            GeoMag(evaluator="invalid")
+
     def test_property_life_span(self):
         geo_mag = GeoMag(coefficients_file="wmm/WMM_2020.COF")
         self.assertTupleEqual(geo_mag.life_span, (2020.0, 2025.0))
@@ -593,3 +852,438 @@ class TestGeoMag(TestCase):
     def test_property_release_date(self):
         geo_mag = GeoMag(coefficients_file="wmm/WMM_2020.COF")
         self.assertEqual(geo_mag.release_date, "12/10/2019")
+
+    def test_triangle_size(self):
+        self.assertEqual(GeoMag._triangle_size(0), 1)
+        self.assertEqual(GeoMag._triangle_size(1), 3)
+        self.assertEqual(GeoMag._triangle_size(12), 91)
+
+    def test_load_coefficients_layout(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2020)
+        geo_mag.preload()
+        self.assertEqual(len(geo_mag._c), 4 * 91)
+        self.assertEqual(len(geo_mag._k), 91)
+        # n=1, m=1 is stored at index 2 and is already normalized by 1.0
+        self.assertEqual(list(geo_mag._c[8:12]), [-1450.7, 4652.9, 7.7, -25.1])
+
+    def test_preload(self):
+        geo_mag = GeoMag(coefficients_file="wmm/WMM_2020.COF")
+        self.assertIsNone(geo_mag._epoch)
+        seconds = geo_mag.preload()
+        self.assertGreaterEqual(seconds, 0.0)
+        self.assertEqual(geo_mag._epoch, 2020.0)
+
+    def test_prepared_coefficients_data(self):
+        for evaluator in ("legendre", "clenshaw"):
+            geo_mag = GeoMag(coefficients_data=WMM_2025, evaluator=evaluator)
+            prepared = geo_mag.prepared_coefficients_data()
+            self.assertEqual(prepared[0], (2025.0, "WMM-2025", "11/13/2024"))
+            self.assertEqual(prepared[1]["evaluator"], evaluator)
+            self.assertEqual(prepared[1]["maxord"], 12)
+
+            loaded = GeoMag(coefficients_data=prepared, evaluator=evaluator)
+            loaded.preload()
+            self.assertEqual(list(loaded._c), list(geo_mag._c))
+            self.assertEqual(list(loaded._k), list(geo_mag._k))
+            self.assertEqual(loaded.model, "WMM-2025")
+            self.assertEqual(loaded.life_span, (2025.0, 2030.0))
+            self.assertEqual(
+                loaded.calculate(47.6205, -122.3493, 0, 2025.25).d,
+                geo_mag.calculate(47.6205, -122.3493, 0, 2025.25).d,
+            )
+
+        with self.assertRaises(ValueError):
+            GeoMag(coefficients_data=WMM_2025_PREPARED, evaluator="clenshaw").preload()
+        with self.assertRaises(ValueError):
+            GeoMag(coefficients_data=WMM_2025_PREPARED, high_resolution=True).preload()
+
+    def test_prepared_module(self):
+        prepared = GeoMag(coefficients_data=WMM_2025).prepared_coefficients_data()
+        self.assertEqual(WMM_2025_PREPARED, prepared)
+
+    def test_warmup(self):
+        geo_mag = GeoMag(coefficients_file="wmm/WMM_2020.COF")
+        seconds = geo_mag.warmup()
+        self.assertGreaterEqual(seconds, 0.0)
+        self.assertEqual(geo_mag._epoch, 2020.0)
+
+    def test_preload_models(self):
+        existing = GeoMag(coefficients_data=WMM_2020)
+        loaded = preload_models(
+            [existing, {"coefficients_file": "wmm/WMM_2015.COF"}], warmup=False
+        )
+        self.assertEqual(len(loaded), 2)
+        self.assertIs(loaded[0][0], existing)
+        self.assertEqual(loaded[0][0].model, "WMM-2020")
+        self.assertEqual(loaded[1][0].model, "WMM-2015")
+        self.assertGreaterEqual(loaded[1][1], 0.0)
+
+
+class TestGeoMagBatch(TestCase):
+    POINTS = (
+        (47.6205, -122.3493, 0, 2025.25),
+        (89, -121, 28, 2026.5),
+        (-80, 100, 50, 2027),
+        (0, 0, 0, 2028),
+        (-45.5, 170.25, 850, 2029.75),
+    )
+
+    def test_calculate_batch(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        glat, glon, alt, time = (list(column) for column in zip(*self.POINTS))
+        results = geo_mag.calculate_batch(glat, glon, alt, time)
+        self.assertEqual(len(results), len(self.POINTS))
+        self.assertFalse(results.is_high_resolution)
+        for index, point in enumerate(self.POINTS):
+            expected = geo_mag.calculate(*point)
+            self.assertAlmostEqual(results.x[index], expected.x, 6)
+            self.assertAlmostEqual(results.y[index], expected.y, 6)
+            self.assertAlmostEqual(results.z[index], expected.z, 6)
+            self.assertAlmostEqual(results.h[index], expected.h, 6)
+            self.assertAlmostEqual(results.f[index], expected.f, 6)
+            self.assertAlmostEqual(results.i[index], expected.i, 9)
+            self.assertAlmostEqual(results.d[index], expected.d, 9)
+            if expected.gv is None:
+                self.assertNotEqual(results.gv[index], results.gv[index])
+            else:
+                self.assertAlmostEqual(results.gv[index], expected.gv, 9)
+
+            result = results[index]
+            self.assertIsInstance(result, GeoMagResult)
+            self.assertAlmostEqual(result.x, expected.x, 6)
+            self.assertEqual(result.gv is None, expected.gv is None)
+            self.assertEqual(result.in_blackout_zone, expected.in_blackout_zone)
+            self.assertEqual(result.in_caution_zone, expected.in_caution_zone)
+
+    def test_calculate_batch_broadcasts_scalars(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        results = geo_mag.calculate_batch([10, 20], [30, 40], 0, 2026)
+        self.assertEqual(list(results.alt), [0, 0])
+        self.assertEqual(list(results.time), [2026, 2026])
+        self.assertAlmostEqual(results.d[1], geo_mag.calculate(20, 40, 0, 2026).d, 9)
+
+    def test_calculate_batch_length_mismatch_raises(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        with self.assertRaisesRegex(
+            ValueError, "All columns must have the same length"
+        ):
+            geo_mag.calculate_batch([10, 20], [30, 40], [0], 2026)
+        with self.assertRaisesRegex(
+            ValueError, "All columns must have the same length"
+        ):
+            geo_mag.calculate_batch([10, 20], [30], 0, 2026)
+
+    def test_calculate_batch_broadcasts_longitude(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        results = geo_mag.calculate_batch([10, 20], 30, 0, 2026)
+        self.assertEqual(list(results.glon), [30, 30])
+        self.assertAlmostEqual(results.d[1], geo_mag.calculate(20, 30, 0, 2026).d, 9)
+
+    def test_calculate_batch_zones(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        glat = [0, -64, -70, 75, 80]
+        glon = [0, 137, 140, -100, 100]
+        results = geo_mag.calculate_batch(glat, glon, 0, 2026)
+        self.assertEqual(results.in_blackout_zone, [False, True, False, False, True])
+        self.assertEqual(results.in_caution_zone, [False, False, True, True, False])
+        self.assertTrue(results[1].in_blackout_zone)
+        self.assertTrue(results[2].in_caution_zone)
+
+        results = geo_mag.calculate_batch(
+            glat, glon, 0, 2026, blackout_zone=1000, caution_zone=4000
+        )
+        self.assertEqual(results.in_blackout_zone, [False, True, False, False, False])
+        self.assertEqual(results.in_caution_zone, [False, False, False, True, True])
+        self.assertFalse(results[4].in_blackout_zone)
+        self.assertTrue(results[4].in_caution_zone)
+
+        with self.assertRaisesRegex(
+            BlackoutZoneException,
+            "The horizontal field strength at this location is 617.5",
+        ):
+            geo_mag.calculate_batch(glat, glon, 0, 2026, raise_in_warning_zone=True)
+        with self.assertRaisesRegex(
+            CautionZoneException, "where H smaller than 6000 nT"
+        ):
+            geo_mag.calculate_batch(
+                glat[2:4], glon[2:4], 0, 2026, raise_in_warning_zone=True
+            )
+        results = geo_mag.calculate_batch([0], [0], 0, 2026, raise_in_warning_zone=True)
+        self.assertEqual(results.in_blackout_zone, [False])
+
+        results = geo_mag.calculate_track(
+            [(lat, lon, 0, 2026) for lat, lon in zip(glat, glon)]
+        )
+        self.assertEqual(results.in_blackout_zone, [False, True, False, False, True])
+
+    def test_calculate_batch_time_beyond_model_raises(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        with self.assertRaisesRegex(
+            ValueError, "Time extends beyond model 5-year life span"
+        ):
+            geo_mag.calculate_batch([10, 20], [30, 40], 0, [2026, 2031])
+
+    def test_calculate_geocentric(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        for glat, glon, alt, time in self.POINTS:
+            expected = geo_mag.calculate(glat, glon, alt, time)
+            r, ct, _, _, _, ca, sa = geo_mag._geodetic_to_spherical(glat, glon, alt)
+            br, bt, bp = geo_mag.calculate_geocentric(
+                r, math.degrees(math.acos(ct)), glon, time
+            )
+            self.assertAlmostEqual(-bt * ca - br * sa, expected.x, 6)
+            self.assertAlmostEqual(bp, expected.y, 6)
+            self.assertAlmostEqual(bt * sa - br * ca, expected.z, 6)
+
+    def test_calculate_ecef(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        for glat, glon, alt, time in self.POINTS:
+            expected = geo_mag.calculate(glat, glon, alt, time)
+            r, ct, st, srlon, crlon, _, _ = geo_mag._geodetic_to_spherical(
+                glat, glon, alt
+            )
+            x, y, z = r * st * crlon, r * st * srlon, r * ct
+            bx, by, bz = geo_mag.calculate_ecef(x, y, z, time)
+            self.assertAlmostEqual(
+                math.sqrt(bx * bx + by * by + bz * bz), expected.f, 6
+            )
+            ecef = geo_mag.calculate_geocentric(
+                r, math.degrees(math.acos(ct)), glon, time, frame="ecef"
+            )
+            self.assertAlmostEqual(ecef[0], bx, 6)
+            self.assertAlmostEqual(ecef[1], by, 6)
+            self.assertAlmostEqual(ecef[2], bz, 6)
+
+    def test_calculate_ecef_spherical_frame(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        spherical = geo_mag.calculate_ecef(0, 7000, 0, 2026, frame="spherical")
+        expected = geo_mag.calculate_geocentric(7000, 90, 90, 2026)
+        for value, expected_value in zip(spherical, expected):
+            self.assertAlmostEqual(value, expected_value, 6)
+
+    def test_calculate_ecef_at_pole(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        bx, by, bz = geo_mag.calculate_ecef(0, 0, 6371.2, 2026)
+        for phi in (0, 45, 170):
+            ecef = geo_mag.calculate_geocentric(6371.2, 0, phi, 2026, frame="ecef")
+            self.assertAlmostEqual(ecef[0], bx, 6)
+            self.assertAlmostEqual(ecef[1], by, 6)
+            self.assertAlmostEqual(ecef[2], bz, 6)
+
+    def test_calculate_geocentric_batch(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        radius, theta, phi = [6371.2, 7000], [10, 135], [-120, 45]
+        for frame in ("spherical", "ecef"):
+            columns = geo_mag.calculate_geocentric_batch(
+                radius, theta, phi, 2026, frame=frame
+            )
+            for index in range(2):
+                expected = geo_mag.calculate_geocentric(
+                    radius[index], theta[index], phi[index], 2026, frame=frame
+                )
+                for column, expected_value in zip(columns, expected):
+                    self.assertAlmostEqual(column[index], expected_value, 6)
+
+    def test_calculate_ecef_batch(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        x, y, z = [6371.2, 0, 0], [0, 6371.2, 0], [0, 0, 6371.2]
+        for frame in ("spherical", "ecef"):
+            columns = geo_mag.calculate_ecef_batch(
+                x, y, z, [2026, 2027, 2028], frame=frame
+            )
+            for index, time in enumerate((2026, 2027, 2028)):
+                expected = geo_mag.calculate_ecef(
+                    x[index], y[index], z[index], time, frame=frame
+                )
+                for column, expected_value in zip(columns, expected):
+                    self.assertAlmostEqual(column[index], expected_value, 6)
+
+    def test_unknown_frame_raises(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        with self.assertRaisesRegex(ValueError, "Unknown frame invalid"):
+            geo_mag.calculate_ecef(7000, 0, 0, 2026, frame="invalid")
+        with self.assertRaisesRegex(ValueError, "Unknown frame invalid"):
+            geo_mag.calculate_ecef_batch([7000], [0], [0], 2026, frame="invalid")
+
+
+class TestGeoMagTrack(TestCase):
+    def setUp(self):
+        self.previous_backend = backend.get_backend()
+        backend.set_backend(backend.BACKEND_PYTHON)
+
+    def tearDown(self):
+        backend.set_backend(self.previous_backend)
+
+    def assert_matches_batch(self, result, points, delta=1e-9):
+        expected = GeoMag(coefficients_data=WMM_2025).calculate_batch(
+            *(list(column) for column in zip(*points))
+        )
+        self.assertEqual(len(result), len(points))
+        for column in ("x", "y", "z", "h", "f", "i", "d"):
+            for value, expected_value in zip(
+                getattr(result, column), getattr(expected, column)
+            ):
+                self.assertAlmostEqual(value, expected_value, delta=delta)
+
+    def test_track(self):
+        points = [(89.5 + index * 0.25, -121 + index, 28, 2026.5) for index in range(3)]
+        points += [(47.6205, -122.3493, 0, 2025.25)] * 2
+        points += [(47.6205, -122.3493 + index * 0.01, 0, 2026) for index in range(3)]
+        for evaluator in ("legendre", "clenshaw"):
+            geo_mag = GeoMag(coefficients_data=WMM_2025, evaluator=evaluator)
+            self.assert_matches_batch(geo_mag.calculate_track(points), points)
+
+    def test_reuses_legendre_functions(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        points = [(47.6205, -122.3493 + index * 0.01, 0, 2026) for index in range(5)]
+        with patch.object(
+            geo_mag, "_legendre_tables", wraps=geo_mag._legendre_tables
+        ) as tables, patch.object(
+            GeoMag, "_longitude_series", wraps=GeoMag._longitude_series
+        ) as series:
+            result = geo_mag.calculate_track(points + points[-1:])
+        self.assertEqual(tables.call_count, 1)
+        self.assertEqual(series.call_count, 5)
+        self.assert_matches_batch(result, points + points[-1:])
+
+    def test_lat_and_alt_tolerance(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        points = [
+            (47.6205 + index * 1e-6, -122.3493, index * 1e-4, 2026)
+            for index in range(5)
+        ]
+        with patch.object(
+            geo_mag, "_legendre_tables", wraps=geo_mag._legendre_tables
+        ) as tables:
+            result = geo_mag.calculate_track(
+                points, lat_tolerance=1e-5, alt_tolerance=1e-3
+            )
+        self.assertEqual(tables.call_count, 1)
+        self.assert_matches_batch(result, points, delta=0.1)
+
+    def test_max_error(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        points = [
+            (40 + index * 0.0016, -100 + index * 0.002, 10, 2026 + index / 31557600)
+            for index in range(1000)
+        ]
+        with instrument() as stats:
+            result = geo_mag.calculate_track(points, max_error=0.01)
+        self.assertLess(stats.as_dict()["WMM-2025"]["field"]["points"], 200)
+        self.assert_matches_batch(result, points, delta=0.01)
+
+    def test_max_error_splits_intervals(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        points = [(index * 0.5, index * 0.5, 0, 2026) for index in range(101)]
+        result = geo_mag.calculate_track(points, max_error=1.0, max_interval=100)
+        self.assert_matches_batch(result, points, delta=1.0)
+
+    def test_short_tracks(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        self.assertEqual(len(geo_mag.calculate_track([], max_error=1.0)), 0)
+        point = [(47.6205, -122.3493, 0, 2025.25)]
+        self.assert_matches_batch(geo_mag.calculate_track(point, max_error=1.0), point)
+
+    def test_invalid_track(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        with self.assertRaisesRegex(ValueError, "max_interval must be at least 1"):
+            geo_mag.calculate_track([], max_interval=0)
+        with self.assertRaisesRegex(
+            ValueError, "Time extends beyond model 5-year life span"
+        ):
+            geo_mag.calculate_track([(0, 0, 0, 2040)])
+
+
+class SlowGeoMag(GeoMag):
+    """Count the calculations running at the same time."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lock = threading.Lock()
+        self.running = 0
+        self.most_running = 0
+        self.calls = 0
+
+    def calculate(self, *args, **kwargs):
+        with self.lock:
+            self.calls += 1
+            self.running += 1
+            self.most_running = max(self.most_running, self.running)
+        try:
+            time.sleep(0.01)
+            return super().calculate(*args, **kwargs)
+        finally:
+            with self.lock:
+                self.running -= 1
+
+
+class TestGeoMagAsync(IsolatedAsyncioTestCase):
+    async def test_acalculate(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        result = await geo_mag.acalculate(47.6205, -122.3493, 0, 2025.25)
+        self.assertAlmostEqual(result.d, 15.065629638512593, 9)
+
+    async def test_acalculate_raises(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        with self.assertRaisesRegex(
+            ValueError, "Time extends beyond model 5-year life span"
+        ):
+            await geo_mag.acalculate(0, 0, 0, 2040)
+
+    async def test_acalculate_process_pool(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        with ProcessPoolExecutor(1) as executor:
+            result = await geo_mag.acalculate(
+                47.6205, -122.3493, 0, 2025.25, executor=executor
+            )
+        self.assertAlmostEqual(result.d, 15.065629638512593, 9)
+
+    async def test_acalculate_many(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        points = [(lat, 10.0, 0, 2026.0) for lat in range(-90, 91, 15)]
+        results = await geo_mag.acalculate_many(points)
+        self.assertEqual([result.glat for result in results], list(range(-90, 91, 15)))
+        for point, result in zip(points, results):
+            self.assertAlmostEqual(result.d, geo_mag.calculate(*point).d, 9)
+
+    async def test_acalculate_many_backpressure(self):
+        geo_mag = SlowGeoMag(coefficients_data=WMM_2025)
+        with ThreadPoolExecutor(8) as executor:
+            results = await geo_mag.acalculate_many(
+                ((0.0, 0.0, 0, 2026.0) for _ in range(12)),
+                executor=executor,
+                max_concurrency=3,
+            )
+        self.assertEqual(len(results), 12)
+        self.assertLessEqual(geo_mag.most_running, 3)
+
+    async def test_acalculate_many_stops_on_error(self):
+        geo_mag = SlowGeoMag(coefficients_data=WMM_2025)
+        points = [(0.0, 0.0, 0, 2040.0)] + [(0.0, 0.0, 0, 2026.0)] * 50
+        with ThreadPoolExecutor(2) as executor:
+            with self.assertRaisesRegex(
+                ValueError, "Time extends beyond model 5-year life span"
+            ):
+                await geo_mag.acalculate_many(
+                    points, executor=executor, max_concurrency=2
+                )
+        self.assertLess(geo_mag.calls, 10)
+
+    async def test_acalculate_many_cancel(self):
+        geo_mag = SlowGeoMag(coefficients_data=WMM_2025)
+        with ThreadPoolExecutor(1) as executor:
+            task = asyncio.ensure_future(
+                geo_mag.acalculate_many(
+                    [(0.0, 0.0, 0, 2026.0)] * 50, executor=executor, max_concurrency=10
+                )
+            )
+            await asyncio.sleep(0.03)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+        self.assertLess(geo_mag.calls, 20)
+
+    async def test_acalculate_many_invalid_concurrency(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        with self.assertRaisesRegex(ValueError, "max_concurrency must be at least 1"):
+            await geo_mag.acalculate_many([], max_concurrency=0)
@@ -0,0 +1,97 @@
+from unittest import TestCase
+
+from pygeomag import GeoMag, instrument, instrumentation
+from pygeomag.wmm.wmm_2025 import WMM_2025
+
+
+class TestInstrumentation(TestCase):
+    def test_disabled_by_default(self):
+        self.assertIsNone(instrumentation.active())
+
+    def test_calculate_records_phases(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        with instrument() as stats:
+            self.assertIs(instrumentation.active(), stats)
+            geo_mag.calculate(47.6205, -122.3493, 0, 2025.25)
+            geo_mag.calculate(47.6205, -122.3493, 0, 2025.25)
+        self.assertIsNone(instrumentation.active())
+
+        phases = stats.as_dict()["WMM-2025"]
+        self.assertEqual(phases["load"]["calls"], 1)
+        self.assertEqual(phases["load"]["points"], 0)
+        for phase in ("convert", "field", "result"):
+            self.assertEqual(phases[phase]["calls"], 2)
+            self.assertEqual(phases[phase]["points"], 2)
+            self.assertGreaterEqual(phases[phase]["seconds"], 0.0)
+
+    def test_not_recorded_when_stopped(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        stats = instrument()
+        geo_mag.calculate(47.6205, -122.3493, 0, 2025.25)
+        self.assertEqual(stats.as_dict(), {})
+
+    def test_batch_records_points(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        geo_mag.preload()
+        with instrument() as stats:
+            geo_mag.calculate_batch([0.0, 10.0, 20.0], [0.0, 0.0, 0.0], 0, 2025.5)
+        phases = stats.as_dict()["WMM-2025"]
+        self.assertNotIn("load", phases)
+        for phase in ("convert", "field", "result"):
+            self.assertEqual(phases[phase]["calls"], 1)
+            self.assertEqual(phases[phase]["points"], 3)
+
+    def test_geocentric_records_field(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        with instrument() as stats:
+            geo_mag.calculate_geocentric(6371.2, 90, 0, 2025.0)
+            geo_mag.calculate_ecef_batch(
+                [6371.2, 0.0], [0.0, 6371.2], [0.0, 0.0], 2025.0
+            )
+        field = stats.as_dict()["WMM-2025"]["field"]
+        self.assertEqual(field["calls"], 2)
+        self.assertEqual(field["points"], 3)
+
+    def test_callback(self):
+        calls = []
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        with instrument(lambda *args: calls.append(args)):
+            geo_mag.calculate(47.6205, -122.3493, 0, 2025.25)
+        self.assertEqual(
+            [(model, phase, points) for model, phase, _, points in calls],
+            [
+                ("WMM-2025", "load", 0),
+                ("WMM-2025", "convert", 1),
+                ("WMM-2025", "field", 1),
+                ("WMM-2025", "result", 1),
+            ],
+        )
+
+    def test_nested(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        with instrument() as outer:
+            with instrument() as inner:
+                geo_mag.calculate(47.6205, -122.3493, 0, 2025.25)
+            self.assertIs(instrumentation.active(), outer)
+            geo_mag.calculate(47.6205, -122.3493, 0, 2025.25)
+        self.assertEqual(inner.as_dict()["WMM-2025"]["field"]["calls"], 1)
+        self.assertEqual(outer.as_dict()["WMM-2025"]["field"]["calls"], 1)
+
+    def test_reset(self):
+        stats = instrument()
+        stats.record("WMM-2025", instrumentation.PHASE_FIELD, stats.clock())
+        stats.reset()
+        self.assertEqual(stats.as_dict(), {})
+
+    def test_to_prometheus(self):
+        stats = instrument()
+        stats.record("WMM-2025", instrumentation.PHASE_FIELD, stats.clock(), 3)
+        text = stats.to_prometheus(prefix="test")
+        self.assertIn("# TYPE test_phase_calls_total counter\n", text)
+        self.assertIn(
+            'test_phase_calls_total{model="WMM-2025",phase="field"} 1\n', text
+        )
+        self.assertIn(
+            'test_phase_points_total{model="WMM-2025",phase="field"} 3\n', text
+        )
+        self.assertIn('test_phase_seconds_total{model="WMM-2025",phase="field"} ', text)
@@ -0,0 +1,67 @@
+import contextlib
+import importlib
+import io
+import os
+import tempfile
+from unittest import TestCase
+
+from pygeomag import GeoMag
+from pygeomag.prepared import PREPARED_MODULES, format_prepared, main
+
+
+class TestPrepared(TestCase):
+    def test_generated_modules(self):
+        for module_name in PREPARED_MODULES:
+            module = importlib.import_module(f"pygeomag.wmm.{module_name}")
+            prepared_module = importlib.import_module(
+                f"pygeomag.wmm.{module_name}_prepared"
+            )
+            name = next(
+                attribute
+                for attribute in dir(module)
+                if attribute.lower() == module_name
+            )
+            self.assertEqual(
+                getattr(prepared_module, f"{name}_PREPARED"),
+                GeoMag(
+                    coefficients_data=getattr(module, name)
+                ).prepared_coefficients_data(),
+            )
+
+    def test_format_prepared(self):
+        prepared = (
+            (2025.0, "WMM-2025", "11/13/2024"),
+            {
+                "evaluator": "legendre",
+                "maxord": 1,
+                "c": (0.0, -0.0, 1e-05, -29351.8),
+                "k": (0.0, 0.1, 0.333),
+            },
+        )
+        namespace = {}
+        exec(format_prepared("TABLES", prepared), namespace)
+        self.assertEqual(namespace["TABLES"], prepared)
+        self.assertIn("prepared for the legendre evaluator", namespace["__doc__"])
+
+    def test_main(self):
+        with tempfile.TemporaryDirectory() as directory:
+            with contextlib.redirect_stdout(io.StringIO()) as output:
+                self.assertEqual(
+                    main(["wmm_2020", "--evaluator", "clenshaw", "-o", directory]), 0
+                )
+            filename = os.path.join(directory, "wmm_2020_clenshaw_prepared.py")
+            self.assertEqual(output.getvalue().strip(), filename)
+            with open(filename) as file:
+                namespace = {}
+                exec(file.read(), namespace)
+
+        prepared = namespace["WMM_2020_CLENSHAW_PREPARED"]
+        self.assertEqual(prepared[1]["evaluator"], "clenshaw")
+        geo_mag = GeoMag(coefficients_data=prepared, evaluator="clenshaw")
+        self.assertAlmostEqual(
+            geo_mag.calculate(47.6205, -122.3493, 0, 2023.75).d,
+            GeoMag(base_year=2020, evaluator="clenshaw")
+            .calculate(47.6205, -122.3493, 0, 2023.75)
+            .d,
+            12,
+        )
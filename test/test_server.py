@@ -0,0 +1,191 @@
+import asyncio
+import json
+from unittest import IsolatedAsyncioTestCase, TestCase
+
+from pygeomag import GeoMag, instrument
+from pygeomag.server import Server
+from pygeomag.wmm.wmm_2020 import WMM_2020
+from pygeomag.wmm.wmm_2025 import WMM_2025
+
+
+class TestServer(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.server = Server(
+            [GeoMag(coefficients_data=WMM_2025), GeoMag(coefficients_data=WMM_2020)],
+            port=0,
+            window=0.05,
+        )
+        await self.server.start()
+
+    async def asyncTearDown(self):
+        await self.server.stop()
+
+    async def request(self, method, path, body=None, raw=None):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        content = b"" if body is None else json.dumps(body).encode()
+        if raw is None:
+            raw = (
+                f"{method} {path} HTTP/1.1\r\nHost: localhost\r\nConnection: close\r\n"
+                f"Content-Length: {len(content)}\r\n\r\n"
+            ).encode() + content
+        writer.write(raw)
+        await writer.drain()
+        response = await reader.read()
+        writer.close()
+        head, _, payload = response.partition(b"\r\n\r\n")
+        status = int(head.split()[1])
+        return status, json.loads(payload)
+
+    async def test_health(self):
+        self.assertEqual(await self.request("GET", "/health"), (200, {"status": "ok"}))
+
+    async def test_models(self):
+        self.assertEqual(
+            await self.request("GET", "/models"),
+            (200, {"models": ["WMM-2025", "WMM-2020"]}),
+        )
+
+    async def test_calculate_get(self):
+        status, result = await self.request(
+            "GET", "/calculate?lat=47.6205&lon=-122.3493&alt=0&time=2025.25"
+        )
+        self.assertEqual(status, 200)
+        self.assertEqual(result["model"], "WMM-2025")
+        self.assertAlmostEqual(result["d"], 15.065629638512593, places=9)
+        self.assertIsNone(result["gv"])
+        self.assertFalse(result["in_blackout_zone"])
+        self.assertFalse(result["in_caution_zone"])
+
+    async def test_calculate_post_with_model(self):
+        status, result = await self.request(
+            "POST",
+            "/calculate",
+            {"lat": 47.6205, "lon": -122.3493, "time": 2023.75, "model": "WMM-2020"},
+        )
+        self.assertEqual(status, 200)
+        expected = GeoMag(coefficients_data=WMM_2020).calculate(
+            47.6205, -122.3493, 0, 2023.75
+        )
+        self.assertAlmostEqual(result["d"], expected.d, places=9)
+
+    async def test_calculate_defaults_to_now(self):
+        status, result = await self.request(
+            "GET", "/calculate?lat=0&lon=0&allow_date_outside_lifespan=true"
+        )
+        self.assertEqual(status, 200)
+        self.assertGreater(result["time"], 2025)
+
+    async def test_calculate_coalesces_requests(self):
+        with instrument() as stats:
+            responses = await asyncio.gather(
+                *(
+                    self.request("GET", f"/calculate?lat={lat}&lon=0&time=2026")
+                    for lat in range(-80, 81, 10)
+                )
+            )
+        self.assertEqual([status for status, _ in responses], [200] * 17)
+        self.assertEqual(
+            [result["glat"] for _, result in responses], list(range(-80, 81, 10))
+        )
+        field = stats.as_dict()["WMM-2025"]["field"]
+        self.assertEqual(field["points"], 17)
+        self.assertLess(field["calls"], 17)
+        self.assertEqual(self.server._coalescers["WMM-2025"]._tasks, set())
+
+    async def test_calculate_batch(self):
+        status, result = await self.request(
+            "POST",
+            "/calculate_batch",
+            {
+                "lat": [47.6205, 89],
+                "lon": [-122.3493, -121],
+                "alt": [0, 28],
+                "time": 2026.5,
+            },
+        )
+        self.assertEqual(status, 200)
+        expected = GeoMag(coefficients_data=WMM_2025).calculate(89, -121, 28, 2026.5)
+        self.assertAlmostEqual(result["d"][1], expected.d, places=9)
+        self.assertAlmostEqual(result["gv"][1], expected.gv, places=9)
+        self.assertIsNone(result["gv"][0])
+        self.assertEqual(result["in_blackout_zone"], [False, True])
+        self.assertEqual(result["in_caution_zone"], [False, False])
+
+    async def test_keep_alive(self):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.server.port)
+        for _ in range(2):
+            writer.write(b"GET /health HTTP/1.1\r\nHost: localhost\r\n\r\n")
+            await writer.drain()
+            head = await reader.readuntil(b"\r\n\r\n")
+            self.assertIn(b"Connection: keep-alive", head)
+            length = int(head.split(b"Content-Length: ")[1].split(b"\r\n")[0])
+            self.assertEqual(
+                json.loads(await reader.readexactly(length)), {"status": "ok"}
+            )
+        writer.close()
+
+    async def test_errors(self):
+        self.assertEqual(
+            await self.request("GET", "/unknown"),
+            (404, {"error": "Unknown path /unknown"}),
+        )
+        self.assertEqual(
+            await self.request("PUT", "/calculate"),
+            (405, {"error": "Method PUT is not allowed"}),
+        )
+        self.assertEqual(
+            await self.request("GET", "/calculate_batch"),
+            (405, {"error": "Method GET is not allowed"}),
+        )
+        self.assertEqual(
+            await self.request("GET", "/calculate?lat=1"),
+            (400, {"error": "Missing parameter lon"}),
+        )
+        self.assertEqual(
+            await self.request("GET", "/calculate?lat=1&lon=1&model=WMM-1900"),
+            (404, {"error": "Unknown model WMM-1900"}),
+        )
+        self.assertEqual(
+            await self.request("GET", "/calculate?lat=1&lon=1&time=2040"),
+            (400, {"error": "Time extends beyond model 5-year life span"}),
+        )
+        self.assertEqual(
+            await self.request("POST", "/calculate_batch", [1]),
+            (400, {"error": "The body must be a JSON object"}),
+        )
+        self.assertEqual(
+            await self.request("POST", "/calculate_batch", {"lat": [1, 2], "lon": [1]}),
+            (400, {"error": "All columns must have the same length"}),
+        )
+        self.assertEqual(
+            await self.request(
+                "POST",
+                "/calculate",
+                raw=b"POST /calculate HTTP/1.1\r\nConnection: close\r\n"
+                b"Content-Length: 1\r\n\r\n{",
+            ),
+            (400, {"error": "The body is not valid JSON"}),
+        )
+        self.assertEqual(
+            await self.request("GET", "/", raw=b"GARBAGE\r\n\r\n"),
+            (400, {"error": "Invalid request line"}),
+        )
+
+    async def test_malformed_parameters(self):
+        for path, body in (
+            ("/calculate", {"lat": None, "lon": 1}),
+            ("/calculate", {"lat": [1], "lon": 1}),
+            ("/calculate_batch", {"lat": 1, "lon": [1]}),
+            ("/calculate_batch", {"lat": [1, None], "lon": [1, 2]}),
+            ("/calculate_batch", {"lat": [1], "lon": [1], "alt": None}),
+            ("/calculate_batch", {"lat": [1], "lon": [1], "time": {"year": 2026}}),
+        ):
+            status, payload = await self.request("POST", path, body)
+            self.assertEqual(status, 400, body)
+            self.assertIn("error", payload)
+
+
+class TestServerOptions(TestCase):
+    def test_requires_a_model(self):
+        with self.assertRaisesRegex(ValueError, "At least one model is required"):
+            Server([])
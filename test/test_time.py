@@ -2,13 +2,23 @@ import datetime
 import os
 import sys
 import time
-from unittest import TestCase
+import warnings
+from unittest import TestCase, mock, skipUnless
 
 from pygeomag import (
     calculate_decimal_year,
+    calculate_decimal_years,
     decimal_year_from_date,
     decimal_year_from_struct_time,
+    decimal_years_from_datetime64,
+    decimal_years_from_epoch,
 )
+from pygeomag import time as pygeomag_time
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestHelpers(TestCase):
@@ -98,3 +108,153 @@ class TestHelpers(TestCase):
         with_dst = time.mktime(time.struct_time(test_parameters[0][0]))
         without_dst = time.mktime(time.struct_time(test_parameters[1][0]))
         self.assertNotEqual(with_dst, without_dst)
+
+    def test_precise(self):
+        utc_minus_2 = datetime.timezone(datetime.timedelta(hours=-2))
+        test_parameters = (
+            (datetime.date(2020, 7, 2), 2020.5),
+            (datetime.datetime(2020, 7, 2, 12), 2020.5 + 0.5 / 366),
+            (datetime.datetime(2020, 7, 2, 6, 30, 36), 2020.5 + 0.27125 / 366),
+            (
+                datetime.datetime(2020, 7, 2, 23, tzinfo=utc_minus_2),
+                2020.5 + 25 / 24 / 366,
+            ),
+            (datetime.datetime(2021, 12, 31, 23, 59, 59, 999999), 2022.0),
+            (time.struct_time((2020, 7, 2, 12, 0, 0, 0, 0, 1)), 2020.5 + 0.5 / 366),
+            (1593691200, 2020.5 + 0.5 / 366),
+        )
+        for value, expected in test_parameters:
+            self.assertAlmostEqual(
+                expected, calculate_decimal_year(value, precise=True), 9
+            )
+        # Without precise, an aware datetime keeps its own date
+        self.assertEqual(2020.5, decimal_year_from_date(test_parameters[3][0]))
+
+    def test_no_mktime(self):
+        with mock.patch("time.mktime", side_effect=AssertionError("mktime was called")):
+            self.assertEqual(
+                2020.5,
+                decimal_year_from_struct_time(
+                    time.struct_time((2020, 7, 2, 0, 0, 0, 0, 0, 1))
+                ),
+            )
+
+    def test_year_table(self):
+        pygeomag_time._year_table.clear()
+        for day in range(365):
+            decimal_year_from_date(
+                datetime.date(2023, 1, 1) + datetime.timedelta(days=day)
+            )
+        self.assertEqual({2023: (19358, 365)}, pygeomag_time._year_table)
+        for year in range(1, 3000):
+            self.assertEqual(
+                (
+                    datetime.date(year, 1, 1).toordinal()
+                    - datetime.date(1970, 1, 1).toordinal(),
+                    366
+                    if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+                    else 365,
+                ),
+                pygeomag_time._year(year),
+            )
+
+
+class TestBatchHelpers(TestCase):
+    def test_decimal_years_from_epoch(self):
+        epoch = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+        dates = []
+        for year in (1600, 1900, 1969, 1970, 2000, 2020, 2023, 2100, 2400):
+            for month, day in ((1, 1), (2, 28), (2, 29), (3, 1), (7, 2), (12, 31)):
+                try:
+                    dates.append(
+                        datetime.datetime(
+                            year, month, day, 18, tzinfo=datetime.timezone.utc
+                        )
+                    )
+                except ValueError:
+                    continue
+        seconds = [(date - epoch).total_seconds() for date in dates]
+
+        years = decimal_years_from_epoch(seconds)
+        precise = decimal_years_from_epoch(seconds, precise=True)
+        for date, year, precise_year in zip(dates, years, precise):
+            self.assertEqual(decimal_year_from_date(date.date()), year)
+            length = (
+                366
+                if date.year % 4 == 0 and (date.year % 100 != 0 or date.year % 400 == 0)
+                else 365
+            )
+            self.assertAlmostEqual(year + 0.75 / length, precise_year, 9)
+
+    def test_calculate_decimal_years(self):
+        values = [
+            2025.25,
+            2020,
+            datetime.date(2020, 7, 2),
+            datetime.datetime(2020, 7, 2, 12),
+            datetime.datetime(
+                2020, 7, 2, 23, tzinfo=datetime.timezone(datetime.timedelta(hours=-2))
+            ),
+            time.struct_time((2020, 7, 2, 12, 0, 0, 0, 0, 0)),
+            1593648000,
+        ]
+        self.assertEqual(
+            [2025.25, 2020.0, 2020.5, 2020.5, 2020.5, 2020.5, 2020.5],
+            calculate_decimal_years(values),
+        )
+        precise = calculate_decimal_years(values, precise=True)
+        self.assertAlmostEqual(2020.5 + 0.5 / 366, precise[3], 9)
+        self.assertAlmostEqual(2020.5 + 1 / 366 + 1 / 24 / 366, precise[4], 9)
+        self.assertAlmostEqual(2020.5 + 0.5 / 366, precise[5], 9)
+
+    def test_calculate_decimal_years_exception(self):
+        with self.assertRaises(TypeError):
+            calculate_decimal_years(["2020-07-02"])
+
+    @skipUnless(numpy, "NumPy is not installed")
+    def test_decimal_years_from_epoch_array(self):
+        seconds = numpy.arange(-3e9, 5e9, 86400 * 12.3456)
+        years = decimal_years_from_epoch(seconds)
+        self.assertIsInstance(years, numpy.ndarray)
+        numpy.testing.assert_array_equal(
+            decimal_years_from_epoch(seconds.tolist()), years
+        )
+        numpy.testing.assert_allclose(
+            decimal_years_from_epoch(seconds.tolist(), precise=True),
+            decimal_years_from_epoch(seconds, precise=True),
+        )
+
+    @skipUnless(numpy, "NumPy is not installed")
+    def test_decimal_years_from_datetime64(self):
+        values = numpy.array(
+            ["2020-07-02T12:00", "NaT", "1969-12-31T18:00", "2100-03-01"],
+            dtype="datetime64[ms]",
+        )
+        years = decimal_years_from_datetime64(values)
+        self.assertEqual(2020.5, years[0])
+        self.assertTrue(numpy.isnan(years[1]))
+        self.assertEqual(1969 + 364 / 365, years[2])
+        self.assertEqual(2100 + 59 / 365, years[3])
+        self.assertAlmostEqual(
+            2020.5 + 0.5 / 366,
+            decimal_years_from_datetime64(values, precise=True)[0],
+            9,
+        )
+        numpy.testing.assert_array_equal(years, calculate_decimal_years(values))
+        with self.assertRaises(TypeError):
+            decimal_years_from_datetime64(numpy.array([1.0]))
+
+    @skipUnless(numpy, "NumPy is not installed")
+    def test_calculate_decimal_years_array(self):
+        years = calculate_decimal_years(numpy.array([2025.25, 1593648000.0]))
+        numpy.testing.assert_array_equal([2025.25, 2020.5], years)
+
+    @skipUnless(numpy, "NumPy is not installed")
+    def test_calculate_decimal_years_array_nan(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            for precise in (False, True):
+                years = calculate_decimal_years(
+                    numpy.array([numpy.nan, 1593648000.0, numpy.inf]), precise
+                )
+                numpy.testing.assert_array_equal([numpy.nan, 2020.5, numpy.inf], years)
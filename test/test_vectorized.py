@@ -0,0 +1,239 @@
+import random
+import unittest
+from unittest import TestCase
+
+from pygeomag import CautionZoneException, GeoMag, backend, instrument
+from pygeomag.wmm.wmm_2025 import WMM_2025
+from pygeomag.wmm.wmmhr_2025 import WMMHR_2025
+
+try:
+    import numpy
+
+    from pygeomag import vectorized
+except ImportError:
+    numpy = None
+
+COLUMNS = ("x", "y", "z", "h", "f", "i", "d")
+
+
+def random_columns(count):
+    rng = random.Random(1)
+    glat = [90.0, -90.0, 89.9999, 0.0, 55.0, -55.0] + [
+        rng.uniform(-90, 90) for _ in range(count - 6)
+    ]
+    glon = [rng.uniform(-180, 180) for _ in range(count)]
+    alt = [rng.uniform(-1, 850) for _ in range(count)]
+    time = [rng.uniform(2025, 2030) for _ in range(count)]
+    return glat, glon, alt, time
+
+
+@unittest.skipUnless(numpy, "NumPy is not installed")
+class TestVectorized(TestCase):
+    def setUp(self):
+        self.previous_backend = backend.get_backend()
+        backend.set_backend(backend.BACKEND_PYTHON)
+
+    def tearDown(self):
+        backend.set_backend(self.previous_backend)
+
+    def assert_matches_batch(self, geo_mag, count, delta):
+        columns = random_columns(count)
+        expected = geo_mag.calculate_batch(*columns)
+        for name in backend.available_backends():
+            backend.set_backend(name)
+            result = geo_mag.calculate_batch(
+                *(numpy.array(column) for column in columns)
+            )
+            self.assertIsInstance(result.d, numpy.ndarray)
+            for column in COLUMNS:
+                numpy.testing.assert_allclose(
+                    getattr(result, column),
+                    getattr(expected, column),
+                    rtol=0,
+                    atol=delta,
+                )
+            numpy.testing.assert_allclose(result.gv, expected.gv, rtol=0, atol=1e-9)
+
+    def test_legendre(self):
+        self.assert_matches_batch(GeoMag(coefficients_data=WMM_2025), 200, 1e-9)
+
+    def test_clenshaw(self):
+        self.assert_matches_batch(
+            GeoMag(coefficients_data=WMM_2025, evaluator="clenshaw"), 200, 1e-9
+        )
+
+    def test_high_resolution_legendre(self):
+        self.assert_matches_batch(
+            GeoMag(coefficients_data=WMMHR_2025, high_resolution=True), 20, 1e-8
+        )
+
+    def test_high_resolution_clenshaw(self):
+        self.assert_matches_batch(
+            GeoMag(
+                coefficients_data=WMMHR_2025, high_resolution=True, evaluator="clenshaw"
+            ),
+            20,
+            1e-8,
+        )
+
+    def test_scalar_columns_are_broadcast(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        result = geo_mag.calculate_batch(
+            numpy.array([47.6205, 0.0]), -122.3493, 0, 2025.25
+        )
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result.glon.shape, (2,))
+        self.assertAlmostEqual(float(result.d[0]), 15.065629638512593, places=9)
+        self.assertAlmostEqual(result[0].d, 15.065629638512593, places=9)
+
+    def test_length_mismatch_raises(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        with self.assertRaisesRegex(
+            ValueError, "All columns must have the same length"
+        ):
+            geo_mag.calculate_batch(numpy.zeros(2), numpy.zeros(3), 0, 2025.25)
+
+    def test_records_phases(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        geo_mag.preload()
+        with instrument() as stats:
+            geo_mag.calculate_batch(numpy.zeros(3), numpy.zeros(3), 0, 2025.5)
+        phases = stats.as_dict()["WMM-2025"]
+        for phase in ("convert", "field", "result"):
+            self.assertEqual(phases[phase]["calls"], 1)
+            self.assertEqual(phases[phase]["points"], 3)
+
+    def test_rows_per_chunk(self):
+        standard = vectorized.rows_per_chunk(GeoMag(coefficients_data=WMM_2025))
+        high_resolution = vectorized.rows_per_chunk(
+            GeoMag(coefficients_data=WMMHR_2025, high_resolution=True)
+        )
+        self.assertGreater(standard, 8 * high_resolution)
+        self.assertEqual(
+            vectorized.rows_per_chunk(GeoMag(coefficients_data=WMM_2025), memory=1), 1
+        )
+        self.assertEqual(
+            vectorized.rows_per_chunk(
+                GeoMag(coefficients_data=WMM_2025), dtype=numpy.float32
+            ),
+            2 * standard,
+        )
+
+    def assert_float32_close(self, geo_mag):
+        columns = [numpy.array(column) for column in random_columns(200)]
+        expected = vectorized.calculate_batch(geo_mag, *columns)
+        away_from_poles = numpy.fabs(columns[0]) < 89.0  # noqa: PLR2004 Magic value used in comparison
+        for name in backend.available_backends():
+            backend.set_backend(name)
+            result = vectorized.calculate_batch(geo_mag, *columns, dtype=numpy.float32)
+            for column in COLUMNS:
+                self.assertEqual(getattr(result, column).dtype, numpy.float32)
+            for column in ("x", "y", "z", "h", "f"):
+                numpy.testing.assert_allclose(
+                    getattr(result, column), getattr(expected, column), rtol=0, atol=0.2
+                )
+            numpy.testing.assert_allclose(result.i, expected.i, rtol=0, atol=1e-4)
+            numpy.testing.assert_allclose(
+                result.d[away_from_poles],
+                expected.d[away_from_poles],
+                rtol=0,
+                atol=1e-2,
+            )
+
+    def test_float32_legendre(self):
+        self.assert_float32_close(GeoMag(coefficients_data=WMM_2025))
+
+    def test_float32_clenshaw(self):
+        self.assert_float32_close(
+            GeoMag(coefficients_data=WMM_2025, evaluator="clenshaw")
+        )
+
+    def test_near_poles(self):
+        glat = [90.0 - 10.0**-exponent for exponent in range(1, 10)]
+        glat += [90.0, -90.0] + [-value for value in glat]
+        glon = [index * 17.0 - 180.0 for index in range(len(glat))]
+        geo_mag = GeoMag(coefficients_data=WMMHR_2025, high_resolution=True)
+        expected = geo_mag.calculate_batch(glat, glon, 0.0, 2027.5)
+        # In single precision the functions of high degrees are subnormal this close to the poles
+        for dtype, delta in ((numpy.float64, 1e-8), (numpy.float32, 0.05)):
+            result = vectorized.calculate_batch(
+                geo_mag, numpy.array(glat), numpy.array(glon), 0.0, 2027.5, dtype=dtype
+            )
+            for column in ("x", "y", "z"):
+                numpy.testing.assert_allclose(
+                    getattr(result, column),
+                    getattr(expected, column),
+                    rtol=0,
+                    atol=delta,
+                )
+
+    def test_zones(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        glat = numpy.array([0.0, -64.0, -70.0, 75.0, 80.0])
+        glon = numpy.array([0.0, 137.0, 140.0, -100.0, 100.0])
+        expected = geo_mag.calculate_batch(list(glat), list(glon), 0, 2026)
+        for name in backend.available_backends():
+            backend.set_backend(name)
+            results = geo_mag.calculate_batch(glat, glon, 0, 2026)
+            self.assertEqual(results.in_blackout_zone.dtype, bool)
+            self.assertEqual(
+                results.in_blackout_zone.tolist(), expected.in_blackout_zone
+            )
+            self.assertEqual(results.in_caution_zone.tolist(), expected.in_caution_zone)
+            self.assertTrue(results[2].in_caution_zone)
+
+        results = geo_mag.calculate_batch(
+            glat, glon, 0, 2026, blackout_zone=1000, caution_zone=4000
+        )
+        self.assertEqual(
+            results.in_caution_zone.tolist(), [False, False, False, True, True]
+        )
+        with self.assertRaisesRegex(CautionZoneException, "is 4711.7"):
+            geo_mag.calculate_batch(
+                glat[2:], glon[2:], 0, 2026, raise_in_warning_zone=True
+            )
+        results = geo_mag.calculate_batch(
+            glat[:1], glon[:1], 0, 2026, raise_in_warning_zone=True
+        )
+        self.assertFalse(results.in_caution_zone.any())
+
+    def test_invalid_dtype_raises(self):
+        with self.assertRaisesRegex(ValueError, "dtype must be float32 or float64"):
+            vectorized.calculate_batch(
+                GeoMag(coefficients_data=WMM_2025),
+                numpy.zeros(2),
+                0,
+                0,
+                2025.5,
+                dtype=int,
+            )
+
+    def test_precision_report(self):
+        report = vectorized.precision_report(
+            GeoMag(coefficients_data=WMM_2025), step=30.0
+        )
+        self.assertEqual(set(report), set(COLUMNS))
+        for column in ("x", "y", "z", "h", "f"):
+            self.assertLess(report[column]["max"], 0.2)
+            self.assertLessEqual(report[column]["mean"], report[column]["rms"])
+            self.assertLessEqual(report[column]["rms"], report[column]["max"])
+        self.assertLess(report["d"]["max"], 0.01)
+        self.assertEqual(
+            {"max": 0.0, "mean": 0.0, "rms": 0.0},
+            vectorized.precision_report(
+                GeoMag(coefficients_data=WMM_2025), step=30.0, dtype=numpy.float64
+            )["f"],
+        )
+
+    def test_outside_lifespan_raises(self):
+        geo_mag = GeoMag(coefficients_data=WMM_2025)
+        with self.assertRaisesRegex(
+            ValueError, "Time extends beyond model 5-year life span"
+        ):
+            geo_mag.calculate_batch(
+                numpy.zeros(2), numpy.zeros(2), 0, numpy.array([2025.0, 2031.0])
+            )
+        result = geo_mag.calculate_batch(
+            numpy.zeros(2), numpy.zeros(2), 0, numpy.array([2025.0, 2031.0]), True
+        )
+        self.assertEqual(len(result), 2)